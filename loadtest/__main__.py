@@ -0,0 +1,119 @@
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+
+import aiohttp
+from loadtest.config import build_parser
+from loadtest.saga import (
+    OrderFlow,
+    check_services,
+    seed_inventory,
+    wait_for_queue_drain,
+)
+from loadtest.stats import StepStats, render_table
+
+
+class ServicesUnavailable(Exception):
+    pass
+
+
+def plan_scenarios(orders: int, mix: dict, seed: int) -> list:
+    rng = random.Random(seed)
+    names = list(mix)
+    return rng.choices(names, weights=[mix[name] for name in names], k=orders)
+
+
+async def run_load_test(args) -> dict:
+    stats = StepStats()
+    scenarios = plan_scenarios(args.orders, args.mix, args.seed)
+    outcomes = Counter()
+    failures = []
+    run_id = uuid.uuid4().hex[:8]
+    connector = aiohttp.TCPConnector(limit=args.concurrency * 2)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        down = await check_services(session, args)
+        if down:
+            raise ServicesUnavailable(
+                f"Not reachable: {', '.join(down)}. Start the stack with "
+                "`make run-infra run-services` or point the --*-url "
+                "options at running services."
+            )
+        skus = await seed_inventory(session, args, quantity=args.orders * 3)
+        flow = OrderFlow(session, args, stats, skus, run_id)
+        pending = iter(enumerate(scenarios))
+
+        async def worker(worker_id: int):
+            rng = random.Random(args.seed + worker_id)
+            for index, scenario in pending:
+                try:
+                    await flow.run(index, scenario, rng)
+                    outcomes[f"{scenario}_ok"] += 1
+                except Exception as e:
+                    outcomes[f"{scenario}_failed"] += 1
+                    failures.append(f"order {index} ({scenario}): {e!r}")
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(worker(worker_id) for worker_id in range(args.concurrency))
+        )
+        elapsed = time.perf_counter() - started
+        drain_seconds = await wait_for_queue_drain(session, args)
+
+    completed = sum(
+        count for key, count in outcomes.items() if key.endswith("_ok")
+    )
+    return {
+        "run_id": run_id,
+        "orders": args.orders,
+        "concurrency": args.concurrency,
+        "mix": args.mix,
+        "elapsed_seconds": elapsed,
+        "requests": stats.requests,
+        "requests_per_second": stats.requests / elapsed if elapsed else 0,
+        "orders_per_second": completed / elapsed if elapsed else 0,
+        "queue_drain_seconds": drain_seconds,
+        "outcomes": dict(outcomes),
+        "steps": stats.summary(),
+        "failures": failures[:20],
+    }
+
+
+def render_report(report: dict) -> str:
+    drain = report["queue_drain_seconds"]
+    lines = [
+        f"run {report['run_id']}: {report['orders']} orders, "
+        f"concurrency {report['concurrency']}, mix {report['mix']}",
+        "",
+        render_table(report["steps"]),
+        "",
+        f"elapsed        {report['elapsed_seconds']:.2f}s",
+        f"requests/s     {report['requests_per_second']:.1f}",
+        f"orders/s       {report['orders_per_second']:.1f}",
+        "queue drain    "
+        + (f"{drain:.2f}s" if drain is not None else "unavailable"),
+        f"outcomes       {report['outcomes']}",
+    ]
+    lines += [f"  {failure}" for failure in report["failures"]]
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        report = asyncio.run(run_load_test(args))
+    except ServicesUnavailable as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(render_report(report))
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import argparse
+import os
+from typing import Dict
+
+
+class Config:
+    # Base URLs follow the services' own convention: host plus root_path
+    INVENTORY_URL = os.getenv(
+        "LOADTEST_INVENTORY_URL", "http://localhost:8001/inventory"
+    )
+    ORDERS_URL = os.getenv(
+        "LOADTEST_ORDERS_URL", "http://localhost:8002/orders"
+    )
+    PAYMENTS_URL = os.getenv(
+        "LOADTEST_PAYMENTS_URL", "http://localhost:8003/payments"
+    )
+    DELIVERY_URL = os.getenv(
+        "LOADTEST_DELIVERY_URL", "http://localhost:8004/delivery"
+    )
+    RABBITMQ_MANAGEMENT_URL = os.getenv(
+        "LOADTEST_RABBITMQ_MANAGEMENT_URL", "http://localhost:15672"
+    )
+    RABBITMQ_USER = os.getenv("LOADTEST_RABBITMQ_USER", "guest")
+    RABBITMQ_PASSWORD = os.getenv("LOADTEST_RABBITMQ_PASSWORD", "guest")
+    ORDERS = int(os.getenv("LOADTEST_ORDERS", 100))
+    CONCURRENCY = int(os.getenv("LOADTEST_CONCURRENCY", 10))
+    MIX = os.getenv("LOADTEST_MIX", "complete=8,cancel=1,abandon=1")
+    SKUS = int(os.getenv("LOADTEST_SKUS", 5))
+    STEP_TIMEOUT = float(os.getenv("LOADTEST_STEP_TIMEOUT", 30))
+    POLL_INTERVAL = float(os.getenv("LOADTEST_POLL_INTERVAL", 0.05))
+    DRAIN_TIMEOUT = float(os.getenv("LOADTEST_DRAIN_TIMEOUT", 120))
+    SEED = int(os.getenv("LOADTEST_SEED", 42))
+
+
+SCENARIOS = ["complete", "cancel", "abandon", "reject"]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(
+                f"Unknown scenario '{name}', expected one of {SCENARIOS}"
+            )
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"Scenario '{name}' needs a numeric weight"
+            )
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("Mix weights must add up to > 0")
+    return mix
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description=(
+            "Drive the create -> confirm -> pay -> deliver saga through "
+            "the running services and report per-step latency."
+        ),
+    )
+    parser.add_argument("--orders", type=int, default=Config.ORDERS)
+    parser.add_argument("--concurrency", type=int, default=Config.CONCURRENCY)
+    parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=parse_mix(Config.MIX),
+        help=("Scenario weights, e.g. complete=8,cancel=1,abandon=1,reject=1"),
+    )
+    parser.add_argument("--skus", type=int, default=Config.SKUS)
+    parser.add_argument("--seed", type=int, default=Config.SEED)
+    parser.add_argument(
+        "--step-timeout", type=float, default=Config.STEP_TIMEOUT
+    )
+    parser.add_argument(
+        "--poll-interval", type=float, default=Config.POLL_INTERVAL
+    )
+    parser.add_argument(
+        "--drain-timeout", type=float, default=Config.DRAIN_TIMEOUT
+    )
+    parser.add_argument("--inventory-url", default=Config.INVENTORY_URL)
+    parser.add_argument("--orders-url", default=Config.ORDERS_URL)
+    parser.add_argument("--payments-url", default=Config.PAYMENTS_URL)
+    parser.add_argument("--delivery-url", default=Config.DELIVERY_URL)
+    parser.add_argument(
+        "--rabbitmq-management-url", default=Config.RABBITMQ_MANAGEMENT_URL
+    )
+    parser.add_argument("--rabbitmq-user", default=Config.RABBITMQ_USER)
+    parser.add_argument(
+        "--rabbitmq-password", default=Config.RABBITMQ_PASSWORD
+    )
+    parser.add_argument(
+        "--json", dest="json_path", help="Also write the report to this file"
+    )
+    return parser
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import random
+import time
+from typing import Iterable, List, Optional
+
+import aiohttp
+from loadtest.stats import StepStats
+
+
+class StepFailed(Exception):
+    pass
+
+
+class OrderFlow:
+    # One customer walking through the saga. Synchronous steps time the
+    # HTTP call; "wait_*" steps time how long the asynchronous hop over the
+    # broker took to become visible in the next service.
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        args,
+        stats: StepStats,
+        skus: List[str],
+        run_id: str,
+    ):
+        self.session = session
+        self.args = args
+        self.stats = stats
+        self.skus = skus
+        self.run_id = run_id
+
+    async def run(self, index: int, scenario: str, rng: random.Random):
+        started = time.perf_counter()
+        order_id = await self.create_order(index, rng)
+        if scenario == "abandon":
+            return
+        await self.request(
+            "confirm_order",
+            "PUT",
+            f"{self.args.orders_url}/orders/{order_id}/confirm",
+        )
+        if scenario == "cancel":
+            await self.request(
+                "cancel_order",
+                "PUT",
+                f"{self.args.orders_url}/orders/{order_id}/cancel",
+            )
+            return
+
+        payment = await self.wait_for_payment(order_id)
+        if scenario == "reject":
+            # Orders does not react to a failed payment, so the saga ends
+            # once payments has accepted the rejection
+            await self.pay(payment, "rejected")
+            return
+        await self.pay(payment, "approved")
+        await self.wait_for_order_status("wait_order_paid", order_id, ["paid"])
+        delivery = await self.create_delivery(index, order_id)
+        await self.request(
+            "delivery_in_transit",
+            "PUT",
+            f"{self.args.delivery_url}/deliveries/{delivery['id']}/in-transit",
+        )
+        await self.request(
+            "delivery_delivered",
+            "PUT",
+            f"{self.args.delivery_url}/deliveries/{delivery['id']}/delivered",
+        )
+        await self.wait_for_order_status(
+            "wait_order_finished", order_id, ["finished"]
+        )
+        self.stats.record("saga_complete", time.perf_counter() - started)
+
+    async def pay(self, payment: dict, status: str):
+        # The webhook only accepts the gateway's "approved" or "rejected"
+        await self.request(
+            f"pay_webhook_{status}",
+            "POST",
+            f"{self.args.payments_url}/payments/webhook",
+            json={"payment_id": payment["id"], "status": status},
+        )
+
+    async def request(self, step: str, method: str, url: str, **kwargs):
+        with self.stats.measure(step):
+            self.stats.requests += 1
+            async with self.session.request(method, url, **kwargs) as response:
+                body = await response.read()
+                if response.status >= 400:
+                    raise StepFailed(
+                        f"{step}: {method} {url} returned "
+                        f"{response.status} {body[:200]!r}"
+                    )
+                return json.loads(body) if body else None
+
+    async def create_order(self, index: int, rng: random.Random) -> int:
+        items = rng.sample(self.skus, k=rng.randint(1, min(3, len(self.skus))))
+        order = await self.request(
+            "create_order",
+            "POST",
+            f"{self.args.orders_url}/orders/",
+            json={
+                "customer": {
+                    "name": f"Load Test {index}",
+                    "email": self._email(index),
+                    "phone_number": "+5511999999999",
+                },
+                "order_items": [
+                    {"product_sku": sku, "quantity": 1} for sku in items
+                ],
+            },
+        )
+        return order["id"]
+
+    async def create_delivery(self, index: int, order_id: int) -> dict:
+        return await self.request(
+            "create_delivery",
+            "POST",
+            f"{self.args.delivery_url}/deliveries/",
+            json={
+                "order_id": order_id,
+                "delivery_address": "123 Main St",
+                "delivery_date": "2024-08-20",
+                "status": "pending",
+                "address": {
+                    "city": "Sao Paulo",
+                    "state": "SP",
+                    "country": "Brazil",
+                    "zip_code": "01000-000",
+                },
+                "customer": {
+                    "name": f"Load Test {index}",
+                    "email": self._email(index),
+                    "phone_number": "+5511999999999",
+                },
+            },
+        )
+
+    async def wait_for_payment(self, order_id: int) -> dict:
+        # Payments creates the payment when it consumes the confirmation
+        url = f"{self.args.payments_url}/payments/by-order-id/{order_id}"
+        with self.stats.measure("wait_payment_created"):
+            deadline = time.monotonic() + self.args.step_timeout
+            while time.monotonic() < deadline:
+                self.stats.requests += 1
+                async with self.session.get(url) as response:
+                    if response.status == 200:
+                        return await response.json()
+                await asyncio.sleep(self.args.poll_interval)
+            raise StepFailed(f"No payment for order {order_id}")
+
+    async def wait_for_order_status(
+        self, step: str, order_id: int, statuses: Iterable[str]
+    ):
+        # The order's SSE stream sends the current status first, so a
+        # change that landed before we connected is not missed
+        url = f"{self.args.orders_url}/orders/{order_id}/events"
+        timeout = aiohttp.ClientTimeout(total=self.args.step_timeout)
+        status = None
+        with self.stats.measure(step):
+            self.stats.requests += 1
+            async with self.session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    raise StepFailed(
+                        f"{step}: {url} returned {response.status}"
+                    )
+                async for line in response.content:
+                    if not line.startswith(b"data:"):
+                        continue
+                    status = json.loads(line[5:]).get("status")
+                    if status in statuses:
+                        return
+            raise StepFailed(f"{step}: order {order_id} ended as {status}")
+
+    def _email(self, index: int) -> str:
+        return f"loadtest-{self.run_id}-{index}@example.com"
+
+
+async def check_services(session: aiohttp.ClientSession, args) -> List[str]:
+    # Names of services whose liveness probe does not answer
+    down = []
+    for name, base in [
+        ("inventory", args.inventory_url),
+        ("orders", args.orders_url),
+        ("payments", args.payments_url),
+        ("delivery", args.delivery_url),
+    ]:
+        try:
+            async with session.get(f"{base}/health/live") as response:
+                if response.status != 200:
+                    down.append(name)
+        except aiohttp.ClientError:
+            down.append(name)
+    return down
+
+
+async def seed_inventory(
+    session: aiohttp.ClientSession, args, quantity: int
+) -> List[str]:
+    # Idempotent: existing products are topped up instead of recreated
+    base = args.inventory_url
+    async with session.post(
+        f"{base}/categories/", json={"name": "Load Test"}
+    ) as response:
+        await response.read()
+    skus = [f"LOADTEST-{index}" for index in range(args.skus)]
+    for sku in skus:
+        async with session.post(
+            f"{base}/products/",
+            json={
+                "sku": sku,
+                "name": f"Load test product {sku}",
+                "category_name": "Load Test",
+                "price": 10.0,
+                "quantity": quantity,
+            },
+        ) as response:
+            created = response.status < 400
+            await response.read()
+        if not created:
+            async with session.post(
+                f"{base}/inventory/{sku}/add", json={"quantity": quantity}
+            ) as response:
+                await response.read()
+    return skus
+
+
+async def wait_for_queue_drain(
+    session: aiohttp.ClientSession, args
+) -> Optional[float]:
+    # Seconds until every RabbitMQ queue is empty, None if the management
+    # API is unreachable or the queues never drain
+    url = f"{args.rabbitmq_management_url}/api/queues"
+    auth = aiohttp.BasicAuth(args.rabbitmq_user, args.rabbitmq_password)
+    started = time.perf_counter()
+    deadline = time.monotonic() + args.drain_timeout
+    while time.monotonic() < deadline:
+        try:
+            async with session.get(url, auth=auth) as response:
+                if response.status != 200:
+                    return None
+                queues = await response.json()
+        except aiohttp.ClientError:
+            return None
+        if sum(queue.get("messages", 0) for queue in queues) == 0:
+            return time.perf_counter() - started
+        await asyncio.sleep(max(args.poll_interval, 0.5))
+    return None
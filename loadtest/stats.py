@@ -0,0 +1,75 @@
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    # Nearest-rank, so reported values are latencies that actually happened
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class StepStats:
+    # Latencies and errors per saga step, collected from every worker
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.requests = 0
+
+    def record(self, step: str, seconds: float):
+        self.latencies[step].append(seconds)
+
+    def record_error(self, step: str):
+        self.errors[step] += 1
+
+    @contextmanager
+    def measure(self, step: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.record_error(step)
+            raise
+        self.record(step, time.perf_counter() - started)
+
+    def summary(self) -> Dict[str, dict]:
+        steps = {}
+        for step in sorted(set(self.latencies) | set(self.errors)):
+            values = sorted(self.latencies.get(step, []))
+            steps[step] = {
+                "count": len(values),
+                "errors": self.errors.get(step, 0),
+                "mean_ms": (sum(values) / len(values) * 1000) if values else 0,
+                **{
+                    f"p{pct}_ms": percentile(values, pct) * 1000
+                    for pct in PERCENTILES
+                },
+            }
+        return steps
+
+
+def render_table(
+    steps: Dict[str, dict], columns: Optional[List[str]] = None
+) -> str:
+    columns = columns or ["count", "errors", "mean_ms"] + [
+        f"p{pct}_ms" for pct in PERCENTILES
+    ]
+    width = max([len("step")] + [len(step) for step in steps])
+    lines = [
+        "step".ljust(width) + "".join(column.rjust(10) for column in columns)
+    ]
+    for step, values in steps.items():
+        cells = []
+        for column in columns:
+            value = values[column]
+            cells.append(
+                f"{value:10.1f}" if isinstance(value, float) else f"{value:10}"
+            )
+        lines.append(step.ljust(width) + "".join(cells))
+    return "\n".join(lines)
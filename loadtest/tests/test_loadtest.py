@@ -0,0 +1,198 @@
+import argparse
+import asyncio
+import json
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from loadtest.__main__ import plan_scenarios, render_report, run_load_test
+from loadtest.config import build_parser, parse_mix
+from loadtest.stats import StepStats, percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([0.2], 95) == 0.2
+    assert percentile([], 50) == 0.0
+
+
+def test_step_stats_summary():
+    stats = StepStats()
+    stats.record("create_order", 0.010)
+    stats.record("create_order", 0.030)
+    stats.record_error("confirm_order")
+
+    summary = stats.summary()
+
+    assert summary["create_order"]["count"] == 2
+    assert summary["create_order"]["mean_ms"] == pytest.approx(20)
+    assert summary["create_order"]["p99_ms"] == pytest.approx(30)
+    assert summary["confirm_order"] == {
+        "count": 0,
+        "errors": 1,
+        "mean_ms": 0,
+        "p50_ms": 0.0,
+        "p90_ms": 0.0,
+        "p95_ms": 0.0,
+        "p99_ms": 0.0,
+    }
+
+
+def test_parse_mix():
+    assert parse_mix("complete=3, cancel=1") == {"complete": 3, "cancel": 1}
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("refund=1")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_mix("complete=0")
+
+
+def test_plan_scenarios_is_reproducible():
+    mix = {"complete": 1, "abandon": 1}
+
+    plan = plan_scenarios(50, mix, seed=7)
+
+    assert plan == plan_scenarios(50, mix, seed=7)
+    assert set(plan) == {"complete", "abandon"}
+
+
+def _fake_stack() -> web.Application:
+    # Stands in for the four services and the broker hops between them
+    orders, payments, deliveries = {}, {}, {}
+    hop = 0.005
+
+    def later(callback):
+        asyncio.get_running_loop().call_later(hop, callback)
+
+    async def ok(request):
+        return web.json_response({})
+
+    async def create_order(request):
+        order_id = len(orders) + 1
+        orders[order_id] = "pending"
+        return web.json_response({"id": order_id})
+
+    async def confirm_order(request):
+        order_id = int(request.match_info["order_id"])
+        orders[order_id] = "confirmed"
+        later(lambda: payments.setdefault(order_id, f"pay-{order_id}"))
+        return web.json_response({"id": order_id})
+
+    async def cancel_order(request):
+        orders[int(request.match_info["order_id"])] = "canceled"
+        return web.json_response({})
+
+    async def order_events(request):
+        order_id = int(request.match_info["order_id"])
+        response = web.StreamResponse(
+            headers={"Content-Type": "text/event-stream"}
+        )
+        await response.prepare(request)
+        sent = None
+        while sent not in ("finished", "canceled"):
+            if orders[order_id] != sent:
+                sent = orders[order_id]
+                event = {"type": "status", "order_id": order_id}
+                await response.write(
+                    b"event: status\ndata: %s\n\n"
+                    % json.dumps({**event, "status": sent}).encode()
+                )
+            await asyncio.sleep(0.001)
+        return response
+
+    async def payment_by_order(request):
+        order_id = int(request.match_info["order_id"])
+        if order_id not in payments:
+            raise web.HTTPNotFound()
+        return web.json_response({"id": payments[order_id]})
+
+    async def webhook(request):
+        # Same contract as PaymentService.handle_webhook
+        payload = await request.json()
+        status = payload.get("status")
+        if status not in ("approved", "rejected"):
+            return web.json_response(
+                {"detail": f"Unsupported status '{status}' in webhook"},
+                status=400,
+            )
+        order_id = int(payload["payment_id"].split("-")[1])
+        if status == "approved":
+            later(lambda: orders.__setitem__(order_id, "paid"))
+        return web.json_response({})
+
+    async def create_delivery(request):
+        payload = await request.json()
+        deliveries[len(deliveries) + 1] = payload["order_id"]
+        return web.json_response({"id": len(deliveries)})
+
+    async def delivered(request):
+        order_id = deliveries[int(request.match_info["delivery_id"])]
+        later(lambda: orders.__setitem__(order_id, "finished"))
+        return web.json_response({})
+
+    async def queues(request):
+        return web.json_response([{"name": "orders_queue", "messages": 0}])
+
+    app = web.Application()
+    for service in ["inventory", "orders", "payments", "delivery"]:
+        app.router.add_get(f"/{service}/health/live", ok)
+    app.router.add_post("/inventory/categories/", ok)
+    app.router.add_post("/inventory/products/", ok)
+    app.router.add_post("/orders/orders/", create_order)
+    app.router.add_put("/orders/orders/{order_id}/confirm", confirm_order)
+    app.router.add_put("/orders/orders/{order_id}/cancel", cancel_order)
+    app.router.add_get("/orders/orders/{order_id}/events", order_events)
+    app.router.add_get(
+        "/payments/payments/by-order-id/{order_id}", payment_by_order
+    )
+    app.router.add_post("/payments/payments/webhook", webhook)
+    app.router.add_post("/delivery/deliveries/", create_delivery)
+    app.router.add_put("/delivery/deliveries/{delivery_id}/in-transit", ok)
+    app.router.add_put(
+        "/delivery/deliveries/{delivery_id}/delivered", delivered
+    )
+    app.router.add_get("/api/queues", queues)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_run_load_test_against_fake_stack():
+    server = TestServer(_fake_stack())
+    await server.start_server()
+    base = str(server.make_url("")).rstrip("/")
+    args = build_parser().parse_args(
+        [
+            "--orders=12",
+            "--concurrency=4",
+            "--mix=complete=2,cancel=1,abandon=1,reject=1",
+            "--poll-interval=0.001",
+            "--step-timeout=5",
+            f"--inventory-url={base}/inventory",
+            f"--orders-url={base}/orders",
+            f"--payments-url={base}/payments",
+            f"--delivery-url={base}/delivery",
+            f"--rabbitmq-management-url={base}",
+        ]
+    )
+
+    try:
+        report = await run_load_test(args)
+    finally:
+        await server.close()
+
+    assert report["failures"] == []
+    assert sum(report["outcomes"].values()) == 12
+    assert report["steps"]["create_order"]["count"] == 12
+    assert report["steps"]["saga_complete"]["count"] == report["outcomes"].get(
+        "complete_ok", 0
+    )
+    assert report["steps"]["pay_webhook_approved"]["count"] == report[
+        "outcomes"
+    ].get("complete_ok", 0)
+    assert report["steps"]["pay_webhook_rejected"]["count"] == report[
+        "outcomes"
+    ].get("reject_ok", 0)
+    assert report["queue_drain_seconds"] is not None
+    assert "requests/s" in render_report(report)
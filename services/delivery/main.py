@@ -1,7 +1,40 @@
 import logging
+import threading
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from src.adapters.api import customer_api, delivery_api, health_api
+from src.adapters.api import (
+    customer_api,
+    debug_api,
+    delivery_api,
+    health_api,
+    metrics_api,
+)
+from src.adapters.dependencies import (
+    get_delivery_publisher,
+    get_health_monitor,
+)
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
+from src.config import Config
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.order_status_subscriber import (
+    OrderStatusSubscriber,
+)
+from src.infrastructure.persistence.db_setup import SessionLocal
+from src.infrastructure.persistence.sqlalchemy_order_status_repository import (
+    SQLAlchemyOrderStatusRepository,
+)
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
+from src.infrastructure.tracing.exporters import start_tracing
+from src.infrastructure.tracing.tracer import tracer
 
 logger = logging.getLogger("app")
 logger.setLevel(logging.INFO)
@@ -14,7 +47,35 @@ formatter = logging.Formatter(
 console_handler.setFormatter(formatter)
 logger.addHandler(console_handler)
 
-app = FastAPI(root_path="/delivery")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_tracing(tracer)
+    health_monitor = get_health_monitor()
+    health_monitor.start()
+    # The ledger shares the subscriber's session, so a status and its
+    # processed-message row commit together
+    db = SessionLocal()
+    order_status_subscriber = OrderStatusSubscriber(
+        SQLAlchemyOrderStatusRepository(db),
+        deduplicator=MessageDeduplicator(
+            SQLAlchemyProcessedMessageRepository(db)
+        ),
+    )
+    threading.Thread(target=order_status_subscriber.start_consuming).start()
+    yield
+    get_delivery_publisher().close()
+    health_monitor.stop()
+    tracer.shutdown()
+
+
+app = FastAPI(lifespan=lifespan, root_path="/delivery")
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(customer_api.router)
 app.include_router(delivery_api.router)
 app.include_router(health_api.router)
+app.include_router(metrics_api.router)
+if Config.DEBUG_ENDPOINTS_ENABLED:
+    app.include_router(debug_api.router)
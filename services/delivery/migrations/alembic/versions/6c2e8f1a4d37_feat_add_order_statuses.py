@@ -0,0 +1,32 @@
+"""feat: add order statuses read model
+
+Revision ID: 6c2e8f1a4d37
+Revises: 3390fc45520d
+Create Date: 2026-10-19 15:21:08.417392
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c2e8f1a4d37"
+down_revision: Union[str, None] = "3390fc45520d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_statuses",
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("order_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("order_statuses")
@@ -0,0 +1,41 @@
+"""feat: add processed messages ledger
+
+Revision ID: 8d4b2e7f1c59
+Revises: 6c2e8f1a4d37
+Create Date: 2026-10-19 18:42:17.206315
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4b2e7f1c59"
+down_revision: Union[str, None] = "6c2e8f1a4d37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "processed_messages",
+        sa.Column("message_id", sa.String(length=64), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("message_id"),
+    )
+    op.create_index(
+        op.f("ix_processed_messages_processed_at"),
+        "processed_messages",
+        ["processed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_processed_messages_processed_at"),
+        table_name="processed_messages",
+    )
+    op.drop_table("processed_messages")
@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Response
+from src.infrastructure.metrics.metrics_registry import CONTENT_TYPE, registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", tags=["Metrics"], include_in_schema=False)
+def metrics():
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pika
 from fastapi import Depends
 from sqlalchemy.orm import Session
@@ -6,15 +8,19 @@ from src.application.services.order_verification_service import (
     OrderVerificationService,
 )
 from src.config import Config
+from src.infrastructure.health.health_monitor import HealthMonitor
 from src.infrastructure.health.health_service import HealthService
 from src.infrastructure.messaging.delivery_publisher import DeliveryPublisher
-from src.infrastructure.persistence.db_setup import get_db
+from src.infrastructure.persistence.db_setup import SessionLocal, get_db
 from src.infrastructure.persistence.sqlalchemy_customer_repository import (
     SQLAlchemyCustomerRepository,
 )
 from src.infrastructure.persistence.sqlalchemy_delivery_repository import (
     SQLAlchemyDeliveryRepository,
 )
+from src.infrastructure.persistence.sqlalchemy_order_status_repository import (
+    SQLAlchemyOrderStatusRepository,
+)
 
 
 def get_health_service(
@@ -23,15 +29,36 @@ def get_health_service(
     return HealthService(db, rabbitmq_host=Config.BROKER_HOST)
 
 
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    health_service = get_health_service(SessionLocal())
+    return HealthMonitor(
+        {
+            "database": health_service.check_database,
+            "rabbitmq": health_service.check_rabbitmq,
+        }
+    )
+
+
+@lru_cache
+def get_delivery_publisher() -> DeliveryPublisher:
+    # One publisher per process; it owns the connection and local buffer
+    return DeliveryPublisher(
+        pika.ConnectionParameters(host=Config.BROKER_HOST, heartbeat=120)
+    )
+
+
+def get_order_verification_service(
+    db: Session = Depends(get_db),
+) -> OrderVerificationService:
+    return OrderVerificationService(SQLAlchemyOrderStatusRepository(db))
+
+
 def get_delivery_service(
     db: Session = Depends(get_db),
-    delivery_publisher: DeliveryPublisher = Depends(
-        lambda: DeliveryPublisher(
-            pika.ConnectionParameters(host=Config.BROKER_HOST, heartbeat=120)
-        )
-    ),
+    delivery_publisher: DeliveryPublisher = Depends(get_delivery_publisher),
     order_verification_service: OrderVerificationService = Depends(
-        OrderVerificationService
+        get_order_verification_service
     ),
 ) -> DeliveryService:
     delivery_repository = SQLAlchemyDeliveryRepository(db)
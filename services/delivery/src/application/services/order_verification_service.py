@@ -1,22 +1,73 @@
 import logging
+from typing import Optional
 
 import aiohttp
 from src.config import Config
+from src.domain.repositories.order_status_repository import (
+    OrderStatusRepository,
+)
+from src.infrastructure.metrics.metrics_registry import registry
+from src.infrastructure.metrics.request_metrics import (
+    outbound_call_trace_config,
+)
+from src.infrastructure.tracing.http_client import client_trace_config
 
 logger = logging.getLogger("app")
 
+INACTIVE_ORDER_STATUSES = ["canceled", "deleted"]
+
 
 class OrderVerificationService:
+    # Answers from the local order-status read model and only asks the
+    # orders service for orders no event has been received for yet.
+    def __init__(
+        self, order_status_repository: Optional[OrderStatusRepository] = None
+    ):
+        self.order_status_repository = order_status_repository
+        self.verifications = registry.counter(
+            "order_verifications_total",
+            "Order verifications by where the status was read from.",
+            ["source"],
+        )
+
     async def verify_order(self, order_id: int) -> bool:
-        async with aiohttp.ClientSession() as session:
+        status = self._get_local_status(order_id)
+        if status is not None:
+            self.verifications.inc(source="read_model")
+            return status not in INACTIVE_ORDER_STATUSES
+
+        self.verifications.inc(source="http")
+        async with aiohttp.ClientSession(
+            trace_configs=[client_trace_config(), outbound_call_trace_config()]
+        ) as session:
             try:
                 url = f"{Config.ORDER_SERVICE_BASE_URL}/orders/{order_id}"
                 logger.info(f"Verifying order: {url}")
                 async with session.get(url) as response:
                     if response.status == 200:
                         order = await response.json()
-                        if order["status"] not in ["canceled"]:
+                        self._save_local_status(order_id, order["status"])
+                        if order["status"] not in INACTIVE_ORDER_STATUSES:
                             return True
             except Exception as e:
                 logger.error(f"Error verifying order {order_id}: {e}")
             return False
+
+    def _get_local_status(self, order_id: int) -> Optional[str]:
+        if self.order_status_repository is None:
+            return None
+        try:
+            return self.order_status_repository.get_status(order_id)
+        except Exception as e:
+            logger.error(f"Error reading status of order {order_id}: {e}")
+            return None
+
+    def _save_local_status(self, order_id: int, status: str):
+        if self.order_status_repository is None:
+            return
+        try:
+            self.order_status_repository.save_status(
+                order_id, status, replace=False
+            )
+        except Exception as e:
+            logger.error(f"Error saving status of order {order_id}: {e}")
@@ -9,3 +9,61 @@ class Config:
     DATABASE_NAME = os.getenv("DATABASE_NAME")
     DATABASE_USER = os.getenv("DATABASE_USER")
     DATABASE_PASSWORD = os.getenv("DATABASE_PASSWORD")
+    MESSAGE_LEDGER_TTL = int(os.getenv("MESSAGE_LEDGER_TTL", 86400))
+    MESSAGE_LEDGER_EVICTION_INTERVAL = int(
+        os.getenv("MESSAGE_LEDGER_EVICTION_INTERVAL", 300)
+    )
+    MESSAGE_RETRY_DELAYS = [
+        int(delay)
+        for delay in os.getenv(
+            "MESSAGE_RETRY_DELAYS", "1000,5000,25000,125000"
+        ).split(",")
+    ]
+    MESSAGE_MAX_ATTEMPTS = int(os.getenv("MESSAGE_MAX_ATTEMPTS", 5))
+    QUEUE_DEPTH_SAMPLE_INTERVAL = float(
+        os.getenv("QUEUE_DEPTH_SAMPLE_INTERVAL", 15)
+    )
+    PUBLISH_BUFFER_SIZE = int(os.getenv("PUBLISH_BUFFER_SIZE", 1000))
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+        os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 3)
+    )
+    CIRCUIT_BREAKER_RESET_TIMEOUT = float(
+        os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", 30)
+    )
+    HEALTH_CHECK_INTERVAL = float(os.getenv("HEALTH_CHECK_INTERVAL", 10))
+    HEALTH_CHECK_TIMEOUT = float(os.getenv("HEALTH_CHECK_TIMEOUT", 2))
+    COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+    COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", 6))
+    COMPRESSION_CONTENT_TYPES = [
+        content_type.strip()
+        for content_type in os.getenv(
+            "COMPRESSION_CONTENT_TYPES",
+            "application/json,text/plain,text/html,text/csv",
+        ).split(",")
+    ]
+    COMPRESSION_BROTLI_ENABLED = (
+        os.getenv("COMPRESSION_BROTLI_ENABLED", "true").lower() == "true"
+    )
+    COMPRESSION_BROTLI_QUALITY = int(
+        os.getenv("COMPRESSION_BROTLI_QUALITY", 4)
+    )
+    TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "delivery")
+    # none, console, file or otlp (OTLP/HTTP JSON)
+    TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none")
+    TRACING_FILE_PATH = os.getenv("TRACING_FILE_PATH", "traces.jsonl")
+    TRACING_OTLP_ENDPOINT = os.getenv(
+        "TRACING_OTLP_ENDPOINT", "http://otel-collector:4318/v1/traces"
+    )
+    TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", 1.0))
+    TRACING_BATCH_SIZE = int(os.getenv("TRACING_BATCH_SIZE", 512))
+    TRACING_EXPORT_INTERVAL = float(os.getenv("TRACING_EXPORT_INTERVAL", 5))
+    TRACING_QUEUE_SIZE = int(os.getenv("TRACING_QUEUE_SIZE", 2048))
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 100))
+    # Share of statements under the threshold that feed the stats
+    SLOW_QUERY_SAMPLE_RATIO = float(os.getenv("SLOW_QUERY_SAMPLE_RATIO", 0.1))
+    SLOW_QUERY_MAX_FINGERPRINTS = int(
+        os.getenv("SLOW_QUERY_MAX_FINGERPRINTS", 500)
+    )
+    DEBUG_ENDPOINTS_ENABLED = (
+        os.getenv("DEBUG_ENDPOINTS_ENABLED", "false").lower() == "true"
+    )
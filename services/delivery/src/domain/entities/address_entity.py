@@ -4,6 +4,13 @@ from src.domain.exceptions import InvalidEntity
 
 
 class AddressEntity:
+    __slots__ = (
+        "_city",
+        "_state",
+        "_country",
+        "_zip_code",
+        "_id",
+    )
 
     def __init__(
         self,
@@ -19,6 +26,23 @@ class AddressEntity:
         self.country = country
         self.zip_code = zip_code
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        city: str,
+        state: str,
+        country: str,
+        zip_code: str,
+        id: Optional[int] = None,
+    ) -> "AddressEntity":
+        entity = cls.__new__(cls)
+        entity._city = city
+        entity._state = state
+        entity._country = country
+        entity._zip_code = zip_code
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
@@ -5,6 +5,12 @@ from src.domain.exceptions import InvalidEntity
 
 
 class CustomerEntity:
+    __slots__ = (
+        "_name",
+        "_email",
+        "_phone_number",
+        "_id",
+    )
 
     def __init__(
         self,
@@ -18,6 +24,21 @@ class CustomerEntity:
         self.email = email
         self.phone_number = phone_number
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        name: str,
+        email: str,
+        phone_number: Optional[str] = None,
+        id: Optional[int] = None,
+    ) -> "CustomerEntity":
+        entity = cls.__new__(cls)
+        entity._name = name
+        entity._email = email
+        entity._phone_number = phone_number
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
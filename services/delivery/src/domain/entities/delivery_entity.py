@@ -15,6 +15,16 @@ class DeliveryStatus(str, Enum):
 
 
 class DeliveryEntity:
+    __slots__ = (
+        "_order_id",
+        "_delivery_address",
+        "_delivery_date",
+        "_status",
+        "_customer",
+        "_address",
+        "_id",
+    )
+
     def __init__(
         self,
         order_id: int,
@@ -33,6 +43,28 @@ class DeliveryEntity:
         self.customer = customer
         self.address = address
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        order_id: int,
+        delivery_address: str,
+        delivery_date: str,
+        status: DeliveryStatus,
+        customer: CustomerEntity,
+        address: AddressEntity,
+        id: Optional[int] = None,
+    ) -> "DeliveryEntity":
+        # Skips validation; only for rows loaded from the database
+        entity = cls.__new__(cls)
+        entity._order_id = order_id
+        entity._delivery_address = delivery_address
+        entity._delivery_date = delivery_date
+        entity._status = status
+        entity._customer = customer
+        entity._address = address
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+
+
+class OrderStatusRepository(ABC):
+    @abstractmethod
+    def get_status(self, order_id: int) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_status(
+        self,
+        order_id: int,
+        status: str,
+        replace: bool = True,
+        occurred_at: Optional[datetime] = None,
+    ):
+        raise NotImplementedError
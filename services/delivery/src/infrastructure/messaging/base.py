@@ -0,0 +1,231 @@
+import logging
+import queue
+import socket
+import threading
+import time
+from typing import Optional, Tuple
+
+import pika
+from src.config import Config
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+from src.infrastructure.metrics.metrics_registry import registry
+from src.infrastructure.tracing.tracer import (
+    Span,
+    SpanKind,
+    StatusCode,
+    inject_message_properties,
+    tracer,
+)
+
+logger = logging.getLogger("app")
+
+OutgoingMessage = Tuple[str, str, Optional[pika.BasicProperties], Span]
+PUBLISH_ERRORS = (pika.exceptions.AMQPError, socket.gaierror, OSError)
+
+
+class BaseMessagingAdapter:
+    # Connections are opened lazily: consumers connect from their own
+    # thread in start_consuming, publishers hand messages to a background
+    # thread so callers never wait on the broker.
+    def __init__(
+        self,
+        connection_params,
+        max_retries=5,
+        delay=5,
+        buffer_size: Optional[int] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.connection_params = connection_params
+        self.max_retries = max_retries
+        self.delay = delay
+        self.connection = None
+        self.channel = None
+        self.exchange_name = None  # Set in derived classes
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._buffer: "queue.Queue[OutgoingMessage]" = queue.Queue(
+            maxsize=buffer_size or Config.PUBLISH_BUFFER_SIZE
+        )
+        self._in_flight: Optional[OutgoingMessage] = None
+        self._publish_connection = None
+        self._publish_channel = None
+        self._publisher_thread: Optional[threading.Thread] = None
+        self._publisher_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self.dropped_messages = registry.counter(
+            "messaging_publish_dropped_total",
+            "Outgoing messages dropped because the local buffer was full.",
+            ["exchange"],
+        )
+
+    def connect(self):
+        attempts = 0
+        while attempts < self.max_retries:
+            try:
+                self.connection = pika.BlockingConnection(
+                    self.connection_params
+                )
+                self.channel = self.connection.channel()
+                return
+            except (pika.exceptions.AMQPConnectionError, socket.gaierror) as e:
+                attempts += 1
+                logger.error(
+                    f"Attempt {attempts}/{self.max_retries} failed: {str(e)}"
+                )
+                time.sleep(self.delay)
+
+        logger.error("Max retries exceeded. Could not connect to RabbitMQ.")
+        raise pika.exceptions.AMQPConnectionError(
+            "Failed to connect to RabbitMQ after multiple attempts."
+        )
+
+    def ensure_connected(self):
+        if self.channel is None:
+            self.connect()
+
+    def publish(
+        self,
+        routing_key: str,
+        body: str,
+        properties: Optional[pika.BasicProperties] = None,
+    ) -> bool:
+        # The span travels with the message and is ended by the publisher
+        # thread once the broker has it, or when the message is dropped
+        span = tracer.start_span(
+            f"{self.exchange_name} publish",
+            SpanKind.PRODUCER,
+            {
+                "messaging.system": "rabbitmq",
+                "messaging.operation": "publish",
+                "messaging.destination.name": self.exchange_name,
+                "messaging.rabbitmq.destination.routing_key": routing_key,
+            },
+        )
+        properties = inject_message_properties(properties, span)
+        try:
+            self._buffer.put_nowait((routing_key, body, properties, span))
+        except queue.Full:
+            self.dropped_messages.inc(exchange=self.exchange_name)
+            logger.error(
+                f"Publish buffer full, dropping message to {routing_key}: "
+                f"{body}"
+            )
+            span.set_status(StatusCode.ERROR, "publish buffer full")
+            span.end()
+            return False
+        self._start_publisher()
+        return True
+
+    def _start_publisher(self):
+        with self._publisher_lock:
+            if (
+                self._publisher_thread is not None
+                and self._publisher_thread.is_alive()
+            ):
+                return
+            self._stopped.clear()
+            self._publisher_thread = threading.Thread(
+                target=self._run_publisher,
+                name=f"{type(self).__name__}-publisher",
+                daemon=True,
+            )
+            self._publisher_thread.start()
+
+    def _run_publisher(self):
+        while not self._stopped.is_set():
+            if self._in_flight is None:
+                try:
+                    self._in_flight = self._buffer.get(timeout=1)
+                except queue.Empty:
+                    self._process_publisher_events()
+                    continue
+            routing_key, body, properties, span = self._in_flight
+            if not self.circuit_breaker.allow_request():
+                span.add_event("circuit breaker open")
+                self._stopped.wait(self.circuit_breaker.retry_after())
+                continue
+            try:
+                self._publish_now(routing_key, body, properties)
+            except PUBLISH_ERRORS as e:
+                logger.error(f"Failed to publish to {routing_key}: {e}")
+                span.record_exception(e, set_status=False)
+                self.circuit_breaker.record_failure()
+                self._close_publish_connection()
+            else:
+                self.circuit_breaker.record_success()
+                self._in_flight = None
+                span.end()
+
+    def _publish_now(
+        self,
+        routing_key: str,
+        body: str,
+        properties: Optional[pika.BasicProperties],
+    ):
+        if self._publish_channel is None or self._publish_channel.is_closed:
+            self._publish_connection = pika.BlockingConnection(
+                self.connection_params
+            )
+            self._publish_channel = self._publish_connection.channel()
+        self._publish_channel.basic_publish(
+            exchange=self.exchange_name,
+            routing_key=routing_key,
+            body=body,
+            properties=properties,
+        )
+
+    def _process_publisher_events(self):
+        # Keeps heartbeats flowing on an idle publisher connection
+        if self._publish_connection is None:
+            return
+        try:
+            self._publish_connection.process_data_events(time_limit=0)
+        except PUBLISH_ERRORS as e:
+            logger.error(f"Publisher connection lost: {e}")
+            self._close_publish_connection()
+
+    def _close_publish_connection(self):
+        connection = self._publish_connection
+        self._publish_connection = None
+        self._publish_channel = None
+        if connection is not None and connection.is_open:
+            try:
+                connection.close()
+            except PUBLISH_ERRORS:
+                pass
+
+    def pending_messages(self) -> int:
+        return self._buffer.qsize() + (self._in_flight is not None)
+
+    def close(self, timeout: float = 5.0):
+        deadline = time.monotonic() + timeout
+        while self.pending_messages() and time.monotonic() < deadline:
+            if not self.circuit_breaker.allow_request():
+                break
+            time.sleep(0.05)
+        if self.pending_messages():
+            logger.warning(
+                f"Closing publisher with {self.pending_messages()} "
+                "unpublished messages."
+            )
+        self._stopped.set()
+        if self._publisher_thread is not None:
+            self._publisher_thread.join()
+        self._close_publish_connection()
+        self._end_unsent_spans()
+
+    def _end_unsent_spans(self):
+        with self._buffer.mutex:
+            unsent = list(self._buffer.queue)
+        if self._in_flight is not None:
+            unsent.append(self._in_flight)
+        for *_, span in unsent:
+            span.set_status(StatusCode.ERROR, "publisher closed")
+            span.end()
+
+    def schedule_queue_sampling(self, on_message):
+        # on_message must be decorated with @instrument_consumer
+        metrics = getattr(on_message, "consumer_metrics", None)
+        connection = getattr(self, "connection", None)
+        if metrics is None or connection is None:
+            return
+        metrics.schedule_sampling(connection, self.channel)
@@ -0,0 +1,98 @@
+import json
+import logging
+from datetime import datetime
+from typing import Optional
+
+import pika
+from src.config import Config
+from src.domain.repositories.order_status_repository import (
+    OrderStatusRepository,
+)
+from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.consumer_metrics import instrument_consumer
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.retry_topology import RetryTopology
+from src.infrastructure.tracing.tracer import traced_consumer
+
+logger = logging.getLogger("app")
+
+
+class OrderStatusSubscriber(BaseMessagingAdapter):
+    # Keeps the order-status read model up to date from order events.
+    # Delivery gets its own queue bound to orders_exchange so payments
+    # still receives every order event on orders_queue.
+    queue_name = "delivery_orders_queue"
+
+    def __init__(
+        self,
+        order_status_repository: OrderStatusRepository,
+        max_retries=5,
+        delay=5,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        retry_topology: Optional[RetryTopology] = None,
+    ):
+        self.order_status_repository = order_status_repository
+        self.deduplicator = deduplicator
+        self.retry_topology = retry_topology or RetryTopology(self.queue_name)
+        connection_params = pika.ConnectionParameters(
+            host=Config.BROKER_HOST, heartbeat=120
+        )
+        super().__init__(connection_params, max_retries, delay)
+
+    def start_consuming(self):
+        self.ensure_connected()
+        self.channel.exchange_declare(
+            exchange="orders_exchange", exchange_type="topic", durable=True
+        )
+        self.channel.queue_declare(queue=self.queue_name, durable=True)
+        self.channel.queue_bind(
+            exchange="orders_exchange",
+            queue=self.queue_name,
+            routing_key="orders_queue",
+        )
+        self.retry_topology.declare(self.channel)
+
+        self.channel.basic_consume(
+            queue=self.queue_name,
+            on_message_callback=self.on_message,
+            auto_ack=False,
+        )
+
+        logger.info(f"Starting to consume messages from {self.queue_name}.")
+        self.schedule_queue_sampling(self.on_message)
+        self.channel.start_consuming()
+
+    @instrument_consumer("delivery_orders_queue")
+    @traced_consumer("delivery_orders_queue")
+    def on_message(self, ch, method, properties, body):
+        logger.info(f"Received message from {self.queue_name}: {body}")
+        if self.deduplicator and self.deduplicator.is_duplicate(properties):
+            logger.info(
+                f"Skipping duplicate message {properties.message_id} "
+                f"from {self.queue_name}."
+            )
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
+        try:
+            data = json.loads(body.decode("utf-8"))
+            occurred_at = data.get("occurred_at")
+            self.order_status_repository.save_status(
+                data["order_id"],
+                data["status"],
+                occurred_at=(
+                    datetime.fromisoformat(occurred_at)
+                    if occurred_at
+                    else None
+                ),
+            )
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
+        finally:
+            ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -0,0 +1,121 @@
+import logging
+from typing import List, Optional
+
+import pika
+
+from src.config import Config
+from src.infrastructure.metrics.metrics_registry import registry
+
+logger = logging.getLogger("app")
+
+ATTEMPTS_HEADER = "x-attempts"
+LAST_ERROR_HEADER = "x-last-error"
+
+
+class RetryTopology:
+    # Failed messages are parked in per-tier delay queues whose TTL
+    # dead-letters them back onto the work queue, so retries back off
+    # instead of spinning in a redelivery loop.
+    def __init__(
+        self,
+        queue: str,
+        delays: Optional[List[int]] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        self.queue = queue
+        self.delays = delays or Config.MESSAGE_RETRY_DELAYS
+        self.max_attempts = max_attempts or Config.MESSAGE_MAX_ATTEMPTS
+        self.retries = registry.counter(
+            "messaging_message_retries_total",
+            "Failed messages sent to a delay queue or the dead-letter queue.",
+            ["queue", "outcome"],
+        )
+
+    @property
+    def dead_letter_queue(self) -> str:
+        return f"{self.queue}.dlq"
+
+    def delay_queue(self, delay: int) -> str:
+        return f"{self.queue}.retry.{delay}ms"
+
+    def declare(self, channel):
+        for delay in self.delays:
+            channel.queue_declare(
+                queue=self.delay_queue(delay),
+                durable=True,
+                arguments={
+                    "x-message-ttl": delay,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue,
+                },
+            )
+        channel.queue_declare(queue=self.dead_letter_queue, durable=True)
+
+    @staticmethod
+    def get_headers(properties) -> dict:
+        headers = getattr(properties, "headers", None)
+        return dict(headers) if isinstance(headers, dict) else {}
+
+    @classmethod
+    def get_attempts(cls, properties) -> int:
+        return int(cls.get_headers(properties).get(ATTEMPTS_HEADER, 0))
+
+    def retry(self, channel, properties, body, error: Exception):
+        attempts = self.get_attempts(properties) + 1
+        headers = self.get_headers(properties)
+        headers[ATTEMPTS_HEADER] = attempts
+        headers[LAST_ERROR_HEADER] = str(error)[:255]
+        republished = pika.BasicProperties(
+            message_id=getattr(properties, "message_id", None),
+            delivery_mode=pika.DeliveryMode.Persistent,
+            headers=headers,
+        )
+
+        if attempts >= self.max_attempts:
+            routing_key = self.dead_letter_queue
+            self.retries.inc(queue=self.queue, outcome="dead_letter")
+            logger.error(
+                f"Message failed {attempts} times, moving to {routing_key}."
+            )
+        else:
+            delay = self.delays[min(attempts, len(self.delays)) - 1]
+            routing_key = self.delay_queue(delay)
+            self.retries.inc(queue=self.queue, outcome="retry")
+            logger.warning(
+                f"Message failed (attempt {attempts}/{self.max_attempts}), "
+                f"retrying in {delay}ms."
+            )
+        channel.basic_publish(
+            exchange="",
+            routing_key=routing_key,
+            body=body,
+            properties=republished,
+        )
+
+    def replay_dead_letters(self, channel, limit: Optional[int] = None) -> int:
+        replayed = 0
+        while limit is None or replayed < limit:
+            method, properties, body = channel.basic_get(
+                queue=self.dead_letter_queue
+            )
+            if method is None:
+                break
+            headers = self.get_headers(properties)
+            headers.pop(ATTEMPTS_HEADER, None)
+            headers.pop(LAST_ERROR_HEADER, None)
+            channel.basic_publish(
+                exchange="",
+                routing_key=self.queue,
+                body=body,
+                properties=pika.BasicProperties(
+                    message_id=getattr(properties, "message_id", None),
+                    delivery_mode=pika.DeliveryMode.Persistent,
+                    headers=headers,
+                ),
+            )
+            channel.basic_ack(delivery_tag=method.delivery_tag)
+            replayed += 1
+        logger.info(
+            f"Replayed {replayed} messages from {self.dead_letter_queue}."
+        )
+        return replayed
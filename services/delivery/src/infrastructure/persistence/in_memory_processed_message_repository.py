@@ -0,0 +1,46 @@
+import threading
+from datetime import datetime
+from typing import Dict, Set
+
+from src.domain.repositories.processed_message_repository import (
+    ProcessedMessageRepository,
+)
+
+
+class InMemoryProcessedMessageRepository(ProcessedMessageRepository):
+    def __init__(self):
+        self._processed_at: Dict[str, datetime] = {}
+        self._staged: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def exists(self, message_id: str) -> bool:
+        return message_id in self._processed_at
+
+    def add(self, message_id: str) -> bool:
+        with self._lock:
+            if message_id in self._processed_at or message_id in self._staged:
+                return False
+            self._staged.add(message_id)
+            return True
+
+    def commit(self):
+        with self._lock:
+            now = datetime.utcnow()
+            for message_id in self._staged:
+                self._processed_at.setdefault(message_id, now)
+            self._staged.clear()
+
+    def rollback(self):
+        with self._lock:
+            self._staged.clear()
+
+    def delete_older_than(self, cutoff: datetime) -> int:
+        with self._lock:
+            expired = [
+                message_id
+                for message_id, processed_at in self._processed_at.items()
+                if processed_at < cutoff
+            ]
+            for message_id in expired:
+                del self._processed_at[message_id]
+        return len(expired)
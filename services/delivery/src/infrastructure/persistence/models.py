@@ -1,4 +1,6 @@
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 from src.domain.entities.delivery_entity import DeliveryStatus
 from src.infrastructure.persistence.db_setup import Base
@@ -13,9 +15,16 @@ class DeliveryModel(Base):
     status = Column(Enum(DeliveryStatus), default=DeliveryStatus.PENDING)
     customer_id = Column(Integer, ForeignKey("customers.id"))
     address_id = Column(Integer, ForeignKey("addresses.id"))
-    customer = relationship("CustomerModel", back_populates="deliveries")
+    # Eager so listing deliveries costs a fixed number of queries, not
+    # two more per row
+    customer = relationship(
+        "CustomerModel", back_populates="deliveries", lazy="selectin"
+    )
     address = relationship(
-        "AddressModel", uselist=False, back_populates="delivery"
+        "AddressModel",
+        uselist=False,
+        back_populates="delivery",
+        lazy="selectin",
     )
 
 
@@ -40,3 +49,17 @@ class AddressModel(Base):
     delivery = relationship(
         "DeliveryModel", uselist=False, back_populates="address"
     )
+
+
+class OrderStatusModel(Base):
+    # Local read model of order statuses, fed by orders_exchange events
+    __tablename__ = "order_statuses"
+    order_id = Column(Integer, primary_key=True)
+    status = Column(String, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class ProcessedMessageModel(Base):
+    __tablename__ = "processed_messages"
+    message_id = Column(String(64), primary_key=True)
+    processed_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -4,8 +4,10 @@ from sqlalchemy.orm import Session
 from src.domain.entities.customer_entity import CustomerEntity
 from src.domain.repositories.customer_repository import CustomerRepository
 from src.infrastructure.persistence.models import CustomerModel
+from src.infrastructure.tracing.tracer import traced_repository
 
 
+@traced_repository("postgresql")
 class SQLAlchemyCustomerRepository(CustomerRepository):
     def __init__(self, db: Session):
         self.db = db
@@ -40,7 +42,7 @@ class SQLAlchemyCustomerRepository(CustomerRepository):
             .first()
         )
         if db_customer:
-            return CustomerEntity(
+            return CustomerEntity.from_trusted_row(
                 id=db_customer.id,
                 name=db_customer.name,
                 email=db_customer.email,
@@ -55,7 +57,7 @@ class SQLAlchemyCustomerRepository(CustomerRepository):
             .all()
         )
         return [
-            CustomerEntity(
+            CustomerEntity.from_trusted_row(
                 id=db_customer.id,
                 name=db_customer.name,
                 email=db_customer.email,
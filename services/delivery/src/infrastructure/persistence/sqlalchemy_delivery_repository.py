@@ -10,8 +10,10 @@ from src.infrastructure.persistence.models import (
     CustomerModel,
     DeliveryModel,
 )
+from src.infrastructure.tracing.tracer import traced_repository
 
 
+@traced_repository("postgresql")
 class SQLAlchemyDeliveryRepository(DeliveryRepository):
     def __init__(self, db: Session):
         self.db = db
@@ -75,19 +77,19 @@ class SQLAlchemyDeliveryRepository(DeliveryRepository):
             .first()
         )
         if db_delivery:
-            return DeliveryEntity(
+            return DeliveryEntity.from_trusted_row(
                 id=db_delivery.id,
                 order_id=db_delivery.order_id,
                 delivery_address=db_delivery.delivery_address,
                 delivery_date=db_delivery.delivery_date,
                 status=db_delivery.status,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=db_delivery.customer.id,
                     name=db_delivery.customer.name,
                     email=db_delivery.customer.email,
                     phone_number=db_delivery.customer.phone_number,
                 ),
-                address=AddressEntity(
+                address=AddressEntity.from_trusted_row(
                     id=db_delivery.address.id,
                     city=db_delivery.address.city,
                     state=db_delivery.address.state,
@@ -104,19 +106,19 @@ class SQLAlchemyDeliveryRepository(DeliveryRepository):
             .first()
         )
         if db_delivery:
-            return DeliveryEntity(
+            return DeliveryEntity.from_trusted_row(
                 id=db_delivery.id,
                 order_id=db_delivery.order_id,
                 delivery_address=db_delivery.delivery_address,
                 delivery_date=db_delivery.delivery_date,
                 status=db_delivery.status,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=db_delivery.customer.id,
                     name=db_delivery.customer.name,
                     email=db_delivery.customer.email,
                     phone_number=db_delivery.customer.phone_number,
                 ),
-                address=AddressEntity(
+                address=AddressEntity.from_trusted_row(
                     id=db_delivery.address.id,
                     city=db_delivery.address.city,
                     state=db_delivery.address.state,
@@ -140,19 +142,19 @@ class SQLAlchemyDeliveryRepository(DeliveryRepository):
     def list_all(self) -> List[DeliveryEntity]:
         db_deliveries = self.db.query(DeliveryModel).all()
         return [
-            DeliveryEntity(
+            DeliveryEntity.from_trusted_row(
                 id=db_delivery.id,
                 order_id=db_delivery.order_id,
                 delivery_address=db_delivery.delivery_address,
                 delivery_date=db_delivery.delivery_date,
                 status=db_delivery.status,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=db_delivery.customer.id,
                     name=db_delivery.customer.name,
                     email=db_delivery.customer.email,
                     phone_number=db_delivery.customer.phone_number,
                 ),
-                address=AddressEntity(
+                address=AddressEntity.from_trusted_row(
                     id=db_delivery.address.id,
                     city=db_delivery.address.city,
                     state=db_delivery.address.state,
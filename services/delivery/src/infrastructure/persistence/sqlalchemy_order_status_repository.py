@@ -0,0 +1,70 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.domain.repositories.order_status_repository import (
+    OrderStatusRepository,
+)
+from src.infrastructure.persistence.models import OrderStatusModel
+from src.infrastructure.tracing.tracer import traced_repository
+
+# Statuses fetched over HTTP carry no event time; stored as the oldest
+# possible version, any event replaces them
+UNVERSIONED = datetime(1970, 1, 1)
+
+
+@traced_repository("postgresql")
+class SQLAlchemyOrderStatusRepository(OrderStatusRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_status(self, order_id: int) -> Optional[str]:
+        return (
+            self.db.query(OrderStatusModel.status)
+            .filter(OrderStatusModel.order_id == order_id)
+            .scalar()
+        )
+
+    def save_status(
+        self,
+        order_id: int,
+        status: str,
+        replace: bool = True,
+        occurred_at: Optional[datetime] = None,
+    ):
+        # replace=False only fills gaps, so a status fetched over HTTP never
+        # overwrites a newer one that arrived as an event meanwhile.
+        # Retries and the outbox relay can reorder events, so one with an
+        # occurred_at only replaces a status from an older event.
+        if occurred_at is None:
+            occurred_at = datetime.utcnow() if replace else UNVERSIONED
+        try:
+            db_status = self.db.get(OrderStatusModel, order_id)
+            if db_status is None:
+                self.db.add(
+                    OrderStatusModel(
+                        order_id=order_id,
+                        status=status,
+                        updated_at=occurred_at,
+                    )
+                )
+            elif replace:
+                # Conditional, so a newer status committed meanwhile wins
+                self.db.query(OrderStatusModel).filter(
+                    OrderStatusModel.order_id == order_id,
+                    OrderStatusModel.updated_at < occurred_at,
+                ).update(
+                    {"status": status, "updated_at": occurred_at},
+                    synchronize_session=False,
+                )
+            else:
+                return
+            self.db.commit()
+        except IntegrityError:
+            self.db.rollback()
+            if replace:
+                raise
+        except Exception:
+            self.db.rollback()
+            raise
@@ -0,0 +1,39 @@
+import aiohttp
+from src.infrastructure.tracing.tracer import (
+    TRACEPARENT,
+    SpanKind,
+    StatusCode,
+    tracer,
+)
+
+
+async def _on_request_start(session, context, params):
+    context.span = tracer.start_span(
+        f"HTTP {params.method}",
+        SpanKind.CLIENT,
+        {"http.request.method": params.method, "url.full": str(params.url)},
+    )
+    params.headers[TRACEPARENT] = context.span.context.to_traceparent()
+
+
+async def _on_request_end(session, context, params):
+    status = params.response.status
+    context.span.set_attribute("http.response.status_code", status)
+    if status >= 500:
+        context.span.set_status(StatusCode.ERROR)
+    context.span.end()
+
+
+async def _on_request_exception(session, context, params):
+    context.span.record_exception(params.exception)
+    context.span.end()
+
+
+def client_trace_config() -> aiohttp.TraceConfig:
+    # Pass to aiohttp.ClientSession(trace_configs=[...]): every request
+    # gets a CLIENT span and carries it to the server in traceparent
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_exception)
+    return trace_config
@@ -0,0 +1,41 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.api import debug_api
+from src.infrastructure.persistence.slow_query_log import slow_query_log
+
+
+class TestDebugAPI(unittest.TestCase):
+    def setUp(self):
+        app = FastAPI()
+        app.include_router(debug_api.router)
+        self.client = TestClient(app)
+        slow_query_log.reset()
+
+    def tearDown(self):
+        slow_query_log.reset()
+
+    def test_reset_clears_stats(self):
+        # Arrange
+        slow_query_log.record("SELECT * FROM deliveries", 500)
+
+        # Act
+        response = self.client.delete("/debug/queries")
+
+        # Assert
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(
+            self.client.get("/debug/queries").json()["queries"], []
+        )
+
+    def test_unknown_sort_key_is_rejected(self):
+        # Act
+        response = self.client.get("/debug/queries", params={"sort": "nope"})
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import Response
+from src.adapters.api.health_api import (
+    health_check,
+    liveness_check,
+    readiness_check,
+)
+from src.infrastructure.health.health_monitor import HealthMonitor
+
+
+class TestHealthAPI(unittest.TestCase):
+    def setUp(self):
+        self.health_monitor = MagicMock(spec=HealthMonitor)
+        self.health_monitor.get_health_status.return_value = {
+            "database": "healthy",
+            "rabbitmq": "unhealthy",
+        }
+
+    def test_health_check(self):
+        # Act
+        result = health_check(health_monitor=self.health_monitor)
+
+        # Assert
+        self.assertEqual(result["rabbitmq"], "unhealthy")
+        self.health_monitor.get_health_status.assert_called_once()
+
+    def test_liveness_check(self):
+        # Act
+        result = liveness_check()
+
+        # Assert
+        self.assertEqual(result, {"status": "alive"})
+
+    def test_readiness_check_not_ready(self):
+        # Arrange
+        self.health_monitor.is_ready.return_value = False
+        response = Response()
+
+        # Act
+        readiness_check(response, health_monitor=self.health_monitor)
+
+        # Assert
+        self.assertEqual(response.status_code, 503)
+
+
+if __name__ == "__main__":
+    unittest.main()
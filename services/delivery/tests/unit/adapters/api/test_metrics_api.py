@@ -0,0 +1,21 @@
+import unittest
+
+from src.adapters.api.metrics_api import metrics
+from src.infrastructure.metrics.metrics_registry import CONTENT_TYPE, registry
+
+
+class TestMetricsAPI(unittest.TestCase):
+    def test_metrics(self):
+        # Arrange
+        registry.counter("test_metrics_api_total", "Test counter.").inc()
+
+        # Act
+        response = metrics()
+
+        # Assert
+        self.assertEqual(response.media_type, CONTENT_TYPE)
+        self.assertIn(b"test_metrics_api_total 1", response.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.adapters.api import delivery_api
+from src.adapters.dependencies import get_delivery_publisher
+from src.domain.entities.delivery_entity import DeliveryStatus
+from src.infrastructure.persistence.db_setup import Base, get_db
+from src.infrastructure.persistence.models import (
+    AddressModel,
+    CustomerModel,
+    DeliveryModel,
+)
+from src.infrastructure.persistence.query_counter import assert_max_queries
+
+# The deliveries, their customers and their addresses
+LIST_DELIVERIES_BUDGET = 3
+
+
+class TestQueryBudget(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        app = FastAPI()
+        app.include_router(delivery_api.router)
+        app.dependency_overrides[get_db] = lambda: self.db
+        app.dependency_overrides[get_delivery_publisher] = lambda: MagicMock()
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def seed_deliveries(self, count):
+        for index in range(count):
+            self.db.add(
+                DeliveryModel(
+                    order_id=index,
+                    delivery_address="123 Main St",
+                    delivery_date="2024-08-01",
+                    status=DeliveryStatus.PENDING,
+                    customer=CustomerModel(
+                        name=f"Customer {index}",
+                        email=f"customer{index}@example.com",
+                    ),
+                    address=AddressModel(
+                        city="City",
+                        state="State",
+                        country="Country",
+                        zip_code="12345",
+                    ),
+                )
+            )
+        self.db.commit()
+        self.db.expunge_all()
+
+    def assert_list_within_budget(self, deliveries):
+        # Arrange
+        self.seed_deliveries(deliveries)
+
+        # Act
+        with assert_max_queries(self.engine, LIST_DELIVERIES_BUDGET):
+            response = self.client.get("/deliveries/")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), deliveries)
+
+    def test_list_single_delivery_stays_within_query_budget(self):
+        self.assert_list_within_budget(1)
+
+    def test_list_many_deliveries_stays_within_query_budget(self):
+        self.assert_list_within_budget(20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+
+LARGE_BODY = {
+    "deliveries": [{"id": i, "status": "pending"} for i in range(200)]
+}
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    def setUp(self):
+        app = FastAPI()
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=500,
+            content_types=["application/json"],
+            brotli_enabled=False,
+        )
+        app.get("/large")(lambda: LARGE_BODY)
+        app.get("/small")(lambda: {"status": "ok"})
+        app.get("/text")(lambda: PlainTextResponse("x" * 2000))
+        self.client = TestClient(app)
+
+    def test_large_json_is_gzipped(self):
+        # Act
+        response = self.client.get(
+            "/large", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        self.assertEqual(response.headers["content-encoding"], "gzip")
+        self.assertEqual(response.json(), LARGE_BODY)
+
+    def test_small_body_is_not_compressed(self):
+        # Act
+        response = self.client.get(
+            "/small", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        self.assertNotIn("content-encoding", response.headers)
+
+    def test_content_type_outside_allowlist_is_not_compressed(self):
+        # Act
+        response = self.client.get(
+            "/text", headers={"Accept-Encoding": "gzip"}
+        )
+
+        # Assert
+        self.assertNotIn("content-encoding", response.headers)
+
+    def test_skipped_response_creates_no_compressor(self):
+        for path in ("/small", "/text"):
+            with self.subTest(path=path):
+                # Act
+                with patch(
+                    "src.adapters.middleware.compression_middleware"
+                    "._GzipCompressor"
+                ) as mock_compressor:
+                    self.client.get(path, headers={"Accept-Encoding": "gzip"})
+
+                # Assert
+                mock_compressor.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+from src.infrastructure.metrics.request_metrics import (
+    current_stats,
+    record_query,
+)
+
+
+class TestMetricsMiddleware(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware, metrics=self.metrics)
+
+        @app.post("/deliveries/{order_id}")
+        async def create_delivery(order_id: int):
+            current_stats().add_outbound_call()
+            record_query(0.05)
+            return {"order_id": order_id}
+
+        @app.get("/health/live")
+        def live():
+            return {"status": "ok"}
+
+        self.client = TestClient(app)
+
+    def test_request_records_route_queries_and_outbound_calls(self):
+        # Act
+        self.client.post("/deliveries/1")
+
+        # Assert
+        rendered = self.metrics.render()
+        labels = 'method="POST",route="/deliveries/{order_id}"'
+        self.assertIn(
+            f'http_requests_total{{{labels},status="200"}} 1', rendered
+        )
+        self.assertIn(f"http_request_db_queries_sum{{{labels}}} 1", rendered)
+        self.assertIn(
+            f"http_request_outbound_calls_sum{{{labels}}} 1", rendered
+        )
+
+    def test_probe_endpoints_are_not_recorded(self):
+        # Act
+        self.client.get("/health/live")
+
+        # Assert
+        self.assertNotIn("http_requests_total{", self.metrics.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
+from src.infrastructure.tracing.tracer import TRACEPARENT, SpanKind, tracer
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+class TestTracingMiddleware(unittest.TestCase):
+    def setUp(self):
+        self.collector = _Collector()
+        tracer.start(self.collector)
+        app = FastAPI()
+        app.add_middleware(TracingMiddleware)
+
+        @app.get("/deliveries/{delivery_id}")
+        def get_delivery(delivery_id: int):
+            return {"id": delivery_id}
+
+        @app.get("/health/live")
+        def live():
+            return {"status": "ok"}
+
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        tracer.shutdown()
+
+    def test_request_continues_caller_trace(self):
+        # Act
+        self.client.get("/deliveries/1", headers={TRACEPARENT: PARENT})
+
+        # Assert
+        span = self.collector.spans[0]
+        self.assertEqual(span.name, "GET /deliveries/{delivery_id}")
+        self.assertEqual(span.kind, SpanKind.SERVER)
+        self.assertEqual(span.parent_span_id, "b7ad6b7169203331")
+
+    def test_probe_endpoints_are_not_traced(self):
+        # Act
+        self.client.get("/health/live")
+
+        # Assert
+        self.assertEqual(self.collector.spans, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,6 +6,9 @@ from src.application.services.order_verification_service import (
     OrderVerificationService,
 )
 from src.config import Config
+from src.domain.repositories.order_status_repository import (
+    OrderStatusRepository,
+)
 
 
 class TestOrderVerificationService(unittest.TestCase):
@@ -33,7 +36,9 @@ class TestOrderVerificationService(unittest.TestCase):
         # Assert
         self.assertTrue(result)
         get = mock_client_session.return_value.__aenter__.return_value.get
-        get.assert_called_once_with(f"http://test-url/{self.valid_order_id}")
+        get.assert_called_once_with(
+            f"http://test-url/orders/{self.valid_order_id}"
+        )
 
     @patch.object(Config, "ORDER_SERVICE_BASE_URL", "http://test-url")
     @patch("aiohttp.ClientSession")
@@ -54,7 +59,9 @@ class TestOrderVerificationService(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         get = mock_client_session.return_value.__aenter__.return_value.get
-        get.assert_called_once_with(f"http://test-url/{self.valid_order_id}")
+        get.assert_called_once_with(
+            f"http://test-url/orders/{self.valid_order_id}"
+        )
 
     @patch.object(Config, "ORDER_SERVICE_BASE_URL", "http://test-url")
     @patch("aiohttp.ClientSession")
@@ -74,7 +81,9 @@ class TestOrderVerificationService(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         get = mock_client_session.return_value.__aenter__.return_value.get
-        get.assert_called_once_with(f"http://test-url/{self.invalid_order_id}")
+        get.assert_called_once_with(
+            f"http://test-url/orders/{self.invalid_order_id}"
+        )
 
     @patch.object(Config, "ORDER_SERVICE_BASE_URL", "http://test-url")
     @patch("aiohttp.ClientSession")
@@ -94,7 +103,84 @@ class TestOrderVerificationService(unittest.TestCase):
         # Assert
         self.assertFalse(result)
         get = mock_client_session.return_value.__aenter__.return_value.get
-        get.assert_called_once_with(f"http://test-url/{self.valid_order_id}")
+        get.assert_called_once_with(
+            f"http://test-url/orders/{self.valid_order_id}"
+        )
+
+    @patch("aiohttp.ClientSession")
+    def test_verify_order_from_read_model(self, mock_client_session):
+        # Arrange
+        repository = MagicMock(spec=OrderStatusRepository)
+        repository.get_status.return_value = "confirmed"
+        service = OrderVerificationService(repository)
+
+        # Act
+        result = asyncio.run(service.verify_order(self.valid_order_id))
+
+        # Assert
+        self.assertTrue(result)
+        repository.get_status.assert_called_once_with(self.valid_order_id)
+        mock_client_session.assert_not_called()
+
+    @patch("aiohttp.ClientSession")
+    def test_verify_canceled_order_from_read_model(self, mock_client_session):
+        # Arrange
+        repository = MagicMock(spec=OrderStatusRepository)
+        repository.get_status.return_value = "canceled"
+        service = OrderVerificationService(repository)
+
+        # Act
+        result = asyncio.run(service.verify_order(self.valid_order_id))
+
+        # Assert
+        self.assertFalse(result)
+        mock_client_session.assert_not_called()
+
+    @patch.object(Config, "ORDER_SERVICE_BASE_URL", "http://test-url")
+    @patch("aiohttp.ClientSession")
+    def test_verify_order_miss_falls_back_to_http(self, mock_client_session):
+        # Arrange
+        repository = MagicMock(spec=OrderStatusRepository)
+        repository.get_status.return_value = None
+        service = OrderVerificationService(repository)
+        mock_response = AsyncMock()
+        mock_response.status = 200
+        mock_response.json = AsyncMock(return_value={"status": "pending"})
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+        mock_client_session.return_value.__aenter__.return_value = mock_session
+
+        # Act
+        result = asyncio.run(service.verify_order(self.valid_order_id))
+
+        # Assert
+        self.assertTrue(result)
+        repository.save_status.assert_called_once_with(
+            self.valid_order_id, "pending", replace=False
+        )
+
+    @patch.object(Config, "ORDER_SERVICE_BASE_URL", "http://test-url")
+    @patch("aiohttp.ClientSession")
+    def test_verify_order_read_model_error_falls_back_to_http(
+        self, mock_client_session
+    ):
+        # Arrange
+        repository = MagicMock(spec=OrderStatusRepository)
+        repository.get_status.side_effect = Exception("Database error")
+        service = OrderVerificationService(repository)
+        mock_response = AsyncMock()
+        mock_response.status = 404
+        mock_session = MagicMock()
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+        mock_client_session.return_value.__aenter__.return_value = mock_session
+
+        # Act
+        result = asyncio.run(service.verify_order(self.invalid_order_id))
+
+        # Assert
+        self.assertFalse(result)
+        mock_session.get.assert_called_once()
+        repository.save_status.assert_not_called()
 
 
 if __name__ == "__main__":
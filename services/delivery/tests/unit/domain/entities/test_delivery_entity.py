@@ -208,6 +208,29 @@ class TestDeliveryEntity(unittest.TestCase):
         # Assert
         self.assertEqual(delivery.status, new_status)
 
+    def test_from_trusted_row_skips_validation(self):
+        # Arrange
+        fields = dict(
+            order_id=self.valid_order_id,
+            delivery_address=self.valid_delivery_address,
+            delivery_date=self.valid_delivery_date,
+            status=self.valid_status,
+            customer=self.valid_customer,
+            address=self.valid_address,
+            id=0,
+        )
+
+        # Act
+        delivery = DeliveryEntity.from_trusted_row(**fields)
+
+        # Assert
+        self.assertEqual(delivery.id, 0)
+        self.assertEqual(delivery.order_id, self.valid_order_id)
+        self.assertEqual(delivery.status, self.valid_status)
+        self.assertFalse(hasattr(delivery, "__dict__"))
+        with self.assertRaises(InvalidEntity):
+            DeliveryEntity(**fields)
+
 
 if __name__ == "__main__":
     unittest.main()
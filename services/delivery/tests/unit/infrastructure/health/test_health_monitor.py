@@ -0,0 +1,49 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from src.infrastructure.health.health_monitor import HealthMonitor
+
+
+class TestHealthMonitor(unittest.TestCase):
+    def test_refresh_caches_results(self):
+        # Arrange
+        database_check = MagicMock(return_value=True)
+        rabbitmq_check = MagicMock(return_value=True)
+        monitor = HealthMonitor(
+            {"database": database_check, "rabbitmq": rabbitmq_check}
+        )
+
+        # Act
+        monitor.refresh()
+        monitor.get_health_status()
+        status = monitor.get_health_status()
+
+        # Assert
+        self.assertEqual(
+            status, {"database": "healthy", "rabbitmq": "healthy"}
+        )
+        self.assertTrue(monitor.is_ready())
+        database_check.assert_called_once()
+        rabbitmq_check.assert_called_once()
+
+    def test_refresh_times_out_slow_check(self):
+        # Arrange
+        release = threading.Event()
+        slow_check = MagicMock(side_effect=lambda: release.wait() or True)
+        monitor = HealthMonitor({"rabbitmq": slow_check}, timeout=0.05)
+
+        # Act
+        monitor.refresh()
+
+        # Assert
+        self.assertEqual(
+            monitor.get_health_status(), {"rabbitmq": "unhealthy"}
+        )
+        self.assertFalse(monitor.is_ready())
+        release.set()
+        monitor.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,13 +55,15 @@ class TestHealthService(unittest.TestCase):
 
         # Act
         result = self.health_service.check_rabbitmq()
+        self.health_service.check_rabbitmq()
 
         # Assert
         self.assertTrue(result)
         mock_pika.assert_called_once_with(
             pika.ConnectionParameters(host=self.rabbitmq_host, heartbeat=120)
         )
-        mock_connection.close.assert_called_once()
+        self.assertEqual(mock_connection.process_data_events.call_count, 2)
+        mock_connection.close.assert_not_called()
         mock_logger.error.assert_not_called()
 
     @patch("src.infrastructure.health.health_service.pika.BlockingConnection")
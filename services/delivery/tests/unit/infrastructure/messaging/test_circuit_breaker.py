@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def test_opens_after_failure_threshold(self):
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+        # Act
+        breaker.record_failure()
+        allowed_before_threshold = breaker.allow_request()
+        breaker.record_failure()
+
+        # Assert
+        self.assertTrue(allowed_before_threshold)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow_request())
+
+    @patch("src.infrastructure.messaging.circuit_breaker.time.monotonic")
+    def test_half_opens_after_reset_timeout(self, mock_monotonic):
+        # Arrange
+        mock_monotonic.return_value = 100.0
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        # Act
+        mock_monotonic.return_value = 131.0
+
+        # Assert
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow_request())
+
+    def test_success_closes_breaker(self):
+        # Arrange
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        # Act
+        breaker.record_success()
+
+        # Assert
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.retry_after(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.infrastructure.messaging.consumer_metrics import (
+    ConsumerMetrics,
+    instrument_consumer,
+)
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestConsumerMetrics(unittest.TestCase):
+    def setUp(self):
+        self.metrics = ConsumerMetrics("test_queue", MetricsRegistry())
+
+    def test_track_records_message(self):
+        # Act
+        with self.metrics.track(MagicMock(redelivered=True)):
+            in_flight = self.metrics.in_flight.get(queue="test_queue")
+
+        # Assert
+        self.assertEqual(in_flight, 1)
+        self.assertEqual(self.metrics.in_flight.get(queue="test_queue"), 0)
+        self.assertEqual(self.metrics.consumed.get(queue="test_queue"), 1)
+        self.assertEqual(self.metrics.redeliveries.get(queue="test_queue"), 1)
+
+    def test_track_records_failed_handler(self):
+        # Act
+        with self.assertRaises(ValueError):
+            with self.metrics.track(MagicMock(redelivered=False)):
+                raise ValueError
+
+        # Assert
+        self.assertEqual(self.metrics.in_flight.get(queue="test_queue"), 0)
+        self.assertEqual(self.metrics.consumed.get(queue="test_queue"), 1)
+
+    def test_sample_uses_passive_declare(self):
+        # Arrange
+        channel = MagicMock()
+        channel.queue_declare.return_value.method.message_count = 42
+        channel.queue_declare.return_value.method.consumer_count = 2
+
+        # Act
+        self.metrics.sample(channel)
+
+        # Assert
+        channel.queue_declare.assert_called_once_with(
+            queue="test_queue", passive=True
+        )
+        self.assertEqual(self.metrics.queue_depth.get(queue="test_queue"), 42)
+        self.assertEqual(
+            self.metrics.queue_consumers.get(queue="test_queue"), 2
+        )
+
+    def test_schedule_sampling_reschedules_after_failure(self):
+        # Arrange
+        connection = MagicMock()
+        channel = MagicMock()
+        channel.queue_declare.side_effect = Exception("channel closed")
+
+        # Act
+        self.metrics.schedule_sampling(connection, channel, interval=5)
+        interval, sample = connection.call_later.call_args[0]
+        sample()
+
+        # Assert
+        self.assertEqual(interval, 5)
+        self.assertEqual(connection.call_later.call_count, 2)
+
+    def test_instrument_consumer_wraps_handler(self):
+        # Arrange
+        calls = []
+
+        class Subscriber:
+            @instrument_consumer("instrumented_queue")
+            def on_message(self, ch, method, properties, body):
+                calls.append(body)
+
+        # Act
+        Subscriber().on_message(MagicMock(), MagicMock(), MagicMock(), b"{}")
+
+        # Assert
+        self.assertEqual(calls, [b"{}"])
+        metrics = Subscriber.on_message.consumer_metrics
+        self.assertEqual(metrics.consumed.get(queue="instrumented_queue"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
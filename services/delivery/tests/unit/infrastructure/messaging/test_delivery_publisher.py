@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pika
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
 from src.infrastructure.messaging.delivery_publisher import DeliveryPublisher
 
 
@@ -9,22 +10,33 @@ class TestDeliveryPublisher(unittest.TestCase):
     def setUp(self):
         self.connection_params = pika.ConnectionParameters("localhost")
 
-    @patch(
-        "src.infrastructure.messaging.delivery_publisher.pika.BlockingConnection"
-    )
-    @patch("src.infrastructure.messaging.delivery_publisher.logger")
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+    def test_init_does_not_connect(self, mock_blocking_connection):
+        # Act
+        publisher = DeliveryPublisher(
+            connection_params=self.connection_params, max_retries=3, delay=1
+        )
+
+        # Assert
+        mock_blocking_connection.assert_not_called()
+        self.assertIsNone(publisher.channel)
+        self.assertEqual(publisher.exchange_name, "delivery_exchange")
+
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+    @patch("src.infrastructure.messaging.base.logger")
     def test_connect_success(self, mock_logger, mock_blocking_connection):
         # Arrange
         mock_channel = MagicMock()
         mock_connection = MagicMock()
         mock_connection.channel.return_value = mock_channel
         mock_blocking_connection.return_value = mock_connection
-
-        # Act
         publisher = DeliveryPublisher(
             connection_params=self.connection_params, max_retries=3, delay=1
         )
 
+        # Act
+        publisher.connect()
+
         # Assert
         mock_blocking_connection.assert_called_once_with(
             self.connection_params
@@ -32,10 +44,8 @@ class TestDeliveryPublisher(unittest.TestCase):
         self.assertIsNotNone(publisher.channel)
         mock_logger.error.assert_not_called()
 
-    @patch(
-        "src.infrastructure.messaging.delivery_publisher.pika.BlockingConnection"
-    )
-    @patch("src.infrastructure.messaging.delivery_publisher.logger")
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+    @patch("src.infrastructure.messaging.base.logger")
     @patch("time.sleep", return_value=None)
     def test_connect_failure(
         self, mock_sleep, mock_logger, mock_blocking_connection
@@ -44,14 +54,15 @@ class TestDeliveryPublisher(unittest.TestCase):
         mock_blocking_connection.side_effect = (
             pika.exceptions.AMQPConnectionError
         )
+        publisher = DeliveryPublisher(
+            connection_params=self.connection_params,
+            max_retries=3,
+            delay=1,
+        )
 
         # Act & Assert
         with self.assertRaises(pika.exceptions.AMQPConnectionError):
-            DeliveryPublisher(
-                connection_params=self.connection_params,
-                max_retries=3,
-                delay=1,
-            )
+            publisher.connect()
 
         self.assertEqual(mock_blocking_connection.call_count, 3)
         mock_logger.error.assert_called_with(
@@ -59,15 +70,14 @@ class TestDeliveryPublisher(unittest.TestCase):
         )
         mock_sleep.assert_called_with(1)
 
-    @patch(
-        "src.infrastructure.messaging.delivery_publisher.pika.BlockingConnection"
-    )
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
     @patch("src.infrastructure.messaging.delivery_publisher.logger")
     def test_publish_delivery_update_success(
         self, mock_logger, mock_blocking_connection
     ):
         # Arrange
         mock_channel = MagicMock()
+        mock_channel.is_closed = False
         mock_connection = MagicMock()
         mock_connection.channel.return_value = mock_channel
         mock_blocking_connection.return_value = mock_connection
@@ -78,16 +88,59 @@ class TestDeliveryPublisher(unittest.TestCase):
 
         # Act
         publisher.publish_delivery_update(1, 101, "delivered")
+        publisher.close()
 
         # Assert
         mock_channel.basic_publish.assert_called_once_with(
             exchange=publisher.exchange_name,
             routing_key="delivery_queue",
             body='{"delivery_id": 1, "order_id": 101, "status": "delivered"}',
+            properties=ANY,
         )
+        properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+        self.assertEqual(len(properties.message_id), 32)
         mock_logger.info.assert_called_once_with(
-            'Published delivery update: {"delivery_id": 1, "order_id": 101, "status": "delivered"} to delivery_queue'
+            'Queued delivery update: {"delivery_id": 1, "order_id": 101, "status": "delivered"} to delivery_queue'
+        )
+
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+    def test_publish_fails_fast_while_broker_is_down(
+        self, mock_blocking_connection
+    ):
+        # Arrange
+        mock_blocking_connection.side_effect = (
+            pika.exceptions.AMQPConnectionError
+        )
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        publisher = DeliveryPublisher(self.connection_params)
+        publisher.circuit_breaker = breaker
+
+        # Act
+        publisher.publish_delivery_update(1, 101, "delivered")
+        publisher.close(timeout=1)
+
+        # Assert
+        self.assertEqual(mock_blocking_connection.call_count, 1)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(publisher.pending_messages(), 1)
+
+    @patch("src.infrastructure.messaging.delivery_publisher.logger")
+    def test_publish_drops_update_when_buffer_is_full(self, mock_logger):
+        # Arrange
+        publisher = DeliveryPublisher(self.connection_params)
+        publisher._buffer.maxsize = 1
+        publisher._start_publisher = MagicMock()
+        publisher.publish_delivery_update(1, 101, "delivered")
+
+        # Act
+        publisher.publish_delivery_update(2, 102, "delivered")
+
+        # Assert
+        self.assertEqual(publisher.pending_messages(), 1)
+        self.assertEqual(
+            publisher.dropped_messages.get(exchange="delivery_exchange"), 1
         )
+        mock_logger.info.assert_called_once()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.persistence.in_memory_processed_message_repository import (
+    InMemoryProcessedMessageRepository,
+)
+
+
+class TestMessageDeduplicator(unittest.TestCase):
+    def setUp(self):
+        self.repository = InMemoryProcessedMessageRepository()
+        self.deduplicator = MessageDeduplicator(
+            self.repository, ttl=60, eviction_interval=60
+        )
+        self.properties = MagicMock(message_id="abc")
+
+    def test_is_duplicate_after_mark_processed(self):
+        # Act
+        before = self.deduplicator.is_duplicate(self.properties)
+        self.deduplicator.mark_processed(self.properties)
+        after = self.deduplicator.is_duplicate(self.properties)
+
+        # Assert
+        self.assertFalse(before)
+        self.assertTrue(after)
+
+    def test_claim_in_flight_is_duplicate_until_discarded(self):
+        # Act
+        first = self.deduplicator.is_duplicate(self.properties)
+        in_flight = self.deduplicator.is_duplicate(self.properties)
+        self.deduplicator.discard()
+        retried = self.deduplicator.is_duplicate(self.properties)
+
+        # Assert
+        self.assertFalse(first)
+        self.assertTrue(in_flight)
+        self.assertFalse(retried)
+        self.assertFalse(self.repository.exists("abc"))
+
+    def test_message_without_id_is_never_duplicate(self):
+        # Arrange
+        properties = MagicMock(message_id=None)
+
+        # Act
+        self.deduplicator.mark_processed(properties)
+
+        # Assert
+        self.assertFalse(self.deduplicator.is_duplicate(properties))
+        self.assertEqual(self.repository.delete_older_than(datetime.max), 0)
+
+    def test_store_errors_roll_back_and_do_not_block_processing(self):
+        # Arrange
+        repository = MagicMock()
+        repository.add.side_effect = Exception("database unavailable")
+        repository.commit.side_effect = Exception("database unavailable")
+        deduplicator = MessageDeduplicator(repository)
+
+        # Act
+        result = deduplicator.is_duplicate(self.properties)
+        deduplicator.mark_processed(self.properties)
+
+        # Assert
+        self.assertFalse(result)
+        self.assertEqual(repository.rollback.call_count, 2)
+
+    @patch("src.infrastructure.messaging.message_deduplicator.time.monotonic")
+    def test_mark_processed_evicts_expired(self, mock_monotonic):
+        # Arrange
+        mock_monotonic.return_value = 0
+        deduplicator = MessageDeduplicator(
+            self.repository, ttl=60, eviction_interval=10
+        )
+        self.repository._processed_at["old"] = datetime.utcnow() - timedelta(
+            seconds=120
+        )
+        mock_monotonic.return_value = 11
+
+        # Act
+        deduplicator.is_duplicate(self.properties)
+        deduplicator.mark_processed(self.properties)
+
+        # Assert
+        self.assertFalse(self.repository.exists("old"))
+        self.assertTrue(self.repository.exists("abc"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import json
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from src.domain.repositories.order_status_repository import (
+    OrderStatusRepository,
+)
+from src.infrastructure.messaging.order_status_subscriber import (
+    OrderStatusSubscriber,
+)
+
+
+class TestOrderStatusSubscriber(unittest.TestCase):
+    def setUp(self):
+        self.repository = MagicMock(spec=OrderStatusRepository)
+        self.deduplicator = MagicMock()
+        self.deduplicator.is_duplicate.return_value = False
+        self.retry_topology = MagicMock()
+        self.subscriber = OrderStatusSubscriber(
+            self.repository,
+            deduplicator=self.deduplicator,
+            retry_topology=self.retry_topology,
+        )
+        self.channel = MagicMock()
+        self.method = MagicMock(delivery_tag=7)
+        self.properties = MagicMock(message_id="abc")
+
+    @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+    def test_start_consuming_binds_own_queue(self, mock_blocking_connection):
+        # Arrange
+        mock_channel = mock_blocking_connection.return_value.channel()
+
+        # Act
+        self.subscriber.start_consuming()
+
+        # Assert
+        mock_channel.queue_declare.assert_called_once_with(
+            queue="delivery_orders_queue", durable=True
+        )
+        mock_channel.queue_bind.assert_called_once_with(
+            exchange="orders_exchange",
+            queue="delivery_orders_queue",
+            routing_key="orders_queue",
+        )
+        self.retry_topology.declare.assert_called_once_with(mock_channel)
+        mock_blocking_connection.return_value.call_later.assert_called_once()
+        mock_channel.start_consuming.assert_called_once()
+
+    def test_on_message_saves_status(self):
+        # Arrange
+        body = json.dumps(
+            {"order_id": 1, "amount": 10.0, "status": "confirmed"}
+        ).encode("utf-8")
+
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, body
+        )
+
+        # Assert
+        self.repository.save_status.assert_called_once_with(
+            1, "confirmed", occurred_at=None
+        )
+        self.deduplicator.mark_processed.assert_called_once_with(
+            self.properties
+        )
+        self.retry_topology.retry.assert_not_called()
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_on_message_passes_event_time(self):
+        # Arrange
+        body = json.dumps(
+            {
+                "order_id": 1,
+                "status": "canceled",
+                "occurred_at": "2024-01-01T12:00:00.250000",
+            }
+        ).encode("utf-8")
+
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, body
+        )
+
+        # Assert
+        self.repository.save_status.assert_called_once_with(
+            1,
+            "canceled",
+            occurred_at=datetime(2024, 1, 1, 12, 0, 0, 250000),
+        )
+
+    def test_on_message_skips_duplicate(self):
+        # Arrange
+        self.deduplicator.is_duplicate.return_value = True
+        body = json.dumps({"order_id": 1, "status": "confirmed"}).encode()
+
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, body
+        )
+
+        # Assert
+        self.repository.save_status.assert_not_called()
+        self.deduplicator.mark_processed.assert_not_called()
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_on_message_failure_is_scheduled_for_retry(self):
+        # Arrange
+        error = Exception("database unavailable")
+        self.repository.save_status.side_effect = error
+        body = json.dumps({"order_id": 1, "status": "confirmed"}).encode()
+
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, body
+        )
+
+        # Assert
+        self.deduplicator.mark_processed.assert_not_called()
+        self.deduplicator.discard.assert_called_once()
+        self.retry_topology.retry.assert_called_once_with(
+            self.channel, self.properties, body, error
+        )
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_on_message_invalid_message_is_scheduled_for_retry(self):
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, b"not json"
+        )
+
+        # Assert
+        self.repository.save_status.assert_not_called()
+        self.retry_topology.retry.assert_called_once()
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_on_message_records_metrics(self):
+        # Arrange
+        metrics = OrderStatusSubscriber.on_message.consumer_metrics
+        consumed = metrics.consumed.get(queue="delivery_orders_queue")
+        body = json.dumps({"order_id": 1, "status": "confirmed"}).encode()
+
+        # Act
+        self.subscriber.on_message(
+            self.channel, self.method, self.properties, body
+        )
+
+        # Assert
+        self.assertEqual(
+            metrics.consumed.get(queue="delivery_orders_queue"), consumed + 1
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
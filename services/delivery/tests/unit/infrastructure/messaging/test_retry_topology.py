@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import MagicMock
+
+from src.infrastructure.messaging.retry_topology import (
+    ATTEMPTS_HEADER,
+    LAST_ERROR_HEADER,
+    RetryTopology,
+)
+
+
+class TestRetryTopology(unittest.TestCase):
+    def setUp(self):
+        self.topology = RetryTopology(
+            "delivery_orders_queue", delays=[100, 1000], max_attempts=3
+        )
+        self.channel = MagicMock()
+
+    def test_declare_creates_delay_queues_and_dead_letter_queue(self):
+        # Act
+        self.topology.declare(self.channel)
+
+        # Assert
+        for delay in (100, 1000):
+            self.channel.queue_declare.assert_any_call(
+                queue=f"delivery_orders_queue.retry.{delay}ms",
+                durable=True,
+                arguments={
+                    "x-message-ttl": delay,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": "delivery_orders_queue",
+                },
+            )
+        self.channel.queue_declare.assert_any_call(
+            queue="delivery_orders_queue.dlq", durable=True
+        )
+
+    def test_retry_routes_by_attempt(self):
+        cases = [
+            (0, "delivery_orders_queue.retry.100ms"),
+            (1, "delivery_orders_queue.retry.1000ms"),
+            (2, "delivery_orders_queue.dlq"),
+        ]
+        for attempts, routing_key in cases:
+            with self.subTest(attempts=attempts):
+                # Arrange
+                channel = MagicMock()
+                properties = MagicMock(
+                    message_id="abc", headers={ATTEMPTS_HEADER: attempts}
+                )
+
+                # Act
+                self.topology.retry(
+                    channel, properties, b"{}", Exception("boom")
+                )
+
+                # Assert
+                kwargs = channel.basic_publish.call_args.kwargs
+                self.assertEqual(kwargs["routing_key"], routing_key)
+                self.assertEqual(kwargs["body"], b"{}")
+                self.assertEqual(kwargs["properties"].message_id, "abc")
+                headers = kwargs["properties"].headers
+                self.assertEqual(headers[ATTEMPTS_HEADER], attempts + 1)
+                self.assertEqual(headers[LAST_ERROR_HEADER], "boom")
+
+    def test_get_attempts_without_headers(self):
+        # Act / Assert
+        self.assertEqual(
+            RetryTopology.get_attempts(MagicMock(headers=None)), 0
+        )
+
+    def test_replay_dead_letters_republishes_and_acks(self):
+        # Arrange
+        dead_letter = (
+            MagicMock(delivery_tag=7),
+            MagicMock(
+                message_id="abc",
+                headers={ATTEMPTS_HEADER: 3, LAST_ERROR_HEADER: "boom"},
+            ),
+            b"{}",
+        )
+        self.channel.basic_get.side_effect = [
+            dead_letter,
+            (None, None, None),
+        ]
+
+        # Act
+        replayed = self.topology.replay_dead_letters(self.channel)
+
+        # Assert
+        self.assertEqual(replayed, 1)
+        kwargs = self.channel.basic_publish.call_args.kwargs
+        self.assertEqual(kwargs["routing_key"], "delivery_orders_queue")
+        self.assertEqual(kwargs["properties"].headers, {})
+        self.channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+
+    def test_counter_render(self):
+        # Arrange
+        counter = self.metrics.counter("jobs_total", "Jobs done.", ["queue"])
+
+        # Act
+        counter.inc(queue="a")
+        counter.inc(2, queue="a")
+
+        # Assert
+        self.assertEqual(
+            self.metrics.render(),
+            "# HELP jobs_total Jobs done.\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{queue="a"} 3\n',
+        )
+
+    def test_histogram_render(self):
+        # Arrange
+        histogram = self.metrics.histogram(
+            "latency_seconds", "Latency.", buckets=[0.1, 1]
+        )
+
+        # Act
+        histogram.observe(0.05)
+        histogram.observe(3)
+        output = self.metrics.render()
+
+        # Assert
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', output)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 2', output)
+        self.assertIn("latency_seconds_count 2", output)
+
+    def test_conflicting_type_raises(self):
+        # Arrange
+        self.metrics.counter("jobs_total", "Jobs done.")
+
+        # Act / Assert
+        with self.assertRaises(ValueError):
+            self.metrics.gauge("jobs_total", "Jobs done.")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from src.infrastructure.metrics.request_metrics import (
+    current_stats,
+    instrument_engine,
+    outbound_call_trace_config,
+    track_request,
+)
+
+
+class TestRequestMetrics(unittest.TestCase):
+    def test_engine_queries_are_attributed_to_the_current_request(self):
+        # Arrange
+        engine = instrument_engine(create_engine("sqlite://"))
+
+        # Act
+        with track_request() as stats:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+        # Assert
+        self.assertEqual(stats.queries, 2)
+        self.assertIsNone(current_stats())
+
+    def test_outbound_calls_are_counted(self):
+        # Arrange
+        on_request_start = outbound_call_trace_config().on_request_start[0]
+
+        async def fan_out():
+            with track_request() as stats:
+                await on_request_start(None, SimpleNamespace(), None)
+            return stats
+
+        # Act
+        stats = asyncio.run(fan_out())
+
+        # Assert
+        self.assertEqual(stats.outbound_calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
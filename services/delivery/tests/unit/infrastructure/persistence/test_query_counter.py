@@ -0,0 +1,37 @@
+import unittest
+
+from sqlalchemy import create_engine, text
+from src.infrastructure.persistence.query_counter import (
+    QueryCounter,
+    assert_max_queries,
+)
+
+
+class TestQueryCounter(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+
+    def test_counter_captures_statements_inside_the_block(self):
+        # Act
+        with self.engine.connect() as connection:
+            with QueryCounter(self.engine) as counter:
+                connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        # Assert
+        self.assertEqual(counter.statements, ["SELECT 1"])
+
+    def test_budget_exceeded_lists_offending_statements(self):
+        # Act
+        with self.engine.connect() as connection:
+            with self.assertRaises(AssertionError) as error:
+                with assert_max_queries(self.engine, 1):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 2"))
+
+        # Assert
+        self.assertIn("1. SELECT 1\n2. SELECT 2", str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from src.infrastructure.persistence.slow_query_log import (
+    SlowQueryLog,
+    fingerprint,
+)
+from src.infrastructure.tracing.tracer import tracer
+
+
+class TestSlowQueryLog(unittest.TestCase):
+    def setUp(self):
+        self.log = SlowQueryLog(threshold_ms=100, sample_ratio=1.0)
+
+    def test_fingerprint_collapses_parameters_and_in_lists(self):
+        # Act
+        normalized = fingerprint(
+            "SELECT * FROM addresses WHERE id IN (%(p_1)s, %(p_2)s)"
+        )
+
+        # Assert
+        self.assertEqual(
+            normalized, "SELECT * FROM addresses WHERE id IN (...)"
+        )
+
+    def test_stats_aggregate_per_fingerprint(self):
+        # Act
+        for duration in [1, 2, 3, 150]:
+            self.log.record("SELECT * FROM deliveries WHERE id = 3", duration)
+
+        # Assert
+        (entry,) = self.log.snapshot()
+        self.assertEqual(entry["sampled_calls"], 4)
+        self.assertEqual(entry["slow_calls"], 1)
+        self.assertEqual(entry["p50_ms"], 3)
+
+    def test_slow_query_is_logged_with_its_repository_method(self):
+        # Act
+        with self.assertLogs("app", level="WARNING") as logs:
+            with tracer.span("SQLAlchemyDeliveryRepository.list_all"):
+                self.log.record("SELECT * FROM deliveries", 300)
+
+        # Assert
+        self.assertIn(
+            "Slow query 300.0ms in SQLAlchemyDeliveryRepository.list_all",
+            logs.output[0],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from datetime import datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.persistence.db_setup import Base
+from src.infrastructure.persistence.models import OrderStatusModel
+from src.infrastructure.persistence.sqlalchemy_order_status_repository import (
+    SQLAlchemyOrderStatusRepository,
+)
+
+EARLIER = datetime(2024, 1, 1, 12, 0)
+LATER = datetime(2024, 1, 1, 12, 5)
+
+
+class TestSQLAlchemyOrderStatusRepository(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine)()
+        self.repository = SQLAlchemyOrderStatusRepository(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def test_newer_event_replaces_status(self):
+        # Arrange
+        self.repository.save_status(1, "confirmed", occurred_at=EARLIER)
+
+        # Act
+        self.repository.save_status(1, "canceled", occurred_at=LATER)
+
+        # Assert
+        self.assertEqual(self.repository.get_status(1), "canceled")
+        self.assertEqual(self.db.get(OrderStatusModel, 1).updated_at, LATER)
+
+    def test_late_event_does_not_overwrite_newer_status(self):
+        # Arrange
+        self.repository.save_status(1, "canceled", occurred_at=LATER)
+
+        # Act
+        self.repository.save_status(1, "confirmed", occurred_at=EARLIER)
+
+        # Assert
+        self.assertEqual(self.repository.get_status(1), "canceled")
+
+    def test_fetched_status_fills_gap_and_yields_to_events(self):
+        # Arrange
+        self.repository.save_status(1, "pending", replace=False)
+
+        # Act
+        self.repository.save_status(1, "paid", replace=False)
+        self.repository.save_status(1, "confirmed", occurred_at=EARLIER)
+
+        # Assert
+        self.assertEqual(self.repository.get_status(1), "confirmed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.models import ProcessedMessageModel
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
+
+
+class TestSQLAlchemyProcessedMessageRepository(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock(spec=Session)
+        self.repository = SQLAlchemyProcessedMessageRepository(self.session)
+
+    def test_add_stages_row_without_committing(self):
+        # Act
+        result = self.repository.add("abc")
+
+        # Assert
+        self.assertTrue(result)
+        self.session.begin_nested.assert_called_once()
+        added = self.session.add.call_args[0][0]
+        self.assertIsInstance(added, ProcessedMessageModel)
+        self.assertEqual(added.message_id, "abc")
+        self.session.flush.assert_called_once()
+        self.session.commit.assert_not_called()
+
+    def test_add_returns_false_for_recorded_message(self):
+        # Arrange
+        self.session.begin_nested.return_value.__exit__.return_value = False
+        self.session.flush.side_effect = IntegrityError("", {}, Exception())
+
+        # Act
+        result = self.repository.add("abc")
+
+        # Assert
+        self.assertFalse(result)
+        self.session.rollback.assert_not_called()
+
+    def test_delete_older_than(self):
+        # Arrange
+        self.session.query().filter().delete.return_value = 3
+
+        # Act
+        deleted = self.repository.delete_older_than(datetime.utcnow())
+
+        # Assert
+        self.assertEqual(deleted, 3)
+        self.session.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.infrastructure.tracing.exporters import (
+    BatchSpanProcessor,
+    FileSpanExporter,
+    build_exporter,
+    to_otlp,
+)
+from src.infrastructure.tracing.tracer import SpanKind, Tracer
+
+
+def _span():
+    with Tracer("delivery").span("POST /deliveries/", SpanKind.SERVER) as span:
+        pass
+    return span
+
+
+class TestExporters(unittest.TestCase):
+    def test_to_otlp_builds_export_request(self):
+        # Arrange
+        span = _span()
+
+        # Act
+        request = to_otlp([span], "delivery")
+
+        # Assert
+        exported = request["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        self.assertEqual(exported["spanId"], span.context.span_id)
+        self.assertEqual(exported["kind"], SpanKind.SERVER)
+
+    def test_file_exporter_appends_one_request_per_line(self):
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "traces.jsonl")
+            exporter = FileSpanExporter(path)
+
+            # Act
+            exporter.export([_span()], "delivery")
+            exporter.export([_span()], "delivery")
+
+            # Assert
+            with open(path) as f:
+                lines = f.read().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertIn("resourceSpans", json.loads(lines[0]))
+
+    def test_batch_processor_shutdown_flushes_pending_spans(self):
+        # Arrange
+        exporter = MagicMock()
+        processor = BatchSpanProcessor(exporter, "delivery", interval=60)
+        processor.start()
+        processor.on_end(_span())
+
+        # Act
+        processor.shutdown()
+
+        # Assert
+        exporter.export.assert_called_once()
+
+    def test_build_exporter_is_off_by_default(self):
+        # Act & Assert
+        self.assertIsNone(build_exporter("none"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from multidict import CIMultiDict
+from src.infrastructure.tracing.http_client import client_trace_config
+from src.infrastructure.tracing.tracer import TRACEPARENT, SpanKind, tracer
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+class TestClientTraceConfig(unittest.TestCase):
+    def setUp(self):
+        self.collector = _Collector()
+        tracer.start(self.collector)
+
+    def tearDown(self):
+        tracer.shutdown()
+
+    def test_client_span_is_propagated_in_traceparent(self):
+        # Arrange
+        trace_config = client_trace_config()
+        context = SimpleNamespace()
+        params = SimpleNamespace(
+            method="GET",
+            url="http://orders/orders/1",
+            headers=CIMultiDict(),
+            response=SimpleNamespace(status=200),
+        )
+
+        async def request():
+            await trace_config.on_request_start[0](None, context, params)
+            await trace_config.on_request_end[0](None, context, params)
+
+        # Act
+        asyncio.run(request())
+
+        # Assert
+        span = self.collector.spans[0]
+        self.assertEqual(span.kind, SpanKind.CLIENT)
+        self.assertEqual(
+            params.headers[TRACEPARENT], span.context.to_traceparent()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import pika
+from src.infrastructure.tracing.tracer import (
+    TRACEPARENT,
+    SpanContext,
+    SpanKind,
+    traced_consumer,
+    traced_repository,
+    tracer,
+)
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+class TestTracer(unittest.TestCase):
+    def setUp(self):
+        self.collector = _Collector()
+        tracer.start(self.collector)
+
+    def tearDown(self):
+        tracer.shutdown()
+
+    def test_traceparent_round_trip(self):
+        # Act
+        context = SpanContext.from_traceparent(PARENT)
+
+        # Assert
+        self.assertEqual(context.span_id, "b7ad6b7169203331")
+        self.assertEqual(context.to_traceparent(), PARENT)
+        self.assertIsNone(SpanContext.from_traceparent("garbage"))
+
+    def test_nested_spans_share_trace(self):
+        # Act
+        with tracer.span("outer") as outer:
+            with tracer.span("inner") as inner:
+                pass
+
+        # Assert
+        self.assertEqual(inner.context.trace_id, outer.context.trace_id)
+        self.assertEqual(inner.parent_span_id, outer.context.span_id)
+
+    def test_traced_repository_wraps_public_methods(self):
+        # Arrange
+        @traced_repository("postgresql")
+        class Repository:
+            def get_status(self, order_id):
+                return "confirmed"
+
+        # Act
+        status = Repository().get_status(1)
+
+        # Assert
+        self.assertEqual(status, "confirmed")
+        self.assertEqual(
+            [span.name for span in self.collector.spans],
+            ["Repository.get_status"],
+        )
+
+    def test_traced_consumer_continues_trace(self):
+        # Arrange
+        class Subscriber:
+            @traced_consumer("delivery_orders_queue")
+            def on_message(self, ch, method, properties, body):
+                return tracer.current_span()
+
+        properties = pika.BasicProperties(headers={TRACEPARENT: PARENT})
+
+        # Act
+        span = Subscriber().on_message(None, None, properties, b"{}")
+
+        # Assert
+        self.assertEqual(span.kind, SpanKind.CONSUMER)
+        self.assertEqual(span.parent_span_id, "b7ad6b7169203331")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
+from src.domain.entities.price_entity import PriceEntity
+from src.domain.entities.product_entity import ProductEntity
+
+
+def _build(factory):
+    return factory(ProductEntity)(
+        id=1,
+        sku="SKU000001",
+        name="Product 1",
+        category=factory(CategoryEntity)(id=1, name="Lanche"),
+        price=factory(PriceEntity)(id=1, amount=9.99),
+        inventory=factory(InventoryEntity)(id=1, quantity=100),
+        description="Benchmark product",
+        images=["https://example.com/image.png"],
+    )
+
+
+class TestEntityBenchmarks:
+
+    def test_product_constructor(self, benchmark):
+        product = benchmark(_build, lambda cls: cls)
+
+        assert product.sku == "SKU000001"
+
+    def test_product_from_trusted_row(self, benchmark):
+        product = benchmark(_build, lambda cls: cls.from_trusted_row)
+
+        assert product.sku == "SKU000001"
@@ -0,0 +1,39 @@
+import json
+from types import SimpleNamespace
+
+from src.infrastructure.messaging.inventory_subscriber import (
+    InventorySubscriber,
+)
+
+
+class _NoopProductService:
+    # Isolates decoding and dispatch from the service and the database
+    def add_inventory(self, sku, quantity):
+        return None
+
+    def subtract_inventory(self, sku, quantity):
+        return None
+
+
+class _Channel:
+    def basic_ack(self, delivery_tag, multiple=False):
+        pass
+
+
+class TestMessageBenchmarks:
+
+    def test_inventory_subscriber_on_message(self, benchmark):
+        subscriber = InventorySubscriber(
+            _NoopProductService(), aggregate=False
+        )
+        body = json.dumps(
+            {"sku": "SKU000001", "action": "subtract", "quantity": 1}
+        ).encode()
+
+        benchmark(
+            subscriber.on_message,
+            _Channel(),
+            SimpleNamespace(delivery_tag=1),
+            SimpleNamespace(message_id="bench", headers=None),
+            body,
+        )
@@ -0,0 +1,45 @@
+import pytest
+from src.infrastructure.persistence.sqlalchemy_product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+
+class TestProductRepositoryBenchmarks:
+
+    @pytest.fixture
+    def repository(self, db_session):
+        return SQLAlchemyProductRepository(db_session)
+
+    def test_find_by_sku(self, benchmark, repository, db_session):
+        # Expired before every round so rows are hydrated again instead
+        # of coming back from the identity map
+        def find():
+            db_session.expire_all()
+            return repository.find_by_sku("SKU000001")
+
+        product = benchmark(find)
+
+        assert product.sku == "SKU000001"
+
+    def test_list_all_paginated(self, benchmark, repository, db_session):
+        def list_page():
+            db_session.expire_all()
+            return repository.list_all_paginated(1, 50)
+
+        products = benchmark(list_page)[0]
+
+        assert len(products) == 50
+
+    def test_list_summaries_paginated(self, benchmark, repository):
+        rows = benchmark(repository.list_summaries_paginated, 1, 50)[0]
+
+        assert len(rows) == 50
+
+    def test_list_all(self, benchmark, repository, db_session):
+        def list_all():
+            db_session.expire_all()
+            return repository.list_all()
+
+        products = benchmark(list_all)
+
+        assert products
@@ -0,0 +1,49 @@
+from src.application.dto.serializers import (
+    serialize_product,
+    serialize_product_row,
+)
+from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
+from src.domain.entities.price_entity import PriceEntity
+from src.domain.entities.product_entity import ProductEntity
+
+PRODUCT = ProductEntity(
+    id=1,
+    sku="SKU000001",
+    name="Product 1",
+    category=CategoryEntity(id=1, name="Lanche"),
+    price=PriceEntity(id=1, amount=9.99),
+    inventory=InventoryEntity(id=1, quantity=100),
+    description="Benchmark product",
+    images=["https://example.com/image.png"],
+)
+ROW = {
+    "sku": "SKU000001",
+    "name": "Product 1",
+    "category_name": "Lanche",
+    "price": 9.99,
+    "quantity": 100,
+    "description": "Benchmark product",
+    "images": ["https://example.com/image.png"],
+}
+
+
+class TestSerializerBenchmarks:
+
+    def test_serialize_product(self, benchmark):
+        response = benchmark(serialize_product, PRODUCT)
+
+        assert response.sku == "SKU000001"
+
+    def test_serialize_product_to_json(self, benchmark):
+        # What FastAPI does with a response_model return value
+        body = benchmark(
+            lambda: serialize_product(PRODUCT).model_dump_json().encode()
+        )
+
+        assert body
+
+    def test_serialize_product_row(self, benchmark):
+        payload = benchmark(serialize_product_row, ROW)
+
+        assert payload["sku"] == "SKU000001"
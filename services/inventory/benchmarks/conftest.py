@@ -0,0 +1,46 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.infrastructure.persistence.db_setup import Base
+from src.infrastructure.persistence.models import (
+    CategoryModel,
+    InventoryModel,
+    PriceModel,
+    ProductModel,
+)
+
+# In-memory SQLite by default. Point this at a throwaway local Postgres
+# database to include driver and network costs; its tables are dropped.
+DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL", "sqlite://")
+PRODUCTS = int(os.getenv("BENCHMARK_PRODUCTS", 500))
+CATEGORIES = ["Lanche", "Acompanhamento", "Bebida", "Sobremesa"]
+
+
+@pytest.fixture(scope="session")
+def db_session():
+    engine = create_engine(DATABASE_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    categories = [CategoryModel(name=name) for name in CATEGORIES]
+    session.add_all(categories)
+    session.flush()
+    for index in range(PRODUCTS):
+        product = ProductModel(
+            sku=f"SKU{index:06d}",
+            name=f"Product {index}",
+            description="Benchmark product",
+            images=["https://example.com/image.png"],
+            category_id=categories[index % len(categories)].id,
+        )
+        session.add(product)
+        session.flush()
+        session.add(PriceModel(product_id=product.id, amount=9.99))
+        session.add(InventoryModel(product_id=product.id, quantity=100))
+    session.commit()
+    yield session
+    session.close()
+    Base.metadata.drop_all(engine)
+    engine.dispose()
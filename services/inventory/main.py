@@ -5,21 +5,38 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from src.adapters.api import (
     category_api,
+    debug_api,
     health_api,
     inventory_api,
+    metrics_api,
     product_api,
 )
+from src.adapters.dependencies import get_health_monitor, get_product_cache
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
 from src.application.services.product_service import ProductService
+from src.config import Config
 from src.infrastructure.messaging.inventory_subscriber import (
     InventorySubscriber,
 )
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
 from src.infrastructure.persistence.db_setup import SessionLocal
 from src.infrastructure.persistence.sqlalchemy_category_repository import (
     SQLAlchemyCategoryRepository,
 )
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
 from src.infrastructure.persistence.sqlalchemy_product_repository import (
     SQLAlchemyProductRepository,
 )
+from src.infrastructure.tracing.exporters import start_tracing
+from src.infrastructure.tracing.tracer import tracer
 
 logger = logging.getLogger("app")
 logger.setLevel(logging.INFO)
@@ -35,18 +52,36 @@ logger.addHandler(console_handler)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    start_tracing(tracer)
+    health_monitor = get_health_monitor()
+    health_monitor.start()
     db = SessionLocal()
     product_repository = SQLAlchemyProductRepository(db)
     category_repository = SQLAlchemyCategoryRepository(db)
-    product_service = ProductService(product_repository, category_repository)
+    product_service = ProductService(
+        product_repository, category_repository, get_product_cache()
+    )
 
-    inventory_subscriber = InventorySubscriber(product_service)
+    deduplicator = MessageDeduplicator(
+        SQLAlchemyProcessedMessageRepository(db)
+    )
+    inventory_subscriber = InventorySubscriber(
+        product_service, deduplicator=deduplicator
+    )
     threading.Thread(target=inventory_subscriber.start_consuming).start()
     yield
+    health_monitor.stop()
+    tracer.shutdown()
 
 
 app = FastAPI(lifespan=lifespan, root_path="/inventory")
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(category_api.router)
 app.include_router(product_api.router)
 app.include_router(inventory_api.router)
 app.include_router(health_api.router)
+app.include_router(metrics_api.router)
+if Config.DEBUG_ENDPOINTS_ENABLED:
+    app.include_router(debug_api.router)
@@ -0,0 +1,34 @@
+"""feat: add product updated_at for conditional reads
+
+Revision ID: 4e8a2d6c1b95
+Revises: 7b1d4e9c2a63
+Create Date: 2026-10-19 14:02:41.530219
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8a2d6c1b95"
+down_revision: Union[str, None] = "7b1d4e9c2a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "products",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("products", "updated_at")
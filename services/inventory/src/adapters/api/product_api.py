@@ -1,6 +1,9 @@
-from typing import List
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from src.adapters.dependencies import get_product_service
 from src.application.dto.product_dto import (
     ProductCreate,
@@ -8,13 +11,46 @@ from src.application.dto.product_dto import (
     ProductsPaginatedResponse,
     ProductUpdate,
 )
-from src.application.dto.serializers import serialize_product
+from src.application.dto.serializers import (
+    serialize_product,
+    serialize_product_row,
+)
 from src.application.services.product_service import ProductService
 from src.domain.exceptions import EntityAlreadyExists, EntityNotFound
 
 router = APIRouter()
 
 
+def _validators(last_modified: datetime) -> Dict[str, str]:
+    last_modified = last_modified.replace(tzinfo=timezone.utc)
+    version = (
+        int(last_modified.timestamp()) * 1_000_000 + last_modified.microsecond
+    )
+    return {
+        "ETag": f'"{version:x}"',
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": "no-cache",
+    }
+
+
+def _is_not_modified(request: Request, validators: Dict[str, str]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        etags = [
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ]
+        return "*" in etags or validators["ETag"] in etags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+        return parsedate_to_datetime(validators["Last-Modified"]) <= since
+    except (TypeError, ValueError):
+        return False
+
+
 @router.post("/products/", tags=["Product"], response_model=ProductResponse)
 def create_product(
     product: ProductCreate,
@@ -49,27 +85,40 @@ def read_products_paginated(
         records_per_page,
         number_of_pages,
         total_records,
-    ) = service.list_products_paginated(current_page, records_per_page)
-    response = {
-        "products": [serialize_product(product) for product in products],
-        "pagination": {
-            "current_page": current_page,
-            "records_per_page": records_per_page,
-            "number_of_pages": number_of_pages,
-            "total_records": total_records,
-        },
-    }
-    return response
+    ) = service.list_product_summaries_paginated(
+        current_page, records_per_page
+    )
+    # Rows are trusted, so the page skips response_model validation
+    return ORJSONResponse(
+        {
+            "products": [serialize_product_row(row) for row in products],
+            "pagination": {
+                "current_page": current_page,
+                "records_per_page": records_per_page,
+                "number_of_pages": number_of_pages,
+                "total_records": total_records,
+            },
+        }
+    )
 
 
 @router.get(
     "/products/{sku}", tags=["Product"], response_model=ProductResponse
 )
 def read_product(
-    sku: str, service: ProductService = Depends(get_product_service)
+    sku: str,
+    request: Request,
+    response: Response,
+    service: ProductService = Depends(get_product_service),
 ):
     try:
+        # Validators come from the entity the (cached) lookup returns, so a
+        # revalidation costs no database read when the product is cached
         product = service.get_product_by_sku(sku)
+        validators = _validators(product.updated_at)
+        if _is_not_modified(request, validators):
+            return Response(status_code=304, headers=validators)
+        response.headers.update(validators)
         return serialize_product(product)
     except EntityNotFound as e:
         raise HTTPException(status_code=404, detail=str(e))
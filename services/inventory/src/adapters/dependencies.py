@@ -1,9 +1,17 @@
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.application.services.product_service import ProductService
 from src.config import Config
+from src.infrastructure.cache.product_cache import (
+    ProductCache,
+    build_product_cache,
+)
+from src.infrastructure.concurrency.single_flight import SingleFlight
+from src.infrastructure.health.health_monitor import HealthMonitor
 from src.infrastructure.health.health_service import HealthService
-from src.infrastructure.persistence.db_setup import get_db
+from src.infrastructure.persistence.db_setup import SessionLocal, get_db
 from src.infrastructure.persistence.sqlalchemy_category_repository import (
     SQLAlchemyCategoryRepository,
 )
@@ -16,7 +24,37 @@ def get_health_service(db: Session = Depends(get_db)) -> HealthService:
     return HealthService(db, rabbitmq_host=Config.BROKER_HOST)
 
 
-def get_product_service(db: Session = Depends(get_db)) -> ProductService:
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    health_service = get_health_service(SessionLocal())
+    return HealthMonitor(
+        {
+            "database": health_service.check_database,
+            "rabbitmq": health_service.check_rabbitmq,
+        }
+    )
+
+
+@lru_cache
+def get_product_cache() -> ProductCache:
+    return build_product_cache()
+
+
+@lru_cache
+def get_product_single_flight() -> SingleFlight:
+    return SingleFlight("product_lookup")
+
+
+def get_product_service(
+    db: Session = Depends(get_db),
+    product_cache: ProductCache = Depends(get_product_cache),
+    single_flight: SingleFlight = Depends(get_product_single_flight),
+) -> ProductService:
     product_repository = SQLAlchemyProductRepository(db)
     category_repository = SQLAlchemyCategoryRepository(db)
-    return ProductService(product_repository, category_repository)
+    return ProductService(
+        product_repository,
+        category_repository,
+        product_cache,
+        single_flight,
+    )
@@ -1,3 +1,5 @@
+from typing import Mapping
+
 from src.application.dto.category_dto import CategoryResponse
 from src.application.dto.product_dto import ProductResponse
 from src.domain.entities.category_entity import CategoryEntity
@@ -16,6 +18,24 @@ def serialize_product(product: ProductEntity) -> ProductResponse:
     )
 
 
+# Maps a product summary row (see list_summaries_paginated) straight to the
+# ProductResponse shape without building an entity or validating a model;
+# rendered with ORJSONResponse on the product list.
+def serialize_product_row(row: Mapping) -> dict:
+    # The price comes from an outer join, so a product without a price row
+    # yields None rather than failing the whole page
+    price = row["price"]
+    return {
+        "sku": row["sku"],
+        "name": row["name"],
+        "category_name": row["category_name"],
+        "price": float(price) if price is not None else None,
+        "quantity": row["quantity"],
+        "description": row["description"],
+        "images": row["images"],
+    }
+
+
 def serialize_category(category: CategoryEntity) -> CategoryResponse:
     return CategoryResponse(
         id=category.id,
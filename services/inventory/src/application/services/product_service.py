@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.entities.inventory_entity import InventoryEntity
@@ -8,6 +8,8 @@ from src.domain.entities.product_entity import ProductEntity
 from src.domain.exceptions import EntityAlreadyExists, EntityNotFound
 from src.domain.repositories.category_repository import CategoryRepository
 from src.domain.repositories.product_repository import ProductRepository
+from src.infrastructure.cache.product_cache import ProductCache
+from src.infrastructure.concurrency.single_flight import SingleFlight
 
 logger = logging.getLogger("app")
 
@@ -17,9 +19,13 @@ class ProductService:
         self,
         product_repository: ProductRepository,
         category_repository: CategoryRepository,
+        product_cache: Optional[ProductCache] = None,
+        single_flight: Optional[SingleFlight] = None,
     ):
         self.product_repository = product_repository
         self.category_repository = category_repository
+        self.product_cache = product_cache
+        self.single_flight = single_flight or SingleFlight("product_lookup")
 
     def create_product(
         self,
@@ -57,11 +63,31 @@ class ProductService:
         return new_product
 
     def get_product_by_sku(self, sku: str) -> ProductEntity:
+        return self.single_flight.do(sku, lambda: self._load_product(sku))
+
+    def _load_product(self, sku: str) -> ProductEntity:
+        if self.product_cache is None:
+            return self._find_product(sku)
+        product = self.product_cache.get(sku)
+        if product is not None:
+            return product
+        # Taken before the read so a write that lands meanwhile keeps the
+        # row it replaced out of the cache
+        generation = self.product_cache.generation(sku)
+        product = self._find_product(sku)
+        self.product_cache.set(sku, product, generation)
+        return product
+
+    def _find_product(self, sku: str) -> ProductEntity:
         product = self.product_repository.find_by_sku(sku)
         if not product:
             raise EntityNotFound(f"Product with SKU '{sku}' not found")
         return product
 
+    def _invalidate_cache(self, *skus: str):
+        if self.product_cache is not None:
+            self.product_cache.invalidate(*skus)
+
     def update_product(
         self,
         sku: str,
@@ -88,6 +114,7 @@ class ProductService:
         product.description = description
         product.images = images or []
         updated_product = self.product_repository.save(product)
+        self._invalidate_cache(sku)
         return updated_product
 
     def delete_product(self, sku: str) -> ProductEntity:
@@ -96,6 +123,7 @@ class ProductService:
             raise EntityNotFound(f"Product with SKU '{sku}' not found")
 
         self.product_repository.delete(product)
+        self._invalidate_cache(sku)
         return product
 
     def list_products(self) -> List[ProductEntity]:
@@ -116,6 +144,7 @@ class ProductService:
 
         product.add_inventory(quantity)
         self.product_repository.save(product)
+        self._invalidate_cache(sku)
         return product
 
     def subtract_inventory(self, sku: str, quantity: int) -> ProductEntity:
@@ -125,8 +154,25 @@ class ProductService:
 
         product.subtract_inventory(quantity)
         self.product_repository.save(product)
+        self._invalidate_cache(sku)
         return product
 
+    def apply_inventory_deltas(
+        self,
+        deltas: Dict[str, int],
+        before_commit: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[str]:
+        rejected_skus = self.product_repository.apply_inventory_deltas(
+            deltas, before_commit
+        )
+        self._invalidate_cache(*deltas)
+        for sku in rejected_skus:
+            logger.error(
+                f"Net inventory delta {deltas[sku]} for SKU {sku} "
+                "rejected: product not found or insufficient stock."
+            )
+        return rejected_skus
+
     def create_category(self, name: str) -> CategoryEntity:
         category = self.category_repository.find_by_name(name)
         if category:
@@ -160,6 +206,13 @@ class ProductService:
             total_records,
         )
 
+    def list_product_summaries_paginated(
+        self, current_page: int, records_per_page: int
+    ):
+        return self.product_repository.list_summaries_paginated(
+            current_page, records_per_page
+        )
+
     def list_categories_paginated(
         self, current_page: int, records_per_page: int
     ):
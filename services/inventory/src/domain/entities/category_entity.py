@@ -4,12 +4,26 @@ from src.domain.exceptions import InvalidEntity
 
 
 class CategoryEntity:
+    __slots__ = (
+        "_name",
+        "_id",
+    )
+
     def __init__(self, name: str, id: Optional[int] = None):
         self._id = id
         self._name = name
         self._validate_id(self._id)
         self._validate_name(self._name)
 
+    @classmethod
+    def from_trusted_row(
+        cls, name: str, id: Optional[int] = None
+    ) -> "CategoryEntity":
+        entity = cls.__new__(cls)
+        entity._name = name
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
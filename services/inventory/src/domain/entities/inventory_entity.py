@@ -4,6 +4,11 @@ from src.domain.exceptions import InvalidEntity
 
 
 class InventoryEntity:
+    __slots__ = (
+        "_quantity",
+        "_id",
+    )
+
     def __init__(self, quantity: int, id: Optional[int] = None):
         self._id = id
         self._quantity = quantity
@@ -12,6 +17,15 @@ class InventoryEntity:
         self._validate_id(self._id)
         self._validate_quantity(self._quantity)
 
+    @classmethod
+    def from_trusted_row(
+        cls, quantity: int, id: Optional[int] = None
+    ) -> "InventoryEntity":
+        entity = cls.__new__(cls)
+        entity._quantity = quantity
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
@@ -4,6 +4,11 @@ from src.domain.exceptions import InvalidEntity
 
 
 class PriceEntity:
+    __slots__ = (
+        "_amount",
+        "_id",
+    )
+
     def __init__(self, amount: float, id: Optional[int] = None):
         self._id = id
         self._amount = amount
@@ -12,6 +17,15 @@ class PriceEntity:
         self._validate_id(self._id)
         self._validate_amount(self._amount)
 
+    @classmethod
+    def from_trusted_row(
+        cls, amount: float, id: Optional[int] = None
+    ) -> "PriceEntity":
+        entity = cls.__new__(cls)
+        entity._amount = amount
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
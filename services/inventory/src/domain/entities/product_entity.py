@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Optional
 
 from src.domain.entities.category_entity import CategoryEntity
@@ -7,6 +8,17 @@ from src.domain.exceptions import InvalidEntity
 
 
 class ProductEntity:
+    __slots__ = (
+        "_sku",
+        "_name",
+        "_category",
+        "_price",
+        "_inventory",
+        "_description",
+        "_images",
+        "_id",
+        "_updated_at",
+    )
 
     def __init__(
         self,
@@ -18,6 +30,7 @@ class ProductEntity:
         description: Optional[str] = None,
         images: Optional[List[str]] = None,
         id: Optional[int] = None,
+        updated_at: Optional[datetime] = None,
     ):
         self._id = id
         self._sku = sku
@@ -28,6 +41,7 @@ class ProductEntity:
         self._inventory = inventory
         self._description = description
         self._images = images
+        self._updated_at = updated_at
 
         self._validate_id(self._id)
         self._validate_sku(self._sku)
@@ -35,6 +49,33 @@ class ProductEntity:
         if self._images:
             self._validate_images(self._images)
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        sku: str,
+        name: str,
+        category: CategoryEntity,
+        price: PriceEntity,
+        inventory: InventoryEntity,
+        description: Optional[str] = None,
+        images: Optional[List[str]] = None,
+        id: Optional[int] = None,
+        updated_at: Optional[datetime] = None,
+    ) -> "ProductEntity":
+        # Used by the repositories for already-validated database rows;
+        # input from clients goes through __init__ and its checks
+        entity = cls.__new__(cls)
+        entity._sku = sku
+        entity._name = name
+        entity._category = category
+        entity._price = price
+        entity._inventory = inventory
+        entity._description = description
+        entity._images = images
+        entity._id = id
+        entity._updated_at = updated_at
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
@@ -44,6 +85,11 @@ class ProductEntity:
         self._validate_id(value)
         self._id = value
 
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        # Version of the row the entity was loaded from
+        return self._updated_at
+
     @property
     def sku(self) -> str:
         return self._sku
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ProcessedMessageRepository(ABC):
+    # add stages the ledger row in the current transaction, so it commits
+    # or rolls back together with the handler's writes
+    @abstractmethod
+    def add(self, message_id: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, message_id: str):
+        raise NotImplementedError
+
+    @abstractmethod
+    def commit(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def rollback(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete_older_than(self, cutoff: datetime) -> int:
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.entities.product_entity import ProductEntity
@@ -22,8 +22,24 @@ class ProductRepository(ABC):
     def list_all(self) -> List[ProductEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def list_summaries_paginated(
+        self, current_page: int, records_per_page: int
+    ):
+        raise NotImplementedError
+
     @abstractmethod
     def find_by_category(
         self, category: CategoryEntity
     ) -> List[ProductEntity]:
         raise NotImplementedError
+
+    # before_commit receives the rejected SKUs inside the transaction, so
+    # callers can stage or veto related writes before it commits
+    @abstractmethod
+    def apply_inventory_deltas(
+        self,
+        deltas: Dict[str, int],
+        before_commit: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[str]:
+        raise NotImplementedError
@@ -0,0 +1,167 @@
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from src.config import Config
+from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
+from src.domain.entities.price_entity import PriceEntity
+from src.domain.entities.product_entity import ProductEntity
+from src.infrastructure.metrics.metrics_registry import registry
+
+logger = logging.getLogger("app")
+
+CachedValue = Tuple[bytes, Optional[float]]
+
+
+class LRUCacheBackend:
+    # Implements the subset of the redis-py client API used by
+    # ProductCache, so a redis.Redis instance can be swapped in unchanged.
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, CachedValue]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ex: Optional[float] = None):
+        expires_at = time.monotonic() + ex if ex else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(
+                self._entries.pop(key, None) is not None for key in keys
+            )
+
+
+def product_to_dict(product: ProductEntity) -> dict:
+    updated_at = product.updated_at
+    return {
+        "id": product.id,
+        "sku": product.sku,
+        "name": product.name,
+        "category": {"id": product.category.id, "name": product.category.name},
+        "price": {"id": product.price.id, "amount": product.price.amount},
+        "inventory": {
+            "id": product.inventory.id,
+            "quantity": product.inventory.quantity,
+        },
+        "description": product.description,
+        "images": product.images,
+        "updated_at": updated_at.isoformat() if updated_at else None,
+    }
+
+
+def product_from_dict(data: dict) -> ProductEntity:
+    updated_at = data["updated_at"]
+    return ProductEntity.from_trusted_row(
+        id=data["id"],
+        sku=data["sku"],
+        name=data["name"],
+        category=CategoryEntity.from_trusted_row(**data["category"]),
+        price=PriceEntity.from_trusted_row(**data["price"]),
+        inventory=InventoryEntity.from_trusted_row(**data["inventory"]),
+        description=data["description"],
+        images=data["images"],
+        updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+    )
+
+
+class ProductCache:
+    # Products are stored as JSON so callers never share a mutable entity
+    # with the cache and nothing read back from a shared backend is
+    # executable. The TTL bounds staleness when another replica writes
+    # through its own cache. Bump the version when the JSON layout changes
+    KEY_PREFIX = "inventory:product:v3:"
+
+    def __init__(self, backend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl if ttl is not None else Config.PRODUCT_CACHE_TTL
+        # Per-SKU invalidation counters: a fill whose read started before
+        # an invalidation must not write the old row back into the cache
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.requests = registry.counter(
+            "product_cache_requests_total",
+            "Product cache lookups by result.",
+            ["result"],
+        )
+
+    def _key(self, sku: str) -> str:
+        return f"{self.KEY_PREFIX}{sku}"
+
+    def get(self, sku: str) -> Optional[ProductEntity]:
+        try:
+            value = self.backend.get(self._key(sku))
+        except Exception as e:
+            logger.error(f"Product cache read failed for SKU {sku}: {e}")
+            value = None
+        if value is None:
+            self.requests.inc(result="miss")
+            return None
+        self.requests.inc(result="hit")
+        return product_from_dict(json.loads(value))
+
+    def generation(self, sku: str) -> int:
+        with self._lock:
+            return self._generations.get(sku, 0)
+
+    def set(
+        self,
+        sku: str,
+        product: ProductEntity,
+        generation: Optional[int] = None,
+    ):
+        if generation is None:
+            generation = self.generation(sku)
+        elif self.generation(sku) != generation:
+            return
+        value = json.dumps(product_to_dict(product)).encode("utf-8")
+        try:
+            self.backend.set(self._key(sku), value, ex=self.ttl or None)
+            # An invalidation that ran during the write may have deleted
+            # the key before this value landed, so drop it again
+            if self.generation(sku) != generation:
+                self.backend.delete(self._key(sku))
+        except Exception as e:
+            logger.error(f"Product cache write failed for SKU {sku}: {e}")
+
+    def invalidate(self, *skus: str):
+        if not skus:
+            return
+        with self._lock:
+            for sku in skus:
+                self._generations[sku] = self._generations.get(sku, 0) + 1
+        try:
+            self.backend.delete(*(self._key(sku) for sku in skus))
+        except Exception as e:
+            logger.error(f"Product cache invalidation failed for {skus}: {e}")
+
+
+def build_product_cache() -> ProductCache:
+    if Config.PRODUCT_CACHE_BACKEND == "redis":
+        import redis
+
+        backend = redis.Redis.from_url(Config.PRODUCT_CACHE_REDIS_URL)
+    else:
+        backend = LRUCacheBackend(Config.PRODUCT_CACHE_SIZE)
+    return ProductCache(backend)
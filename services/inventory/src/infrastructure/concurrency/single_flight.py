@@ -0,0 +1,55 @@
+import copy
+import threading
+from typing import Callable, Dict, Hashable, Optional, TypeVar
+
+from src.infrastructure.metrics.metrics_registry import registry
+
+T = TypeVar("T")
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    # Concurrent calls for the same key wait for the first caller's fetch
+    # and all receive its result (or exception) instead of repeating it.
+    # Waiters get a deep copy so no two callers share a mutable result.
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = registry.counter(
+            "single_flight_calls_total",
+            "Single-flight calls by whether they ran or shared the fetch.",
+            ["name", "result"],
+        )
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.calls.inc(name=self.name, result="shared")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        self.calls.inc(name=self.name, result="leader")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -11,6 +11,7 @@ class HealthService:
     def __init__(self, db: Session, rabbitmq_host: str):
         self.db = db
         self.rabbitmq_host = rabbitmq_host
+        self.rabbitmq_connection = None
 
     def check_database(self) -> bool:
         try:
@@ -20,18 +21,28 @@ class HealthService:
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return False
+        finally:
+            # Hands the connection back to the pool between checks
+            self.db.close()
 
     def check_rabbitmq(self) -> bool:
         try:
-            connection = pika.BlockingConnection(
-                pika.ConnectionParameters(
-                    host=self.rabbitmq_host, heartbeat=120
+            # Reuses one connection across checks instead of opening and
+            # closing a new one on every probe
+            if (
+                self.rabbitmq_connection is None
+                or not self.rabbitmq_connection.is_open
+            ):
+                self.rabbitmq_connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(
+                        host=self.rabbitmq_host, heartbeat=120
+                    )
                 )
-            )
-            connection.close()
+            self.rabbitmq_connection.process_data_events(time_limit=0)
             return True
         except Exception as e:
             logger.error(f"RabbitMQ health check failed: {e}")
+            self.rabbitmq_connection = None
             return False
 
     def get_health_status(self) -> dict:
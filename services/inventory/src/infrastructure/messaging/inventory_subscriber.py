@@ -2,12 +2,19 @@ import json
 import logging
 import socket
 import time
+from typing import Dict, List, Optional, Set, Tuple
 
 import pika
 from pika.adapters.blocking_connection import BlockingChannel
 from pika.spec import Basic
 from src.application.services.product_service import ProductService
 from src.config import Config
+from src.infrastructure.messaging.consumer_metrics import instrument_consumer
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.retry_topology import RetryTopology
+from src.infrastructure.tracing.tracer import traced_consumer
 
 logger = logging.getLogger("app")
 
@@ -18,6 +25,11 @@ class InventorySubscriber:
         product_service: ProductService,
         max_retries: int = 5,
         delay: int = 5,
+        aggregate: Optional[bool] = None,
+        aggregation_window: Optional[float] = None,
+        aggregation_max_batch: Optional[int] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        retry_topology: Optional[RetryTopology] = None,
     ):
         self.product_service = product_service
         self.connection_params = pika.ConnectionParameters(
@@ -25,6 +37,27 @@ class InventorySubscriber:
         )
         self.max_retries = max_retries
         self.delay = delay
+        self.aggregate = (
+            Config.INVENTORY_AGGREGATION_ENABLED
+            if aggregate is None
+            else aggregate
+        )
+        self.aggregation_window = (
+            aggregation_window or Config.INVENTORY_AGGREGATION_WINDOW
+        )
+        self.aggregation_max_batch = (
+            aggregation_max_batch or Config.INVENTORY_AGGREGATION_MAX_BATCH
+        )
+        self._pending_count = 0
+        self._pending_delivery_tag: Optional[int] = None
+        # Properties, body, SKU and delta of each buffered message
+        self._pending_messages: List[Tuple[Basic, bytes, str, int]] = []
+        self._pending_message_ids: Set[str] = set()
+        self._flush_timer = None
+        self.deduplicator = deduplicator
+        self.retry_topology = retry_topology or RetryTopology(
+            "inventory_queue"
+        )
 
     def connect(self) -> bool:
         attempts = 0
@@ -59,6 +92,9 @@ class InventorySubscriber:
             queue="inventory_queue",
             routing_key="inventory_queue",
         )
+        self.retry_topology.declare(self.channel)
+        if self.aggregate:
+            self.channel.basic_qos(prefetch_count=self.aggregation_max_batch)
 
         self.channel.basic_consume(
             queue="inventory_queue",
@@ -67,8 +103,19 @@ class InventorySubscriber:
         )
 
         logger.info("Starting to consume messages from inventory_queue.")
+        self.schedule_queue_sampling()
         self.channel.start_consuming()
 
+    def schedule_queue_sampling(self) -> None:
+        connection = getattr(self, "connection", None)
+        if connection is None:
+            return
+        self.on_message.consumer_metrics.schedule_sampling(
+            connection, self.channel
+        )
+
+    @instrument_consumer("inventory_queue")
+    @traced_consumer("inventory_queue")
     def on_message(
         self,
         ch: BlockingChannel,
@@ -77,6 +124,16 @@ class InventorySubscriber:
         body: bytes,
     ) -> None:
         logger.info(f"Received message from inventory_queue: {body}")
+        if self._is_duplicate(properties):
+            logger.info(
+                f"Skipping duplicate message {properties.message_id} "
+                "from inventory_queue."
+            )
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
+        if self.aggregate:
+            self._buffer_message(ch, method, properties, body)
+            return
         try:
             data = json.loads(body.decode("utf-8"))
             sku = data.get("sku")
@@ -89,7 +146,181 @@ class InventorySubscriber:
             elif action == "subtract":
                 self.product_service.subtract_inventory(sku, quantity)
                 logger.info(f"Subtracted {quantity} from SKU: {sku}.")
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
         except Exception as e:
             logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
         finally:
             ch.basic_ack(delivery_tag=method.delivery_tag)
+
+    def _is_duplicate(self, properties: Basic) -> bool:
+        if not self.deduplicator:
+            return False
+        message_id = MessageDeduplicator.get_message_id(properties)
+        if message_id and message_id in self._pending_message_ids:
+            return True
+        if self.aggregate:
+            # Buffered messages are claimed when their batch is applied
+            return False
+        return self.deduplicator.is_duplicate(properties)
+
+    def _buffer_message(
+        self,
+        ch: BlockingChannel,
+        method: Basic.Deliver,
+        properties: Basic,
+        body: bytes,
+    ) -> None:
+        try:
+            data = json.loads(body.decode("utf-8"))
+            sku = data.get("sku")
+            action = data.get("action")
+            quantity = data.get("quantity")
+
+            if not isinstance(quantity, int) or quantity < 0:
+                raise ValueError(f"Invalid quantity: {quantity}")
+            if action == "add":
+                delta = quantity
+            elif action == "subtract":
+                delta = -quantity
+            else:
+                raise ValueError(f"Invalid action: {action}")
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            self.retry_topology.retry(ch, properties, body, e)
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
+
+        self._pending_count += 1
+        self._pending_delivery_tag = method.delivery_tag
+        self._pending_messages.append((properties, body, sku, delta))
+        message_id = MessageDeduplicator.get_message_id(properties)
+        if message_id:
+            self._pending_message_ids.add(message_id)
+
+        if self._pending_count >= self.aggregation_max_batch:
+            self.flush(ch)
+        elif self._flush_timer is None:
+            self._flush_timer = self.connection.call_later(
+                self.aggregation_window, lambda: self._on_flush_timer(ch)
+            )
+
+    def _on_flush_timer(self, ch: BlockingChannel) -> None:
+        self._flush_timer = None
+        self.flush(ch)
+
+    def flush(self, ch: BlockingChannel) -> None:
+        if self._flush_timer is not None:
+            self.connection.remove_timeout(self._flush_timer)
+            self._flush_timer = None
+        if not self._pending_count:
+            return
+
+        delivery_tag = self._pending_delivery_tag
+        pending_messages = self._pending_messages
+        self._pending_count = 0
+        self._pending_delivery_tag = None
+        self._pending_messages = []
+        self._pending_message_ids = set()
+
+        # Ledger rows are staged in the batch transaction, so they commit
+        # together with the deltas they account for
+        messages = [
+            message
+            for message in pending_messages
+            if not self._claim(message[0])
+        ]
+        deltas: Dict[str, int] = {}
+        for _, _, sku, delta in messages:
+            deltas[sku] = deltas.get(sku, 0) + delta
+
+        try:
+            rejected_skus = set(
+                self.product_service.apply_inventory_deltas(
+                    deltas,
+                    lambda rejected: self._forget_rejected(messages, rejected),
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error applying {len(messages)} inventory messages: {e}"
+            )
+            if self.deduplicator:
+                self.deduplicator.discard()
+            for properties, body, _, _ in messages:
+                self.retry_topology.retry(ch, properties, body, e)
+            ch.basic_ack(delivery_tag=delivery_tag, multiple=True)
+            return
+
+        for properties, body, sku, delta in messages:
+            # A rejected net delta may hide messages that apply on their
+            # own, e.g. an add netted with an over-large subtract
+            if sku in rejected_skus and not self._apply_single(
+                ch, properties, body, sku, delta
+            ):
+                continue
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
+        ch.basic_ack(delivery_tag=delivery_tag, multiple=True)
+        logger.info(
+            f"Applied {len(messages)} inventory messages as "
+            f"{len(deltas)} net SKU deltas, replaying "
+            f"{len(rejected_skus)} rejected SKUs one message at a time."
+        )
+
+    def _claim(self, properties: Basic) -> bool:
+        # True when the message was already processed and must be skipped
+        if not self.deduplicator or not self.deduplicator.is_duplicate(
+            properties
+        ):
+            return False
+        logger.info(
+            f"Skipping duplicate message {properties.message_id} "
+            "from inventory_queue."
+        )
+        return True
+
+    def _forget_rejected(
+        self,
+        messages: List[Tuple[Basic, bytes, str, int]],
+        rejected_skus: List[str],
+    ) -> None:
+        if not self.deduplicator:
+            return
+        for properties, _, sku, _ in messages:
+            if sku in rejected_skus:
+                self.deduplicator.forget(properties)
+
+    def _apply_single(
+        self,
+        ch: BlockingChannel,
+        properties: Basic,
+        body: bytes,
+        sku: str,
+        delta: int,
+    ) -> bool:
+        if self._claim(properties):
+            return True
+        try:
+            self.product_service.apply_inventory_deltas(
+                {sku: delta}, self._raise_if_rejected
+            )
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
+            return False
+        return True
+
+    @staticmethod
+    def _raise_if_rejected(rejected_skus: List[str]) -> None:
+        # Rolls back the message's ledger row along with the no-op update
+        if rejected_skus:
+            raise ValueError(
+                f"Inventory delta for SKU {rejected_skus[0]} rejected: "
+                "product not found or insufficient stock."
+            )
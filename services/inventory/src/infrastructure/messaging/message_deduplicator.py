@@ -0,0 +1,81 @@
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.config import Config
+from src.domain.repositories.processed_message_repository import (
+    ProcessedMessageRepository,
+)
+
+logger = logging.getLogger("app")
+
+
+class MessageDeduplicator:
+    def __init__(
+        self,
+        repository: ProcessedMessageRepository,
+        ttl: Optional[int] = None,
+        eviction_interval: Optional[int] = None,
+    ):
+        self.repository = repository
+        self.ttl = ttl or Config.MESSAGE_LEDGER_TTL
+        self.eviction_interval = (
+            eviction_interval or Config.MESSAGE_LEDGER_EVICTION_INTERVAL
+        )
+        self._last_eviction = time.monotonic()
+
+    @staticmethod
+    def get_message_id(properties) -> Optional[str]:
+        return getattr(properties, "message_id", None)
+
+    def is_duplicate(self, properties) -> bool:
+        # Claims the message by staging its ledger row; the handler's
+        # commit records it, and a failed handler rolls it back via discard
+        message_id = self.get_message_id(properties)
+        if not message_id:
+            return False
+        try:
+            return not self.repository.add(message_id)
+        except Exception as e:
+            # Fall back to processing: at-least-once beats dropping
+            logger.error(f"Processed-message lookup failed: {e}")
+            self._rollback()
+            return False
+
+    def mark_processed(self, properties):
+        if not self.get_message_id(properties):
+            return
+        try:
+            self.repository.commit()
+            self._evict_expired()
+        except Exception as e:
+            logger.error(f"Failed to record processed message: {e}")
+            self._rollback()
+
+    def forget(self, properties):
+        # Drops only this message's staged ledger row, leaving the rest of
+        # the transaction to commit
+        message_id = self.get_message_id(properties)
+        if message_id:
+            self.repository.remove(message_id)
+
+    def discard(self):
+        # Drops the staged ledger row with whatever the handler left behind
+        self._rollback()
+
+    def _rollback(self):
+        try:
+            self.repository.rollback()
+        except Exception as e:
+            logger.error(f"Failed to roll back processed message: {e}")
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        if now - self._last_eviction < self.eviction_interval:
+            return
+        self._last_eviction = now
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl)
+        deleted = self.repository.delete_older_than(cutoff)
+        if deleted:
+            logger.info(f"Evicted {deleted} expired processed messages.")
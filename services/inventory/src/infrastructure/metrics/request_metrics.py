@@ -0,0 +1,76 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestStats:
+    # Database and outbound HTTP work done on behalf of one request. Sync
+    # endpoints run in the threadpool with a copy of the request context,
+    # which still points at the same instance.
+    __slots__ = ("queries", "query_seconds", "outbound_calls", "_lock")
+
+    def __init__(self):
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.outbound_calls = 0
+        self._lock = threading.Lock()
+
+    def add_query(self, seconds: float):
+        with self._lock:
+            self.queries += 1
+            self.query_seconds += seconds
+
+    def add_outbound_call(self):
+        with self._lock:
+            self.outbound_calls += 1
+
+
+_current_stats: contextvars.ContextVar[Optional[RequestStats]] = (
+    contextvars.ContextVar("request_stats", default=None)
+)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current_stats.get()
+
+
+@contextmanager
+def track_request() -> Iterator[RequestStats]:
+    stats = RequestStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def record_query(seconds: float):
+    # Queries outside a request (consumers, relays) are not attributed
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.add_query(seconds)
+
+
+def _before_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    context._request_metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn, cursor, statement, parameters, context, executemany
+):
+    started = getattr(context, "_request_metrics_started", None)
+    if started is not None:
+        record_query(time.perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
@@ -1,4 +1,15 @@
-from sqlalchemy import JSON, Column, Float, ForeignKey, Integer, String, Text
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from src.infrastructure.persistence.db_setup import Base
 
@@ -18,10 +29,26 @@ class ProductModel(Base):
     description = Column(Text, nullable=True)  # New field for description
     images = Column(JSON, default=[])  # New field for images as JSON list
     category_id = Column(Integer, ForeignKey("categories.id"))
-    category = relationship("CategoryModel", back_populates="products")
-    price = relationship("PriceModel", uselist=False, back_populates="product")
+    # Eager so listing products costs a fixed number of queries, not
+    # three more per row
+    category = relationship(
+        "CategoryModel", back_populates="products", lazy="selectin"
+    )
+    price = relationship(
+        "PriceModel", uselist=False, back_populates="product", lazy="selectin"
+    )
     inventory = relationship(
-        "InventoryModel", uselist=False, back_populates="product"
+        "InventoryModel",
+        uselist=False,
+        back_populates="product",
+        lazy="selectin",
+    )
+    # Bumped on every write to the product, its price or its inventory
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=False,
     )
 
 
@@ -39,3 +66,9 @@ class InventoryModel(Base):
     product_id = Column(Integer, ForeignKey("products.id"))
     quantity = Column(Integer)
     product = relationship("ProductModel", back_populates="inventory")
+
+
+class ProcessedMessageModel(Base):
+    __tablename__ = "processed_messages"
+    message_id = Column(String(64), primary_key=True)
+    processed_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -5,10 +5,12 @@ from sqlalchemy.orm import Session
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.repositories.category_repository import CategoryRepository
 from src.infrastructure.persistence.models import CategoryModel
+from src.infrastructure.tracing.tracer import traced_repository
 
 logger = logging.getLogger("app")
 
 
+@traced_repository("postgresql")
 class SQLAlchemyCategoryRepository(CategoryRepository):
     def __init__(self, db: Session):
         self.db = db
@@ -27,13 +29,17 @@ class SQLAlchemyCategoryRepository(CategoryRepository):
             .first()
         )
         if db_category:
-            return CategoryEntity(id=db_category.id, name=db_category.name)
+            return CategoryEntity.from_trusted_row(
+                id=db_category.id, name=db_category.name
+            )
         return None
 
     def list_all(self) -> List[CategoryEntity]:
         db_categories = self.db.query(CategoryModel).all()
         return [
-            CategoryEntity(id=db_category.id, name=db_category.name)
+            CategoryEntity.from_trusted_row(
+                id=db_category.id, name=db_category.name
+            )
             for db_category in db_categories
         ]
 
@@ -47,7 +53,9 @@ class SQLAlchemyCategoryRepository(CategoryRepository):
         )  # Apply limit and offset
 
         categories = [
-            CategoryEntity(id=db_category.id, name=db_category.name)
+            CategoryEntity.from_trusted_row(
+                id=db_category.id, name=db_category.name
+            )
             for db_category in db_categories
         ]
 
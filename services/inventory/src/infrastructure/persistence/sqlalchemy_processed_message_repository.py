@@ -0,0 +1,51 @@
+from datetime import datetime
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.domain.repositories.processed_message_repository import (
+    ProcessedMessageRepository,
+)
+from src.infrastructure.persistence.models import ProcessedMessageModel
+from src.infrastructure.tracing.tracer import traced_repository
+
+
+@traced_repository("postgresql")
+class SQLAlchemyProcessedMessageRepository(ProcessedMessageRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def add(self, message_id: str) -> bool:
+        # Flush inside a savepoint: the primary key rejects a message
+        # another consumer already recorded, without discarding the rest
+        # of the transaction
+        try:
+            with self.db.begin_nested():
+                self.db.add(
+                    ProcessedMessageModel(
+                        message_id=message_id, processed_at=datetime.utcnow()
+                    )
+                )
+                self.db.flush()
+        except IntegrityError:
+            return False
+        return True
+
+    def remove(self, message_id: str):
+        self.db.query(ProcessedMessageModel).filter(
+            ProcessedMessageModel.message_id == message_id
+        ).delete()
+
+    def commit(self):
+        self.db.commit()
+
+    def rollback(self):
+        self.db.rollback()
+
+    def delete_older_than(self, cutoff: datetime) -> int:
+        deleted = (
+            self.db.query(ProcessedMessageModel)
+            .filter(ProcessedMessageModel.processed_at < cutoff)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+        return deleted
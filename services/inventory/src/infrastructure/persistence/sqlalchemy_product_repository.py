@@ -1,6 +1,8 @@
 import logging
-from typing import List, Optional
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.entities.inventory_entity import InventoryEntity
@@ -13,10 +15,12 @@ from src.infrastructure.persistence.models import (
     PriceModel,
     ProductModel,
 )
+from src.infrastructure.tracing.tracer import traced_repository
 
 logger = logging.getLogger("app")
 
 
+@traced_repository("postgresql")
 class SQLAlchemyProductRepository(ProductRepository):
     def __init__(self, db: Session):
         self.db = db
@@ -51,6 +55,7 @@ class SQLAlchemyProductRepository(ProductRepository):
             self.db.refresh(db_product)
 
         db_product.name = product.name
+        db_product.updated_at = datetime.utcnow()
         db_product.description = product.description
         db_product.images = product.images
         db_product.category = category_model
@@ -65,22 +70,23 @@ class SQLAlchemyProductRepository(ProductRepository):
         self.db.add(db_product.inventory)
         self.db.commit()
         self.db.refresh(db_product)
-        return ProductEntity(
+        return ProductEntity.from_trusted_row(
             id=db_product.id,
             sku=db_product.sku,
             name=db_product.name,
-            category=CategoryEntity(
+            category=CategoryEntity.from_trusted_row(
                 name=db_product.category.name, id=db_product.category.id
             ),
-            inventory=InventoryEntity(
+            inventory=InventoryEntity.from_trusted_row(
                 id=db_product.inventory.id,
                 quantity=db_product.inventory.quantity,
             ),
-            price=PriceEntity(
+            price=PriceEntity.from_trusted_row(
                 id=db_product.price.id, amount=db_product.price.amount
             ),
             description=db_product.description,
             images=db_product.images,
+            updated_at=db_product.updated_at,
         )
 
     def find_by_sku(self, sku: str) -> Optional[ProductEntity]:
@@ -88,25 +94,25 @@ class SQLAlchemyProductRepository(ProductRepository):
             self.db.query(ProductModel).filter(ProductModel.sku == sku).first()
         )
         if db_product:
-            category = (
-                self.db.query(CategoryModel)
-                .filter(CategoryModel.id == db_product.category_id)
-                .first()
-            )
-            return ProductEntity(
+            # Category, price and inventory are already loaded with the row
+            category = db_product.category
+            return ProductEntity.from_trusted_row(
                 id=db_product.id,
                 sku=db_product.sku,
                 name=db_product.name,
-                category=CategoryEntity(id=category.id, name=category.name),
-                price=PriceEntity(
+                category=CategoryEntity.from_trusted_row(
+                    id=category.id, name=category.name
+                ),
+                price=PriceEntity.from_trusted_row(
                     id=db_product.price.id, amount=db_product.price.amount
                 ),
-                inventory=InventoryEntity(
+                inventory=InventoryEntity.from_trusted_row(
                     id=db_product.inventory.id,
                     quantity=db_product.inventory.quantity,
                 ),
                 description=db_product.description,
                 images=db_product.images,
+                updated_at=db_product.updated_at,
             )
         return None
 
@@ -136,22 +142,23 @@ class SQLAlchemyProductRepository(ProductRepository):
     def list_all(self) -> List[ProductEntity]:
         db_products = self.db.query(ProductModel).all()
         return [
-            ProductEntity(
+            ProductEntity.from_trusted_row(
                 id=db_product.id,
                 sku=db_product.sku,
                 name=db_product.name,
-                category=CategoryEntity(
+                category=CategoryEntity.from_trusted_row(
                     id=db_product.category.id, name=db_product.category.name
                 ),
-                price=PriceEntity(
+                price=PriceEntity.from_trusted_row(
                     id=db_product.price.id, amount=db_product.price.amount
                 ),
-                inventory=InventoryEntity(
+                inventory=InventoryEntity.from_trusted_row(
                     id=db_product.inventory.id,
                     quantity=db_product.inventory.quantity,
                 ),
                 description=db_product.description,
                 images=db_product.images,
+                updated_at=db_product.updated_at,
             )
             for db_product in db_products
         ]
@@ -171,25 +178,117 @@ class SQLAlchemyProductRepository(ProductRepository):
                 .all()
             )
             return [
-                ProductEntity(
+                ProductEntity.from_trusted_row(
                     id=db_product.id,
                     sku=db_product.sku,
                     name=db_product.name,
-                    category=CategoryEntity(
+                    category=CategoryEntity.from_trusted_row(
                         id=db_category.id, name=db_category.name
                     ),
-                    price=PriceEntity(
+                    price=PriceEntity.from_trusted_row(
                         id=db_product.price.id, amount=db_product.price.amount
                     ),
-                    inventory=InventoryEntity(
+                    inventory=InventoryEntity.from_trusted_row(
                         id=db_product.inventory.id,
                         quantity=db_product.inventory.quantity,
                     ),
+                    updated_at=db_product.updated_at,
                 )
                 for db_product in db_products
             ]
         return []
 
+    def apply_inventory_deltas(
+        self,
+        deltas: Dict[str, int],
+        before_commit: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[str]:
+        rejected_skus = []
+        applied_skus = []
+        try:
+            for sku, delta in deltas.items():
+                if delta == 0:
+                    continue
+                product_id = (
+                    select(ProductModel.id)
+                    .where(ProductModel.sku == sku)
+                    .scalar_subquery()
+                )
+                result = self.db.execute(
+                    update(InventoryModel)
+                    .where(InventoryModel.product_id == product_id)
+                    .where(InventoryModel.quantity + delta >= 0)
+                    .values(quantity=InventoryModel.quantity + delta)
+                )
+                if result.rowcount == 0:
+                    rejected_skus.append(sku)
+                else:
+                    applied_skus.append(sku)
+            if applied_skus:
+                self.db.execute(
+                    update(ProductModel)
+                    .where(ProductModel.sku.in_(applied_skus))
+                    .values(updated_at=datetime.utcnow())
+                )
+            if before_commit:
+                before_commit(rejected_skus)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return rejected_skus
+
+    def list_summaries_paginated(
+        self, current_page: int, records_per_page: int
+    ):
+        # Read-only listing: selects just the response columns as plain
+        # mappings, so no ORM objects, identity-map entries or entities are
+        # built per row
+        offset = (current_page - 1) * records_per_page
+        total_records = self.db.execute(
+            select(func.count()).select_from(ProductModel)
+        ).scalar_one()
+        rows = (
+            self.db.execute(
+                select(
+                    ProductModel.sku,
+                    ProductModel.name,
+                    CategoryModel.name.label("category_name"),
+                    PriceModel.amount.label("price"),
+                    InventoryModel.quantity,
+                    ProductModel.description,
+                    ProductModel.images,
+                )
+                .outerjoin(
+                    CategoryModel, ProductModel.category_id == CategoryModel.id
+                )
+                .outerjoin(
+                    PriceModel, PriceModel.product_id == ProductModel.id
+                )
+                .outerjoin(
+                    InventoryModel,
+                    InventoryModel.product_id == ProductModel.id,
+                )
+                .order_by(ProductModel.id)
+                .limit(records_per_page)
+                .offset(offset)
+            )
+            .mappings()
+            .all()
+        )
+
+        number_of_pages = (
+            total_records + records_per_page - 1
+        ) // records_per_page
+
+        return (
+            rows,
+            current_page,
+            records_per_page,
+            number_of_pages,
+            total_records,
+        )
+
     def list_all_paginated(self, current_page: int, records_per_page: int):
         offset = (current_page - 1) * records_per_page
         query = self.db.query(ProductModel)
@@ -198,22 +297,23 @@ class SQLAlchemyProductRepository(ProductRepository):
         db_products = query.limit(records_per_page).offset(offset).all()
 
         products = [
-            ProductEntity(
+            ProductEntity.from_trusted_row(
                 id=db_product.id,
                 sku=db_product.sku,
                 name=db_product.name,
-                category=CategoryEntity(
+                category=CategoryEntity.from_trusted_row(
                     id=db_product.category.id, name=db_product.category.name
                 ),
-                price=PriceEntity(
+                price=PriceEntity.from_trusted_row(
                     id=db_product.price.id, amount=db_product.price.amount
                 ),
-                inventory=InventoryEntity(
+                inventory=InventoryEntity.from_trusted_row(
                     id=db_product.inventory.id,
                     quantity=db_product.inventory.quantity,
                 ),
                 description=db_product.description,
                 images=db_product.images,
+                updated_at=db_product.updated_at,
             )
             for db_product in db_products
         ]
@@ -0,0 +1,232 @@
+import json
+import logging
+import queue
+import sys
+import threading
+import urllib.request
+from typing import Any, Dict, List, Optional, TextIO
+
+from src.config import Config
+from src.infrastructure.metrics.metrics_registry import registry
+from src.infrastructure.tracing.tracer import Span
+
+logger = logging.getLogger("app")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[dict]:
+    return [
+        {"key": key, "value": _otlp_value(value)}
+        for key, value in attributes.items()
+    ]
+
+
+def span_to_otlp(span: Span) -> dict:
+    data = {
+        "traceId": span.context.trace_id,
+        "spanId": span.context.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_time_unix_nano),
+        "endTimeUnixNano": str(span.end_time_unix_nano),
+        "attributes": _otlp_attributes(span.attributes),
+        "status": {"code": span.status_code},
+    }
+    if span.parent_span_id:
+        data["parentSpanId"] = span.parent_span_id
+    if span.status_message:
+        data["status"]["message"] = span.status_message
+    if span.events:
+        data["events"] = [
+            {
+                "name": event["name"],
+                "timeUnixNano": str(event["time_unix_nano"]),
+                "attributes": _otlp_attributes(event["attributes"]),
+            }
+            for event in span.events
+        ]
+    return data
+
+
+def to_otlp(spans: List[Span], service_name: str) -> dict:
+    # OTLP/JSON ExportTraceServiceRequest, as accepted on /v1/traces
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes(
+                        {"service.name": service_name}
+                    )
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "app"},
+                        "spans": [span_to_otlp(span) for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class ConsoleSpanExporter:
+    # One readable line per span, for local runs
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream or sys.stdout
+
+    def export(self, spans: List[Span], service_name: str):
+        for span in spans:
+            parent = span.parent_span_id or "-"
+            self.stream.write(
+                f"[trace] {service_name} {span.context.trace_id} "
+                f"{span.context.span_id} parent={parent} {span.name} "
+                f"{span.duration_ms:.2f}ms status={span.status_code}\n"
+            )
+        self.stream.flush()
+
+    def shutdown(self):
+        pass
+
+
+class FileSpanExporter:
+    # Appends one OTLP/JSON request per line, the format the collector's
+    # file exporter writes and its otlpjson receiver reads back
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span], service_name: str):
+        line = json.dumps(to_otlp(spans, service_name))
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+    def shutdown(self):
+        pass
+
+
+class OtlpHttpSpanExporter:
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def export(self, spans: List[Span], service_name: str):
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(to_otlp(spans, service_name)).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+    def shutdown(self):
+        pass
+
+
+class BatchSpanProcessor:
+    # Ended spans are queued and exported from a background thread, so
+    # request and consumer threads never wait on the exporter. When the
+    # queue is full new spans are dropped and counted.
+    def __init__(
+        self,
+        exporter,
+        service_name: str,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        self.exporter = exporter
+        self.service_name = service_name
+        self.batch_size = batch_size or Config.TRACING_BATCH_SIZE
+        self.interval = interval or Config.TRACING_EXPORT_INTERVAL
+        self._queue: "queue.Queue[Span]" = queue.Queue(
+            maxsize=max_queue_size or Config.TRACING_QUEUE_SIZE
+        )
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="span-exporter", daemon=True
+        )
+        self.dropped_spans = registry.counter(
+            "tracing_spans_dropped_total",
+            "Spans dropped because the export queue was full.",
+        )
+        self.export_failures = registry.counter(
+            "tracing_export_failures_total",
+            "Span batches the exporter failed to send.",
+        )
+
+    def start(self) -> "BatchSpanProcessor":
+        self._thread.start()
+        return self
+
+    def on_end(self, span: Span):
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped_spans.inc()
+
+    def _drain(self) -> List[Span]:
+        spans = []
+        while len(spans) < self.batch_size:
+            try:
+                spans.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return spans
+
+    def flush(self):
+        while True:
+            spans = self._drain()
+            if not spans:
+                return
+            try:
+                self.exporter.export(spans, self.service_name)
+            except Exception as e:
+                self.export_failures.inc()
+                logger.error(f"Failed to export {len(spans)} spans: {e}")
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+    def shutdown(self):
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.flush()
+        self.exporter.shutdown()
+
+
+def build_exporter(name: Optional[str] = None):
+    name = (name or Config.TRACING_EXPORTER).lower()
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "file":
+        return FileSpanExporter(Config.TRACING_FILE_PATH)
+    if name == "otlp":
+        return OtlpHttpSpanExporter(Config.TRACING_OTLP_ENDPOINT)
+    if name != "none":
+        logger.warning(f"Unknown TRACING_EXPORTER {name!r}; tracing is off.")
+    return None
+
+
+def start_tracing(tracer) -> Optional[BatchSpanProcessor]:
+    exporter = build_exporter()
+    if exporter is None:
+        return None
+    processor = BatchSpanProcessor(exporter, tracer.service_name).start()
+    tracer.start(processor)
+    logger.info(
+        f"Exporting traces with {type(exporter).__name__} "
+        f"(sample ratio {tracer.sample_ratio})."
+    )
+    return processor
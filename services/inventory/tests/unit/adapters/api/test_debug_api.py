@@ -0,0 +1,39 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.api import debug_api
+from src.infrastructure.persistence.slow_query_log import slow_query_log
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.include_router(debug_api.router)
+    slow_query_log.reset()
+    yield TestClient(app)
+    slow_query_log.reset()
+
+
+class TestDebugAPI:
+    def test_read_query_stats(
+        self, client: TestClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setattr(slow_query_log, "sample_ratio", 1.0)
+        slow_query_log.record("SELECT * FROM products", 5)
+
+        # Act
+        response = client.get("/debug/queries")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["queries"][0]["fingerprint"] == (
+            "SELECT * FROM products"
+        )
+
+    def test_unknown_sort_key_is_rejected(self, client: TestClient) -> None:
+        # Act
+        response = client.get("/debug/queries", params={"sort": "nope"})
+
+        # Assert
+        assert response.status_code == 400
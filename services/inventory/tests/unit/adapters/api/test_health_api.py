@@ -1,26 +1,65 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from src.adapters.api.health_api import health_check
+from fastapi import Response
+from src.adapters.api.health_api import (
+    health_check,
+    liveness_check,
+    readiness_check,
+)
 
 
 class TestHealthAPI:
 
-    @patch("src.adapters.api.health_api.get_health_service")
-    def test_health_check(self, mock_get_health_service):
+    def test_health_check(self):
         # Arrange
-        mock_service = MagicMock()
+        mock_monitor = MagicMock()
         mock_health_status = {"status": "ok"}
-        mock_service.get_health_status.return_value = mock_health_status
-        mock_get_health_service.return_value = mock_service
+        mock_monitor.get_health_status.return_value = mock_health_status
 
         # Act
-        response = health_check(service=mock_service)
+        response = health_check(monitor=mock_monitor)
 
         # Assert
-        mock_service.get_health_status.assert_called_once()
+        mock_monitor.get_health_status.assert_called_once()
         assert response == mock_health_status
 
+    def test_liveness_check(self):
+        # Act
+        response = liveness_check()
+
+        # Assert
+        assert response == {"status": "alive"}
+
+    def test_readiness_check_ready(self):
+        # Arrange
+        mock_monitor = MagicMock()
+        mock_monitor.is_ready.return_value = True
+        response = Response()
+
+        # Act
+        readiness_check(response, monitor=mock_monitor)
+
+        # Assert
+        assert response.status_code == 200
+
+    def test_readiness_check_not_ready(self):
+        # Arrange
+        mock_monitor = MagicMock()
+        mock_monitor.is_ready.return_value = False
+        mock_monitor.get_health_status.return_value = {
+            "database": "unhealthy",
+            "rabbitmq": "healthy",
+        }
+        response = Response()
+
+        # Act
+        result = readiness_check(response, monitor=mock_monitor)
+
+        # Assert
+        assert response.status_code == 503
+        assert result["database"] == "unhealthy"
+
 
 if __name__ == "__main__":
     pytest.main()
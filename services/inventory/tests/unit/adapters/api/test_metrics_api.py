@@ -0,0 +1,21 @@
+import pytest
+from src.adapters.api.metrics_api import metrics
+from src.infrastructure.metrics.metrics_registry import CONTENT_TYPE, registry
+
+
+class TestMetricsAPI:
+
+    def test_metrics(self) -> None:
+        # Arrange
+        registry.counter("test_metrics_api_total", "Test counter.").inc()
+
+        # Act
+        response = metrics()
+
+        # Assert
+        assert response.media_type == CONTENT_TYPE
+        assert b"test_metrics_api_total 1" in response.body
+
+
+if __name__ == "__main__":
+    pytest.main()
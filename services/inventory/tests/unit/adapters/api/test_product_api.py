@@ -1,12 +1,16 @@
+import json
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
+
 from src.adapters.api.product_api import (
     create_product,
     delete_product,
     get_products_by_category,
     read_product,
+    read_products_paginated,
     update_product,
 )
 from src.application.dto.product_dto import (
@@ -14,10 +18,18 @@ from src.application.dto.product_dto import (
     ProductResponse,
     ProductUpdate,
 )
+from src.application.services.product_service import ProductService
 from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
 from src.domain.entities.price_entity import PriceEntity
 from src.domain.entities.product_entity import ProductEntity
 from src.domain.exceptions import EntityAlreadyExists, EntityNotFound
+from src.domain.repositories.category_repository import CategoryRepository
+from src.domain.repositories.product_repository import ProductRepository
+from src.infrastructure.cache.product_cache import (
+    LRUCacheBackend,
+    ProductCache,
+)
 
 
 class TestProductAPI:
@@ -127,15 +139,27 @@ class TestProductAPI:
             inventory=mock_inventory,
             images=["http://example.com"],
             description="Smartphone device",
+            updated_at=datetime(2024, 5, 1, 12, 30, 15, 250000),
         )
         mock_service.get_product_by_sku.return_value = mock_product_entity
         mock_get_product_service.return_value = mock_service
+        http_response = Response()
 
         # Act
-        response = read_product(sku="123ABC", service=mock_service)
+        response = read_product(
+            sku="123ABC",
+            request=MagicMock(headers={}),
+            response=http_response,
+            service=mock_service,
+        )
 
         # Assert
         mock_service.get_product_by_sku.assert_called_once_with("123ABC")
+        assert http_response.headers["ETag"] == '"61763a60bb450"'
+        assert (
+            http_response.headers["Last-Modified"]
+            == "Wed, 01 May 2024 12:30:15 GMT"
+        )
         assert response == ProductResponse(
             id=1,
             sku="123ABC",
@@ -158,12 +182,179 @@ class TestProductAPI:
 
         # Act & Assert
         with pytest.raises(HTTPException) as exc_info:
-            read_product(sku="123ABC", service=mock_service)
+            read_product(
+                sku="123ABC",
+                request=MagicMock(headers={}),
+                response=Response(),
+                service=mock_service,
+            )
 
         mock_service.get_product_by_sku.assert_called_once_with("123ABC")
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == "Product not found"
 
+    def test_read_products_paginated_renders_plain_json(self):
+        # Arrange
+        mock_service = MagicMock()
+        row = {
+            "sku": "123ABC",
+            "name": "Test Product",
+            "category_name": "Test Category",
+            "price": 100.0,
+            "quantity": 10,
+            "description": None,
+            "images": [],
+        }
+        mock_service.list_product_summaries_paginated.return_value = (
+            [row],
+            1,
+            10,
+            1,
+            1,
+        )
+
+        # Act
+        response = read_products_paginated(service=mock_service)
+
+        # Assert
+        body = json.loads(response.body)
+        assert response.media_type == "application/json"
+        assert body["products"] == [row]
+        assert body["pagination"] == {
+            "current_page": 1,
+            "records_per_page": 10,
+            "number_of_pages": 1,
+            "total_records": 1,
+        }
+        mock_service.list_product_summaries_paginated.assert_called_once_with(
+            1, 10
+        )
+        mock_service.list_products_paginated.assert_not_called()
+
+    def test_read_product_if_none_match_returns_not_modified(self):
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.get_product_by_sku.return_value = ProductEntity(
+            id=1,
+            sku="123ABC",
+            name="Laptop",
+            category=CategoryEntity(id=1, name="Electronics"),
+            price=PriceEntity(id=1, amount=999.99),
+            inventory=MagicMock(quantity=50),
+            updated_at=datetime(2024, 5, 1, 12, 30, 15, 250000),
+        )
+        request = MagicMock(
+            headers={"if-none-match": 'W/"stale", "61763a60bb450"'}
+        )
+
+        # Act
+        response = read_product(
+            sku="123ABC",
+            request=request,
+            response=Response(),
+            service=mock_service,
+        )
+
+        # Assert
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["ETag"] == '"61763a60bb450"'
+        mock_service.get_product_by_sku.assert_called_once_with("123ABC")
+
+    def test_read_product_stale_etag_returns_product(self):
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.get_product_by_sku.return_value = ProductEntity(
+            id=1,
+            sku="123ABC",
+            name="Laptop",
+            category=CategoryEntity(id=1, name="Electronics"),
+            price=PriceEntity(id=1, amount=999.99),
+            inventory=MagicMock(quantity=50),
+            updated_at=datetime(2024, 5, 1, 12, 30, 15, 250000),
+        )
+        request = MagicMock(headers={"if-none-match": '"stale"'})
+
+        # Act
+        response = read_product(
+            sku="123ABC",
+            request=request,
+            response=Response(),
+            service=mock_service,
+        )
+
+        # Assert
+        assert response.sku == "123ABC"
+        mock_service.get_product_by_sku.assert_called_once_with("123ABC")
+
+    def test_read_product_if_modified_since_returns_not_modified(self):
+        # Arrange
+        mock_service = MagicMock()
+        mock_service.get_product_by_sku.return_value = ProductEntity(
+            id=1,
+            sku="123ABC",
+            name="Laptop",
+            category=CategoryEntity(id=1, name="Electronics"),
+            price=PriceEntity(id=1, amount=999.99),
+            inventory=MagicMock(quantity=50),
+            updated_at=datetime(2024, 5, 1, 12, 30, 15, 250000),
+        )
+        request = MagicMock(
+            headers={"if-modified-since": "Wed, 01 May 2024 12:30:15 GMT"}
+        )
+
+        # Act
+        response = read_product(
+            sku="123ABC",
+            request=request,
+            response=Response(),
+            service=mock_service,
+        )
+
+        # Assert
+        assert response.status_code == 304
+        mock_service.get_product_by_sku.assert_called_once_with("123ABC")
+
+    def test_read_product_revalidates_cached_product_without_database(self):
+        # Arrange
+        product_repo = MagicMock(spec=ProductRepository)
+        product_repo.find_by_sku.return_value = ProductEntity(
+            id=1,
+            sku="123ABC",
+            name="Laptop",
+            category=CategoryEntity(id=1, name="Electronics"),
+            price=PriceEntity(id=1, amount=999.99),
+            inventory=InventoryEntity(id=1, quantity=50),
+            updated_at=datetime(2024, 5, 1, 12, 30, 15, 250000),
+        )
+        service = ProductService(
+            product_repo,
+            MagicMock(spec=CategoryRepository),
+            ProductCache(LRUCacheBackend(max_size=10), ttl=60),
+        )
+        http_response = Response()
+        read_product(
+            sku="123ABC",
+            request=MagicMock(headers={}),
+            response=http_response,
+            service=service,
+        )
+        request = MagicMock(
+            headers={"if-none-match": http_response.headers["ETag"]}
+        )
+
+        # Act
+        response = read_product(
+            sku="123ABC",
+            request=request,
+            response=Response(),
+            service=service,
+        )
+
+        # Assert
+        assert response.status_code == 304
+        product_repo.find_by_sku.assert_called_once_with("123ABC")
+
     @patch("src.adapters.api.product_api.get_product_service")
     def test_update_product_success(self, mock_get_product_service):
         # Arrange
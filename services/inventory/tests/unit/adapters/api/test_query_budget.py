@@ -0,0 +1,127 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.adapters.api import product_api
+from src.infrastructure.persistence.db_setup import Base, get_db
+from src.infrastructure.persistence.models import (
+    CategoryModel,
+    InventoryModel,
+    PriceModel,
+    ProductModel,
+)
+from src.infrastructure.persistence.query_counter import assert_max_queries
+from src.infrastructure.persistence.sqlalchemy_product_repository import (
+    SQLAlchemyProductRepository,
+)
+
+# The page and the total count, projected in one joined select
+LIST_PRODUCTS_BUDGET = 2
+# The category (looked up by the service and again by the repository),
+# its products, and their category, price and inventory
+PRODUCTS_BY_CATEGORY_BUDGET = 6
+# The product and its category, price and inventory
+FIND_PRODUCT_BUDGET = 4
+
+
+@pytest.fixture
+def engine() -> Engine:
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine: Engine) -> Session:
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def client(db: Session) -> TestClient:
+    app = FastAPI()
+    app.include_router(product_api.router)
+    app.dependency_overrides[get_db] = lambda: db
+    return TestClient(app)
+
+
+def seed_products(db: Session, count: int):
+    category = CategoryModel(name="Food")
+    for index in range(count):
+        db.add(
+            ProductModel(
+                sku=f"SKU{index}",
+                name=f"Product {index}",
+                images=[],
+                category=category,
+                price=PriceModel(amount=2.5),
+                inventory=InventoryModel(quantity=10),
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+
+class TestQueryBudget:
+    @pytest.mark.parametrize("products", [1, 20])
+    def test_list_products_stays_within_query_budget(
+        self,
+        client: TestClient,
+        db: Session,
+        engine: Engine,
+        products: int,
+    ) -> None:
+        # Arrange
+        seed_products(db, products)
+
+        # Act
+        with assert_max_queries(engine, LIST_PRODUCTS_BUDGET):
+            response = client.get("/products/?records_per_page=20")
+
+        # Assert
+        assert response.status_code == 200
+        assert len(response.json()["products"]) == products
+
+    @pytest.mark.parametrize("products", [1, 20])
+    def test_products_by_category_stays_within_query_budget(
+        self,
+        client: TestClient,
+        db: Session,
+        engine: Engine,
+        products: int,
+    ) -> None:
+        # Arrange
+        seed_products(db, products)
+
+        # Act
+        with assert_max_queries(engine, PRODUCTS_BY_CATEGORY_BUDGET):
+            response = client.get("/products/by-category/Food")
+
+        # Assert
+        assert response.status_code == 200
+        assert len(response.json()) == products
+
+    def test_find_by_sku_stays_within_query_budget(
+        self, db: Session, engine: Engine
+    ) -> None:
+        # Arrange
+        seed_products(db, 1)
+        repository = SQLAlchemyProductRepository(db)
+
+        # Act
+        with assert_max_queries(engine, FIND_PRODUCT_BUDGET):
+            product = repository.find_by_sku("SKU0")
+
+        # Assert
+        assert product.category.name == "Food"
+        assert product.price.amount == 2.5
+        assert product.inventory.quantity == 10
@@ -0,0 +1,100 @@
+import gzip
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+
+LARGE_BODY = {
+    "products": [
+        {"sku": str(i), "images": ["https://example.com/image.png"]}
+        for i in range(200)
+    ]
+}
+
+
+class TestCompressionMiddleware:
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=500,
+            content_types=["application/json", "text/plain"],
+            brotli_enabled=False,
+        )
+        app.get("/large")(lambda: LARGE_BODY)
+        app.get("/small")(lambda: {"status": "ok"})
+        app.get("/html")(
+            lambda: PlainTextResponse("x" * 2000, media_type="text/html")
+        )
+        app.get("/stream")(
+            lambda: StreamingResponse(
+                (b"line %d\n" % i for i in range(500)),
+                media_type="text/plain",
+            )
+        )
+        return TestClient(app)
+
+    def test_large_json_is_gzipped(self, client):
+        # Act
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.json() == LARGE_BODY
+
+    def test_small_body_is_not_compressed(self, client):
+        # Act
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"status": "ok"}
+
+    def test_content_type_outside_allowlist_is_not_compressed(self, client):
+        # Act
+        response = client.get("/html", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+
+    @pytest.mark.parametrize("path", ["/small", "/html"])
+    def test_skipped_response_creates_no_compressor(self, client, path):
+        # Act
+        with patch(
+            "src.adapters.middleware.compression_middleware._GzipCompressor"
+        ) as mock_compressor:
+            client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        mock_compressor.assert_not_called()
+
+    def test_client_without_gzip_gets_identity(self, client):
+        # Act
+        response = client.get("/large", headers={"Accept-Encoding": "br"})
+
+        # Assert
+        assert "content-encoding" not in response.headers
+        assert response.json() == LARGE_BODY
+
+    def test_streaming_response_is_compressed_incrementally(self, client):
+        # Act
+        with client.stream(
+            "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+        ) as response:
+            raw = b"".join(response.iter_raw())
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(raw).decode().count("line") == 500
+
+
+if __name__ == "__main__":
+    pytest.main()
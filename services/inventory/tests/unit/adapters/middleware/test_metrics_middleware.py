@@ -0,0 +1,82 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+from src.infrastructure.metrics.request_metrics import record_query
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(metrics: MetricsRegistry) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/products/{sku}")
+    def get_product(sku: str):
+        for _ in range(3):
+            record_query(0.1)
+        return {"sku": sku}
+
+    @app.get("/health/live")
+    def live():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+class TestMetricsMiddleware:
+    def test_request_is_labelled_by_route_template(
+        self, client: TestClient, metrics: MetricsRegistry
+    ) -> None:
+        # Act
+        client.get("/products/SKU1")
+        client.get("/products/SKU2")
+
+        # Assert
+        assert (
+            'http_requests_total{method="GET",route="/products/{sku}",'
+            'status="200"} 2' in metrics.render()
+        )
+
+    def test_queries_are_counted_per_request(
+        self, client: TestClient, metrics: MetricsRegistry
+    ) -> None:
+        # Act
+        client.get("/products/SKU1")
+
+        # Assert
+        rendered = metrics.render()
+        assert (
+            'http_request_db_queries_sum{method="GET",'
+            'route="/products/{sku}"} 3' in rendered
+        )
+        assert (
+            'http_request_db_queries_bucket{method="GET",'
+            'route="/products/{sku}",le="3"} 1' in rendered
+        )
+
+    def test_unknown_paths_share_one_label(
+        self, client: TestClient, metrics: MetricsRegistry
+    ) -> None:
+        # Act
+        client.get("/nope/1")
+
+        # Assert
+        assert (
+            'http_requests_total{method="GET",route="<unmatched>",'
+            'status="404"} 1' in metrics.render()
+        )
+
+    def test_probe_endpoints_are_not_recorded(
+        self, client: TestClient, metrics: MetricsRegistry
+    ) -> None:
+        # Act
+        client.get("/health/live")
+
+        # Assert
+        assert "http_requests_total{" not in metrics.render()
@@ -0,0 +1,63 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
+from src.infrastructure.tracing.tracer import TRACEPARENT, SpanKind, tracer
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/products/{sku}")
+    def get_product(sku: str):
+        return {"sku": sku}
+
+    @app.get("/health/live")
+    def live():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+class TestTracingMiddleware:
+
+    def test_request_continues_caller_trace(self, client, spans) -> None:
+        # Act
+        client.get("/products/SKU1", headers={TRACEPARENT: PARENT})
+
+        # Assert
+        span = spans[0]
+        assert span.name == "GET /products/{sku}"
+        assert span.kind == SpanKind.SERVER
+        assert span.parent_span_id == "b7ad6b7169203331"
+        assert span.attributes["http.response.status_code"] == 200
+
+    def test_probe_endpoints_are_not_traced(self, client, spans) -> None:
+        # Act
+        client.get("/health/live")
+
+        # Assert
+        assert spans == []
@@ -1,6 +1,16 @@
 from unittest.mock import MagicMock, patch
 
-from src.adapters.dependencies import get_health_service, get_product_service
+from src.adapters.dependencies import (
+    get_health_monitor,
+    get_health_service,
+    get_product_cache,
+    get_product_service,
+    get_product_single_flight,
+)
+from src.infrastructure.cache.product_cache import (
+    LRUCacheBackend,
+    ProductCache,
+)
 
 
 class TestDependencies:
@@ -25,6 +35,45 @@ class TestDependencies:
         )
         assert result == mock_health_service_instance
 
+    @patch("src.adapters.dependencies.SessionLocal")
+    def test_get_health_monitor(self, mock_session_local):
+        # Arrange
+        get_health_monitor.cache_clear()
+
+        # Act
+        result = get_health_monitor()
+
+        # Assert
+        assert get_health_monitor() is result
+        assert set(result.checks) == {"database", "rabbitmq"}
+        mock_session_local.assert_called_once()
+        get_health_monitor.cache_clear()
+
+    @patch("src.config.Config.PRODUCT_CACHE_BACKEND", "memory")
+    def test_get_product_cache(self):
+        # Arrange
+        get_product_cache.cache_clear()
+
+        # Act
+        result = get_product_cache()
+
+        # Assert
+        assert isinstance(result, ProductCache)
+        assert isinstance(result.backend, LRUCacheBackend)
+        assert get_product_cache() is result
+        get_product_cache.cache_clear()
+
+    def test_get_product_single_flight(self):
+        # Arrange
+        get_product_single_flight.cache_clear()
+
+        # Act
+        result = get_product_single_flight()
+
+        # Assert
+        assert get_product_single_flight() is result
+        get_product_single_flight.cache_clear()
+
     @patch("src.adapters.dependencies.get_db")
     @patch("src.adapters.dependencies.SQLAlchemyProductRepository")
     @patch("src.adapters.dependencies.SQLAlchemyCategoryRepository")
@@ -51,9 +100,15 @@ class TestDependencies:
 
         mock_product_service_instance = MagicMock()
         mock_product_service.return_value = mock_product_service_instance
+        mock_product_cache = MagicMock()
+        mock_single_flight = MagicMock()
 
         # Act
-        result = get_product_service(db=mock_db_session)
+        result = get_product_service(
+            db=mock_db_session,
+            product_cache=mock_product_cache,
+            single_flight=mock_single_flight,
+        )
 
         # Assert
         mock_get_db.assert_not_called()
@@ -64,6 +119,9 @@ class TestDependencies:
             mock_db_session
         )
         mock_product_service.assert_called_once_with(
-            mock_product_repository, mock_category_repository
+            mock_product_repository,
+            mock_category_repository,
+            mock_product_cache,
+            mock_single_flight,
         )
         assert result == mock_product_service_instance
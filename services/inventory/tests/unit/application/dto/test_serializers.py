@@ -1,13 +1,17 @@
 from unittest.mock import Mock
 
 import pytest
+
 from src.application.dto.category_dto import CategoryResponse
 from src.application.dto.product_dto import ProductResponse
 from src.application.dto.serializers import (
     serialize_category,
     serialize_product,
+    serialize_product_row,
 )
 from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
+from src.domain.entities.price_entity import PriceEntity
 from src.domain.entities.product_entity import ProductEntity
 
 
@@ -60,6 +64,53 @@ class TestSerializeFunctions:
         assert result.id == 1
         assert result.name == "Food"
 
+    def test_serialize_product_row_matches_response_model(self):
+        # Arrange
+        row = {
+            "sku": "123",
+            "name": "Potato Sauce",
+            "category_name": "Food",
+            "price": 2,
+            "quantity": 100,
+            "description": "Awesome sauce",
+            "images": ["http://example.com"],
+        }
+        product = ProductEntity(
+            sku="123",
+            name="Potato Sauce",
+            category=CategoryEntity(name="Food"),
+            price=PriceEntity(amount=2),
+            inventory=InventoryEntity(quantity=100),
+            description="Awesome sauce",
+            images=["http://example.com"],
+        )
+
+        # Act
+        result = serialize_product_row(row)
+
+        # Assert
+        expected = serialize_product(product).model_dump(mode="json")
+        assert result == expected
+        assert isinstance(result["price"], float)
+
+    def test_serialize_product_row_without_price(self):
+        # Arrange
+        row = {
+            "sku": "123",
+            "name": "Potato Sauce",
+            "category_name": None,
+            "price": None,
+            "quantity": None,
+            "description": None,
+            "images": None,
+        }
+
+        # Act
+        result = serialize_product_row(row)
+
+        # Assert
+        assert result["price"] is None
+
 
 if __name__ == "__main__":
     pytest.main()
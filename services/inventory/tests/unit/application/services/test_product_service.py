@@ -1,6 +1,10 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
+
 from src.application.services.product_service import ProductService
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.entities.inventory_entity import InventoryEntity
@@ -9,6 +13,10 @@ from src.domain.entities.product_entity import ProductEntity
 from src.domain.exceptions import EntityAlreadyExists, EntityNotFound
 from src.domain.repositories.category_repository import CategoryRepository
 from src.domain.repositories.product_repository import ProductRepository
+from src.infrastructure.cache.product_cache import (
+    LRUCacheBackend,
+    ProductCache,
+)
 
 
 class TestProductService:
@@ -84,6 +92,149 @@ class TestProductService:
         with pytest.raises(EntityNotFound):
             service.get_product_by_sku("123")
 
+    def test_get_product_by_sku_reads_through_cache(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        product_repo.find_by_sku.return_value = ProductEntity(
+            sku="123",
+            name="Product",
+            category=CategoryEntity(name="Category"),
+            price=PriceEntity(amount=10.0),
+            inventory=InventoryEntity(quantity=5),
+        )
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        service = ProductService(product_repo, category_repo, cache)
+
+        # Act
+        first = service.get_product_by_sku("123")
+        second = service.get_product_by_sku("123")
+
+        # Assert
+        product_repo.find_by_sku.assert_called_once_with("123")
+        assert second.sku == first.sku
+        assert second.inventory.quantity == 5
+
+    def test_get_product_by_sku_coalesces_concurrent_lookups(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        product = ProductEntity(
+            sku="123",
+            name="Product",
+            category=CategoryEntity(name="Category"),
+            price=PriceEntity(amount=10.0),
+            inventory=InventoryEntity(quantity=5),
+        )
+        release = threading.Event()
+
+        def slow_find_by_sku(sku):
+            release.wait(timeout=5)
+            return product
+
+        product_repo.find_by_sku.side_effect = slow_find_by_sku
+        service = ProductService(product_repo, category_repo)
+        shared = service.single_flight.calls
+        baseline = shared.get(name="product_lookup", result="shared")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(service.get_product_by_sku, "123")
+                for _ in range(5)
+            ]
+            deadline = time.monotonic() + 5
+            while (
+                shared.get(name="product_lookup", result="shared")
+                < baseline + 4
+                and time.monotonic() < deadline
+            ):
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        # Assert
+        assert [result.sku for result in results] == ["123"] * 5
+        assert len({id(result) for result in results}) == 5
+        product_repo.find_by_sku.assert_called_once_with("123")
+
+    def test_get_product_by_sku_skips_fill_after_concurrent_write(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        service = ProductService(product_repo, category_repo, cache)
+
+        def find_by_sku_racing_write(sku):
+            product = ProductEntity(
+                sku=sku,
+                name="Product",
+                category=CategoryEntity(name="Category"),
+                price=PriceEntity(amount=10.0),
+                inventory=InventoryEntity(quantity=5),
+            )
+            # A write commits and invalidates while this read is in flight
+            cache.invalidate(sku)
+            return product
+
+        product_repo.find_by_sku.side_effect = find_by_sku_racing_write
+
+        # Act
+        result = service.get_product_by_sku("123")
+
+        # Assert
+        assert result.sku == "123"
+        assert cache.get("123") is None
+
+    def test_inventory_change_invalidates_cached_product(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        product_repo.find_by_sku.side_effect = lambda sku: ProductEntity(
+            sku=sku,
+            name="Product",
+            category=CategoryEntity(name="Category"),
+            price=PriceEntity(amount=10.0),
+            inventory=InventoryEntity(quantity=5),
+        )
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        service = ProductService(product_repo, category_repo, cache)
+        service.get_product_by_sku("123")
+
+        # Act
+        service.add_inventory("123", 3)
+        service.get_product_by_sku("123")
+
+        # Assert
+        assert product_repo.find_by_sku.call_count == 3
+
+    def test_write_operations_invalidate_cache(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        product = Mock(spec=ProductEntity)
+        product_repo.find_by_sku.return_value = product
+        product_repo.apply_inventory_deltas.return_value = []
+        category_repo.find_by_name.return_value = Mock(spec=CategoryEntity)
+        cache = Mock(spec=ProductCache)
+        service = ProductService(product_repo, category_repo, cache)
+
+        # Act
+        service.update_product("123", "Name", "Category", 10.0, 1)
+        service.delete_product("123")
+        service.add_inventory("123", 1)
+        service.subtract_inventory("123", 1)
+        service.apply_inventory_deltas({"456": -1})
+
+        # Assert
+        assert [c.args for c in cache.invalidate.call_args_list] == [
+            ("123",),
+            ("123",),
+            ("123",),
+            ("123",),
+            ("456",),
+        ]
+
     def test_update_product(self):
         # Arrange
         product_repo = Mock(spec=ProductRepository)
@@ -176,6 +327,19 @@ class TestProductService:
         product_repo.list_all.assert_called_once()
         assert result == product_repo.list_all.return_value
 
+    def test_list_product_summaries_paginated(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        service = ProductService(product_repo, category_repo)
+
+        # Act
+        result = service.list_product_summaries_paginated(2, 20)
+
+        # Assert
+        product_repo.list_summaries_paginated.assert_called_once_with(2, 20)
+        assert result == product_repo.list_summaries_paginated.return_value
+
     def test_get_products_by_category(self):
         # Arrange
         category_repo = Mock(spec=CategoryRepository)
@@ -256,6 +420,22 @@ class TestProductService:
         with pytest.raises(EntityNotFound):
             service.subtract_inventory("123", 50)
 
+    def test_apply_inventory_deltas(self):
+        # Arrange
+        product_repo = Mock(spec=ProductRepository)
+        category_repo = Mock(spec=CategoryRepository)
+        product_repo.apply_inventory_deltas.return_value = ["456"]
+        service = ProductService(product_repo, category_repo)
+
+        # Act
+        result = service.apply_inventory_deltas({"123": -4, "456": -10})
+
+        # Assert
+        assert result == ["456"]
+        product_repo.apply_inventory_deltas.assert_called_once_with(
+            {"123": -4, "456": -10}, None
+        )
+
     def test_create_category(self):
         # Arrange
         category_repo = Mock(spec=CategoryRepository)
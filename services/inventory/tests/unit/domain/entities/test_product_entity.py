@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from src.domain.entities.category_entity import CategoryEntity
@@ -452,6 +452,46 @@ class TestProductEntity:
             "images": ["https://example.com"],
         }
 
+    def test_from_trusted_row_skips_validation(self):
+        # Arrange
+        category = CategoryEntity.from_trusted_row(name="Category", id=1)
+        price = PriceEntity.from_trusted_row(amount=99.99, id=1)
+        inventory = InventoryEntity.from_trusted_row(quantity=100, id=1)
+
+        # Act
+        with patch.object(ProductEntity, "_validate_sku") as validate_sku:
+            product = ProductEntity.from_trusted_row(
+                sku="ABC123",
+                name="Product Name",
+                category=category,
+                price=price,
+                inventory=inventory,
+                id=1,
+            )
+
+        # Assert
+        validate_sku.assert_not_called()
+        assert product.sku == "ABC123"
+        assert product.category.name == "Category"
+        assert product.price.amount == 99.99
+        assert product.inventory.quantity == 100
+
+    def test_entities_use_slots(self):
+        # Act
+        product = ProductEntity.from_trusted_row(
+            sku="ABC123",
+            name="Product Name",
+            category=CategoryEntity.from_trusted_row(name="Category"),
+            price=PriceEntity.from_trusted_row(amount=1.0),
+            inventory=InventoryEntity.from_trusted_row(quantity=1),
+        )
+
+        # Assert
+        assert not hasattr(product, "__dict__")
+        assert not hasattr(product.category, "__dict__")
+        with pytest.raises(AttributeError):
+            product.unexpected = True
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -46,6 +46,20 @@ class TestProductRepository:
             inspect.signature(ProductRepository.list_all).parameters.keys()
         ) == ["self"]
 
+    def test_has_list_summaries_paginated_method(self):
+        # Arrange & Act
+        has_method = inspect.isfunction(
+            ProductRepository.list_summaries_paginated
+        )
+
+        # Assert
+        assert has_method is True
+        assert list(
+            inspect.signature(
+                ProductRepository.list_summaries_paginated
+            ).parameters.keys()
+        ) == ["self", "current_page", "records_per_page"]
+
     def test_has_find_by_category_method(self):
         # Arrange & Act
         has_find_by_category = inspect.isfunction(
@@ -60,6 +74,20 @@ class TestProductRepository:
             ).parameters.keys()
         ) == ["self", "category"]
 
+    def test_has_apply_inventory_deltas_method(self):
+        # Arrange & Act
+        has_apply_inventory_deltas = inspect.isfunction(
+            ProductRepository.apply_inventory_deltas
+        )
+
+        # Assert
+        assert has_apply_inventory_deltas is True
+        assert list(
+            inspect.signature(
+                ProductRepository.apply_inventory_deltas
+            ).parameters.keys()
+        ) == ["self", "deltas", "before_commit"]
+
     def test_methods_are_callable(self):
         # Arrange & Act / Assert
         assert callable(getattr(ProductRepository, "save", None))
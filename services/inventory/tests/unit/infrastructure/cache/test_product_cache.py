@@ -0,0 +1,210 @@
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.domain.entities.category_entity import CategoryEntity
+from src.domain.entities.inventory_entity import InventoryEntity
+from src.domain.entities.price_entity import PriceEntity
+from src.domain.entities.product_entity import ProductEntity
+from src.infrastructure.cache.product_cache import (
+    LRUCacheBackend,
+    ProductCache,
+)
+
+
+def make_product(sku="SKU1"):
+    return ProductEntity(
+        sku=sku,
+        name="Product",
+        category=CategoryEntity(name="Category"),
+        price=PriceEntity(amount=10.0),
+        inventory=InventoryEntity(quantity=5),
+    )
+
+
+class TestLRUCacheBackend:
+
+    def test_evicts_least_recently_used_key(self):
+        # Arrange
+        backend = LRUCacheBackend(max_size=2)
+        backend.set("a", b"1")
+        backend.set("b", b"2")
+        backend.get("a")
+
+        # Act
+        backend.set("c", b"3")
+
+        # Assert
+        assert backend.get("a") == b"1"
+        assert backend.get("b") is None
+        assert backend.get("c") == b"3"
+
+    @patch("src.infrastructure.cache.product_cache.time.monotonic")
+    def test_expires_entries_after_ttl(self, mock_monotonic):
+        # Arrange
+        backend = LRUCacheBackend(max_size=2)
+        mock_monotonic.return_value = 100.0
+        backend.set("a", b"1", ex=10)
+
+        # Act
+        mock_monotonic.return_value = 110.0
+        result = backend.get("a")
+
+        # Assert
+        assert result is None
+
+    def test_delete_returns_number_of_removed_keys(self):
+        # Arrange
+        backend = LRUCacheBackend(max_size=2)
+        backend.set("a", b"1")
+
+        # Act
+        result = backend.delete("a", "missing")
+
+        # Assert
+        assert result == 1
+        assert backend.get("a") is None
+
+
+class TestProductCache:
+
+    def test_get_returns_copy_and_counts_hits_and_misses(self):
+        # Arrange
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        product = make_product()
+        hits = cache.requests.get(result="hit")
+        misses = cache.requests.get(result="miss")
+
+        # Act
+        assert cache.get("SKU1") is None
+        cache.set("SKU1", product)
+        result = cache.get("SKU1")
+
+        # Assert
+        assert result is not product
+        assert result.sku == "SKU1"
+        assert cache.requests.get(result="hit") == hits + 1
+        assert cache.requests.get(result="miss") == misses + 1
+
+    def test_invalidate_removes_products(self):
+        # Arrange
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        cache.set("SKU1", make_product("SKU1"))
+        cache.set("SKU2", make_product("SKU2"))
+
+        # Act
+        cache.invalidate("SKU1", "SKU2")
+
+        # Assert
+        assert cache.get("SKU1") is None
+        assert cache.get("SKU2") is None
+
+    def test_set_skips_fill_read_before_invalidation(self):
+        # Arrange
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        generation = cache.generation("SKU1")
+        cache.invalidate("SKU1")
+
+        # Act
+        cache.set("SKU1", make_product("SKU1"), generation)
+        cache.set("SKU2", make_product("SKU2"), cache.generation("SKU2"))
+
+        # Assert
+        assert cache.get("SKU1") is None
+        assert cache.get("SKU2").sku == "SKU2"
+
+    def test_uses_redis_compatible_backend(self):
+        # Arrange
+        backend = MagicMock()
+        backend.get.return_value = None
+        cache = ProductCache(backend, ttl=30)
+
+        # Act
+        cache.set("SKU1", make_product())
+        cache.invalidate("SKU1")
+
+        # Assert
+        key, value = backend.set.call_args.args
+        assert key == "inventory:product:v3:SKU1"
+        assert json.loads(value)["sku"] == "SKU1"
+        assert backend.set.call_args.kwargs == {"ex": 30}
+        backend.delete.assert_called_once_with("inventory:product:v3:SKU1")
+
+    def test_round_trips_product_through_json(self):
+        # Arrange
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        product = ProductEntity.from_trusted_row(
+            id=7,
+            sku="SKU1",
+            name="Product",
+            category=CategoryEntity.from_trusted_row(name="Category", id=2),
+            price=PriceEntity.from_trusted_row(amount=10.5, id=3),
+            inventory=InventoryEntity.from_trusted_row(quantity=5, id=4),
+            description="Desc",
+            images=["a.png"],
+            updated_at=datetime(2024, 1, 1, 12, 0, 0, 123456, timezone.utc),
+        )
+
+        # Act
+        cache.set("SKU1", product)
+        result = cache.get("SKU1")
+
+        # Assert
+        assert result.id == 7
+        assert result.name == "Product"
+        assert (result.category.id, result.category.name) == (2, "Category")
+        assert (result.price.id, result.price.amount) == (3, 10.5)
+        assert (result.inventory.id, result.inventory.quantity) == (4, 5)
+        assert result.description == "Desc"
+        assert result.images == ["a.png"]
+        assert result.updated_at == product.updated_at
+
+    def test_set_does_not_hold_lock_during_backend_write(self):
+        # Arrange
+        backend = MagicMock()
+        cache = ProductCache(backend, ttl=30)
+        lock_held = []
+        backend.set.side_effect = lambda *args, **kwargs: lock_held.append(
+            cache._lock.locked()
+        )
+
+        # Act
+        cache.set("SKU1", make_product())
+
+        # Assert
+        assert lock_held == [False]
+
+    def test_set_drops_value_invalidated_during_write(self):
+        # Arrange
+        cache = ProductCache(LRUCacheBackend(max_size=10), ttl=60)
+        backend_set = cache.backend.set
+
+        def set_racing_invalidation(key, value, ex=None):
+            cache.invalidate("SKU1")
+            backend_set(key, value, ex=ex)
+
+        cache.backend.set = set_racing_invalidation
+
+        # Act
+        cache.set("SKU1", make_product(), cache.generation("SKU1"))
+
+        # Assert
+        assert cache.get("SKU1") is None
+
+    def test_backend_failure_is_treated_as_miss(self):
+        # Arrange
+        backend = MagicMock()
+        backend.get.side_effect = ConnectionError("down")
+        cache = ProductCache(backend, ttl=30)
+
+        # Act
+        result = cache.get("SKU1")
+
+        # Assert
+        assert result is None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,119 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.concurrency.single_flight import SingleFlight
+
+
+def wait_for_shared(single_flight, expected, timeout=5):
+    deadline = time.monotonic() + timeout
+    while (
+        single_flight.calls.get(name=single_flight.name, result="shared")
+        < expected
+        and time.monotonic() < deadline
+    ):
+        time.sleep(0.01)
+
+
+class TestSingleFlight:
+
+    def test_concurrent_calls_share_one_fetch(self):
+        # Arrange
+        single_flight = SingleFlight("test_share")
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "value"
+
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(single_flight.do, "key", fetch)
+                for _ in range(3)
+            ]
+            wait_for_shared(single_flight, 2)
+            release.set()
+            results = [future.result() for future in futures]
+
+        # Assert
+        assert results == ["value"] * 3
+        assert len(calls) == 1
+        assert single_flight.calls.get(name="test_share", result="leader") == 1
+
+    def test_concurrent_calls_share_exception(self):
+        # Arrange
+        single_flight = SingleFlight("test_error")
+        release = threading.Event()
+
+        def fetch():
+            release.wait(timeout=5)
+            raise ValueError("boom")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(single_flight.do, "key", fetch)
+                for _ in range(2)
+            ]
+            wait_for_shared(single_flight, 1)
+            release.set()
+
+            # Assert
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_waiters_receive_copies_of_result(self):
+        # Arrange
+        single_flight = SingleFlight("test_copies")
+        release = threading.Event()
+
+        def fetch():
+            release.wait(timeout=5)
+            return {"quantity": 5}
+
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(single_flight.do, "key", fetch)
+                for _ in range(3)
+            ]
+            wait_for_shared(single_flight, 2)
+            release.set()
+            results = [future.result() for future in futures]
+        results[0]["quantity"] = 0
+
+        # Assert
+        assert [result["quantity"] for result in results] == [0, 5, 5]
+        assert len({id(result) for result in results}) == 3
+
+    def test_sequential_calls_fetch_again(self):
+        # Arrange
+        single_flight = SingleFlight("test_sequential")
+        values = iter(["first", "second"])
+
+        # Act
+        first = single_flight.do("key", lambda: next(values))
+        second = single_flight.do("key", lambda: next(values))
+
+        # Assert
+        assert (first, second) == ("first", "second")
+
+    def test_different_keys_do_not_share(self):
+        # Arrange
+        single_flight = SingleFlight("test_keys")
+
+        # Act
+        results = [single_flight.do(key, lambda k=key: k) for key in "ab"]
+
+        # Assert
+        assert results == ["a", "b"]
+
+
+if __name__ == "__main__":
+    pytest.main()
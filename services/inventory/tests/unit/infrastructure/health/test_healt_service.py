@@ -19,6 +19,7 @@ class TestHealthService:
         # Assert
         assert result is True
         mock_db.execute.assert_called_once()
+        mock_db.close.assert_called_once()
 
     @patch("src.infrastructure.health.health_service.Session")
     def test_check_database_failure(self, mock_session):
@@ -41,12 +42,15 @@ class TestHealthService:
         service = HealthService(db=Mock(), rabbitmq_host="localhost")
 
         # Act
-        result = service.check_rabbitmq()
+        first = service.check_rabbitmq()
+        second = service.check_rabbitmq()
 
         # Assert
-        assert result is True
+        assert first is True
+        assert second is True
         mock_pika.assert_called_once()
-        mock_connection.close.assert_called_once()
+        assert mock_connection.process_data_events.call_count == 2
+        mock_connection.close.assert_not_called()
 
     @patch("src.infrastructure.health.health_service.pika.BlockingConnection")
     def test_check_rabbitmq_failure(self, mock_pika):
@@ -60,6 +64,7 @@ class TestHealthService:
         # Assert
         assert result is False
         mock_pika.assert_called_once()
+        assert service.rabbitmq_connection is None
 
     @patch.object(HealthService, "check_database", return_value=True)
     @patch.object(HealthService, "check_rabbitmq", return_value=True)
@@ -0,0 +1,72 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from src.infrastructure.health.health_monitor import HealthMonitor
+
+
+class TestHealthMonitor:
+
+    def test_initial_status_is_unknown(self):
+        # Arrange
+        monitor = HealthMonitor({"database": MagicMock(return_value=True)})
+
+        # Act
+        result = monitor.get_health_status()
+
+        # Assert
+        assert result == {"database": "unknown"}
+        assert monitor.is_ready() is False
+
+    def test_refresh_caches_results(self):
+        # Arrange
+        database_check = MagicMock(return_value=True)
+        rabbitmq_check = MagicMock(return_value=True)
+        monitor = HealthMonitor(
+            {"database": database_check, "rabbitmq": rabbitmq_check}
+        )
+
+        # Act
+        monitor.refresh()
+        first = monitor.get_health_status()
+        second = monitor.get_health_status()
+
+        # Assert
+        assert (
+            first == second == {"database": "healthy", "rabbitmq": "healthy"}
+        )
+        assert monitor.is_ready() is True
+        database_check.assert_called_once()
+        rabbitmq_check.assert_called_once()
+
+    def test_refresh_times_out_slow_check(self):
+        # Arrange
+        release = threading.Event()
+        slow_check = MagicMock(side_effect=lambda: release.wait() or True)
+        monitor = HealthMonitor({"rabbitmq": slow_check}, timeout=0.05)
+
+        # Act
+        monitor.refresh()
+        monitor.refresh()
+
+        # Assert
+        assert monitor.get_health_status() == {"rabbitmq": "unhealthy"}
+        slow_check.assert_called_once()
+        release.set()
+        monitor.stop()
+
+    def test_refresh_marks_raising_check_unhealthy(self):
+        # Arrange
+        monitor = HealthMonitor(
+            {"database": MagicMock(side_effect=Exception("DB error"))}
+        )
+
+        # Act
+        monitor.refresh()
+
+        # Assert
+        assert monitor.get_health_status() == {"database": "unhealthy"}
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,111 @@
+import json
+from unittest.mock import ANY, Mock
+
+import pika
+from src.infrastructure.messaging.in_memory_broker import InMemoryBroker
+from src.infrastructure.messaging.inventory_subscriber import (
+    InventorySubscriber,
+)
+
+
+class TestInMemoryBroker:
+
+    def test_publish_routes_to_bound_queues(self) -> None:
+        # Arrange
+        broker = InMemoryBroker()
+        broker.bind("inventory_exchange", "inventory_queue", "inventory_queue")
+
+        # Act
+        broker.publish("inventory_exchange", "inventory_queue", "{}")
+        broker.publish("inventory_exchange", "other_queue", "{}")
+
+        # Assert
+        assert broker.message_count("inventory_queue") == 1
+        assert broker.message_count("other_queue") == 0
+
+    def test_start_consuming_drains_queue_and_returns(self) -> None:
+        # Arrange
+        broker = InMemoryBroker()
+        channel = broker.connection().channel()
+        for i in range(3):
+            channel.basic_publish("", "inventory_queue", json.dumps({"i": i}))
+        received = []
+
+        def on_message(ch, method, properties, body):
+            received.append(json.loads(body))
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+
+        channel.basic_consume(
+            queue="inventory_queue", on_message_callback=on_message
+        )
+
+        # Act
+        channel.start_consuming()
+
+        # Assert
+        assert received == [{"i": 0}, {"i": 1}, {"i": 2}]
+        assert broker.acked == 3
+        assert broker.message_count("inventory_queue") == 0
+
+    def test_nack_requeues_as_redelivered(self) -> None:
+        # Arrange
+        broker = InMemoryBroker()
+        channel = broker.connection().channel()
+        channel.basic_publish("", "inventory_queue", "{}")
+        method, _, _ = channel.basic_get("inventory_queue")
+
+        # Act
+        channel.basic_nack(delivery_tag=method.delivery_tag)
+        method, _, body = channel.basic_get("inventory_queue")
+
+        # Assert
+        assert method.redelivered is True
+        assert body == b"{}"
+        assert broker.nacked == 1
+
+    def test_connection_runs_due_timers_unless_removed(self) -> None:
+        # Arrange
+        connection = InMemoryBroker().connection()
+        fired = []
+        connection.call_later(0, lambda: fired.append("due"))
+        removed = connection.call_later(0, lambda: fired.append("removed"))
+        connection.call_later(60, lambda: fired.append("later"))
+
+        # Act
+        connection.remove_timeout(removed)
+        connection.process_data_events()
+
+        # Assert
+        assert fired == ["due"]
+
+    def test_aggregating_subscriber_acks_batch_through_broker(self) -> None:
+        # Arrange
+        broker = InMemoryBroker()
+        product_service = Mock()
+        product_service.apply_inventory_deltas.return_value = []
+        subscriber = InventorySubscriber(
+            product_service, aggregate=True, aggregation_max_batch=2
+        )
+        subscriber.connection = broker.connection()
+        channel = subscriber.connection.channel()
+        for i, action in enumerate(["add", "subtract", "subtract"]):
+            channel.basic_publish(
+                "",
+                "inventory_queue",
+                json.dumps({"sku": "SKU1", "action": action, "quantity": 2}),
+                pika.BasicProperties(message_id=f"m-{i}"),
+            )
+        channel.basic_consume(
+            queue="inventory_queue", on_message_callback=subscriber.on_message
+        )
+
+        # Act
+        channel.start_consuming()
+        subscriber.flush(channel)
+
+        # Assert
+        assert product_service.apply_inventory_deltas.call_count == 2
+        product_service.apply_inventory_deltas.assert_any_call(
+            {"SKU1": 0}, ANY
+        )
+        assert broker.acked == 3
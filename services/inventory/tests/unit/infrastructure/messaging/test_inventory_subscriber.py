@@ -1,10 +1,9 @@
 import json
 import socket
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, call, patch
 
 import pika
 import pytest
-
 from src.application.services.product_service import ProductService
 from src.config import Config
 from src.infrastructure.messaging.inventory_subscriber import (
@@ -92,9 +91,12 @@ class TestInventorySubscriber:
         mock_channel.exchange_declare.assert_called_once_with(
             exchange="inventory_exchange", exchange_type="direct", durable=True
         )
-        mock_channel.queue_declare.assert_called_once_with(
+        mock_channel.queue_declare.assert_any_call(
             queue="inventory_queue", durable=True
         )
+        mock_channel.queue_declare.assert_any_call(
+            queue="inventory_queue.dlq", durable=True
+        )
         mock_channel.queue_bind.assert_called_once_with(
             exchange="inventory_exchange",
             queue="inventory_queue",
@@ -187,10 +189,385 @@ class TestInventorySubscriber:
 
         # Assert
         mock_logger.error.assert_called_once()
+        assert (
+            mock_channel.basic_publish.call_args.kwargs["routing_key"]
+            == "inventory_queue.retry.1000ms"
+        )
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=mock_method.delivery_tag
+        )
+
+    def test_start_consuming_aggregate_sets_prefetch(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        subscriber = InventorySubscriber(
+            product_service, aggregate=True, aggregation_max_batch=50
+        )
+        subscriber.connect = Mock(return_value=True)
+        subscriber.channel = Mock()
+
+        # Act
+        subscriber.start_consuming()
+
+        # Assert
+        subscriber.channel.basic_qos.assert_called_once_with(prefetch_count=50)
+
+    def test_on_message_aggregate_buffers_net_deltas(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        product_service.apply_inventory_deltas.return_value = []
+        subscriber = InventorySubscriber(
+            product_service, aggregate=True, aggregation_max_batch=10
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        messages = [
+            ("123", "subtract", 2),
+            ("123", "subtract", 3),
+            ("456", "add", 4),
+            ("123", "add", 1),
+        ]
+
+        # Act
+        for delivery_tag, (sku, action, quantity) in enumerate(messages, 1):
+            body = json.dumps(
+                {"sku": sku, "action": action, "quantity": quantity}
+            ).encode("utf-8")
+            subscriber.on_message(
+                mock_channel, Mock(delivery_tag=delivery_tag), None, body
+            )
+
+        # Assert
+        product_service.apply_inventory_deltas.assert_not_called()
+        mock_channel.basic_ack.assert_not_called()
+        subscriber.connection.call_later.assert_called_once()
+        assert subscriber._pending_count == 4
+
+        # Act
+        subscriber.flush(mock_channel)
+
+        # Assert
+        product_service.apply_inventory_deltas.assert_called_once_with(
+            {"123": -4, "456": 4}, ANY
+        )
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=4, multiple=True
+        )
+        subscriber.connection.remove_timeout.assert_called_once()
+
+    def test_on_message_aggregate_flushes_at_max_batch(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        product_service.apply_inventory_deltas.return_value = []
+        subscriber = InventorySubscriber(
+            product_service, aggregate=True, aggregation_max_batch=2
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": 1}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(mock_channel, Mock(delivery_tag=1), None, body)
+        subscriber.on_message(mock_channel, Mock(delivery_tag=2), None, body)
+
+        # Assert
+        product_service.apply_inventory_deltas.assert_called_once_with(
+            {"123": -2}, ANY
+        )
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=2, multiple=True
+        )
+
+    def test_flush_schedules_batch_for_retry_on_failure(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        error = Exception("database unavailable")
+        product_service.apply_inventory_deltas.side_effect = error
+        retry_topology = Mock()
+        subscriber = InventorySubscriber(
+            product_service,
+            aggregate=True,
+            aggregation_max_batch=10,
+            retry_topology=retry_topology,
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        first = json.dumps(
+            {"sku": "123", "action": "add", "quantity": 1}
+        ).encode("utf-8")
+        second = json.dumps(
+            {"sku": "456", "action": "subtract", "quantity": 2}
+        ).encode("utf-8")
+        subscriber.on_message(mock_channel, Mock(delivery_tag=6), None, first)
+        subscriber.on_message(mock_channel, Mock(delivery_tag=7), None, second)
+
+        # Act
+        subscriber.flush(mock_channel)
+
+        # Assert
+        retry_topology.retry.assert_has_calls(
+            [
+                call(mock_channel, None, first, error),
+                call(mock_channel, None, second, error),
+            ]
+        )
+        mock_channel.basic_nack.assert_not_called()
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=7, multiple=True
+        )
+        assert subscriber._pending_count == 0
+
+    def test_flush_replays_rejected_sku_one_message_at_a_time(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+
+        # The netted -4 and the lone subtract exceed the stock; the add fits
+        def apply_inventory_deltas(deltas, before_commit):
+            rejected = [sku for sku, delta in deltas.items() if delta < 0]
+            before_commit(rejected)
+            return rejected
+
+        product_service.apply_inventory_deltas.side_effect = (
+            apply_inventory_deltas
+        )
+        deduplicator = Mock()
+        deduplicator.is_duplicate.return_value = False
+        retry_topology = Mock()
+        subscriber = InventorySubscriber(
+            product_service,
+            aggregate=True,
+            aggregation_max_batch=10,
+            deduplicator=deduplicator,
+            retry_topology=retry_topology,
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        add = Mock(message_id="add")
+        subtract = Mock(message_id="subtract")
+        add_body = json.dumps(
+            {"sku": "123", "action": "add", "quantity": 2}
+        ).encode("utf-8")
+        subtract_body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": 6}
+        ).encode("utf-8")
+        subscriber.on_message(
+            mock_channel, Mock(delivery_tag=1), add, add_body
+        )
+        subscriber.on_message(
+            mock_channel, Mock(delivery_tag=2), subtract, subtract_body
+        )
+
+        # Act
+        subscriber.flush(mock_channel)
+
+        # Assert
+        assert [
+            args[0]
+            for args, _ in product_service.apply_inventory_deltas.call_args_list
+        ] == [{"123": -4}, {"123": 2}, {"123": -6}]
+        # Both claims leave the batch transaction, then each is re-claimed
+        # with its own replay; only the add is committed
+        deduplicator.forget.assert_has_calls([call(add), call(subtract)])
+        assert deduplicator.is_duplicate.call_count == 4
+        deduplicator.mark_processed.assert_called_once_with(add)
+        deduplicator.discard.assert_called_once()
+        retry_topology.retry.assert_called_once()
+        assert retry_topology.retry.call_args[0][:3] == (
+            mock_channel,
+            subtract,
+            subtract_body,
+        )
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=2, multiple=True
+        )
+
+    def test_on_message_aggregate_acks_invalid_message(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        retry_topology = Mock()
+        subscriber = InventorySubscriber(
+            product_service, aggregate=True, retry_topology=retry_topology
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        mock_method = Mock()
+        body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": -1}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(mock_channel, mock_method, None, body)
+
+        # Assert
+        retry_topology.retry.assert_called_once()
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=mock_method.delivery_tag
+        )
+        assert subscriber._pending_count == 0
+
+    def test_on_message_skips_duplicate(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        deduplicator = Mock()
+        deduplicator.is_duplicate.return_value = True
+        subscriber = InventorySubscriber(
+            product_service, aggregate=False, deduplicator=deduplicator
+        )
+        mock_channel = Mock()
+        mock_method = Mock()
+        body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": 5}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(
+            mock_channel, mock_method, Mock(message_id="abc"), body
+        )
+
+        # Assert
+        product_service.subtract_inventory.assert_not_called()
+        deduplicator.mark_processed.assert_not_called()
         mock_channel.basic_ack.assert_called_once_with(
             delivery_tag=mock_method.delivery_tag
         )
 
+    def test_on_message_marks_processed(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        deduplicator = Mock()
+        deduplicator.is_duplicate.return_value = False
+        subscriber = InventorySubscriber(
+            product_service, aggregate=False, deduplicator=deduplicator
+        )
+        properties = Mock(message_id="abc")
+        body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": 5}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(Mock(), Mock(), properties, body)
+
+        # Assert
+        product_service.subtract_inventory.assert_called_once_with("123", 5)
+        deduplicator.mark_processed.assert_called_once_with(properties)
+
+    def test_on_message_aggregate_skips_duplicates_and_marks_batch(
+        self,
+    ) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        product_service.apply_inventory_deltas.return_value = []
+        deduplicator = Mock()
+        deduplicator.is_duplicate.return_value = False
+        subscriber = InventorySubscriber(
+            product_service,
+            aggregate=True,
+            aggregation_max_batch=10,
+            deduplicator=deduplicator,
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        first = Mock(message_id="abc")
+        redelivered = Mock(message_id="abc")
+        second = Mock(message_id="def")
+        body = json.dumps(
+            {"sku": "123", "action": "subtract", "quantity": 1}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(mock_channel, Mock(delivery_tag=1), first, body)
+        subscriber.on_message(
+            mock_channel, Mock(delivery_tag=2), redelivered, body
+        )
+        subscriber.on_message(mock_channel, Mock(delivery_tag=3), second, body)
+        subscriber.flush(mock_channel)
+
+        # Assert
+        product_service.apply_inventory_deltas.assert_called_once_with(
+            {"123": -2}, ANY
+        )
+        assert deduplicator.is_duplicate.call_args_list == [
+            call(first),
+            call(second),
+        ]
+        assert deduplicator.mark_processed.call_count == 2
+        mock_channel.basic_ack.assert_any_call(delivery_tag=2)
+        mock_channel.basic_ack.assert_called_with(
+            delivery_tag=3, multiple=True
+        )
+
+    def test_flush_skips_messages_already_in_ledger(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        product_service.apply_inventory_deltas.return_value = []
+        deduplicator = Mock()
+        deduplicator.is_duplicate.side_effect = [True, False]
+        subscriber = InventorySubscriber(
+            product_service,
+            aggregate=True,
+            aggregation_max_batch=10,
+            deduplicator=deduplicator,
+        )
+        subscriber.connection = Mock()
+        mock_channel = Mock()
+        processed = Mock(message_id="abc")
+        fresh = Mock(message_id="def")
+        add = json.dumps({"sku": "123", "action": "add", "quantity": 1})
+        subtract = json.dumps(
+            {"sku": "456", "action": "subtract", "quantity": 1}
+        )
+
+        # Act
+        subscriber.on_message(
+            mock_channel, Mock(delivery_tag=1), processed, add.encode()
+        )
+        subscriber.on_message(
+            mock_channel, Mock(delivery_tag=2), fresh, subtract.encode()
+        )
+        subscriber.flush(mock_channel)
+
+        # Assert
+        product_service.apply_inventory_deltas.assert_called_once_with(
+            {"456": -1}, ANY
+        )
+        deduplicator.mark_processed.assert_called_once_with(fresh)
+        mock_channel.basic_ack.assert_called_once_with(
+            delivery_tag=2, multiple=True
+        )
+
+    def test_start_consuming_schedules_queue_sampling(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        subscriber = InventorySubscriber(product_service)
+        subscriber.connect = Mock(return_value=True)
+        subscriber.connection = Mock()
+        subscriber.channel = Mock()
+
+        # Act
+        subscriber.start_consuming()
+
+        # Assert
+        subscriber.connection.call_later.assert_called_once()
+
+    def test_on_message_records_metrics(self) -> None:
+        # Arrange
+        product_service = Mock(spec=ProductService)
+        subscriber = InventorySubscriber(product_service, aggregate=False)
+        metrics = subscriber.on_message.consumer_metrics
+        consumed = metrics.consumed.get(queue="inventory_queue")
+        body = json.dumps(
+            {"sku": "123", "action": "add", "quantity": 1}
+        ).encode("utf-8")
+
+        # Act
+        subscriber.on_message(Mock(), Mock(redelivered=True), None, body)
+
+        # Assert
+        assert metrics.consumed.get(queue="inventory_queue") == consumed + 1
+        assert metrics.redeliveries.get(queue="inventory_queue") >= 1
+
 
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.persistence.in_memory_processed_message_repository import (
+    InMemoryProcessedMessageRepository,
+)
+
+
+class TestMessageDeduplicator:
+
+    def test_is_duplicate_after_mark_processed(self) -> None:
+        # Arrange
+        deduplicator = MessageDeduplicator(
+            InMemoryProcessedMessageRepository()
+        )
+        properties = Mock(message_id="abc")
+
+        # Act
+        before = deduplicator.is_duplicate(properties)
+        deduplicator.mark_processed(properties)
+        after = deduplicator.is_duplicate(properties)
+
+        # Assert
+        assert before is False
+        assert after is True
+
+    def test_message_without_id_is_never_duplicate(self) -> None:
+        # Arrange
+        repository = Mock()
+        deduplicator = MessageDeduplicator(repository)
+        properties = Mock(message_id=None)
+
+        # Act
+        deduplicator.mark_processed(properties)
+        result = deduplicator.is_duplicate(properties)
+
+        # Assert
+        assert result is False
+        repository.add.assert_not_called()
+        repository.commit.assert_not_called()
+
+    def test_store_errors_do_not_block_processing(self) -> None:
+        # Arrange
+        repository = Mock()
+        repository.add.side_effect = Exception("database unavailable")
+        repository.commit.side_effect = Exception("database unavailable")
+        deduplicator = MessageDeduplicator(repository)
+        properties = Mock(message_id="abc")
+
+        # Act
+        result = deduplicator.is_duplicate(properties)
+        deduplicator.mark_processed(properties)
+
+        # Assert
+        assert result is False
+        assert repository.rollback.call_count == 2
+
+    def test_claim_in_flight_is_duplicate_until_discarded(self) -> None:
+        # Arrange
+        repository = InMemoryProcessedMessageRepository()
+        deduplicator = MessageDeduplicator(repository)
+        properties = Mock(message_id="abc")
+
+        # Act
+        first = deduplicator.is_duplicate(properties)
+        in_flight = deduplicator.is_duplicate(properties)
+        deduplicator.discard()
+        retried = deduplicator.is_duplicate(properties)
+
+        # Assert
+        assert first is False
+        assert in_flight is True
+        assert retried is False
+        assert not repository.exists("abc")
+
+    def test_forget_drops_only_that_claim(self) -> None:
+        # Arrange
+        repository = InMemoryProcessedMessageRepository()
+        deduplicator = MessageDeduplicator(repository)
+        kept = Mock(message_id="kept")
+        forgotten = Mock(message_id="forgotten")
+        deduplicator.is_duplicate(kept)
+        deduplicator.is_duplicate(forgotten)
+
+        # Act
+        deduplicator.forget(forgotten)
+        deduplicator.mark_processed(kept)
+
+        # Assert
+        assert repository.exists("kept")
+        assert not repository.exists("forgotten")
+
+    @patch("src.infrastructure.messaging.message_deduplicator.time.monotonic")
+    def test_mark_processed_evicts_expired(self, mock_monotonic: Mock) -> None:
+        # Arrange
+        mock_monotonic.return_value = 0
+        repository = InMemoryProcessedMessageRepository()
+        deduplicator = MessageDeduplicator(
+            repository, ttl=60, eviction_interval=10
+        )
+        repository._processed_at["old"] = datetime.utcnow() - timedelta(
+            seconds=120
+        )
+        mock_monotonic.return_value = 11
+        properties = Mock(message_id="new")
+
+        # Act
+        deduplicator.is_duplicate(properties)
+        deduplicator.mark_processed(properties)
+
+        # Assert
+        assert not repository.exists("old")
+        assert repository.exists("new")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,106 @@
+from unittest.mock import Mock
+
+import pytest
+from src.infrastructure.messaging.retry_topology import (
+    ATTEMPTS_HEADER,
+    LAST_ERROR_HEADER,
+    RetryTopology,
+)
+
+
+class TestRetryTopology:
+
+    def test_declare(self) -> None:
+        # Arrange
+        topology = RetryTopology("inventory_queue", delays=[100, 1000])
+        mock_channel = Mock()
+
+        # Act
+        topology.declare(mock_channel)
+
+        # Assert
+        mock_channel.queue_declare.assert_any_call(
+            queue="inventory_queue.retry.100ms",
+            durable=True,
+            arguments={
+                "x-message-ttl": 100,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": "inventory_queue",
+            },
+        )
+        mock_channel.queue_declare.assert_any_call(
+            queue="inventory_queue.dlq", durable=True
+        )
+        assert mock_channel.queue_declare.call_count == 3
+
+    @pytest.mark.parametrize(
+        "attempts, routing_key",
+        [
+            (0, "inventory_queue.retry.100ms"),
+            (1, "inventory_queue.retry.1000ms"),
+            (2, "inventory_queue.dlq"),
+        ],
+    )
+    def test_retry_routes_by_attempt(
+        self, attempts: int, routing_key: str
+    ) -> None:
+        # Arrange
+        topology = RetryTopology(
+            "inventory_queue", delays=[100, 1000], max_attempts=3
+        )
+        mock_channel = Mock()
+        properties = Mock(
+            message_id="abc", headers={ATTEMPTS_HEADER: attempts}
+        )
+
+        # Act
+        topology.retry(mock_channel, properties, b"{}", Exception("boom"))
+
+        # Assert
+        kwargs = mock_channel.basic_publish.call_args.kwargs
+        assert kwargs["routing_key"] == routing_key
+        assert kwargs["properties"].message_id == "abc"
+        assert kwargs["properties"].headers == {
+            ATTEMPTS_HEADER: attempts + 1,
+            LAST_ERROR_HEADER: "boom",
+        }
+
+    def test_retry_without_properties(self) -> None:
+        # Arrange
+        topology = RetryTopology("inventory_queue", delays=[100])
+        mock_channel = Mock()
+
+        # Act
+        topology.retry(mock_channel, None, b"{}", Exception("boom"))
+
+        # Assert
+        kwargs = mock_channel.basic_publish.call_args.kwargs
+        assert kwargs["routing_key"] == "inventory_queue.retry.100ms"
+        assert kwargs["properties"].headers[ATTEMPTS_HEADER] == 1
+
+    def test_replay_dead_letters(self) -> None:
+        # Arrange
+        topology = RetryTopology("inventory_queue")
+        mock_channel = Mock()
+        mock_channel.basic_get.side_effect = [
+            (
+                Mock(delivery_tag=3),
+                Mock(message_id="abc", headers={ATTEMPTS_HEADER: 5}),
+                b"{}",
+            ),
+            (None, None, None),
+        ]
+
+        # Act
+        replayed = topology.replay_dead_letters(mock_channel)
+
+        # Assert
+        assert replayed == 1
+        kwargs = mock_channel.basic_publish.call_args.kwargs
+        assert kwargs["routing_key"] == "inventory_queue"
+        assert kwargs["properties"].headers == {}
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=3)
+
+
+if __name__ == "__main__":
+    pytest.main()
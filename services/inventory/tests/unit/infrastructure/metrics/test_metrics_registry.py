@@ -0,0 +1,65 @@
+import pytest
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class TestMetricsRegistry:
+
+    def test_counter_render(self) -> None:
+        # Arrange
+        metrics = MetricsRegistry()
+        counter = metrics.counter("jobs_total", "Jobs done.", ["queue"])
+
+        # Act
+        counter.inc(queue="a")
+        counter.inc(2, queue="a")
+        output = metrics.render()
+
+        # Assert
+        assert output == (
+            "# HELP jobs_total Jobs done.\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{queue="a"} 3\n'
+        )
+
+    def test_histogram_render(self) -> None:
+        # Arrange
+        metrics = MetricsRegistry()
+        histogram = metrics.histogram(
+            "latency_seconds", "Latency.", buckets=[0.1, 1]
+        )
+
+        # Act
+        histogram.observe(0.05)
+        histogram.observe(3)
+        output = metrics.render()
+
+        # Assert
+        assert 'latency_seconds_bucket{le="0.1"} 1' in output
+        assert 'latency_seconds_bucket{le="1"} 1' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 2' in output
+        assert "latency_seconds_count 2" in output
+
+    def test_gauge(self) -> None:
+        # Arrange
+        metrics = MetricsRegistry()
+        gauge = metrics.gauge("in_flight", "In flight.")
+
+        # Act
+        gauge.set(3)
+        gauge.dec()
+
+        # Assert
+        assert gauge.get() == 2
+
+    def test_conflicting_type_raises(self) -> None:
+        # Arrange
+        metrics = MetricsRegistry()
+        metrics.counter("jobs_total", "Jobs done.")
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            metrics.gauge("jobs_total", "Jobs done.")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,36 @@
+from sqlalchemy import create_engine, text
+from src.infrastructure.metrics.request_metrics import (
+    current_stats,
+    instrument_engine,
+    track_request,
+)
+
+
+class TestRequestMetrics:
+    def test_engine_queries_are_attributed_to_the_current_request(
+        self,
+    ) -> None:
+        # Arrange
+        engine = instrument_engine(create_engine("sqlite://"))
+
+        # Act
+        with track_request() as stats:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT 2"))
+
+        # Assert
+        assert stats.queries == 2
+        assert stats.query_seconds > 0
+        assert current_stats() is None
+
+    def test_queries_outside_a_request_are_ignored(self) -> None:
+        # Arrange
+        engine = instrument_engine(create_engine("sqlite://"))
+
+        # Act
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        # Assert
+        assert current_stats() is None
@@ -0,0 +1,39 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from src.infrastructure.persistence.query_counter import (
+    QueryCounter,
+    assert_max_queries,
+)
+
+
+@pytest.fixture
+def engine() -> Engine:
+    return create_engine("sqlite://")
+
+
+class TestQueryCounter:
+    def test_counter_captures_statements_inside_the_block(
+        self, engine: Engine
+    ) -> None:
+        # Act
+        with engine.connect() as connection:
+            with QueryCounter(engine) as counter:
+                connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        # Assert
+        assert counter.statements == ["SELECT 1"]
+
+    def test_budget_exceeded_lists_offending_statements(
+        self, engine: Engine
+    ) -> None:
+        # Act
+        with engine.connect() as connection:
+            with pytest.raises(AssertionError) as error:
+                with assert_max_queries(engine, 1):
+                    connection.execute(text("SELECT 1"))
+                    connection.execute(text("SELECT 2"))
+
+        # Assert
+        assert "1. SELECT 1\n2. SELECT 2" in str(error.value)
@@ -0,0 +1,71 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from src.infrastructure.persistence.slow_query_log import (
+    SlowQueryLog,
+    fingerprint,
+)
+from src.infrastructure.tracing.tracer import tracer
+
+
+@pytest.fixture
+def log() -> SlowQueryLog:
+    return SlowQueryLog(threshold_ms=100, sample_ratio=1.0)
+
+
+class TestSlowQueryLog:
+    def test_fingerprint_collapses_parameters_and_in_lists(self) -> None:
+        # Act
+        short = fingerprint("SELECT * FROM prices WHERE product_id IN (?)")
+        long = fingerprint(
+            "SELECT * FROM prices WHERE product_id IN (?, ?, ?)"
+        )
+
+        # Assert
+        assert (
+            short == long == "SELECT * FROM prices WHERE product_id IN (...)"
+        )
+        assert fingerprint("SELECT * FROM products WHERE sku = 'A1'") == (
+            "SELECT * FROM products WHERE sku = ?"
+        )
+
+    def test_stats_aggregate_per_fingerprint(self, log: SlowQueryLog) -> None:
+        # Act
+        for duration in [1, 2, 3, 150]:
+            log.record("SELECT * FROM products WHERE id = 7", duration, rows=2)
+
+        # Assert
+        (entry,) = log.snapshot()
+        assert entry["sampled_calls"] == 4
+        assert entry["slow_calls"] == 1
+        assert entry["p50_ms"] == 3
+        assert entry["max_ms"] == 150
+        assert entry["rows"] == 8
+
+    def test_slow_query_is_logged_with_its_repository_method(
+        self, log: SlowQueryLog, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        # Act
+        with caplog.at_level(logging.WARNING, logger="app"):
+            with tracer.span("SQLAlchemyProductRepository.find_by_sku"):
+                log.record("SELECT * FROM products WHERE sku = 'A1'", 300)
+
+        # Assert
+        assert (
+            "Slow query 300.0ms in SQLAlchemyProductRepository.find_by_sku"
+            in caplog.text
+        )
+
+    def test_instrumented_engine_records_statements(
+        self, log: SlowQueryLog
+    ) -> None:
+        # Arrange
+        engine = log.instrument(create_engine("sqlite://"))
+
+        # Act
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        # Assert
+        assert log.snapshot()[0]["fingerprint"] == "SELECT ?"
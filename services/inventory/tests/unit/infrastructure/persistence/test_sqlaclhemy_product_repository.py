@@ -1,10 +1,14 @@
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 from src.domain.entities.category_entity import CategoryEntity
 from src.domain.entities.inventory_entity import InventoryEntity
 from src.domain.entities.price_entity import PriceEntity
 from src.domain.entities.product_entity import ProductEntity
+from src.infrastructure.persistence.db_setup import Base
 from src.infrastructure.persistence.models import (
     CategoryModel,
     InventoryModel,
@@ -104,6 +108,7 @@ class TestSQLAlchemyProductRepository:
         mock_product_model_instance.category_id = 1
         mock_product_model_instance.description = "Laptop device"
         mock_product_model_instance.images = ["https://example.com"]
+        mock_product_model_instance.updated_at = datetime(2024, 5, 1, 12, 30)
 
         # Set valid integers for price and inventory IDs directly
         mock_product_model_instance.price.id = 1
@@ -114,29 +119,23 @@ class TestSQLAlchemyProductRepository:
         mock_category_model_instance = MagicMock(spec=CategoryModel)
         mock_category_model_instance.id = 1
         mock_category_model_instance.name = "Electronics"
+        mock_product_model_instance.category = mock_category_model_instance
 
-        mock_session.query.return_value.filter.return_value.first.side_effect = [
-            mock_product_model_instance,
-            mock_category_model_instance,
-        ]
+        mock_session.query.return_value.filter.return_value.first.return_value = (
+            mock_product_model_instance
+        )
 
         # Act
         result = repository.find_by_sku("123ABC")
 
         # Assert
-        mock_session.query.assert_any_call(ProductModel)
-        mock_session.query.assert_any_call(CategoryModel)
+        mock_session.query.assert_called_once_with(ProductModel)
 
         product_filter_args = (
             mock_session.query.return_value.filter.call_args_list[0][0][0]
         )
         assert str(product_filter_args) == str(ProductModel.sku == "123ABC")
 
-        category_filter_args = (
-            mock_session.query.return_value.filter.call_args_list[1][0][0]
-        )
-        assert str(category_filter_args) == str(CategoryModel.id == 1)
-
         assert result is not None
         assert result.sku == "123ABC"
         assert result.name == "Laptop"
@@ -145,6 +144,7 @@ class TestSQLAlchemyProductRepository:
         assert result.inventory.quantity == 50
         assert result.description == "Laptop device"
         assert result.images == ["https://example.com"]
+        assert result.updated_at == datetime(2024, 5, 1, 12, 30)
 
     def test_find_by_sku_not_found(self):
         # Arrange
@@ -279,6 +279,111 @@ class TestSQLAlchemyProductRepository:
         assert result[0].price.amount == 999.99
         assert result[0].inventory.quantity == 50
 
+    def test_apply_inventory_deltas(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProductRepository(mock_session)
+        applied = MagicMock(rowcount=1)
+        rejected = MagicMock(rowcount=0)
+        touched = MagicMock()
+        mock_session.execute.side_effect = [applied, rejected, touched]
+
+        # Act
+        result = repository.apply_inventory_deltas(
+            {"123ABC": -4, "NOOP": 0, "456DEF": -100}
+        )
+
+        # Assert
+        assert result == ["456DEF"]
+        # Two inventory updates plus one updated_at bump for 123ABC
+        assert mock_session.execute.call_count == 3
+        mock_session.commit.assert_called_once()
+
+    def test_apply_inventory_deltas_runs_hook_before_commit(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProductRepository(mock_session)
+        mock_session.execute.return_value = MagicMock(rowcount=0)
+        before_commit = MagicMock()
+        before_commit.side_effect = (
+            lambda rejected: mock_session.commit.assert_not_called()
+        )
+
+        # Act
+        repository.apply_inventory_deltas({"123ABC": -4}, before_commit)
+
+        # Assert
+        before_commit.assert_called_once_with(["123ABC"])
+        mock_session.commit.assert_called_once()
+
+    def test_apply_inventory_deltas_hook_can_veto_commit(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProductRepository(mock_session)
+        mock_session.execute.return_value = MagicMock(rowcount=0)
+        before_commit = MagicMock(side_effect=ValueError("rejected"))
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            repository.apply_inventory_deltas({"123ABC": -4}, before_commit)
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_apply_inventory_deltas_rolls_back_on_error(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProductRepository(mock_session)
+        mock_session.execute.side_effect = Exception("deadlock")
+
+        # Act / Assert
+        with pytest.raises(Exception):
+            repository.apply_inventory_deltas({"123ABC": 1})
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_list_summaries_paginated_projects_columns(self):
+        # Arrange
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        category = CategoryModel(name="Food")
+        session.add(category)
+        session.flush()
+        for index in range(3):
+            product = ProductModel(
+                sku=f"SKU{index}",
+                name=f"Product {index}",
+                description="Tasty",
+                images=["http://example.com"],
+                category_id=category.id,
+            )
+            session.add(product)
+            session.flush()
+            session.add(PriceModel(product_id=product.id, amount=2.5))
+            session.add(InventoryModel(product_id=product.id, quantity=10))
+        session.commit()
+        repository = SQLAlchemyProductRepository(session)
+
+        # Act
+        rows, current_page, records_per_page, pages, total = (
+            repository.list_summaries_paginated(2, 2)
+        )
+
+        # Assert
+        assert (current_page, records_per_page, pages, total) == (2, 2, 2, 3)
+        assert [dict(row) for row in rows] == [
+            {
+                "sku": "SKU2",
+                "name": "Product 2",
+                "category_name": "Food",
+                "price": 2.5,
+                "quantity": 10,
+                "description": "Tasty",
+                "images": ["http://example.com"],
+            }
+        ]
+        session.close()
+
 
 if __name__ == "__main__":
     pytest.main()
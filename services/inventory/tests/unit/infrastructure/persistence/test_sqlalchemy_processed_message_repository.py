@@ -0,0 +1,74 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from src.infrastructure.persistence.models import ProcessedMessageModel
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
+
+
+class TestSQLAlchemyProcessedMessageRepository:
+
+    def test_add_stages_row_without_committing(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProcessedMessageRepository(mock_session)
+
+        # Act
+        result = repository.add("abc")
+
+        # Assert
+        assert result is True
+        mock_session.begin_nested.assert_called_once()
+        added = mock_session.add.call_args[0][0]
+        assert isinstance(added, ProcessedMessageModel)
+        assert added.message_id == "abc"
+        mock_session.flush.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_add_returns_false_for_recorded_message(self):
+        # Arrange
+        mock_session = MagicMock()
+        mock_session.begin_nested.return_value.__exit__.return_value = False
+        mock_session.flush.side_effect = IntegrityError("", {}, Exception())
+        repository = SQLAlchemyProcessedMessageRepository(mock_session)
+
+        # Act
+        result = repository.add("abc")
+
+        # Assert
+        assert result is False
+        mock_session.rollback.assert_not_called()
+
+    def test_remove_deletes_within_transaction(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProcessedMessageRepository(mock_session)
+
+        # Act
+        repository.remove("abc")
+
+        # Assert
+        mock_session.query.return_value.filter.return_value.delete.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    def test_delete_older_than(self):
+        # Arrange
+        mock_session = MagicMock()
+        repository = SQLAlchemyProcessedMessageRepository(mock_session)
+        mock_session.query.return_value.filter.return_value.delete.return_value = (
+            2
+        )
+
+        # Act
+        result = repository.delete_older_than(datetime.utcnow())
+
+        # Assert
+        assert result == 2
+        mock_session.commit.assert_called_once()
+
+
+if __name__ == "__main__":
+    pytest.main()
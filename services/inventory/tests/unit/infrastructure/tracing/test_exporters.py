@@ -0,0 +1,73 @@
+import json
+from unittest.mock import MagicMock
+
+from src.infrastructure.tracing.exporters import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    build_exporter,
+    to_otlp,
+)
+from src.infrastructure.tracing.tracer import SpanKind, Tracer
+
+
+def _span(name="GET /products/{sku}"):
+    with Tracer("inventory").span(name, SpanKind.SERVER) as span:
+        pass
+    return span
+
+
+class TestExporters:
+
+    def test_to_otlp_builds_export_request(self) -> None:
+        # Arrange
+        span = _span()
+
+        # Act
+        request = to_otlp([span], "inventory")
+
+        # Assert
+        exported = request["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert exported["traceId"] == span.context.trace_id
+        assert exported["kind"] == SpanKind.SERVER
+        assert request["resourceSpans"][0]["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "inventory"}}
+        ]
+
+    def test_file_exporter_appends_one_request_per_line(
+        self, tmp_path
+    ) -> None:
+        # Arrange
+        path = tmp_path / "traces.jsonl"
+        exporter = FileSpanExporter(str(path))
+
+        # Act
+        exporter.export([_span()], "inventory")
+        exporter.export([_span()], "inventory")
+
+        # Assert
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert "resourceSpans" in json.loads(lines[0])
+
+    def test_batch_processor_shutdown_flushes_pending_spans(self) -> None:
+        # Arrange
+        exporter = MagicMock()
+        processor = BatchSpanProcessor(exporter, "inventory", interval=60)
+        processor.start()
+        processor.on_end(_span())
+
+        # Act
+        processor.shutdown()
+
+        # Assert
+        exporter.export.assert_called_once()
+        exporter.shutdown.assert_called_once()
+
+    def test_build_exporter(self) -> None:
+        # Act & Assert
+        assert isinstance(build_exporter("console"), ConsoleSpanExporter)
+        assert isinstance(build_exporter("file"), FileSpanExporter)
+        assert isinstance(build_exporter("otlp"), OtlpHttpSpanExporter)
+        assert build_exporter("none") is None
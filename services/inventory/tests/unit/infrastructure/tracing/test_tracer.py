@@ -0,0 +1,128 @@
+import pika
+import pytest
+from src.infrastructure.tracing.tracer import (
+    TRACEPARENT,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    traced_consumer,
+    traced_repository,
+    tracer,
+)
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+class TestTracer:
+
+    def test_traceparent_round_trip(self) -> None:
+        # Act
+        context = SpanContext.from_traceparent(PARENT)
+
+        # Assert
+        assert context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+        assert context.span_id == "b7ad6b7169203331"
+        assert context.to_traceparent() == PARENT
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            None,
+            "garbage",
+            "00-00000000000000000000000000000000-b7ad6b7169203331-01",
+        ],
+    )
+    def test_invalid_traceparent_is_ignored(self, value) -> None:
+        # Act
+        context = SpanContext.from_traceparent(value)
+
+        # Assert
+        assert context is None
+
+    def test_nested_spans_share_trace(self, spans) -> None:
+        # Act
+        with tracer.span("outer") as outer:
+            with tracer.span("inner") as inner:
+                pass
+
+        # Assert
+        assert inner.context.trace_id == outer.context.trace_id
+        assert inner.parent_span_id == outer.context.span_id
+        assert [span.name for span in spans] == ["inner", "outer"]
+
+    def test_span_records_exception(self, spans) -> None:
+        # Act
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+
+        # Assert
+        assert spans[0].status_code == StatusCode.ERROR
+
+    def test_unsampled_spans_are_not_exported(self) -> None:
+        # Arrange
+        collector = _Collector()
+        unsampled = Tracer("inventory", sample_ratio=0.0, processor=collector)
+
+        # Act
+        with unsampled.span("request"):
+            carrier = unsampled.inject({})
+
+        # Assert
+        assert carrier[TRACEPARENT].endswith("-00")
+        assert collector.spans == []
+
+    def test_traced_repository_wraps_public_methods(self, spans) -> None:
+        # Arrange
+        @traced_repository("postgresql")
+        class Repository:
+            def find(self, sku):
+                return self._load(sku)
+
+            def _load(self, sku):
+                return {"sku": sku}
+
+        # Act
+        product = Repository().find("SKU1")
+
+        # Assert
+        assert product == {"sku": "SKU1"}
+        assert [span.name for span in spans] == ["Repository.find"]
+        assert spans[0].kind == SpanKind.CLIENT
+
+    def test_traced_consumer_continues_trace(self, spans) -> None:
+        # Arrange
+        class Subscriber:
+            @traced_consumer("inventory_queue")
+            def on_message(self, ch, method, properties, body):
+                return tracer.current_span()
+
+        properties = pika.BasicProperties(headers={TRACEPARENT: PARENT})
+
+        # Act
+        span = Subscriber().on_message(None, None, properties, b"{}")
+
+        # Assert
+        assert span.name == "inventory_queue process"
+        assert span.kind == SpanKind.CONSUMER
+        assert span.parent_span_id == "b7ad6b7169203331"
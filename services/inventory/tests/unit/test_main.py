@@ -13,6 +13,8 @@ class TestApp:
         assert "/products/" in router_paths
         assert "/inventory/{sku}/add" in router_paths
         assert "/health" in router_paths
+        assert "/health/live" in router_paths
+        assert "/health/ready" in router_paths
 
 
 if __name__ == "__main__":
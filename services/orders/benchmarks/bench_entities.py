@@ -0,0 +1,40 @@
+from src.domain.entities.customer_entity import CustomerEntity
+from src.domain.entities.order_entity import OrderEntity, OrderStatus
+from src.domain.entities.order_item_entity import OrderItemEntity
+
+CUSTOMER = {
+    "id": 1,
+    "name": "Benchmark Customer",
+    "email": "benchmark@example.com",
+    "phone_number": "+5511999999999",
+}
+
+
+def _build(factory):
+    customer = factory(CustomerEntity)(**CUSTOMER)
+    items = [
+        factory(OrderItemEntity)(
+            id=item, product_sku=f"SKU{item:03d}", quantity=item + 1
+        )
+        for item in range(1, 4)
+    ]
+    return factory(OrderEntity)(
+        id=1,
+        customer=customer,
+        order_items=items,
+        status=OrderStatus.PAID,
+        order_number="BENCH-000001",
+        estimated_time="2024-09-01 12:00:00",
+    )
+
+
+def test_order_constructor(benchmark):
+    order = benchmark(_build, lambda cls: cls)
+
+    assert order.id == 1
+
+
+def test_order_from_trusted_row(benchmark):
+    order = benchmark(_build, lambda cls: cls.from_trusted_row)
+
+    assert order.id == 1
@@ -0,0 +1,55 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from src.infrastructure.messaging.delivery_subscriber import DeliverySubscriber
+from src.infrastructure.messaging.payment_subscriber import PaymentSubscriber
+
+
+class _NoopOrderService:
+    # Isolates decoding and dispatch from the service and the database
+    def set_paid_order(self, order_id):
+        return None
+
+    def update_order_status(self, order_id, status):
+        return None
+
+
+class _InlineBridge:
+    def run(self, coro):
+        return coro
+
+
+class _Channel:
+    def basic_ack(self, delivery_tag):
+        pass
+
+
+@pytest.fixture(scope="module")
+def delivery():
+    return (
+        _Channel(),
+        SimpleNamespace(delivery_tag=1),
+        SimpleNamespace(message_id="bench", headers=None),
+    )
+
+
+def test_payment_subscriber_on_message(benchmark, delivery):
+    channel, method, properties = delivery
+    subscriber = PaymentSubscriber(
+        _NoopOrderService(), MagicMock(), event_loop_bridge=_InlineBridge()
+    )
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode()
+
+    benchmark(subscriber.on_message, channel, method, properties, body)
+
+
+def test_delivery_subscriber_on_message(benchmark, delivery):
+    channel, method, properties = delivery
+    subscriber = DeliverySubscriber(
+        _NoopOrderService(), MagicMock(), event_loop_bridge=_InlineBridge()
+    )
+    body = json.dumps({"order_id": 1, "status": "delivered"}).encode()
+
+    benchmark(subscriber.on_message, channel, method, properties, body)
@@ -0,0 +1,50 @@
+import pytest
+from src.domain.entities.order_entity import OrderStatus
+from src.infrastructure.persistence.sqlalchemy_order_repository import (
+    SQLAlchemyOrderRepository,
+)
+
+
+@pytest.fixture
+def repository(db_session):
+    return SQLAlchemyOrderRepository(db_session)
+
+
+def test_find_by_id(benchmark, repository, db_session):
+    # Expired before every round so rows are hydrated again instead of
+    # coming back from the identity map
+    def find():
+        db_session.expire_all()
+        return repository.find_by_id(1)
+
+    order = benchmark(find)
+
+    assert order.id == 1
+
+
+def test_list_paginated(benchmark, repository, db_session):
+    def list_page():
+        db_session.expire_all()
+        return repository.list_paginated(0, 50)
+
+    orders = benchmark(list_page)
+
+    assert len(orders) == 50
+
+
+def test_list_all(benchmark, repository, db_session):
+    def list_all():
+        db_session.expire_all()
+        return repository.list_all()
+
+    orders = benchmark(list_all)
+
+    assert orders
+
+
+def test_list_status_rows(benchmark, repository):
+    rows = benchmark(
+        repository.list_status_rows, [OrderStatus.PAID, OrderStatus.READY]
+    )
+
+    assert rows
@@ -0,0 +1,53 @@
+import pytest
+from src.application.dto.serializers import order_to_dict, serialize_order
+from src.domain.entities.customer_entity import CustomerEntity
+from src.domain.entities.order_entity import OrderEntity, OrderStatus
+from src.domain.entities.order_item_entity import OrderItemEntity
+
+
+@pytest.fixture(scope="module")
+def order():
+    return OrderEntity(
+        id=1,
+        order_number="BENCH-000001",
+        customer=CustomerEntity(
+            id=1,
+            name="Benchmark Customer",
+            email="benchmark@example.com",
+            phone_number="+5511999999999",
+        ),
+        order_items=[
+            OrderItemEntity(
+                id=item,
+                product_sku=f"SKU{item:03d}",
+                quantity=item + 1,
+                name=f"Product {item}",
+                description="Benchmark product",
+                price=9.99,
+            )
+            for item in range(1, 4)
+        ],
+        status=OrderStatus.PREPARING,
+        estimated_time="2024-09-01 12:00:00",
+    )
+
+
+def test_serialize_order(benchmark, order):
+    response = benchmark(serialize_order, order, 59.94)
+
+    assert response.id == 1
+
+
+def test_serialize_order_to_json(benchmark, order):
+    # What FastAPI does with a response_model return value
+    body = benchmark(
+        lambda: serialize_order(order, 59.94).model_dump_json().encode()
+    )
+
+    assert body
+
+
+def test_order_to_dict(benchmark, order):
+    payload = benchmark(order_to_dict, order, 59.94)
+
+    assert payload["id"] == 1
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.domain.entities.order_entity import OrderStatus
+from src.infrastructure.persistence.db_setup import Base
+from src.infrastructure.persistence.models import (
+    CustomerModel,
+    OrderItemModel,
+    OrderModel,
+)
+
+# In-memory SQLite by default. Point this at a throwaway local Postgres
+# database to include driver and network costs; its tables are dropped.
+DATABASE_URL = os.getenv("BENCHMARK_DATABASE_URL", "sqlite://")
+ORDERS = int(os.getenv("BENCHMARK_ORDERS", 500))
+ITEMS_PER_ORDER = int(os.getenv("BENCHMARK_ITEMS_PER_ORDER", 3))
+
+STATUSES = list(OrderStatus)
+
+
+@pytest.fixture(scope="session")
+def db_session():
+    engine = create_engine(DATABASE_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    customer = CustomerModel(
+        name="Benchmark Customer",
+        email="benchmark@example.com",
+        phone_number="+5511999999999",
+    )
+    session.add(customer)
+    session.flush()
+    for index in range(ORDERS):
+        order = OrderModel(
+            order_number=f"BENCH-{index:06d}",
+            customer_id=customer.id,
+            status=STATUSES[index % len(STATUSES)],
+            estimated_time="2024-09-01 12:00:00",
+        )
+        session.add(order)
+        session.flush()
+        session.add_all(
+            OrderItemModel(
+                order_id=order.id,
+                product_sku=f"SKU{item:03d}",
+                quantity=item + 1,
+            )
+            for item in range(ITEMS_PER_ORDER)
+        )
+    session.commit()
+    yield session
+    session.close()
+    Base.metadata.drop_all(engine)
+    engine.dispose()
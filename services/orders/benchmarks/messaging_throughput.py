@@ -0,0 +1,246 @@
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+from typing import Callable, Dict, List
+
+import pika
+from src.infrastructure.messaging.delivery_subscriber import DeliverySubscriber
+from src.infrastructure.messaging.event_loop_bridge import EventLoopBridge
+from src.infrastructure.messaging.in_memory_broker import InMemoryBroker
+from src.infrastructure.messaging.payment_subscriber import PaymentSubscriber
+
+# Drains a backlog of synthetic messages through the real subscribers over
+# an in-memory broker, so results cover decoding, dispatch, the event loop
+# bridge and acking, but not RabbitMQ or the network.
+#
+#   python -m benchmarks.messaging_throughput --messages 20000
+#   python -m benchmarks.messaging_throughput --service-latency-ms 2
+
+MODES = ("single", "pooled")
+
+
+class _OrderService:
+    # Stands in for OrderService; the latency models its DB and HTTP calls
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def _work(self):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+    async def set_paid_order(self, order_id):
+        await self._work()
+
+    async def cancel_order(self, order_id):
+        await self._work()
+
+    async def update_order_status(self, order_id, status):
+        await self._work()
+
+
+CONSUMERS: Dict[str, dict] = {
+    "payment": {
+        "subscriber": PaymentSubscriber,
+        "exchange": "payment_exchange",
+        "queue": "payment_queue",
+        "statuses": ["completed", "completed", "completed", "refunded"],
+    },
+    "delivery": {
+        "subscriber": DeliverySubscriber,
+        "exchange": "delivery_exchange",
+        "queue": "delivery_queue",
+        "statuses": ["in_transit", "delivered"],
+    },
+}
+
+
+def publish_backlog(broker: InMemoryBroker, consumer: dict, messages: int):
+    broker.bind(consumer["exchange"], consumer["queue"], consumer["queue"])
+    statuses = consumer["statuses"]
+    for i in range(messages):
+        body = json.dumps(
+            {"order_id": i, "status": statuses[i % len(statuses)]}
+        )
+        properties = pika.BasicProperties(message_id=uuid.uuid4().hex)
+        broker.publish(
+            consumer["exchange"], consumer["queue"], body, properties
+        )
+
+
+def consume(
+    broker: InMemoryBroker,
+    subscriber,
+    queue: str,
+    wrap: Callable = None,
+):
+    connection = broker.connection()
+    subscriber.connection = connection
+    subscriber.channel = connection.channel()
+    callback = subscriber.on_message
+    subscriber.channel.basic_consume(
+        queue=queue, on_message_callback=wrap(callback) if wrap else callback
+    )
+    subscriber.channel.start_consuming()
+
+
+def drain(
+    broker: InMemoryBroker,
+    subscribers: List,
+    queue: str,
+    wrap: Callable = None,
+):
+    if len(subscribers) == 1:
+        consume(broker, subscribers[0], queue, wrap)
+        return
+    threads = [
+        threading.Thread(target=consume, args=(broker, s, queue, wrap))
+        for s in subscribers
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def track_allocations(samples: List[int]) -> Callable:
+    # Peak traced memory while one message is handled, above what was
+    # already allocated when it arrived
+    def wrap(callback):
+        def traced(ch, method, properties, body):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            callback(ch, method, properties, body)
+            samples.append(tracemalloc.get_traced_memory()[1] - before)
+
+        return traced
+
+    return wrap
+
+
+def run(name: str, mode: str, args) -> dict:
+    consumer = CONSUMERS[name]
+    workers = args.workers if mode == "pooled" else 1
+    bridge = EventLoopBridge()
+    bridge.start()
+    service = _OrderService(args.service_latency_ms / 1000)
+
+    def subscribers():
+        return [
+            consumer["subscriber"](
+                service, pika.ConnectionParameters(), event_loop_bridge=bridge
+            )
+            for _ in range(workers)
+        ]
+
+    try:
+        broker = InMemoryBroker()
+        publish_backlog(broker, consumer, args.messages)
+        cpu_started = time.process_time()
+        started = time.perf_counter()
+        drain(broker, subscribers(), consumer["queue"])
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        handled = broker.acked
+
+        # Separate, smaller pass: tracing slows every allocation down
+        broker = InMemoryBroker()
+        publish_backlog(broker, consumer, args.allocation_sample)
+        samples: List[int] = []
+        tracemalloc.start()
+        try:
+            retained_before, _ = tracemalloc.get_traced_memory()
+            drain(
+                broker,
+                subscribers()[:1],
+                consumer["queue"],
+                track_allocations(samples),
+            )
+            retained = tracemalloc.get_traced_memory()[0] - retained_before
+        finally:
+            tracemalloc.stop()
+    finally:
+        bridge.stop()
+
+    return {
+        "consumer": name,
+        "mode": mode,
+        "workers": workers,
+        "messages": handled,
+        "elapsed_seconds": elapsed,
+        "messages_per_second": handled / elapsed if elapsed else 0,
+        "cpu_us_per_message": cpu / handled * 1e6 if handled else 0,
+        "peak_bytes_per_message": (
+            sum(samples) / len(samples) if samples else 0
+        ),
+        "retained_bytes_per_message": (
+            retained / len(samples) if samples else 0
+        ),
+    }
+
+
+def render_table(results: List[dict]) -> str:
+    header = (
+        f"{'consumer':<10} {'mode':<8} {'workers':>7} {'messages':>9} "
+        f"{'msg/s':>10} {'cpu us/msg':>11} {'peak B/msg':>11} "
+        f"{'kept B/msg':>11}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['consumer']:<10} {r['mode']:<8} {r['workers']:>7} "
+            f"{r['messages']:>9} {r['messages_per_second']:>10.0f} "
+            f"{r['cpu_us_per_message']:>11.1f} "
+            f"{r['peak_bytes_per_message']:>11.0f} "
+            f"{r['retained_bytes_per_message']:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.messaging_throughput",
+        description="Messages/s, CPU and allocations per consumer mode.",
+    )
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument(
+        "--consumers",
+        nargs="+",
+        choices=list(CONSUMERS),
+        default=list(CONSUMERS),
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=MODES, default=list(MODES)
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Consumers in pooled mode."
+    )
+    parser.add_argument(
+        "--service-latency-ms",
+        type=float,
+        default=0,
+        help="Simulated order service time per message.",
+    )
+    parser.add_argument("--allocation-sample", type=int, default=1000)
+    parser.add_argument("--json", action="store_true")
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    results = [
+        run(name, mode, args) for name in args.consumers for mode in args.modes
+    ]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(render_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,13 +4,37 @@ from contextlib import asynccontextmanager
 
 import pika
 from fastapi import FastAPI
-from src.adapters.api import customer_api, health_api, order_api
+from src.adapters.api import (
+    customer_api,
+    debug_api,
+    health_api,
+    kitchen_api,
+    metrics_api,
+    order_api,
+)
 from src.adapters.dependencies import (
-    get_inventory_publisher,
-    get_order_update_publisher,
+    get_event_hub,
+    get_health_monitor,
+    get_inventory_client,
+    get_kitchen_queue,
+    get_outbox_publisher,
+)
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
 )
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
 from src.application.services.order_service import OrderService
+from src.config import Config
 from src.infrastructure.messaging.delivery_subscriber import DeliverySubscriber
+from src.infrastructure.messaging.event_loop_bridge import EventLoopBridge
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.order_status_subscriber import (
+    OrderStatusSubscriber,
+)
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
 from src.infrastructure.messaging.payment_subscriber import PaymentSubscriber
 from src.infrastructure.persistence.db_setup import SessionLocal
 from src.infrastructure.persistence.sqlalchemy_customer_repository import (
@@ -19,6 +43,12 @@ from src.infrastructure.persistence.sqlalchemy_customer_repository import (
 from src.infrastructure.persistence.sqlalchemy_order_repository import (
     SQLAlchemyOrderRepository,
 )
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
+from src.infrastructure.realtime.kitchen_queue import KITCHEN_STATUSES
+from src.infrastructure.tracing.exporters import start_tracing
+from src.infrastructure.tracing.tracer import tracer
 
 # Set up logging
 logger = logging.getLogger("app")
@@ -33,30 +63,84 @@ console_handler.setFormatter(formatter)
 logger.addHandler(console_handler)
 
 
+def build_order_service(db, event_loop_bridge) -> OrderService:
+    outbox_publisher = get_outbox_publisher(db)
+    return OrderService(
+        SQLAlchemyOrderRepository(db),
+        SQLAlchemyCustomerRepository(db),
+        outbox_publisher,
+        outbox_publisher,
+        http_session=event_loop_bridge.http_session,
+        inventory_client=get_inventory_client(),
+    )
+
+
+def load_kitchen_rows():
+    db = SessionLocal()
+    try:
+        return SQLAlchemyOrderRepository(db).list_status_rows(KITCHEN_STATUSES)
+    finally:
+        db.close()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    db = SessionLocal()
-    order_repository = SQLAlchemyOrderRepository(db)
-    customer_repository = SQLAlchemyCustomerRepository(db)
-    inventory_publisher = get_inventory_publisher()
-    order_update_publisher = get_order_update_publisher()
-    order_service = OrderService(
-        order_repository,
-        customer_repository,
-        inventory_publisher,
-        order_update_publisher,
-    )
+    start_tracing(tracer)
+    health_monitor = get_health_monitor()
+    health_monitor.start()
+    event_loop_bridge = EventLoopBridge()
+    event_loop_bridge.start()
     connection_params = pika.ConnectionParameters(
         host="rabbitmq", heartbeat=120
     )
-    payment_subscriber = PaymentSubscriber(order_service, connection_params)
-    delivery_subscriber = DeliverySubscriber(order_service, connection_params)
+    # Each subscriber gets its own session, so the processed-message ledger
+    # row commits in the same transaction as the handler's writes
+    payment_db = SessionLocal()
+    payment_subscriber = PaymentSubscriber(
+        build_order_service(payment_db, event_loop_bridge),
+        connection_params,
+        event_loop_bridge=event_loop_bridge,
+        deduplicator=MessageDeduplicator(
+            SQLAlchemyProcessedMessageRepository(payment_db)
+        ),
+    )
+    delivery_db = SessionLocal()
+    delivery_subscriber = DeliverySubscriber(
+        build_order_service(delivery_db, event_loop_bridge),
+        connection_params,
+        event_loop_bridge=event_loop_bridge,
+        deduplicator=MessageDeduplicator(
+            SQLAlchemyProcessedMessageRepository(delivery_db)
+        ),
+    )
+    order_status_subscriber = OrderStatusSubscriber(
+        get_kitchen_queue(),
+        get_event_hub(),
+        connection_params,
+        load_snapshot=load_kitchen_rows,
+    )
+    outbox_relay = OutboxRelay(SessionLocal, connection_params)
+    outbox_relay.start()
     threading.Thread(target=payment_subscriber.start_consuming).start()
     threading.Thread(target=delivery_subscriber.start_consuming).start()
+    threading.Thread(target=order_status_subscriber.start_consuming).start()
     yield
+    outbox_relay.stop()
+    event_loop_bridge.stop()
+    payment_db.close()
+    delivery_db.close()
+    health_monitor.stop()
+    tracer.shutdown()
 
 
 app = FastAPI(lifespan=lifespan, root_path="/orders")
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(order_api.router)
 app.include_router(customer_api.router)
+app.include_router(kitchen_api.router)
 app.include_router(health_api.router)
+app.include_router(metrics_api.router)
+if Config.DEBUG_ENDPOINTS_ENABLED:
+    app.include_router(debug_api.router)
@@ -0,0 +1,34 @@
+"""feat: add order created_at
+
+Revision ID: 3d7b1f9a6e42
+Revises: 9a4f3b7e2c18
+Create Date: 2026-10-19 15:12:40.518273
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3d7b1f9a6e42"
+down_revision: Union[str, None] = "9a4f3b7e2c18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "orders",
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("orders", "created_at")
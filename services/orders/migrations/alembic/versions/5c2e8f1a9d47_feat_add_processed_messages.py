@@ -0,0 +1,41 @@
+"""feat: add processed messages ledger
+
+Revision ID: 5c2e8f1a9d47
+Revises: 6e1169805c33
+Create Date: 2026-10-19 10:12:41.532118
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2e8f1a9d47"
+down_revision: Union[str, None] = "6e1169805c33"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "processed_messages",
+        sa.Column("message_id", sa.String(length=64), nullable=False),
+        sa.Column("processed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("message_id"),
+    )
+    op.create_index(
+        op.f("ix_processed_messages_processed_at"),
+        "processed_messages",
+        ["processed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f("ix_processed_messages_processed_at"),
+        table_name="processed_messages",
+    )
+    op.drop_table("processed_messages")
@@ -0,0 +1,29 @@
+"""feat: add outbox traceparent
+
+Revision ID: 7f3a9c2e5b10
+Revises: 3d7b1f9a6e42
+Create Date: 2026-10-19 17:05:12.204417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3a9c2e5b10"
+down_revision: Union[str, None] = "3d7b1f9a6e42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "outbox",
+        sa.Column("traceparent", sa.String(length=55), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("outbox", "traceparent")
@@ -0,0 +1,38 @@
+"""feat: add transactional outbox
+
+Revision ID: 9a4f3b7e2c18
+Revises: 5c2e8f1a9d47
+Create Date: 2026-10-19 11:04:17.218403
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4f3b7e2c18"
+down_revision: Union[str, None] = "5c2e8f1a9d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("message_id", sa.String(length=64), nullable=False),
+        sa.Column("exchange", sa.String(), nullable=False),
+        sa.Column("routing_key", sa.String(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("message_id"),
+    )
+    op.create_index(op.f("ix_outbox_id"), "outbox", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_outbox_id"), table_name="outbox")
+    op.drop_table("outbox")
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, HTTPException, Response
+from src.infrastructure.persistence.slow_query_log import (
+    SORT_KEYS,
+    slow_query_log,
+)
+
+router = APIRouter()
+
+
+@router.get("/debug/queries", tags=["Debug"], include_in_schema=False)
+def read_query_stats(sort: str = "total_ms", limit: int = 50):
+    if sort not in SORT_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"sort must be one of: {', '.join(SORT_KEYS)}",
+        )
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "sample_ratio": slow_query_log.sample_ratio,
+        "queries": slow_query_log.snapshot(sort, limit),
+    }
+
+
+@router.delete("/debug/queries", tags=["Debug"], include_in_schema=False)
+def reset_query_stats():
+    slow_query_log.reset()
+    return Response(status_code=204)
@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from src.adapters.dependencies import get_kitchen_queue
+from src.config import Config
+from src.infrastructure.realtime.kitchen_queue import KitchenQueue
+from src.infrastructure.realtime.sse import (
+    SSE_HEADERS,
+    event_stream,
+    format_event,
+)
+
+router = APIRouter()
+
+
+@router.get("/kitchen/queue", tags=["Kitchen"])
+def read_kitchen_queue(
+    kitchen_queue: KitchenQueue = Depends(get_kitchen_queue),
+):
+    return ORJSONResponse({"tickets": kitchen_queue.snapshot()})
+
+
+@router.get("/kitchen/queue/events", tags=["Kitchen"])
+async def stream_kitchen_queue(
+    kitchen_queue: KitchenQueue = Depends(get_kitchen_queue),
+):
+    # One snapshot event, then upsert/remove deltas as statuses change
+    tickets, subscription = kitchen_queue.subscribe()
+    return StreamingResponse(
+        event_stream(
+            subscription,
+            [format_event("snapshot", {"tickets": tickets})],
+            keepalive=Config.SSE_KEEPALIVE_INTERVAL,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
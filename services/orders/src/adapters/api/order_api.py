@@ -1,21 +1,33 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from src.adapters.dependencies import get_order_service
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from src.adapters.dependencies import get_event_hub, get_order_service
 from src.application.dto.order_dto import (
     EstimatedTimeUpdate,
     OrderCreate,
     OrderResponse,
     OrdersPaginatedResponse,
     OrderStatusUpdate,
-    PaginationMeta,
 )
-from src.application.dto.serializers import serialize_order
+from src.application.dto.serializers import order_to_dict, serialize_order
 from src.application.services.order_service import OrderService
+from src.config import Config
 from src.domain.entities.customer_entity import CustomerEntity
 from src.domain.entities.order_entity import OrderStatus
 from src.domain.entities.order_item_entity import OrderItemEntity
 from src.domain.exceptions import EntityNotFound, InvalidEntity
+from src.infrastructure.realtime.event_hub import EventHub
+from src.infrastructure.realtime.order_events import (
+    is_final,
+    order_topic,
+    status_event,
+)
+from src.infrastructure.realtime.sse import (
+    SSE_HEADERS,
+    event_stream,
+    format_event,
+)
 
 router = APIRouter()
 
@@ -49,21 +61,24 @@ async def read_orders(
         await service.list_orders_paginated(current_page, records_per_page)
     )
 
-    response = OrdersPaginatedResponse(
-        orders=[
-            serialize_order(order, await service.calculate_order_total(order))
-            for order in orders
-        ],
-        pagination=PaginationMeta(
-            current_page=current_page,
-            records_per_page=records_per_page,
-            number_of_pages=number_of_pages,
-            total_records=total_records,
-        ),
+    # Entities are trusted, so the page skips response_model validation
+    return ORJSONResponse(
+        {
+            "orders": [
+                order_to_dict(
+                    order, await service.calculate_order_total(order)
+                )
+                for order in orders
+            ],
+            "pagination": {
+                "current_page": current_page,
+                "records_per_page": records_per_page,
+                "number_of_pages": number_of_pages,
+                "total_records": total_records,
+            },
+        }
     )
 
-    return response
-
 
 @router.get(
     "/orders/{order_id}", tags=["Orders"], response_model=OrderResponse
@@ -79,6 +94,36 @@ async def read_order(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/orders/{order_id}/events", tags=["Orders"])
+async def stream_order_events(
+    order_id: int,
+    service: OrderService = Depends(get_order_service),
+    event_hub: EventHub = Depends(get_event_hub),
+):
+    # Subscribed before reading the status, so no change is missed. The
+    # database session is released before the stream starts.
+    subscription = event_hub.subscribe(order_topic(order_id))
+    try:
+        status = service.get_order_status(order_id)
+    except EntityNotFound as e:
+        subscription.close()
+        raise HTTPException(status_code=404, detail=str(e))
+
+    current = status_event(order_id, status.value)
+    if is_final(current):
+        subscription.close()
+    return StreamingResponse(
+        event_stream(
+            subscription,
+            [format_event(current["type"], current)],
+            keepalive=Config.SSE_KEEPALIVE_INTERVAL,
+            is_last=is_final,
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get(
     "/orders/by-order-number/{order_number}",
     tags=["Orders"],
@@ -1,19 +1,21 @@
-import pika
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 from src.application.services.order_service import OrderService
+from src.infrastructure.clients.inventory_client import InventoryClient
+from src.infrastructure.health.health_monitor import HealthMonitor
 from src.infrastructure.health.health_service import HealthService
-from src.infrastructure.messaging.inventory_publisher import InventoryPublisher
-from src.infrastructure.messaging.order_update_publisher import (
-    OrderUpdatePublisher,
-)
-from src.infrastructure.persistence.db_setup import get_db
+from src.infrastructure.messaging.outbox_publisher import OutboxPublisher
+from src.infrastructure.persistence.db_setup import SessionLocal, get_db
 from src.infrastructure.persistence.sqlalchemy_customer_repository import (
     SQLAlchemyCustomerRepository,
 )
 from src.infrastructure.persistence.sqlalchemy_order_repository import (
     SQLAlchemyOrderRepository,
 )
+from src.infrastructure.realtime.event_hub import EventHub
+from src.infrastructure.realtime.kitchen_queue import KitchenQueue
 
 
 def get_health_service(
@@ -22,36 +24,47 @@ def get_health_service(
     return HealthService(db, rabbitmq_host="rabbitmq")
 
 
-def get_inventory_publisher() -> (
-    InventoryPublisher
-):  # TODO this should be an interface
-    connection_params = pika.ConnectionParameters(
-        host="rabbitmq", heartbeat=120
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    health_service = get_health_service(SessionLocal())
+    return HealthMonitor(
+        {
+            "database": health_service.check_database,
+            "rabbitmq": health_service.check_rabbitmq,
+        }
     )
-    return InventoryPublisher(connection_params)
 
 
-def get_order_update_publisher() -> (
-    OrderUpdatePublisher
-):  # TODO this should be an interface
-    connection_params = pika.ConnectionParameters(
-        host="rabbitmq", heartbeat=120
-    )
-    return OrderUpdatePublisher(connection_params)
+@lru_cache
+def get_inventory_client() -> InventoryClient:
+    return InventoryClient()
+
+
+@lru_cache
+def get_event_hub() -> EventHub:
+    return EventHub()
+
+
+@lru_cache
+def get_kitchen_queue() -> KitchenQueue:
+    return KitchenQueue(get_event_hub())
+
+
+def get_outbox_publisher(db: Session = Depends(get_db)) -> OutboxPublisher:
+    return OutboxPublisher(db)
 
 
 def get_order_service(
     db: Session = Depends(get_db),
-    inventory_publisher: InventoryPublisher = Depends(get_inventory_publisher),
-    order_update_publisher: OrderUpdatePublisher = Depends(
-        get_order_update_publisher
-    ),
+    outbox_publisher: OutboxPublisher = Depends(get_outbox_publisher),
+    inventory_client: InventoryClient = Depends(get_inventory_client),
 ) -> OrderService:
     order_repository = SQLAlchemyOrderRepository(db)
     customer_repository = SQLAlchemyCustomerRepository(db)
     return OrderService(
         order_repository,
         customer_repository,
-        inventory_publisher,
-        order_update_publisher,
+        outbox_publisher,
+        outbox_publisher,
+        inventory_client=inventory_client,
     )
@@ -0,0 +1,184 @@
+import zlib
+from functools import partial
+from typing import List, Optional
+
+from src.config import Config
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+class _GzipCompressor:
+    encoding = "gzip"
+
+    def __init__(self, level: int):
+        # wbits=31 writes a gzip header and trailer around the deflate data
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self, quality: int):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def _accepted_encodings(accept_encoding: str) -> List[str]:
+    encodings = []
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = params.strip().replace(" ", "")
+        if name and quality not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            encodings.append(name.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    # Compresses eligible responses with brotli (when installed and enabled)
+    # or gzip. Bodies below minimum_size and content types outside the
+    # allowlist are passed through untouched, and the compressor is only
+    # created once a response qualifies, so small hot responses such as
+    # health probes cost no compression CPU or memory.
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        compress_level: Optional[int] = None,
+        content_types: Optional[List[str]] = None,
+        brotli_enabled: Optional[bool] = None,
+        brotli_quality: Optional[int] = None,
+    ):
+        self.app = app
+        self.minimum_size = (
+            minimum_size
+            if minimum_size is not None
+            else Config.COMPRESSION_MINIMUM_SIZE
+        )
+        self.compress_level = compress_level or Config.COMPRESSION_LEVEL
+        self.content_types = content_types or Config.COMPRESSION_CONTENT_TYPES
+        self.brotli_enabled = brotli is not None and (
+            brotli_enabled
+            if brotli_enabled is not None
+            else Config.COMPRESSION_BROTLI_ENABLED
+        )
+        self.brotli_quality = (
+            brotli_quality or Config.COMPRESSION_BROTLI_QUALITY
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encodings = _accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if self.brotli_enabled and "br" in encodings:
+            make_compressor = partial(_BrotliCompressor, self.brotli_quality)
+        elif "gzip" in encodings:
+            make_compressor = partial(_GzipCompressor, self.compress_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, make_compressor, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        media_type = content_type.split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+
+class _CompressionResponder:
+    def __init__(
+        self, middleware: CompressionMiddleware, make_compressor, send
+    ):
+        self.middleware = middleware
+        self.make_compressor = make_compressor
+        self.compressor = None
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.compressing = False
+        self.passthrough = False
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            if not self.middleware.is_compressible(
+                Headers(raw=message["headers"])
+            ):
+                self.passthrough = True
+                await self._send(message)
+                return
+            # Held back until the first body chunk shows the response size
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+        if self.compressing:
+            await self._send_compressed(message)
+            return
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        self.compressor = self.make_compressor()
+        self.compressing = True
+        headers["Content-Encoding"] = self.compressor.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            body = self.compressor.compress(body) + self.compressor.finish()
+            headers["Content-Length"] = str(len(body))
+            message = {**message, "body": body}
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+        await self._send(self.start_message)
+        await self._send_compressed(message)
+
+    async def _send_compressed(self, message: Message):
+        more_body = message.get("more_body", False)
+        body = self.compressor.compress(message.get("body", b""))
+        if more_body:
+            # Flushed per chunk so streamed responses are not held back
+            body += self.compressor.flush()
+        else:
+            body += self.compressor.finish()
+        await self._send(
+            {
+                "type": "http.response.body",
+                "body": body,
+                "more_body": more_body,
+            }
+        )
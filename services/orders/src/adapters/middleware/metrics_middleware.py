@@ -0,0 +1,93 @@
+import time
+from typing import Sequence
+
+from src.infrastructure.metrics.metrics_registry import (
+    MetricsRegistry,
+    registry,
+)
+from src.infrastructure.metrics.request_metrics import track_request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+EXCLUDED_PATHS = ("/health", "/metrics")
+UNMATCHED_ROUTE = "<unmatched>"
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class MetricsMiddleware:
+    # Records latency, status and in-flight requests per route, plus how
+    # many queries and outbound calls each request made. Routes are
+    # labelled by their template so ids don't blow up cardinality.
+    def __init__(
+        self,
+        app: ASGIApp,
+        metrics: MetricsRegistry = registry,
+        excluded_paths: Sequence[str] = EXCLUDED_PATHS,
+    ):
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+        self.requests = metrics.counter(
+            "http_requests_total",
+            "HTTP requests by route and status code.",
+            ["method", "route", "status"],
+        )
+        self.duration = metrics.histogram(
+            "http_request_duration_seconds",
+            "Time to produce the response.",
+            ["method", "route"],
+        )
+        self.in_flight = metrics.gauge(
+            "http_requests_in_flight",
+            "Requests currently being handled.",
+        )
+        self.db_queries = metrics.histogram(
+            "http_request_db_queries",
+            "Database queries issued per request.",
+            ["method", "route"],
+            buckets=COUNT_BUCKETS,
+        )
+        self.db_duration = metrics.histogram(
+            "http_request_db_duration_seconds",
+            "Time spent in database queries per request.",
+            ["method", "route"],
+        )
+        self.outbound_calls = metrics.histogram(
+            "http_request_outbound_calls",
+            "Outbound HTTP calls made per request.",
+            ["method", "route"],
+            buckets=COUNT_BUCKETS,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(
+            self.excluded_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc()
+        start = time.perf_counter()
+        with track_request() as stats:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.in_flight.dec()
+                # The router records the matched route in the scope
+                route = getattr(scope.get("route"), "path", None)
+                labels = {
+                    "method": scope["method"],
+                    "route": route or UNMATCHED_ROUTE,
+                }
+                self.requests.inc(status=str(status), **labels)
+                self.duration.observe(elapsed, **labels)
+                self.db_queries.observe(stats.queries, **labels)
+                self.db_duration.observe(stats.query_seconds, **labels)
+                self.outbound_calls.observe(stats.outbound_calls, **labels)
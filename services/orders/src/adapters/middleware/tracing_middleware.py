@@ -0,0 +1,51 @@
+from typing import Sequence
+
+from src.infrastructure.tracing.tracer import SpanKind, StatusCode, tracer
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+EXCLUDED_PATHS = ("/health", "/metrics")
+
+
+class TracingMiddleware:
+    # Opens a SERVER span per request, continuing the caller's trace from
+    # its traceparent header. Probe and scrape endpoints are skipped.
+    def __init__(
+        self, app: ASGIApp, excluded_paths: Sequence[str] = EXCLUDED_PATHS
+    ):
+        self.app = app
+        self.excluded_paths = tuple(excluded_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(
+            self.excluded_paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        parent = tracer.extract(Headers(scope=scope))
+        attributes = {
+            "http.request.method": method,
+            "url.path": scope["path"],
+        }
+        with tracer.span(
+            f"{method} {scope['path']}", SpanKind.SERVER, attributes, parent
+        ) as span:
+
+            async def send_wrapper(message: Message):
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    span.set_attribute("http.response.status_code", status)
+                    if status >= 500:
+                        span.set_status(StatusCode.ERROR)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                # The router records the matched route in the scope
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.name = f"{method} {route}"
+                    span.set_attribute("http.route", route)
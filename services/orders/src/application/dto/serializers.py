@@ -35,3 +35,39 @@ def serialize_customer(customer: CustomerEntity) -> CustomerResponse:
         email=customer.email,
         phone_number=customer.phone_number,
     )
+
+
+# Plain-dict counterparts of the serializers above for trusted entities.
+# They skip model validation and are rendered with ORJSONResponse on the
+# high-volume list endpoints; the output matches model_dump(mode="json").
+def order_to_dict(order: OrderEntity, total_amount: float) -> dict:
+    return {
+        "id": order.id,
+        "order_number": order.order_number,
+        "customer": customer_to_dict(order.customer),
+        "order_items": [
+            order_item_to_dict(item) for item in order.order_items
+        ],
+        "status": order.status.value,
+        "total_amount": float(total_amount),
+        "estimated_time": order.estimated_time,
+    }
+
+
+def order_item_to_dict(order_item: OrderItemEntity) -> dict:
+    return {
+        "product_sku": order_item.product_sku,
+        "quantity": order_item.quantity,
+        "name": order_item.name,
+        "description": order_item.description,
+        "price": float(order_item.price),
+    }
+
+
+def customer_to_dict(customer: CustomerEntity) -> dict:
+    return {
+        "id": customer.id,
+        "name": customer.name,
+        "email": customer.email,
+        "phone_number": customer.phone_number,
+    }
@@ -1,9 +1,9 @@
 import logging
-from typing import List, Optional, Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple
 
 import aiohttp
 from fastapi import HTTPException  # TODO remove this from service
-from src.config import Config
 from src.domain.entities.customer_entity import CustomerEntity
 from src.domain.entities.order_entity import OrderEntity, OrderStatus
 from src.domain.entities.order_item_entity import OrderItemEntity
@@ -14,10 +14,15 @@ from src.domain.exceptions import (
 )
 from src.domain.repositories.customer_repository import CustomerRepository
 from src.domain.repositories.order_repository import OrderRepository
+from src.infrastructure.clients.inventory_client import InventoryClient
 from src.infrastructure.messaging.inventory_publisher import InventoryPublisher
 from src.infrastructure.messaging.order_update_publisher import (
     OrderUpdatePublisher,
 )
+from src.infrastructure.metrics.request_metrics import (
+    outbound_call_trace_config,
+)
+from src.infrastructure.tracing.http_client import client_trace_config
 
 logger = logging.getLogger("app")
 
@@ -30,50 +35,60 @@ class OrderService:
         customer_repository: CustomerRepository,
         inventory_publisher: InventoryPublisher,  # TODO this should be a port
         order_update_publisher: OrderUpdatePublisher,  # TODO this should be a port
+        http_session: Optional[aiohttp.ClientSession] = None,
+        inventory_client: Optional[InventoryClient] = None,
     ):
         self.order_repository = order_repository
         self.customer_repository = customer_repository
         self.inventory_publisher = inventory_publisher
         self.order_update_publisher = order_update_publisher
+        self.http_session = http_session
+        self.inventory_client = inventory_client or InventoryClient()
+
+    @asynccontextmanager
+    async def _http_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self.http_session is not None:
+            yield self.http_session
+            return
+        async with aiohttp.ClientSession(
+            trace_configs=[client_trace_config(), outbound_call_trace_config()]
+        ) as session:
+            yield session
 
     async def _fetch_product_details(
         self, order_items: List[OrderItemEntity]
     ) -> List[OrderItemEntity]:
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             for item in order_items:
-                url = f"{Config.INVENTORY_SERVICE_BASE_URL}/products/{item.product_sku}"
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Product SKU {item.product_sku} not found in inventory.",
-                        )
-                    product = await response.json()
-                    item.name = product.get("name")
-                    item.description = product.get("description")
-                    item.price = product.get("price")
+                product = await self.inventory_client.get_product(
+                    session, item.product_sku
+                )
+                if product is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Product SKU {item.product_sku} not found in inventory.",
+                    )
+                item.name = product.get("name")
+                item.description = product.get("description")
+                item.price = product.get("price")
         return order_items
 
     async def validate_inventory(
         self, order_items: List[OrderItemEntity]
     ) -> bool:
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             for item in order_items:
-                url = f"{Config.INVENTORY_SERVICE_BASE_URL}/products/{item.product_sku}"
-                logger.info(f"Validating invetory: {url}")
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        logger.error(
-                            f"Product SKU {item.product_sku} not found in inventory. "
-                            f"Response: {response.status}, {await response.json()}"
-                        )
-                        return False
-                    product = await response.json()
-                    if product["quantity"] < item.quantity:
-                        logger.error(
-                            f"Insufficient quantity for SKU {item.product_sku}."
-                        )
-                        return False
+                logger.info(f"Validating inventory: {item.product_sku}")
+                product = await self.inventory_client.get_product(
+                    session, item.product_sku
+                )
+                if product is None:
+                    return False
+                if product["quantity"] < item.quantity:
+                    logger.error(
+                        f"Insufficient quantity for SKU {item.product_sku}."
+                    )
+                    return False
         return True
 
     async def create_order(
@@ -104,22 +119,16 @@ class OrderService:
             order_items=order_items,
         )
 
-        try:
-            for item in order_items:
-                self.inventory_publisher.publish_inventory_update(
-                    item.product_sku, "subtract", item.quantity
-                )
-
-            self.order_repository.save(order)
-            order.total_amount = await self.calculate_order_total(order)
-            return order
+        # Events are staged in the outbox and committed with the order, so
+        # a failed save discards them and no compensation is needed.
+        for item in order_items:
+            self.inventory_publisher.publish_inventory_update(
+                item.product_sku, "subtract", item.quantity
+            )
 
-        except Exception as e:
-            for item in order_items:
-                self.inventory_publisher.publish_inventory_update(
-                    item.product_sku, "add", item.quantity
-                )
-            raise e
+        self.order_repository.save(order)
+        order.total_amount = await self.calculate_order_total(order)
+        return order
 
     async def get_order_by_id(self, order_id: int) -> OrderEntity:
         order = self.order_repository.find_by_id(order_id)
@@ -130,6 +139,13 @@ class OrderService:
         )
         return order
 
+    def get_order_status(self, order_id: int) -> OrderStatus:
+        # Status only: no items, so no inventory lookups
+        status = self.order_repository.find_status(order_id)
+        if status is None:
+            raise EntityNotFound(f"Order with ID '{order_id}' not found")
+        return status
+
     async def get_order_by_order_number(
         self, order_number: str
     ) -> OrderEntity:
@@ -172,50 +188,36 @@ class OrderService:
                 ),
             )
 
-        inventory_changes = []
-
-        try:
-            current_order_items = {
-                item.product_sku: item.quantity for item in order.order_items
-            }
-
-            for item in order_items:
-                if item.product_sku in current_order_items:
-                    old_quantity = current_order_items[item.product_sku]
-                    if item.quantity > old_quantity:
-                        diff = item.quantity - old_quantity
-                        self.inventory_publisher.publish_inventory_update(
-                            item.product_sku, "subtract", diff
-                        )
-                        inventory_changes.append((item.product_sku, diff))
-                    elif item.quantity < old_quantity:
-                        diff = old_quantity - item.quantity
-                        self.inventory_publisher.publish_inventory_update(
-                            item.product_sku, "add", diff
-                        )
-                        inventory_changes.append((item.product_sku, -diff))
-                else:
+        order_items = await self._fetch_product_details(order_items)
+        current_order_items = {
+            item.product_sku: item.quantity for item in order.order_items
+        }
+
+        for item in order_items:
+            if item.product_sku in current_order_items:
+                old_quantity = current_order_items[item.product_sku]
+                if item.quantity > old_quantity:
+                    diff = item.quantity - old_quantity
                     self.inventory_publisher.publish_inventory_update(
-                        item.product_sku,
-                        "subtract",
-                        item.quantity,
+                        item.product_sku, "subtract", diff
                     )
-                    inventory_changes.append((item.product_sku, item.quantity))
-
-            order_items = await self._fetch_product_details(order_items)
-            order.customer = existing_customer
-            order.order_items = order_items
-            self.order_repository.save(order)
-            order.total_amount = await self.calculate_order_total(order)
-            return order
-
-        except Exception as e:
-            for sku, quantity in inventory_changes:
-                action = "add" if quantity > 0 else "subtract"
+                elif item.quantity < old_quantity:
+                    diff = old_quantity - item.quantity
+                    self.inventory_publisher.publish_inventory_update(
+                        item.product_sku, "add", diff
+                    )
+            else:
                 self.inventory_publisher.publish_inventory_update(
-                    sku, action, abs(quantity)
+                    item.product_sku,
+                    "subtract",
+                    item.quantity,
                 )
-            raise e
+
+        order.customer = existing_customer
+        order.order_items = order_items
+        self.order_repository.save(order)
+        order.total_amount = await self.calculate_order_total(order)
+        return order
 
     async def update_order_status(
         self, order_id: int, status: OrderStatus
@@ -225,14 +227,14 @@ class OrderService:
             raise EntityNotFound(f"Order with ID '{order_id}' not found")
 
         order.update_status(status)
-        self.order_repository.save(order)
         order.total_amount = await self.calculate_order_total(order)
-
         self.order_update_publisher.publish_order_update(
             order_id=order.id,
             amount=order.total_amount,
             status=order.status.value,
+            created_at=order.created_at,
         )
+        self.order_repository.save(order)
         order.order_items = await self._fetch_product_details(
             order.order_items
         )
@@ -249,19 +251,17 @@ class OrderService:
             raise InvalidEntity("Only pending orders can be confirmed")
 
         order.update_status(OrderStatus.CONFIRMED)
+        order.total_amount = await self.calculate_order_total(order)
+        self.order_update_publisher.publish_order_update(
+            order_id=order.id,
+            amount=order.total_amount,
+            status=order.status.value,
+            created_at=order.created_at,
+        )
         self.order_repository.save(order)
-        try:
-            order.total_amount = await self.calculate_order_total(order)
-            self.order_update_publisher.publish_order_update(
-                order_id=order.id,
-                amount=order.total_amount,
-                status=order.status.value,
-            )
-            order.order_items = await self._fetch_product_details(
-                order.order_items
-            )
-        except Exception as e:
-            raise e
+        order.order_items = await self._fetch_product_details(
+            order.order_items
+        )
         return order
 
     async def cancel_order(self, order_id: int) -> OrderEntity:
@@ -277,16 +277,16 @@ class OrderService:
             )
 
         order.update_status(OrderStatus.CANCELED)
+        self.order_update_publisher.publish_order_update(
+            order_id=order.id,
+            amount=0.0,
+            status=order.status.value,
+            created_at=order.created_at,
+        )
         self.order_repository.save(order)
-        try:
-            self.order_update_publisher.publish_order_update(
-                order_id=order.id, amount=0.0, status=order.status.value
-            )
-            order.order_items = await self._fetch_product_details(
-                order.order_items
-            )
-        except Exception as e:
-            raise e
+        order.order_items = await self._fetch_product_details(
+            order.order_items
+        )
         return order
 
     async def delete_order(self, order_id: int) -> OrderEntity:
@@ -294,6 +294,13 @@ class OrderService:
         if not order:
             raise EntityNotFound(f"Order with ID '{order_id}' not found")
 
+        # Lets read models of order status (delivery) forget the order
+        self.order_update_publisher.publish_order_update(
+            order_id=order.id,
+            amount=0.0,
+            status="deleted",
+            created_at=order.created_at,
+        )
         self.order_repository.delete(order)
         order.order_items = await self._fetch_product_details(
             order.order_items
@@ -334,18 +341,17 @@ class OrderService:
 
     async def calculate_order_total(self, order: OrderEntity) -> float:
         total_amount = 0.0
-        async with aiohttp.ClientSession() as session:
+        async with self._http_session() as session:
             for item in order.order_items:
-                async with session.get(
-                    f"{Config.INVENTORY_SERVICE_BASE_URL}/products/{item.product_sku}"
-                ) as response:
-                    if response.status != 200:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Product {item.product_sku} not found",
-                        )
-                    product = await response.json()
-                    total_amount += product["price"] * item.quantity
+                product = await self.inventory_client.get_product(
+                    session, item.product_sku
+                )
+                if product is None:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Product {item.product_sku} not found",
+                    )
+                total_amount += product["price"] * item.quantity
         return total_amount
 
     async def set_estimated_time(
@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime
 from enum import Enum
 from typing import List, Optional
 
@@ -20,6 +21,16 @@ class OrderStatus(Enum):
 
 
 class OrderEntity:
+    __slots__ = (
+        "_customer",
+        "_order_items",
+        "_status",
+        "_estimated_time",
+        "_id",
+        "_order_number",
+        "_total_amount",
+        "_created_at",
+    )
 
     def __init__(
         self,
@@ -30,6 +41,7 @@ class OrderEntity:
         id: Optional[int] = None,
         order_number: Optional[str] = None,
         total_amount: Optional[float] = None,
+        created_at: Optional[datetime] = None,
     ):
         self._id = id
         self._order_number = order_number or str(uuid.uuid4())
@@ -38,6 +50,7 @@ class OrderEntity:
         self._status = status
         self._total_amount = total_amount or 0.0
         self._estimated_time = estimated_time
+        self._created_at = created_at
 
         self._validate_id(self._id)
         self._validate_order_number(self._order_number)
@@ -46,6 +59,31 @@ class OrderEntity:
         self._validate_total_amount(self._total_amount)
         self._validate_estimated_time(self._estimated_time)
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        customer: CustomerEntity,
+        order_items: List[OrderItemEntity],
+        status: OrderStatus = OrderStatus.PENDING,
+        estimated_time: Optional[str] = None,
+        id: Optional[int] = None,
+        order_number: Optional[str] = None,
+        total_amount: Optional[float] = None,
+        created_at: Optional[datetime] = None,
+    ) -> "OrderEntity":
+        # Rows read back by the repositories were validated when they
+        # were written, so hydration skips the checks in __init__
+        entity = cls.__new__(cls)
+        entity._customer = customer
+        entity._order_items = order_items
+        entity._status = status
+        entity._estimated_time = estimated_time
+        entity._id = id
+        entity._order_number = order_number or str(uuid.uuid4())
+        entity._total_amount = total_amount or 0.0
+        entity._created_at = created_at
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
@@ -55,6 +93,11 @@ class OrderEntity:
         self._validate_id(value)
         self._id = value
 
+    @property
+    def created_at(self) -> Optional[datetime]:
+        # Set from the row; None until the order has been saved
+        return self._created_at
+
     @property
     def order_number(self) -> str:
         return self._order_number
@@ -4,6 +4,14 @@ from src.domain.exceptions import InvalidEntity
 
 
 class OrderItemEntity:
+    __slots__ = (
+        "_product_sku",
+        "_quantity",
+        "_name",
+        "_description",
+        "_price",
+        "_id",
+    )
 
     def __init__(
         self,
@@ -26,6 +34,25 @@ class OrderItemEntity:
         self._validate_product_sku(self._product_sku)
         self._validate_quantity(self._quantity)
 
+    @classmethod
+    def from_trusted_row(
+        cls,
+        product_sku: str,
+        quantity: int,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        price: Optional[float] = None,
+        id: Optional[int] = None,
+    ) -> "OrderItemEntity":
+        entity = cls.__new__(cls)
+        entity._product_sku = product_sku
+        entity._quantity = quantity
+        entity._name = name
+        entity._description = description
+        entity._price = price
+        entity._id = id
+        return entity
+
     @property
     def id(self) -> Optional[int]:
         return self._id
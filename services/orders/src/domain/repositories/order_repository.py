@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Mapping, Optional
 
-from src.domain.entities.order_entity import OrderEntity
+from src.domain.entities.order_entity import OrderEntity, OrderStatus
 
 
 class OrderRepository(ABC):
@@ -17,6 +17,10 @@ class OrderRepository(ABC):
     def find_by_order_number(self, order_number: str) -> Optional[OrderEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def find_status(self, order_id: int) -> Optional[OrderStatus]:
+        raise NotImplementedError
+
     @abstractmethod
     def delete(self, order: OrderEntity):
         raise NotImplementedError
@@ -24,3 +28,7 @@ class OrderRepository(ABC):
     @abstractmethod
     def list_all(self) -> List[OrderEntity]:
         raise NotImplementedError
+
+    @abstractmethod
+    def list_status_rows(self, statuses: List[OrderStatus]) -> List[Mapping]:
+        raise NotImplementedError
@@ -0,0 +1,80 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import aiohttp
+from src.config import Config
+from src.infrastructure.concurrency.single_flight import AsyncSingleFlight
+from src.infrastructure.metrics.metrics_registry import registry
+
+logger = logging.getLogger("app")
+
+CachedProduct = Tuple[str, dict]
+
+
+class InventoryClient:
+    # Keeps the last representation of each product with its ETag and
+    # revalidates it with If-None-Match, so unchanged products come back
+    # as an empty 304.
+    def __init__(self, cache_size: Optional[int] = None):
+        self.cache_size = cache_size or Config.INVENTORY_CLIENT_CACHE_SIZE
+        self.single_flight = AsyncSingleFlight("inventory_product")
+        self._cache: "OrderedDict[str, CachedProduct]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.requests = registry.counter(
+            "inventory_client_requests_total",
+            "Product reads against the inventory service by outcome.",
+            ["outcome"],
+        )
+
+    def _get_cached(self, sku: str) -> Optional[CachedProduct]:
+        with self._lock:
+            cached = self._cache.get(sku)
+            if cached is not None:
+                self._cache.move_to_end(sku)
+            return cached
+
+    def _store(self, sku: str, etag: Optional[str], product: dict):
+        with self._lock:
+            if etag is None:
+                self._cache.pop(sku, None)
+                return
+            self._cache[sku] = (etag, product)
+            self._cache.move_to_end(sku)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def invalidate(self, sku: str):
+        with self._lock:
+            self._cache.pop(sku, None)
+
+    async def get_product(
+        self, session: aiohttp.ClientSession, sku: str
+    ) -> Optional[dict]:
+        return await self.single_flight.do(
+            sku, lambda: self._fetch_product(session, sku)
+        )
+
+    async def _fetch_product(
+        self, session: aiohttp.ClientSession, sku: str
+    ) -> Optional[dict]:
+        url = f"{Config.INVENTORY_SERVICE_BASE_URL}/products/{sku}"
+        cached = self._get_cached(sku)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                self.requests.inc(outcome="not_modified")
+                return cached[1]
+            if response.status != 200:
+                self.requests.inc(outcome="error")
+                logger.error(
+                    f"Product SKU {sku} not found in inventory. "
+                    f"Response: {response.status}"
+                )
+                self.invalidate(sku)
+                return None
+            product = await response.json()
+            self.requests.inc(outcome="fetched")
+            self._store(sku, response.headers.get("ETag"), product)
+            return product
@@ -0,0 +1,42 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from src.infrastructure.metrics.metrics_registry import registry
+
+T = TypeVar("T")
+
+
+class AsyncSingleFlight:
+    # Concurrent calls for the same key await the first caller's fetch and
+    # all receive its result (or exception) instead of repeating it. Calls
+    # are only shared within one event loop, as the API and the subscribers
+    # run on different loops.
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[
+            Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task
+        ] = {}
+        self._lock = threading.Lock()
+        self.calls = registry.counter(
+            "single_flight_calls_total",
+            "Single-flight calls by whether they ran or shared the fetch.",
+            ["name", "result"],
+        )
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        loop = asyncio.get_running_loop()
+        call_key = (loop, key)
+        with self._lock:
+            task = self._calls.get(call_key)
+            leader = task is None
+            if leader:
+                task = self._calls[call_key] = loop.create_task(fn())
+                task.add_done_callback(lambda _: self._forget(call_key))
+        self.calls.inc(name=self.name, result="leader" if leader else "shared")
+        # Shielded so a cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    def _forget(self, call_key):
+        with self._lock:
+            self._calls.pop(call_key, None)
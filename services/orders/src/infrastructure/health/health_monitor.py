@@ -0,0 +1,95 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, Optional
+
+from src.config import Config
+
+logger = logging.getLogger("app")
+
+HEALTHY = "healthy"
+UNHEALTHY = "unhealthy"
+UNKNOWN = "unknown"
+
+
+class HealthMonitor:
+    # Probes read the last snapshot; only this monitor talks to the
+    # dependencies, on a fixed interval and with a per-check timeout.
+    def __init__(
+        self,
+        checks: Dict[str, Callable[[], bool]],
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.checks = checks
+        self.interval = interval or Config.HEALTH_CHECK_INTERVAL
+        self.timeout = timeout or Config.HEALTH_CHECK_TIMEOUT
+        self.checked_at: Optional[float] = None
+        self._snapshot: Dict[str, str] = {name: UNKNOWN for name in checks}
+        # One worker per check keeps a hung dependency from blocking the
+        # others, and keeps each check's connection on a single thread.
+        self._executors = {
+            name: ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"health-{name}"
+            )
+            for name in checks
+        }
+        self._pending: Dict[str, Future] = {}
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self.run, name="health-monitor", daemon=True
+        )
+
+    def get_health_status(self) -> Dict[str, str]:
+        return dict(self._snapshot)
+
+    def is_ready(self) -> bool:
+        return all(status == HEALTHY for status in self._snapshot.values())
+
+    def refresh(self):
+        futures = {}
+        for name, check in self.checks.items():
+            future = self._pending.get(name)
+            # A check still stuck from the previous round is not resubmitted
+            if future is None or future.done():
+                future = self._executors[name].submit(check)
+                self._pending[name] = future
+            futures[name] = future
+
+        deadline = time.monotonic() + self.timeout
+        snapshot = {}
+        for name, future in futures.items():
+            try:
+                healthy = future.result(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except FutureTimeoutError:
+                logger.error(
+                    f"{name} health check timed out after {self.timeout}s."
+                )
+                healthy = False
+            except Exception as e:
+                logger.error(f"{name} health check failed: {e}")
+                healthy = False
+            snapshot[name] = HEALTHY if healthy else UNHEALTHY
+        self._snapshot = snapshot
+        self.checked_at = time.time()
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.refresh()
+            self._stopped.wait(self.interval)
+
+    def start(self):
+        self._thread.start()
+        logger.info("Health monitor started.")
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("Health monitor stopped.")
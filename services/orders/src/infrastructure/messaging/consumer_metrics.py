@@ -0,0 +1,119 @@
+import functools
+import logging
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+from src.config import Config
+from src.infrastructure.metrics.metrics_registry import (
+    MetricsRegistry,
+    registry,
+)
+
+logger = logging.getLogger("app")
+
+
+class ConsumerMetrics:
+    def __init__(self, queue: str, metrics: MetricsRegistry = registry):
+        self.queue = queue
+        self.consumed = metrics.counter(
+            "messaging_messages_consumed_total",
+            "Messages handled by the consumer.",
+            ["queue"],
+        )
+        self.redeliveries = metrics.counter(
+            "messaging_message_redeliveries_total",
+            "Messages the broker delivered more than once.",
+            ["queue"],
+        )
+        self.in_flight = metrics.gauge(
+            "messaging_messages_in_flight",
+            "Messages currently being handled.",
+            ["queue"],
+        )
+        self.handler_duration = metrics.histogram(
+            "messaging_handler_duration_seconds",
+            "Time spent in the message handler.",
+            ["queue"],
+        )
+        self.consume_rate = metrics.gauge(
+            "messaging_consume_rate",
+            "Messages handled per second since the previous sample.",
+            ["queue"],
+        )
+        self.queue_depth = metrics.gauge(
+            "messaging_queue_depth",
+            "Ready messages in the queue at the last sample.",
+            ["queue"],
+        )
+        self.queue_consumers = metrics.gauge(
+            "messaging_queue_consumers",
+            "Consumers attached to the queue at the last sample.",
+            ["queue"],
+        )
+        self._last_sample_time = time.monotonic()
+        self._last_sample_consumed = self.consumed.get(queue=queue)
+
+    @contextmanager
+    def track(self, method):
+        if getattr(method, "redelivered", False) is True:
+            self.redeliveries.inc(queue=self.queue)
+        self.in_flight.inc(queue=self.queue)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.handler_duration.observe(
+                time.perf_counter() - start, queue=self.queue
+            )
+            self.in_flight.dec(queue=self.queue)
+            self.consumed.inc(queue=self.queue)
+
+    def sample(self, channel):
+        result = channel.queue_declare(queue=self.queue, passive=True)
+        self.queue_depth.set(result.method.message_count, queue=self.queue)
+        self.queue_consumers.set(
+            result.method.consumer_count, queue=self.queue
+        )
+
+        now = time.monotonic()
+        consumed = self.consumed.get(queue=self.queue)
+        elapsed = now - self._last_sample_time
+        if elapsed > 0:
+            self.consume_rate.set(
+                (consumed - self._last_sample_consumed) / elapsed,
+                queue=self.queue,
+            )
+        self._last_sample_time = now
+        self._last_sample_consumed = consumed
+
+    def schedule_sampling(
+        self, connection, channel, interval: Optional[float] = None
+    ):
+        # Runs on the consumer's own connection thread; pika channels are
+        # not thread-safe.
+        interval = interval or Config.QUEUE_DEPTH_SAMPLE_INTERVAL
+
+        def sample():
+            try:
+                self.sample(channel)
+            except Exception as e:
+                logger.error(f"Failed to sample {self.queue} depth: {e}")
+            connection.call_later(interval, sample)
+
+        connection.call_later(interval, sample)
+
+
+def instrument_consumer(queue: str):
+    metrics = ConsumerMetrics(queue)
+
+    def decorator(on_message):
+        @functools.wraps(on_message)
+        def wrapper(self, ch, method, properties, body):
+            with metrics.track(method):
+                return on_message(self, ch, method, properties, body)
+
+        wrapper.consumer_metrics = metrics
+        return wrapper
+
+    return decorator
@@ -1,9 +1,17 @@
 import asyncio
 import json
 import logging
+from typing import Optional
 
 from src.domain.entities.order_entity import OrderStatus
 from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.consumer_metrics import instrument_consumer
+from src.infrastructure.messaging.event_loop_bridge import EventLoopBridge
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.retry_topology import RetryTopology
+from src.infrastructure.tracing.tracer import traced_consumer
 
 logger = logging.getLogger("app")
 
@@ -11,12 +19,28 @@ logger = logging.getLogger("app")
 class DeliverySubscriber(BaseMessagingAdapter):
 
     def __init__(
-        self, order_service, connection_params, max_retries=5, delay=5
+        self,
+        order_service,
+        connection_params,
+        max_retries=5,
+        delay=5,
+        event_loop_bridge: Optional[EventLoopBridge] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        retry_topology: Optional[RetryTopology] = None,
     ):
         super().__init__(connection_params, max_retries, delay)
         self.order_service = order_service
+        self.event_loop_bridge = event_loop_bridge
+        self.deduplicator = deduplicator
+        self.retry_topology = retry_topology or RetryTopology("delivery_queue")
+
+    def _run(self, coro):
+        if self.event_loop_bridge is None:
+            return asyncio.run(coro)
+        return self.event_loop_bridge.run(coro)
 
     def start_consuming(self):
+        self.ensure_connected()
         self.channel.exchange_declare(
             exchange="delivery_exchange", exchange_type="topic", durable=True
         )
@@ -26,6 +50,7 @@ class DeliverySubscriber(BaseMessagingAdapter):
             queue="delivery_queue",
             routing_key="delivery_queue",
         )
+        self.retry_topology.declare(self.channel)
 
         self.channel.basic_consume(
             queue="delivery_queue",
@@ -33,30 +58,45 @@ class DeliverySubscriber(BaseMessagingAdapter):
             auto_ack=False,
         )
         logger.info("Starting to consume messages from delivery_queue.")
+        self.schedule_queue_sampling(self.on_message)
         self.channel.start_consuming()
 
+    @instrument_consumer("delivery_queue")
+    @traced_consumer("delivery_queue")
     def on_message(self, ch, method, properties, body):
         logger.info(f"Received message from delivery_queue: {body}")
+        if self.deduplicator and self.deduplicator.is_duplicate(properties):
+            logger.info(
+                f"Skipping duplicate message {properties.message_id} "
+                "from delivery_queue."
+            )
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
         try:
             data = json.loads(body.decode("utf-8"))
             order_id = data.get("order_id")
             status = data.get("status")
 
             if status == "in_transit":
-                asyncio.run(
+                self._run(
                     self.order_service.update_order_status(
                         order_id, OrderStatus.SHIPPED
                     )
                 )
                 logger.info(f"Order ID {order_id} marked as shipped.")
             if status == "delivered":
-                asyncio.run(
+                self._run(
                     self.order_service.update_order_status(
                         order_id, OrderStatus.FINISHED
                     )
                 )
                 logger.info(f"Order ID {order_id} marked as finished.")
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
         except Exception as e:
             logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
         finally:
             ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -0,0 +1,66 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+import aiohttp
+from src.config import Config
+from src.infrastructure.metrics.request_metrics import (
+    outbound_call_trace_config,
+)
+from src.infrastructure.tracing.http_client import client_trace_config
+from src.infrastructure.tracing.tracer import tracer
+
+logger = logging.getLogger("app")
+
+
+class EventLoopBridge:
+    # Single long-lived loop shared by the synchronous consumer threads, so
+    # handlers don't pay asyncio.run setup/teardown on every message.
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout or Config.EVENT_LOOP_TIMEOUT
+        self.loop = asyncio.new_event_loop()
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self._thread = threading.Thread(
+            target=self._run_loop, name="event-loop-bridge", daemon=True
+        )
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _create_http_session(self) -> aiohttp.ClientSession:
+        return aiohttp.ClientSession(
+            trace_configs=[client_trace_config(), outbound_call_trace_config()]
+        )
+
+    def start(self):
+        self._thread.start()
+        self.http_session = self.run(self._create_http_session())
+        logger.info("Event loop bridge started.")
+
+    def run(
+        self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None
+    ) -> Any:
+        future = asyncio.run_coroutine_threadsafe(tracer.bind(coro), self.loop)
+        try:
+            return future.result(timeout=timeout or self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            logger.error(
+                f"Coroutine timed out after {timeout or self.timeout}s "
+                "and was canceled."
+            )
+            raise
+
+    def stop(self):
+        if not self._thread.is_alive():
+            return
+        if self.http_session is not None:
+            self.run(self.http_session.close())
+            self.http_session = None
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+        logger.info("Event loop bridge stopped.")
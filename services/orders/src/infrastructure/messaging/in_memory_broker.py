@@ -0,0 +1,281 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict, deque
+from types import SimpleNamespace
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
+
+import pika
+from pika.spec import Basic, Queue
+
+# (properties, body, redelivered)
+QueuedMessage = Tuple[Optional[pika.BasicProperties], bytes, bool]
+
+
+class InMemoryBroker:
+    # Stand-in for RabbitMQ behind the pika connection and channel calls our
+    # adapters make, so subscribers run unmodified in benchmarks. Exchanges
+    # route on exact routing keys only (enough for our direct/topic use).
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues: Dict[str, Deque[QueuedMessage]] = defaultdict(deque)
+        self._bindings: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._consumers: Dict[str, int] = defaultdict(int)
+        self._queue_names = itertools.count(1)
+        self.acked = 0
+        self.nacked = 0
+
+    def connection(self) -> "InMemoryConnection":
+        return InMemoryConnection(self)
+
+    def declare_queue(self, queue: str = "") -> str:
+        with self._lock:
+            if not queue:
+                queue = f"amq.gen-{next(self._queue_names)}"
+            self._queues[queue]
+        return queue
+
+    def bind(self, exchange: str, queue: str, routing_key: str):
+        with self._lock:
+            self._queues[queue]
+            self._bindings[(exchange, routing_key)].add(queue)
+
+    def publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body,
+        properties: Optional[pika.BasicProperties] = None,
+    ):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        with self._lock:
+            # The default exchange routes straight to the named queue
+            queues = (
+                self._bindings.get((exchange, routing_key), ())
+                if exchange
+                else (routing_key,)
+            )
+            for queue in queues:
+                self._queues[queue].append((properties, body, False))
+
+    def get(self, queue: str) -> Optional[QueuedMessage]:
+        with self._lock:
+            messages = self._queues.get(queue)
+            if not messages:
+                return None
+            return messages.popleft()
+
+    def requeue(self, queue: str, properties, body):
+        with self._lock:
+            self._queues[queue].appendleft((properties, body, True))
+
+    def message_count(self, queue: str) -> int:
+        with self._lock:
+            return len(self._queues.get(queue, ()))
+
+    def consumer_count(self, queue: str) -> int:
+        with self._lock:
+            return self._consumers[queue]
+
+    def _add_consumer(self, queue: str, delta: int):
+        with self._lock:
+            self._consumers[queue] += delta
+
+    def _record_acks(self, acked: int = 0, nacked: int = 0):
+        with self._lock:
+            self.acked += acked
+            self.nacked += nacked
+
+
+class InMemoryConnection:
+    # Timers run on the consuming thread between deliveries, as they do in
+    # pika's BlockingConnection.
+    def __init__(self, broker: InMemoryBroker):
+        self.broker = broker
+        self.is_open = True
+        self._timers: List[Tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count(1)
+        self._cancelled: Set[int] = set()
+        self._callbacks: Deque[Callable[[], None]] = deque()
+
+    @property
+    def is_closed(self) -> bool:
+        return not self.is_open
+
+    def channel(self) -> "InMemoryChannel":
+        return InMemoryChannel(self)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> int:
+        timer_id = next(self._timer_ids)
+        heapq.heappush(
+            self._timers, (time.monotonic() + delay, timer_id, callback)
+        )
+        return timer_id
+
+    def remove_timeout(self, timer_id: int):
+        self._cancelled.add(timer_id)
+
+    def add_callback_threadsafe(self, callback: Callable[[], None]):
+        self._callbacks.append(callback)
+
+    def process_data_events(self, time_limit: float = 0):
+        while self._callbacks:
+            self._callbacks.popleft()()
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, timer_id, callback = heapq.heappop(self._timers)
+            if timer_id in self._cancelled:
+                self._cancelled.discard(timer_id)
+                continue
+            callback()
+
+    def sleep(self, duration: float):
+        time.sleep(duration)
+        self.process_data_events()
+
+    def close(self):
+        self.is_open = False
+
+
+class InMemoryChannel:
+    # Covers the BlockingChannel calls made by the subscribers, the retry
+    # topology and the queue samplers. start_consuming returns once every
+    # consumed queue is empty instead of blocking forever, so a benchmark
+    # can time a drain. Prefetch is recorded but not enforced.
+    def __init__(self, connection: InMemoryConnection):
+        self.connection = connection
+        self.broker = connection.broker
+        self.is_open = True
+        self.prefetch_count = 0
+        self._delivery_tags = itertools.count(1)
+        self._consumers: Dict[str, Tuple[str, Callable, bool]] = {}
+        self._unacked: Dict[int, Tuple[str, object, bytes]] = {}
+        self._consuming = False
+
+    @property
+    def is_closed(self) -> bool:
+        return not self.is_open
+
+    def exchange_declare(self, exchange: str, **kwargs):
+        pass
+
+    def queue_declare(self, queue: str = "", passive: bool = False, **kwargs):
+        queue = self.broker.declare_queue(queue)
+        return SimpleNamespace(
+            method=Queue.DeclareOk(
+                queue=queue,
+                message_count=self.broker.message_count(queue),
+                consumer_count=self.broker.consumer_count(queue),
+            )
+        )
+
+    def queue_bind(self, queue: str, exchange: str, routing_key: str = None):
+        self.broker.bind(exchange, queue, routing_key or queue)
+
+    def basic_qos(self, prefetch_count: int = 0, **kwargs):
+        self.prefetch_count = prefetch_count
+
+    def basic_consume(
+        self,
+        queue: str,
+        on_message_callback: Callable,
+        auto_ack: bool = False,
+        **kwargs,
+    ) -> str:
+        consumer_tag = f"ctag-{queue}-{id(self)}"
+        self._consumers[consumer_tag] = (queue, on_message_callback, auto_ack)
+        self.broker._add_consumer(queue, 1)
+        return consumer_tag
+
+    def basic_cancel(self, consumer_tag: str):
+        queue, _, _ = self._consumers.pop(consumer_tag)
+        self.broker._add_consumer(queue, -1)
+
+    def basic_publish(
+        self,
+        exchange: str,
+        routing_key: str,
+        body,
+        properties: Optional[pika.BasicProperties] = None,
+        **kwargs,
+    ):
+        self.broker.publish(exchange, routing_key, body, properties)
+
+    def basic_get(self, queue: str, auto_ack: bool = False):
+        message = self.broker.get(queue)
+        if message is None:
+            return None, None, None
+        properties, body, redelivered = message
+        delivery_tag = next(self._delivery_tags)
+        if not auto_ack:
+            self._unacked[delivery_tag] = (queue, properties, body)
+        method = Basic.GetOk(
+            delivery_tag=delivery_tag,
+            redelivered=redelivered,
+            routing_key=queue,
+            message_count=self.broker.message_count(queue),
+        )
+        return method, properties, body
+
+    def _settle(self, delivery_tag: int, multiple: bool) -> List[tuple]:
+        if multiple:
+            tags = [tag for tag in self._unacked if tag <= delivery_tag]
+        else:
+            tags = [delivery_tag] if delivery_tag in self._unacked else []
+        return [self._unacked.pop(tag) for tag in tags]
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False):
+        self.broker._record_acks(
+            acked=len(self._settle(delivery_tag, multiple))
+        )
+
+    def basic_nack(
+        self,
+        delivery_tag: int = 0,
+        multiple: bool = False,
+        requeue: bool = True,
+    ):
+        settled = self._settle(delivery_tag, multiple)
+        self.broker._record_acks(nacked=len(settled))
+        if requeue:
+            for queue, properties, body in reversed(settled):
+                self.broker.requeue(queue, properties, body)
+
+    def basic_reject(self, delivery_tag: int = 0, requeue: bool = True):
+        self.basic_nack(delivery_tag, requeue=requeue)
+
+    def start_consuming(self):
+        self._consuming = True
+        while self._consuming and self._deliver_next():
+            pass
+        self._consuming = False
+        self.connection.process_data_events()
+
+    def stop_consuming(self):
+        self._consuming = False
+
+    def _deliver_next(self) -> bool:
+        self.connection.process_data_events()
+        for consumer_tag, consumer in list(self._consumers.items()):
+            queue, callback, auto_ack = consumer
+            message = self.broker.get(queue)
+            if message is None:
+                continue
+            properties, body, redelivered = message
+            delivery_tag = next(self._delivery_tags)
+            if not auto_ack:
+                self._unacked[delivery_tag] = (queue, properties, body)
+            method = Basic.Deliver(
+                consumer_tag=consumer_tag,
+                delivery_tag=delivery_tag,
+                redelivered=redelivered,
+                routing_key=queue,
+            )
+            callback(self, method, properties, body)
+            return True
+        return False
+
+    def close(self):
+        self.is_open = False
@@ -1,5 +1,6 @@
 import json
 import logging
+import uuid
 
 import pika
 from src.infrastructure.messaging.base import BaseMessagingAdapter
@@ -16,14 +17,9 @@ class InventoryPublisher(BaseMessagingAdapter):
         message = json.dumps(
             {"sku": sku, "action": action, "quantity": quantity}
         )
-        try:
-            self.channel.basic_publish(
-                exchange=self.exchange_name,
-                routing_key="inventory_queue",
-                body=message,
-            )
-            logger.info(f"Published inventory update: {message}")
-        except pika.exceptions.ConnectionClosed:
-            logger.error("Connection closed, attempting to reconnect.")
-            self.connect()
-            self.publish_inventory_update(sku, action, quantity)
+        if self.publish(
+            "inventory_queue",
+            message,
+            pika.BasicProperties(message_id=uuid.uuid4().hex),
+        ):
+            logger.info(f"Queued inventory update: {message}")
@@ -0,0 +1,77 @@
+import json
+import logging
+from datetime import datetime
+from typing import Callable, Iterable, Mapping, Optional
+
+from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.realtime.event_hub import EventHub
+from src.infrastructure.realtime.kitchen_queue import KitchenQueue
+from src.infrastructure.realtime.order_events import order_topic, status_event
+from src.infrastructure.tracing.tracer import traced_consumer
+
+logger = logging.getLogger("app")
+
+
+class OrderStatusSubscriber(BaseMessagingAdapter):
+    # Feeds the in-memory read models and the per-order event streams from
+    # the service's own order events.
+    # Every replica declares an exclusive, server-named queue bound to
+    # orders_exchange, so each one sees every status change regardless of
+    # which replica made it.
+    def __init__(
+        self,
+        kitchen_queue: KitchenQueue,
+        event_hub: EventHub,
+        connection_params,
+        max_retries=5,
+        delay=5,
+        load_snapshot: Optional[Callable[[], Iterable[Mapping]]] = None,
+    ):
+        super().__init__(connection_params, max_retries, delay)
+        self.kitchen_queue = kitchen_queue
+        self.event_hub = event_hub
+        self.load_snapshot = load_snapshot
+        self.queue_name = None
+
+    def start_consuming(self):
+        self.ensure_connected()
+        self.channel.exchange_declare(
+            exchange="orders_exchange", exchange_type="topic", durable=True
+        )
+        result = self.channel.queue_declare(queue="", exclusive=True)
+        self.queue_name = result.method.queue
+        self.channel.queue_bind(
+            exchange="orders_exchange",
+            queue=self.queue_name,
+            routing_key="orders_queue",
+        )
+        # Read only once the queue is bound, so a change committed in
+        # between is in the snapshot, in the queue, or both
+        if self.load_snapshot is not None:
+            self.kitchen_queue.load(self.load_snapshot())
+
+        self.channel.basic_consume(
+            queue=self.queue_name,
+            on_message_callback=self.on_message,
+            auto_ack=True,
+        )
+        logger.info(f"Starting to consume order events on {self.queue_name}.")
+        self.channel.start_consuming()
+
+    @traced_consumer("order_status")
+    def on_message(self, ch, method, properties, body):
+        try:
+            data = json.loads(body.decode("utf-8"))
+            order_id, status = data["order_id"], data["status"]
+            created_at = data.get("created_at")
+            self.kitchen_queue.apply(
+                order_id,
+                status,
+                datetime.fromisoformat(created_at) if created_at else None,
+            )
+            self.event_hub.publish(
+                order_topic(order_id), status_event(order_id, status)
+            )
+        except Exception as e:
+            # The read model is rebuilt from the database on restart
+            logger.error(f"Error processing order event: {e}")
@@ -1,5 +1,8 @@
 import json
 import logging
+import uuid
+from datetime import datetime
+from typing import Optional
 
 import pika
 from src.infrastructure.messaging.base import BaseMessagingAdapter
@@ -12,18 +15,26 @@ class OrderUpdatePublisher(BaseMessagingAdapter):
         super().__init__(connection_params, max_retries, delay)
         self.exchange_name = "orders_exchange"
 
-    def publish_order_update(self, order_id: int, amount: float, status: str):
+    def publish_order_update(
+        self,
+        order_id: int,
+        amount: float,
+        status: str,
+        created_at: Optional[datetime] = None,
+    ):
         message = json.dumps(
-            {"order_id": order_id, "amount": amount, "status": status}
+            {
+                "order_id": order_id,
+                "amount": amount,
+                "status": status,
+                "created_at": created_at.isoformat() if created_at else None,
+                # Lets consumers drop a status that arrives after a newer one
+                "occurred_at": datetime.utcnow().isoformat(),
+            }
         )
-        try:
-            self.channel.basic_publish(
-                exchange=self.exchange_name,
-                routing_key="orders_queue",
-                body=message,
-            )
-            logging.info(f"Published order update: {message} to orders_queue")
-        except pika.exceptions.ConnectionClosed:
-            logging.error("Connection closed, attempting to reconnect.")
-            self.connect()
-            self.publish_order_update(order_id, amount, status)
+        if self.publish(
+            "orders_queue",
+            message,
+            pika.BasicProperties(message_id=uuid.uuid4().hex),
+        ):
+            logger.info(f"Queued order update: {message} to orders_queue")
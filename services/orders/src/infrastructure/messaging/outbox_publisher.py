@@ -0,0 +1,66 @@
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy.orm import Session
+from src.infrastructure.persistence.models import OutboxMessageModel
+from src.infrastructure.tracing.tracer import SpanKind, tracer
+
+logger = logging.getLogger("app")
+
+
+class OutboxPublisher:
+    # Stages events in the caller's session instead of talking to the
+    # broker; they are committed together with the order and published
+    # later by OutboxRelay.
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _stage(self, exchange: str, routing_key: str, message: str):
+        with tracer.span(
+            f"{exchange} publish",
+            SpanKind.PRODUCER,
+            {
+                "messaging.system": "rabbitmq",
+                "messaging.operation": "publish",
+                "messaging.destination.name": exchange,
+                "messaging.rabbitmq.destination.routing_key": routing_key,
+            },
+        ):
+            self.db.add(
+                OutboxMessageModel(
+                    message_id=uuid.uuid4().hex,
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    payload=message,
+                    traceparent=tracer.current_traceparent(),
+                )
+            )
+        logger.info(f"Staged {routing_key} message in outbox: {message}")
+
+    def publish_inventory_update(self, sku: str, action: str, quantity: int):
+        message = json.dumps(
+            {"sku": sku, "action": action, "quantity": quantity}
+        )
+        self._stage("inventory_exchange", "inventory_queue", message)
+
+    def publish_order_update(
+        self,
+        order_id: int,
+        amount: float,
+        status: str,
+        created_at: Optional[datetime] = None,
+    ):
+        message = json.dumps(
+            {
+                "order_id": order_id,
+                "amount": amount,
+                "status": status,
+                "created_at": created_at.isoformat() if created_at else None,
+                # Lets consumers drop a status that arrives after a newer one
+                "occurred_at": datetime.utcnow().isoformat(),
+            }
+        )
+        self._stage("orders_exchange", "orders_queue", message)
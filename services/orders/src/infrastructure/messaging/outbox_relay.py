@@ -0,0 +1,128 @@
+import logging
+import threading
+from typing import Callable, Optional
+
+import pika
+from sqlalchemy.orm import Session
+from src.config import Config
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+from src.infrastructure.persistence.models import OutboxMessageModel
+from src.infrastructure.tracing.tracer import TRACEPARENT
+
+logger = logging.getLogger("app")
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        connection_params,
+        batch_size: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.session_factory = session_factory
+        self.connection_params = connection_params
+        self.batch_size = batch_size or Config.OUTBOX_BATCH_SIZE
+        self.poll_interval = poll_interval or Config.OUTBOX_POLL_INTERVAL
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.connection = None
+        self.channel = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self.run, name="outbox-relay", daemon=True
+        )
+
+    def _get_channel(self):
+        if self.channel is None or self.channel.is_closed:
+            self.connection = pika.BlockingConnection(self.connection_params)
+            self.channel = self.connection.channel()
+            # A transacted channel lets a whole batch be published and then
+            # acknowledged by the broker in one round trip on tx_commit;
+            # confirm mode would block on every basic_publish instead
+            self.channel.tx_select()
+        return self.channel
+
+    def _close_connection(self):
+        if self.connection is not None and self.connection.is_open:
+            try:
+                self.connection.close()
+            except Exception as e:
+                logger.error(f"Error closing outbox relay connection: {e}")
+        self.connection = None
+        self.channel = None
+
+    def relay_batch(self) -> int:
+        db = self.session_factory()
+        try:
+            messages = (
+                db.query(OutboxMessageModel)
+                .order_by(OutboxMessageModel.id)
+                .limit(self.batch_size)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+            if not messages:
+                db.commit()
+                return 0
+
+            channel = self._get_channel()
+            for message in messages:
+                channel.basic_publish(
+                    exchange=message.exchange,
+                    routing_key=message.routing_key,
+                    body=message.payload,
+                    properties=pika.BasicProperties(
+                        message_id=message.message_id,
+                        delivery_mode=pika.DeliveryMode.Persistent,
+                        headers=(
+                            {TRACEPARENT: message.traceparent}
+                            if message.traceparent
+                            else None
+                        ),
+                    ),
+                )
+                db.delete(message)
+            channel.tx_commit()
+            db.commit()
+            logger.info(f"Relayed {len(messages)} outbox messages.")
+            return len(messages)
+        except Exception:
+            # Rows stay in the outbox. An uncommitted broker transaction is
+            # discarded with the connection; if tx_commit succeeded but the
+            # delete did not, the message_id lets consumers drop the
+            # redelivery.
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def run(self):
+        while not self._stopped.is_set():
+            if not self.circuit_breaker.allow_request():
+                self._stopped.wait(self.circuit_breaker.retry_after())
+                continue
+            try:
+                relayed = self.relay_batch()
+            except Exception as e:
+                logger.error(f"Outbox relay failed: {e}")
+                self.circuit_breaker.record_failure()
+                self._close_connection()
+                relayed = 0
+            else:
+                self.circuit_breaker.record_success()
+            if relayed < self.batch_size:
+                if self.connection is not None and self.connection.is_open:
+                    self.connection.process_data_events()
+                self._stopped.wait(self.poll_interval)
+
+    def start(self):
+        self._thread.start()
+        logger.info("Outbox relay started.")
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self._close_connection()
+        logger.info("Outbox relay stopped.")
@@ -1,20 +1,44 @@
 import asyncio
 import json
 import logging
+from typing import Optional
 
 from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.consumer_metrics import instrument_consumer
+from src.infrastructure.messaging.event_loop_bridge import EventLoopBridge
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.retry_topology import RetryTopology
+from src.infrastructure.tracing.tracer import traced_consumer
 
 logger = logging.getLogger("app")
 
 
 class PaymentSubscriber(BaseMessagingAdapter):
     def __init__(
-        self, order_service, connection_params, max_retries=5, delay=5
+        self,
+        order_service,
+        connection_params,
+        max_retries=5,
+        delay=5,
+        event_loop_bridge: Optional[EventLoopBridge] = None,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        retry_topology: Optional[RetryTopology] = None,
     ):
         super().__init__(connection_params, max_retries, delay)
         self.order_service = order_service
+        self.event_loop_bridge = event_loop_bridge
+        self.deduplicator = deduplicator
+        self.retry_topology = retry_topology or RetryTopology("payment_queue")
+
+    def _run(self, coro):
+        if self.event_loop_bridge is None:
+            return asyncio.run(coro)
+        return self.event_loop_bridge.run(coro)
 
     def start_consuming(self):
+        self.ensure_connected()
         self.channel.exchange_declare(
             exchange="payment_exchange", exchange_type="topic", durable=True
         )
@@ -24,6 +48,7 @@ class PaymentSubscriber(BaseMessagingAdapter):
             queue="payment_queue",
             routing_key="payment_queue",
         )
+        self.retry_topology.declare(self.channel)
 
         self.channel.basic_consume(
             queue="payment_queue",
@@ -31,22 +56,37 @@ class PaymentSubscriber(BaseMessagingAdapter):
             auto_ack=False,
         )
         logger.info("Starting to consume messages from payment_queue.")
+        self.schedule_queue_sampling(self.on_message)
         self.channel.start_consuming()
 
+    @instrument_consumer("payment_queue")
+    @traced_consumer("payment_queue")
     def on_message(self, ch, method, properties, body):
         logger.info(f"Received message from payment_queue: {body}")
+        if self.deduplicator and self.deduplicator.is_duplicate(properties):
+            logger.info(
+                f"Skipping duplicate message {properties.message_id} "
+                "from payment_queue."
+            )
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
         try:
             data = json.loads(body.decode("utf-8"))
             order_id = data.get("order_id")
             status = data.get("status")
 
             if status == "completed":
-                asyncio.run(self.order_service.set_paid_order(order_id))
+                self._run(self.order_service.set_paid_order(order_id))
                 logger.info(f"Order ID {order_id} marked as paid.")
             if status in ["refunded", "canceled"]:
-                asyncio.run(self.order_service.cancel_order(order_id))
+                self._run(self.order_service.cancel_order(order_id))
                 logger.info(f"Order ID {order_id} marked as canceled.")
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
         except Exception as e:
             logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
         finally:
             ch.basic_ack(delivery_tag=method.delivery_tag)
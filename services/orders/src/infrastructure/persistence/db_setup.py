@@ -1,6 +1,8 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from src.config import Config
+from src.infrastructure.metrics.request_metrics import instrument_engine
+from src.infrastructure.persistence.slow_query_log import slow_query_log
 
 DATABASE_URL = "postgresql://"
 DATABASE_URL += f"{Config.DATABASE_USER}:{Config.DATABASE_PASSWORD}"
@@ -8,7 +10,8 @@ DATABASE_URL += f"@{Config.DATABASE_HOST}:{Config.DATABASE_PORT}/"
 DATABASE_URL += f"{Config.DATABASE_NAME}"
 
 # SQLAlchemy setup
-engine = create_engine(DATABASE_URL)
+engine = instrument_engine(create_engine(DATABASE_URL))
+slow_query_log.instrument(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -1,6 +1,15 @@
 import uuid
+from datetime import datetime
 
-from sqlalchemy import Column, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 from src.domain.entities.order_entity import OrderStatus
 from src.infrastructure.persistence.db_setup import Base
@@ -25,9 +34,17 @@ class OrderModel(Base):
     customer_id = Column(Integer, ForeignKey("customers.id"))
     status = Column(Enum(OrderStatus), default=OrderStatus.PENDING)
     estimated_time = Column(String, nullable=True)
-    customer = relationship("CustomerModel", back_populates="orders")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    # Eager so listing orders costs a fixed number of queries, not one
+    # per row for the customer and another for the items
+    customer = relationship(
+        "CustomerModel", back_populates="orders", lazy="selectin"
+    )
     order_items = relationship(
-        "OrderItemModel", back_populates="order", cascade="all, delete-orphan"
+        "OrderItemModel",
+        back_populates="order",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
 
@@ -38,3 +55,21 @@ class OrderItemModel(Base):
     product_sku = Column(String, index=True)
     quantity = Column(Integer)
     order = relationship("OrderModel", back_populates="order_items")
+
+
+class ProcessedMessageModel(Base):
+    __tablename__ = "processed_messages"
+    message_id = Column(String(64), primary_key=True)
+    processed_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class OutboxMessageModel(Base):
+    __tablename__ = "outbox"
+    id = Column(Integer, primary_key=True, index=True)
+    message_id = Column(String(64), nullable=False, unique=True)
+    exchange = Column(String, nullable=False)
+    routing_key = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)
+    # Trace context of the request that staged the event
+    traceparent = Column(String(55), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
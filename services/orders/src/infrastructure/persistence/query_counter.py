@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryCounter:
+    # Captures the SQL statements an engine runs while the block is active
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: List[str] = []
+
+    def _record(self, conn, cursor, statement, parameters, context, many):
+        self.statements.append(statement)
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def report(self) -> str:
+        return "\n".join(
+            f"{index}. {' '.join(statement.split())}"
+            for index, statement in enumerate(self.statements, start=1)
+        )
+
+
+@contextmanager
+def assert_max_queries(engine: Engine, budget: int) -> Iterator[QueryCounter]:
+    # Fails with every statement listed, so a per-row lazy load shows up
+    # as the same SELECT repeated
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count > budget:
+        raise AssertionError(
+            f"Expected at most {budget} queries, {counter.count} ran:\n"
+            f"{counter.report()}"
+        )
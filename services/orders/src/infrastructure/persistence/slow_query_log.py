@@ -0,0 +1,200 @@
+import functools
+import hashlib
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from src.config import Config
+from src.infrastructure.metrics.metrics_registry import registry
+from src.infrastructure.tracing.tracer import tracer
+
+logger = logging.getLogger("app")
+
+# Durations kept per fingerprint for the percentiles
+RESERVOIR_SIZE = 512
+SORT_KEYS = ("total_ms", "p99_ms", "p50_ms", "max_ms", "slow_calls", "rows")
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PARAMETER = re.compile(r"%\(\w+\)s|%s|\$\d+|(?<!:):\w+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    # Literals and bind parameters become ?, and IN lists of any length
+    # collapse, so selectin loads of different page sizes share one entry
+    normalized = _STRING.sub("?", statement)
+    normalized = _PARAMETER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _percentile(durations: List[float], percentile: float) -> float:
+    if not durations:
+        return 0.0
+    ordered = sorted(durations)
+    index = min(len(ordered) - 1, int(len(ordered) * percentile))
+    return ordered[index]
+
+
+class QueryStats:
+    __slots__ = (
+        "fingerprint",
+        "sampled_calls",
+        "slow_calls",
+        "total_ms",
+        "max_ms",
+        "rows",
+        "sources",
+        "durations",
+    )
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.sampled_calls = 0
+        self.slow_calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.sources: Dict[str, int] = {}
+        self.durations: Deque[float] = deque(maxlen=RESERVOIR_SIZE)
+
+    def to_dict(self, sample_ratio: float) -> dict:
+        durations = list(self.durations)
+        calls = self.sampled_calls or 1
+        return {
+            "id": fingerprint_id(self.fingerprint),
+            "fingerprint": self.fingerprint,
+            "sampled_calls": self.sampled_calls,
+            "estimated_calls": round(self.sampled_calls / sample_ratio),
+            "slow_calls": self.slow_calls,
+            "total_ms": self.total_ms,
+            "mean_ms": self.total_ms / calls,
+            "p50_ms": _percentile(durations, 0.5),
+            "p99_ms": _percentile(durations, 0.99),
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "mean_rows": self.rows / calls,
+            "sources": dict(self.sources),
+        }
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    return hashlib.blake2b(
+        fingerprint.encode("utf-8"), digest_size=6
+    ).hexdigest()
+
+
+class SlowQueryLog:
+    # Every statement is timed, which is cheap; only slow ones and a
+    # sample of the rest are fingerprinted and aggregated. Statements
+    # over the threshold are always logged with the repository method
+    # that ran them, taken from its tracing span.
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        sample_ratio: Optional[float] = None,
+        max_fingerprints: Optional[int] = None,
+    ):
+        self.threshold_ms = (
+            Config.SLOW_QUERY_THRESHOLD_MS
+            if threshold_ms is None
+            else threshold_ms
+        )
+        self.sample_ratio = (
+            Config.SLOW_QUERY_SAMPLE_RATIO
+            if sample_ratio is None
+            else sample_ratio
+        )
+        self.max_fingerprints = (
+            max_fingerprints or Config.SLOW_QUERY_MAX_FINGERPRINTS
+        )
+        self._stats: Dict[str, QueryStats] = {}
+        self._lock = threading.Lock()
+        self.slow_queries = registry.counter(
+            "db_slow_queries_total",
+            "Statements slower than SLOW_QUERY_THRESHOLD_MS.",
+        )
+        self.dropped_fingerprints = registry.counter(
+            "db_slow_query_fingerprints_dropped_total",
+            "Statements not aggregated because the fingerprint table "
+            "was full.",
+        )
+
+    def instrument(self, engine: Engine) -> Engine:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        return engine
+
+    def _before(self, conn, cursor, statement, parameters, context, many):
+        context._slow_query_log_started = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, many):
+        started = getattr(context, "_slow_query_log_started", None)
+        if started is None:
+            return
+        self.record(
+            statement,
+            (time.perf_counter() - started) * 1000,
+            getattr(cursor, "rowcount", -1),
+        )
+
+    def record(self, statement: str, duration_ms: float, rows: int = -1):
+        slow = duration_ms >= self.threshold_ms
+        sampled = random.random() < self.sample_ratio
+        if not slow and not sampled:
+            return
+
+        span = tracer.current_span()
+        source = span.name if span is not None else "<unknown>"
+        normalized = fingerprint(statement)
+        if slow:
+            self.slow_queries.inc()
+            logger.warning(
+                f"Slow query {duration_ms:.1f}ms in {source} "
+                f"[{fingerprint_id(normalized)}]: {normalized}"
+            )
+
+        with self._lock:
+            stats = self._stats.get(normalized)
+            if stats is None:
+                if len(self._stats) >= self.max_fingerprints:
+                    self.dropped_fingerprints.inc()
+                    return
+                stats = self._stats[normalized] = QueryStats(normalized)
+            if slow:
+                stats.slow_calls += 1
+            if not sampled:
+                return
+            stats.sampled_calls += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.rows += max(rows, 0)
+            stats.sources[source] = stats.sources.get(source, 0) + 1
+            stats.durations.append(duration_ms)
+
+    def snapshot(self, sort: str = "total_ms", limit: int = 50) -> List[dict]:
+        # Sample-based figures; estimated_calls scales the sample back up
+        with self._lock:
+            entries = [
+                stats.to_dict(self.sample_ratio or 1.0)
+                for stats in self._stats.values()
+            ]
+        entries.sort(key=lambda entry: entry[sort], reverse=True)
+        return entries[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+slow_query_log = SlowQueryLog()
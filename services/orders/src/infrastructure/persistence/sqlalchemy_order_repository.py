@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import List, Mapping, Optional, Tuple
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from src.domain.entities.customer_entity import CustomerEntity
-from src.domain.entities.order_entity import OrderEntity
+from src.domain.entities.order_entity import OrderEntity, OrderStatus
 from src.domain.entities.order_item_entity import OrderItemEntity
 from src.domain.repositories.order_repository import OrderRepository
 from src.infrastructure.persistence.models import (
@@ -10,13 +11,30 @@ from src.infrastructure.persistence.models import (
     OrderItemModel,
     OrderModel,
 )
+from src.infrastructure.tracing.tracer import traced_repository
 
 
+@traced_repository("postgresql")
 class SQLAlchemyOrderRepository(OrderRepository):
     def __init__(self, db: Session):
         self.db = db
 
     def save(self, order: OrderEntity):
+        # Single commit, so the order, its items and any outbox events
+        # staged on this session are written atomically.
+        try:
+            customer_model, db_order = self._stage_order(order)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(db_order)
+        order.id = db_order.id
+        order.customer.id = customer_model.id
+
+    def _stage_order(
+        self, order: OrderEntity
+    ) -> Tuple[CustomerModel, OrderModel]:
         customer_model = (
             self.db.query(CustomerModel)
             .filter(CustomerModel.email == order.customer.email)
@@ -29,8 +47,7 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 phone_number=order.customer.phone_number,
             )
             self.db.add(customer_model)
-            self.db.commit()
-            self.db.refresh(customer_model)
+            self.db.flush()
 
         if order.id:
             db_order = (
@@ -48,8 +65,7 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 estimated_time=order.estimated_time,
             )
             self.db.add(db_order)
-            self.db.commit()
-            self.db.refresh(db_order)
+            self.db.flush()
 
         self.db.query(OrderItemModel).filter(
             OrderItemModel.order_id == db_order.id
@@ -63,36 +79,27 @@ class SQLAlchemyOrderRepository(OrderRepository):
             )
             self.db.add(db_order_item)
 
-        self.db.commit()
-        self.db.refresh(db_order)
-        order.id = db_order.id
-        order.customer.id = customer_model.id
+        self.db.flush()
+        return customer_model, db_order
 
     def find_by_id(self, order_id: int) -> Optional[OrderEntity]:
         db_order = (
             self.db.query(OrderModel).filter(OrderModel.id == order_id).first()
         )
         if db_order:
-            customer = (
-                self.db.query(CustomerModel)
-                .filter(CustomerModel.id == db_order.customer_id)
-                .first()
-            )
-            order_items = (
-                self.db.query(OrderItemModel)
-                .filter(OrderItemModel.order_id == db_order.id)
-                .all()
-            )
-            return OrderEntity(
+            # Customer and items are already loaded with the order
+            customer = db_order.customer
+            order_items = db_order.order_items
+            return OrderEntity.from_trusted_row(
                 id=db_order.id,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=customer.id,
                     name=customer.name,
                     email=customer.email,
                     phone_number=customer.phone_number,
                 ),
                 order_items=[
-                    OrderItemEntity(
+                    OrderItemEntity.from_trusted_row(
                         id=item.id,
                         product_sku=item.product_sku,
                         quantity=item.quantity,
@@ -102,6 +109,7 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 status=db_order.status,
                 order_number=db_order.order_number,
                 estimated_time=db_order.estimated_time,
+                created_at=db_order.created_at,
             )
         return None
 
@@ -112,26 +120,19 @@ class SQLAlchemyOrderRepository(OrderRepository):
             .first()
         )
         if db_order:
-            customer = (
-                self.db.query(CustomerModel)
-                .filter(CustomerModel.id == db_order.customer_id)
-                .first()
-            )
-            order_items = (
-                self.db.query(OrderItemModel)
-                .filter(OrderItemModel.order_id == db_order.id)
-                .all()
-            )
-            return OrderEntity(
+            # Customer and items are already loaded with the order
+            customer = db_order.customer
+            order_items = db_order.order_items
+            return OrderEntity.from_trusted_row(
                 id=db_order.id,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=customer.id,
                     name=customer.name,
                     email=customer.email,
                     phone_number=customer.phone_number,
                 ),
                 order_items=[
-                    OrderItemEntity(
+                    OrderItemEntity.from_trusted_row(
                         id=item.id,
                         product_sku=item.product_sku,
                         quantity=item.quantity,
@@ -141,9 +142,17 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 status=db_order.status,
                 order_number=db_order.order_number,
                 estimated_time=db_order.estimated_time,
+                created_at=db_order.created_at,
             )
         return None
 
+    def find_status(self, order_id: int) -> Optional[OrderStatus]:
+        return (
+            self.db.query(OrderModel.status)
+            .filter(OrderModel.id == order_id)
+            .scalar()
+        )
+
     def delete(self, order: OrderEntity):
         db_order = (
             self.db.query(OrderModel).filter(OrderModel.id == order.id).first()
@@ -155,16 +164,16 @@ class SQLAlchemyOrderRepository(OrderRepository):
     def list_all(self) -> List[OrderEntity]:
         db_orders = self.db.query(OrderModel).all()
         return [
-            OrderEntity(
+            OrderEntity.from_trusted_row(
                 id=db_order.id,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=db_order.customer.id,
                     name=db_order.customer.name,
                     email=db_order.customer.email,
                     phone_number=db_order.customer.phone_number,
                 ),
                 order_items=[
-                    OrderItemEntity(
+                    OrderItemEntity.from_trusted_row(
                         id=item.id,
                         product_sku=item.product_sku,
                         quantity=item.quantity,
@@ -174,6 +183,7 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 status=db_order.status,
                 order_number=db_order.order_number,
                 estimated_time=db_order.estimated_time,
+                created_at=db_order.created_at,
             )
             for db_order in db_orders
         ]
@@ -181,16 +191,16 @@ class SQLAlchemyOrderRepository(OrderRepository):
     def list_paginated(self, offset: int, limit: int) -> List[OrderEntity]:
         db_orders = self.db.query(OrderModel).offset(offset).limit(limit).all()
         return [
-            OrderEntity(
+            OrderEntity.from_trusted_row(
                 id=db_order.id,
-                customer=CustomerEntity(
+                customer=CustomerEntity.from_trusted_row(
                     id=db_order.customer.id,
                     name=db_order.customer.name,
                     email=db_order.customer.email,
                     phone_number=db_order.customer.phone_number,
                 ),
                 order_items=[
-                    OrderItemEntity(
+                    OrderItemEntity.from_trusted_row(
                         id=item.id,
                         product_sku=item.product_sku,
                         quantity=item.quantity,
@@ -200,9 +210,22 @@ class SQLAlchemyOrderRepository(OrderRepository):
                 status=db_order.status,
                 order_number=db_order.order_number,
                 estimated_time=db_order.estimated_time,
+                created_at=db_order.created_at,
             )
             for db_order in db_orders
         ]
 
     def count_all(self) -> int:
         return self.db.query(OrderModel).count()
+
+    def list_status_rows(self, statuses: List[OrderStatus]) -> List[Mapping]:
+        # Only the columns read models need; no customer or items
+        return (
+            self.db.execute(
+                select(OrderModel.id, OrderModel.status, OrderModel.created_at)
+                .where(OrderModel.status.in_(statuses))
+                .order_by(OrderModel.id)
+            )
+            .mappings()
+            .all()
+        )
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from src.config import Config
+from src.infrastructure.metrics.metrics_registry import registry
+
+logger = logging.getLogger("app")
+
+_CLOSED = object()
+
+
+class Subscription:
+    def __init__(
+        self,
+        hub: "EventHub",
+        topic: str,
+        loop: asyncio.AbstractEventLoop,
+        max_queue_size: int,
+    ):
+        self.hub = hub
+        self.topic = topic
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self.closed = False
+
+    def _deliver(self, event: Any):
+        # Runs on the subscriber's loop. A subscriber that falls behind is
+        # dropped instead of buffering without bound; it reconnects and
+        # starts again from a fresh snapshot.
+        if self.closed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Dropping slow subscriber on {self.topic} "
+                f"after {self.queue.qsize()} pending events."
+            )
+            self.hub.dropped_subscribers.inc()
+            self.close()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.hub.unsubscribe(self)
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_CLOSED)
+
+    async def events(
+        self, keepalive: Optional[float] = None
+    ) -> AsyncIterator[Optional[Any]]:
+        # Yields None every `keepalive` seconds without events, so streams
+        # can write heartbeats and notice disconnected clients.
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        self.queue.get(), timeout=keepalive
+                    )
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                if event is _CLOSED:
+                    return
+                yield event
+        finally:
+            self.close()
+
+
+class EventHub:
+    # In-process pub/sub between the broker consumer threads and the
+    # connections held open on the server's event loop.
+    def __init__(self, max_queue_size: Optional[int] = None):
+        self.max_queue_size = max_queue_size or Config.EVENT_HUB_QUEUE_SIZE
+        self._subscriptions: Dict[str, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.subscribers = registry.gauge(
+            "event_hub_subscribers",
+            "Connections currently subscribed to the event hub.",
+        )
+        self.dropped_subscribers = registry.counter(
+            "event_hub_dropped_subscribers_total",
+            "Subscribers dropped because they fell behind.",
+        )
+
+    def subscribe(self, topic: str) -> Subscription:
+        subscription = Subscription(
+            self, topic, asyncio.get_running_loop(), self.max_queue_size
+        )
+        with self._lock:
+            self._subscriptions[topic].add(subscription)
+        self.subscribers.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.topic)
+            if not subscriptions or subscription not in subscriptions:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.topic]
+        self.subscribers.dec()
+
+    def subscriber_count(self, topic: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(topic, ()))
+
+    def publish(self, topic: str, event: Any):
+        # Safe to call from any thread
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(topic, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(
+                    subscription._deliver, event
+                )
+            except RuntimeError:
+                # The subscriber's loop is already closed
+                self.unsubscribe(subscription)
@@ -0,0 +1,100 @@
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.domain.entities.order_entity import OrderStatus
+from src.infrastructure.realtime.event_hub import EventHub, Subscription
+
+# Display order: closest to hand-off first, oldest first within a status
+KITCHEN_STATUSES = [
+    OrderStatus.READY,
+    OrderStatus.PREPARING,
+    OrderStatus.RECEIVED,
+    OrderStatus.PAID,
+    OrderStatus.CONFIRMED,
+]
+KITCHEN_TOPIC = "kitchen"
+
+_STATUS_RANK = {
+    status.value: rank for rank, status in enumerate(KITCHEN_STATUSES)
+}
+
+
+class KitchenQueue:
+    # Read model of the orders the kitchen is working on. It is loaded
+    # once the status event queue is bound and then kept current from
+    # those events, so kitchen displays never query the database.
+    def __init__(self, event_hub: EventHub):
+        self.event_hub = event_hub
+        self._tickets: Dict[int, dict] = {}
+        self._lock = threading.Lock()
+
+    def load(self, rows: Iterable[Mapping]):
+        with self._lock:
+            self._tickets = {}
+            for row in rows:
+                status = row["status"]
+                status = getattr(status, "value", status)
+                if status in _STATUS_RANK:
+                    self._tickets[row["id"]] = self._ticket(
+                        row["id"], status, row["created_at"]
+                    )
+
+    def apply(
+        self,
+        order_id: int,
+        status: str,
+        created_at: Optional[datetime] = None,
+    ) -> Optional[dict]:
+        with self._lock:
+            ticket = self._tickets.get(order_id)
+            if status in _STATUS_RANK:
+                # Already known (e.g. both in the snapshot and still queued)
+                if ticket is not None and ticket["status"] == status:
+                    return None
+                # Queued by the order's creation time, as load() does, so a
+                # ticket sorts the same whether it was loaded or applied
+                if ticket is not None:
+                    queued_at = ticket["queued_at"]
+                else:
+                    queued_at = created_at or datetime.utcnow()
+                ticket = self._ticket(order_id, status, queued_at)
+                self._tickets[order_id] = ticket
+                delta = {"type": "upsert", "ticket": ticket}
+            elif ticket is not None:
+                del self._tickets[order_id]
+                delta = {"type": "remove", "order_id": order_id}
+            else:
+                return None
+            # Published under the lock so deltas reach subscribers in
+            # the same order they were applied
+            self.event_hub.publish(KITCHEN_TOPIC, delta)
+            return delta
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return self._sorted()
+
+    def subscribe(self) -> Tuple[List[dict], Subscription]:
+        # Taken together under the lock, so no delta falls between the
+        # snapshot and the first event of the subscription
+        with self._lock:
+            return self._sorted(), self.event_hub.subscribe(KITCHEN_TOPIC)
+
+    def _sorted(self) -> List[dict]:
+        return sorted(
+            self._tickets.values(),
+            key=lambda ticket: (
+                _STATUS_RANK[ticket["status"]],
+                ticket["queued_at"],
+                ticket["order_id"],
+            ),
+        )
+
+    @staticmethod
+    def _ticket(order_id: int, status: str, queued_at: datetime) -> dict:
+        return {
+            "order_id": order_id,
+            "status": status,
+            "queued_at": queued_at,
+        }
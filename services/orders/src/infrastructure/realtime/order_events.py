@@ -0,0 +1,14 @@
+# Statuses after which an order no longer changes, so streams can end
+FINAL_ORDER_STATUSES = ["finished", "canceled", "deleted"]
+
+
+def order_topic(order_id: int) -> str:
+    return f"order:{order_id}"
+
+
+def status_event(order_id: int, status: str) -> dict:
+    return {"type": "status", "order_id": order_id, "status": status}
+
+
+def is_final(event: dict) -> bool:
+    return event.get("status") in FINAL_ORDER_STATUSES
@@ -0,0 +1,38 @@
+from typing import Any, AsyncIterator, Callable, Iterable, Optional
+
+import orjson
+from src.infrastructure.realtime.event_hub import Subscription
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    # Stops nginx from buffering the stream
+    "X-Accel-Buffering": "no",
+}
+KEEPALIVE = b": keepalive\n\n"
+
+
+def format_event(event: str, data: Any) -> bytes:
+    return b"event: %s\ndata: %s\n\n" % (event.encode(), orjson.dumps(data))
+
+
+async def event_stream(
+    subscription: Subscription,
+    first_events: Iterable[bytes] = (),
+    keepalive: Optional[float] = None,
+    is_last: Optional[Callable[[dict], bool]] = None,
+) -> AsyncIterator[bytes]:
+    # Hub events are dicts with a "type" key, sent as the SSE event name.
+    # The stream ends after an event matching is_last.
+    try:
+        for chunk in first_events:
+            yield chunk
+        async for event in subscription.events(keepalive):
+            if event is None:
+                yield KEEPALIVE
+                continue
+            yield format_event(event["type"], event)
+            if is_last is not None and is_last(event):
+                return
+    finally:
+        # Runs when the client disconnects and the response is cancelled
+        subscription.close()
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.api import debug_api
+from src.infrastructure.persistence.slow_query_log import slow_query_log
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(debug_api.router)
+    slow_query_log.reset()
+    yield TestClient(app)
+    slow_query_log.reset()
+
+
+def test_query_stats_are_sorted_by_requested_key(client, monkeypatch):
+    monkeypatch.setattr(slow_query_log, "sample_ratio", 1.0)
+    slow_query_log.record("SELECT * FROM orders", 5)
+    slow_query_log.record("SELECT * FROM orders", 5)
+    slow_query_log.record("SELECT * FROM customers", 8)
+
+    response = client.get("/debug/queries", params={"sort": "max_ms"})
+
+    assert response.status_code == 200
+    assert [q["fingerprint"] for q in response.json()["queries"]] == [
+        "SELECT * FROM customers",
+        "SELECT * FROM orders",
+    ]
+
+
+def test_unknown_sort_key_is_rejected(client):
+    response = client.get("/debug/queries", params={"sort": "nope"})
+
+    assert response.status_code == 400
+
+
+def test_reset_clears_stats(client, monkeypatch):
+    monkeypatch.setattr(slow_query_log, "sample_ratio", 1.0)
+    slow_query_log.record("SELECT * FROM orders", 5)
+
+    assert client.delete("/debug/queries").status_code == 204
+    assert client.get("/debug/queries").json()["queries"] == []
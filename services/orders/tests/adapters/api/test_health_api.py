@@ -1,19 +1,54 @@
 from unittest.mock import MagicMock
 
 import pytest
-from src.adapters.api.health_api import health_check
-from src.infrastructure.health.health_service import HealthService
+from fastapi import Response
+from src.adapters.api.health_api import (
+    health_check,
+    liveness_check,
+    readiness_check,
+)
+from src.infrastructure.health.health_monitor import HealthMonitor
 
 
 @pytest.fixture
-def mock_health_service():
-    return MagicMock(spec=HealthService)
+def mock_health_monitor():
+    return MagicMock(spec=HealthMonitor)
 
 
-def test_health_check(mock_health_service):
-    mock_health_service.get_health_status.return_value = {"status": "ok"}
+def test_health_check(mock_health_monitor):
+    mock_health_monitor.get_health_status.return_value = {"status": "ok"}
 
-    result = health_check(health_service=mock_health_service)
+    result = health_check(health_monitor=mock_health_monitor)
 
     assert result == {"status": "ok"}
-    mock_health_service.get_health_status.assert_called_once()
+    mock_health_monitor.get_health_status.assert_called_once()
+
+
+def test_liveness_check():
+    assert liveness_check() == {"status": "alive"}
+
+
+def test_readiness_check_ready(mock_health_monitor):
+    mock_health_monitor.is_ready.return_value = True
+    mock_health_monitor.get_health_status.return_value = {
+        "database": "healthy"
+    }
+    response = Response()
+
+    result = readiness_check(response, health_monitor=mock_health_monitor)
+
+    assert result == {"database": "healthy"}
+    assert response.status_code == 200
+
+
+def test_readiness_check_not_ready(mock_health_monitor):
+    mock_health_monitor.is_ready.return_value = False
+    mock_health_monitor.get_health_status.return_value = {
+        "database": "unhealthy"
+    }
+    response = Response()
+
+    result = readiness_check(response, health_monitor=mock_health_monitor)
+
+    assert result == {"database": "unhealthy"}
+    assert response.status_code == 503
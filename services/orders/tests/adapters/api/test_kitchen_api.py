@@ -0,0 +1,51 @@
+import json
+from datetime import datetime
+
+import pytest
+from src.adapters.api.kitchen_api import (
+    read_kitchen_queue,
+    stream_kitchen_queue,
+)
+from src.infrastructure.realtime.event_hub import EventHub
+from src.infrastructure.realtime.kitchen_queue import KitchenQueue
+
+
+def test_read_kitchen_queue_returns_snapshot():
+    kitchen_queue = KitchenQueue(EventHub())
+    kitchen_queue.load(
+        [{"id": 1, "status": "paid", "created_at": datetime(2024, 1, 1)}]
+    )
+
+    response = read_kitchen_queue(kitchen_queue=kitchen_queue)
+
+    assert json.loads(response.body) == {
+        "tickets": [
+            {
+                "order_id": 1,
+                "status": "paid",
+                "queued_at": "2024-01-01T00:00:00",
+            }
+        ]
+    }
+
+
+@pytest.mark.asyncio
+async def test_stream_kitchen_queue_sends_snapshot_then_deltas():
+    kitchen_queue = KitchenQueue(EventHub())
+    kitchen_queue.load(
+        [{"id": 1, "status": "paid", "created_at": datetime(2024, 1, 1)}]
+    )
+
+    response = await stream_kitchen_queue(kitchen_queue=kitchen_queue)
+    kitchen_queue.apply(1, "finished")
+    first = await response.body_iterator.__anext__()
+    second = await response.body_iterator.__anext__()
+    await response.body_iterator.aclose()
+
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    assert first.startswith(b"event: snapshot\n")
+    assert b'"order_id":1' in first
+    assert second == (
+        b"event: remove\n" b'data: {"type":"remove","order_id":1}\n\n'
+    )
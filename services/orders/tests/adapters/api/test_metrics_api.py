@@ -0,0 +1,11 @@
+from src.adapters.api.metrics_api import metrics
+from src.infrastructure.metrics.metrics_registry import CONTENT_TYPE, registry
+
+
+def test_metrics_renders_registry():
+    registry.counter("test_metrics_api_total", "Test counter.").inc()
+
+    response = metrics()
+
+    assert response.media_type == CONTENT_TYPE
+    assert b"test_metrics_api_total 1" in response.body
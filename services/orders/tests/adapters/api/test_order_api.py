@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
@@ -14,6 +15,7 @@ from src.domain.entities.customer_entity import CustomerEntity
 from src.domain.entities.order_entity import OrderEntity, OrderStatus
 from src.domain.entities.order_item_entity import OrderItemEntity
 from src.domain.exceptions import EntityNotFound, InvalidEntity
+from src.infrastructure.realtime.event_hub import EventHub
 
 
 @pytest.fixture
@@ -73,9 +75,13 @@ async def test_read_orders(mock_order_service, order_entity):
     mock_order_service.calculate_order_total.return_value = 100.0
 
     response = await order_api.read_orders(service=mock_order_service)
+    body = json.loads(response.body)
 
-    assert len(response.orders) == 1
-    assert response.orders[0].customer.name == "John Doe"
+    assert response.media_type == "application/json"
+    assert len(body["orders"]) == 1
+    assert body["orders"][0]["customer"]["name"] == "John Doe"
+    assert body["orders"][0]["total_amount"] == 100.0
+    assert body["pagination"]["total_records"] == 1
     mock_order_service.list_orders_paginated.assert_called_once_with(1, 10)
 
 
@@ -252,3 +258,58 @@ async def test_update_order_to_ready(mock_order_service, order_entity):
     mock_order_service.update_order_status.assert_called_once_with(
         1, OrderStatus.READY
     )
+
+
+@pytest.mark.asyncio
+async def test_stream_order_events_sends_current_status_then_changes():
+    service = MagicMock()
+    service.get_order_status.return_value = OrderStatus.PREPARING
+    event_hub = EventHub(max_queue_size=10)
+
+    response = await order_api.stream_order_events(
+        1, service=service, event_hub=event_hub
+    )
+    event_hub.publish(
+        "order:1", {"type": "status", "order_id": 1, "status": "finished"}
+    )
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert response.media_type == "text/event-stream"
+    assert chunks == [
+        b'event: status\ndata: {"type":"status","order_id":1,'
+        b'"status":"preparing"}\n\n',
+        b'event: status\ndata: {"type":"status","order_id":1,'
+        b'"status":"finished"}\n\n',
+    ]
+    assert event_hub.subscriber_count("order:1") == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_order_events_ends_for_final_orders():
+    service = MagicMock()
+    service.get_order_status.return_value = OrderStatus.CANCELED
+    event_hub = EventHub(max_queue_size=10)
+
+    response = await order_api.stream_order_events(
+        1, service=service, event_hub=event_hub
+    )
+    chunks = [chunk async for chunk in response.body_iterator]
+
+    assert len(chunks) == 1
+    assert b'"status":"canceled"' in chunks[0]
+    assert event_hub.subscriber_count("order:1") == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_order_events_not_found():
+    service = MagicMock()
+    service.get_order_status.side_effect = EntityNotFound("Order not found")
+    event_hub = EventHub(max_queue_size=10)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await order_api.stream_order_events(
+            1, service=service, event_hub=event_hub
+        )
+
+    assert exc_info.value.status_code == 404
+    assert event_hub.subscriber_count("order:1") == 0
@@ -0,0 +1,111 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.adapters.api import order_api
+from src.adapters.dependencies import get_inventory_client
+from src.domain.entities.order_entity import OrderStatus
+from src.infrastructure.persistence.db_setup import Base, get_db
+from src.infrastructure.persistence.models import (
+    CustomerModel,
+    OrderItemModel,
+    OrderModel,
+)
+from src.infrastructure.persistence.query_counter import assert_max_queries
+from src.infrastructure.persistence.sqlalchemy_order_repository import (
+    SQLAlchemyOrderRepository,
+)
+
+# Page of orders, its customers, its items and the total count
+LIST_ORDERS_BUDGET = 4
+# The order, its customer and its items
+FIND_ORDER_BUDGET = 3
+
+
+class _InventoryClient:
+    async def get_product(self, session, sku):
+        return {"name": sku, "description": "", "price": 1.0}
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(order_api.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_inventory_client] = _InventoryClient
+    return TestClient(app)
+
+
+def seed_orders(db, count):
+    for index in range(count):
+        customer = CustomerModel(
+            name=f"Customer {index}", email=f"customer{index}@example.com"
+        )
+        db.add(
+            OrderModel(
+                customer=customer,
+                status=OrderStatus.PENDING,
+                order_items=[
+                    OrderItemModel(product_sku="SKU1", quantity=1),
+                    OrderItemModel(product_sku="SKU2", quantity=2),
+                ],
+            )
+        )
+    db.commit()
+    db.expunge_all()
+
+
+@pytest.mark.parametrize("orders", [1, 20])
+def test_list_orders_stays_within_query_budget(client, db, engine, orders):
+    seed_orders(db, orders)
+
+    with assert_max_queries(engine, LIST_ORDERS_BUDGET):
+        response = client.get("/orders/?records_per_page=20")
+
+    assert response.status_code == 200
+    assert len(response.json()["orders"]) == orders
+
+
+def test_find_by_id_stays_within_query_budget(db, engine):
+    seed_orders(db, 1)
+    repository = SQLAlchemyOrderRepository(db)
+
+    with assert_max_queries(engine, FIND_ORDER_BUDGET):
+        order = repository.find_by_id(1)
+
+    assert order.customer.email == "customer0@example.com"
+    assert len(order.order_items) == 2
+
+
+def test_find_by_order_number_stays_within_query_budget(db, engine):
+    seed_orders(db, 1)
+    order_number = db.query(OrderModel.order_number).scalar()
+    db.expunge_all()
+    repository = SQLAlchemyOrderRepository(db)
+
+    with assert_max_queries(engine, FIND_ORDER_BUDGET):
+        order = repository.find_by_order_number(order_number)
+
+    assert order.customer.email == "customer0@example.com"
+    assert len(order.order_items) == 2
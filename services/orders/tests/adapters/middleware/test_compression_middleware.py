@@ -0,0 +1,118 @@
+import gzip
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from src.adapters.middleware import compression_middleware
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+
+LARGE_BODY = {"orders": [{"id": i, "status": "pending"} for i in range(200)]}
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        compress_level=6,
+        content_types=["application/json", "text/plain"],
+        brotli_enabled=False,
+    )
+
+    @app.get("/large")
+    def large():
+        return LARGE_BODY
+
+    @app.get("/small")
+    def small():
+        return {"status": "ok"}
+
+    @app.get("/html")
+    def html():
+        return PlainTextResponse("x" * 2000, media_type="text/html")
+
+    @app.get("/stream")
+    def stream():
+        chunks = (b"line %d\n" % i for i in range(500))
+        return StreamingResponse(chunks, media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(
+        response.content.decode()
+    )
+    assert response.json() == LARGE_BODY
+
+
+def test_small_body_is_not_compressed(client):
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"status": "ok"}
+
+
+def test_content_type_outside_allowlist_is_not_compressed(client):
+    response = client.get("/html", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == "x" * 2000
+
+
+@pytest.mark.parametrize("path", ["/small", "/html"])
+def test_skipped_response_creates_no_compressor(client, monkeypatch, path):
+    gzip_compressor = Mock()
+    monkeypatch.setattr(
+        compression_middleware, "_GzipCompressor", gzip_compressor
+    )
+
+    client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    gzip_compressor.assert_not_called()
+
+
+def test_client_without_gzip_gets_identity(client):
+    response = client.get(
+        "/large", headers={"Accept-Encoding": "gzip;q=0, identity"}
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.json() == LARGE_BODY
+
+
+def test_streaming_response_is_compressed_incrementally(client):
+    with client.stream(
+        "GET", "/stream", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert gzip.decompress(raw).decode().count("line") == 500
+
+
+def test_brotli_is_preferred_when_available(monkeypatch):
+    brotli = pytest.importorskip("brotli")
+    monkeypatch.setattr(compression_middleware, "brotli", brotli)
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=10, brotli_enabled=True
+    )
+    app.get("/large")(lambda: LARGE_BODY)
+
+    response = TestClient(app).get(
+        "/large", headers={"Accept-Encoding": "gzip, br"}
+    )
+
+    assert response.headers["content-encoding"] == "br"
@@ -0,0 +1,97 @@
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+from src.infrastructure.metrics.request_metrics import (
+    current_stats,
+    record_query,
+)
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(metrics):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, metrics=metrics)
+
+    @app.get("/orders/{order_id}")
+    def get_order(order_id: int):
+        record_query(0.25)
+        record_query(0.25)
+        return {"id": order_id}
+
+    @app.get("/orders/{order_id}/items")
+    async def get_items(order_id: int):
+        current_stats().add_outbound_call()
+        raise HTTPException(status_code=404)
+
+    @app.get("/health/live")
+    def live():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_request_is_labelled_by_route_template(client, metrics):
+    client.get("/orders/1")
+    client.get("/orders/2")
+
+    rendered = metrics.render()
+    assert (
+        'http_requests_total{method="GET",route="/orders/{order_id}",'
+        'status="200"} 2' in rendered
+    )
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/orders/{order_id}"} 2' in rendered
+    )
+
+
+def test_queries_made_by_sync_endpoint_are_counted(client, metrics):
+    client.get("/orders/1")
+
+    rendered = metrics.render()
+    assert (
+        'http_request_db_queries_sum{method="GET",route="/orders/{order_id}"} 2'
+        in rendered
+    )
+    assert (
+        'http_request_db_duration_seconds_sum{method="GET",'
+        'route="/orders/{order_id}"} 0.5' in rendered
+    )
+
+
+def test_outbound_calls_and_error_status_are_recorded(client, metrics):
+    client.get("/orders/1/items")
+
+    rendered = metrics.render()
+    assert (
+        'http_requests_total{method="GET",route="/orders/{order_id}/items",'
+        'status="404"} 1' in rendered
+    )
+    assert (
+        'http_request_outbound_calls_sum{method="GET",'
+        'route="/orders/{order_id}/items"} 1' in rendered
+    )
+    assert "http_requests_in_flight 0" in rendered
+
+
+def test_unknown_paths_share_one_label(client, metrics):
+    client.get("/nope/1")
+    client.get("/nope/2")
+
+    assert (
+        'http_requests_total{method="GET",route="<unmatched>",status="404"} 2'
+        in metrics.render()
+    )
+
+
+def test_probe_endpoints_are_not_recorded(client, metrics):
+    client.get("/health/live")
+
+    assert "http_requests_total{" not in metrics.render()
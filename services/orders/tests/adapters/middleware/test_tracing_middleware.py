@@ -0,0 +1,78 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
+from src.infrastructure.tracing.tracer import TRACEPARENT, SpanKind, tracer
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware)
+
+    @app.get("/orders/{order_id}")
+    def get_order(order_id: int):
+        return {"traceparent": tracer.current_traceparent()}
+
+    @app.get("/broken")
+    def broken():
+        raise RuntimeError("boom")
+
+    @app.get("/health/live")
+    def live():
+        return {"status": "ok"}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_request_continues_caller_trace(client, spans):
+    response = client.get("/orders/1", headers={TRACEPARENT: PARENT})
+
+    span = spans[0]
+    assert span.name == "GET /orders/{order_id}"
+    assert span.kind == SpanKind.SERVER
+    assert span.context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span.parent_span_id == "b7ad6b7169203331"
+    assert span.attributes["http.route"] == "/orders/{order_id}"
+    assert span.attributes["http.response.status_code"] == 200
+    assert response.json()["traceparent"] == span.context.to_traceparent()
+
+
+def test_request_without_traceparent_starts_trace(client, spans):
+    client.get("/orders/1")
+
+    assert spans[0].parent_span_id is None
+
+
+def test_unhandled_error_marks_span(client, spans):
+    response = client.get("/broken")
+
+    assert response.status_code == 500
+    assert spans[0].status_code == 2
+
+
+def test_probe_endpoints_are_not_traced(client, spans):
+    client.get("/health/live")
+
+    assert spans == []
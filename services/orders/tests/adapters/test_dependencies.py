@@ -3,23 +3,25 @@ from unittest.mock import MagicMock, patch
 import pytest
 from sqlalchemy.orm import Session
 from src.adapters.dependencies import (
+    get_health_monitor,
     get_health_service,
-    get_inventory_publisher,
+    get_event_hub,
+    get_inventory_client,
+    get_kitchen_queue,
     get_order_service,
-    get_order_update_publisher,
+    get_outbox_publisher,
 )
 from src.application.services.order_service import OrderService
+from src.infrastructure.clients.inventory_client import InventoryClient
 from src.infrastructure.health.health_service import HealthService
-from src.infrastructure.messaging.inventory_publisher import InventoryPublisher
-from src.infrastructure.messaging.order_update_publisher import (
-    OrderUpdatePublisher,
-)
+from src.infrastructure.messaging.outbox_publisher import OutboxPublisher
 from src.infrastructure.persistence.sqlalchemy_customer_repository import (
     SQLAlchemyCustomerRepository,
 )
 from src.infrastructure.persistence.sqlalchemy_order_repository import (
     SQLAlchemyOrderRepository,
 )
+from src.infrastructure.realtime.kitchen_queue import KitchenQueue
 
 
 @pytest.fixture
@@ -28,13 +30,8 @@ def mock_db_session():
 
 
 @pytest.fixture
-def mock_inventory_publisher():
-    return MagicMock(spec=InventoryPublisher)
-
-
-@pytest.fixture
-def mock_order_update_publisher():
-    return MagicMock(spec=OrderUpdatePublisher)
+def mock_outbox_publisher():
+    return MagicMock(spec=OutboxPublisher)
 
 
 def test_get_health_service(mock_db_session):
@@ -43,34 +40,45 @@ def test_get_health_service(mock_db_session):
     assert health_service.db == mock_db_session
 
 
-@patch("src.adapters.dependencies.pika.BlockingConnection")
-@patch("src.adapters.dependencies.pika.ConnectionParameters")
-def test_get_inventory_publisher(
-    mock_connection_params, mock_blocking_connection
-):
-    mock_connection_params.return_value = MagicMock()
-    mock_blocking_connection.return_value = MagicMock()
-    inventory_publisher = get_inventory_publisher()
-    assert isinstance(inventory_publisher, InventoryPublisher)
-    mock_connection_params.assert_called_once_with(
-        host="rabbitmq", heartbeat=120
-    )
-    mock_blocking_connection.assert_called_once()
+@patch("src.adapters.dependencies.SessionLocal")
+def test_get_health_monitor(mock_session_local):
+    get_health_monitor.cache_clear()
 
+    health_monitor = get_health_monitor()
 
-@patch("src.adapters.dependencies.pika.BlockingConnection")
-@patch("src.adapters.dependencies.pika.ConnectionParameters")
-def test_get_order_update_publisher(
-    mock_connection_params, mock_blocking_connection
-):
-    mock_connection_params.return_value = MagicMock()
-    mock_blocking_connection.return_value = MagicMock()
-    order_update_publisher = get_order_update_publisher()
-    assert isinstance(order_update_publisher, OrderUpdatePublisher)
-    mock_connection_params.assert_called_once_with(
-        host="rabbitmq", heartbeat=120
-    )
-    mock_blocking_connection.assert_called_once()
+    assert get_health_monitor() is health_monitor
+    assert set(health_monitor.checks) == {"database", "rabbitmq"}
+    mock_session_local.assert_called_once()
+    get_health_monitor.cache_clear()
+
+
+def test_get_inventory_client():
+    get_inventory_client.cache_clear()
+
+    inventory_client = get_inventory_client()
+
+    assert isinstance(inventory_client, InventoryClient)
+    assert get_inventory_client() is inventory_client
+    get_inventory_client.cache_clear()
+
+
+def test_get_kitchen_queue():
+    get_event_hub.cache_clear()
+    get_kitchen_queue.cache_clear()
+
+    kitchen_queue = get_kitchen_queue()
+
+    assert isinstance(kitchen_queue, KitchenQueue)
+    assert get_kitchen_queue() is kitchen_queue
+    assert kitchen_queue.event_hub is get_event_hub()
+    get_event_hub.cache_clear()
+    get_kitchen_queue.cache_clear()
+
+
+def test_get_outbox_publisher(mock_db_session):
+    outbox_publisher = get_outbox_publisher(db=mock_db_session)
+    assert isinstance(outbox_publisher, OutboxPublisher)
+    assert outbox_publisher.db == mock_db_session
 
 
 @patch("src.adapters.dependencies.SQLAlchemyOrderRepository")
@@ -79,17 +87,20 @@ def test_get_order_service(
     mock_customer_repository,
     mock_order_repository,
     mock_db_session,
-    mock_inventory_publisher,
-    mock_order_update_publisher,
+    mock_outbox_publisher,
 ):
+    mock_inventory_client = MagicMock(spec=InventoryClient)
     mock_customer_repository.return_value = MagicMock()
     mock_order_repository.return_value = MagicMock()
 
     order_service = get_order_service(
         db=mock_db_session,
-        inventory_publisher=mock_inventory_publisher,
-        order_update_publisher=mock_order_update_publisher,
+        outbox_publisher=mock_outbox_publisher,
+        inventory_client=mock_inventory_client,
     )
     assert isinstance(order_service, OrderService)
+    assert order_service.inventory_client == mock_inventory_client
+    assert order_service.inventory_publisher == mock_outbox_publisher
+    assert order_service.order_update_publisher == mock_outbox_publisher
     mock_order_repository.assert_called_once_with(mock_db_session)
     mock_customer_repository.assert_called_once_with(mock_db_session)
@@ -5,6 +5,7 @@ from src.application.dto.customer_dto import CustomerResponse
 from src.application.dto.order_dto import OrderResponse
 from src.application.dto.order_item_dto import OrderItemResponse
 from src.application.dto.serializers import (
+    order_to_dict,
     serialize_customer,
     serialize_order,
     serialize_order_item,
@@ -115,3 +116,32 @@ def test_serialize_order_empty_items():
     assert serialized_order.status == OrderStatus.PENDING
     assert serialized_order.total_amount == 0.00
     assert serialized_order.estimated_time is None
+
+
+def test_order_to_dict_matches_response_model():
+    customer = CustomerEntity(
+        id=1,
+        name="John Doe",
+        email="john.doe@example.com",
+        phone_number="+123456789",
+    )
+    order = OrderEntity(
+        id=1,
+        customer=customer,
+        order_items=[
+            OrderItemEntity(
+                product_sku="SKU123",
+                quantity=2,
+                name="Product",
+                description="Description",
+                price=20,
+            )
+        ],
+    )
+    order.estimated_time = "02:30"
+
+    result = order_to_dict(order, total_amount=40)
+
+    assert result == serialize_order(order, 40).model_dump(mode="json")
+    assert isinstance(result["total_amount"], float)
+    assert isinstance(result["order_items"][0]["price"], float)
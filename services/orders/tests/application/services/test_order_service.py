@@ -97,6 +97,7 @@ async def test_create_order_insufficient_inventory(mock_get, order_service):
     order_items = [OrderItemEntity(product_sku="SKU123", quantity=10)]
 
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"quantity": 5}
     )
@@ -119,6 +120,7 @@ async def test_update_order_insufficient_inventory(mock_get, order_service):
     )
 
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"quantity": 5}
     )
@@ -141,6 +143,7 @@ async def test_calculate_order_total(mock_get, order_service):
     )
 
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"price": 10.0}
     )
@@ -198,6 +201,7 @@ def order_service(
 async def test_create_order_new_customer(mock_get, order_service):
     # Mocking the external inventory service response
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"quantity": 10, "price": 15.0}
     )
@@ -232,6 +236,7 @@ async def test_create_order_new_customer(mock_get, order_service):
 async def test_create_order_existing_customer(mock_get, order_service):
     # Mocking the external inventory service response
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"quantity": 10, "price": 15.0}
     )
@@ -293,6 +298,21 @@ async def test_get_order_by_id_not_found(order_service, mock_order_repository):
     mock_order_repository.find_by_id.assert_called_once_with(1)
 
 
+def test_get_order_status(order_service, mock_order_repository):
+    mock_order_repository.find_status.return_value = OrderStatus.PREPARING
+
+    assert order_service.get_order_status(1) == OrderStatus.PREPARING
+    mock_order_repository.find_status.assert_called_once_with(1)
+    mock_order_repository.find_by_id.assert_not_called()
+
+
+def test_get_order_status_not_found(order_service, mock_order_repository):
+    mock_order_repository.find_status.return_value = None
+
+    with pytest.raises(EntityNotFound):
+        order_service.get_order_status(1)
+
+
 @pytest.mark.asyncio
 async def test_update_order_status(order_service, mock_order_repository):
     customer = CustomerEntity(
@@ -340,6 +360,7 @@ async def test_confirm_order_invalid_status(
 async def test_cancel_order(mock_get, order_service):
     # Mocking the external inventory service response
     mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
     mock_get.return_value.__aenter__.return_value.json = AsyncMock(
         return_value={"quantity": 10}
     )
@@ -382,6 +403,9 @@ async def test_delete_order(order_service, mock_order_repository):
 
     mock_order_repository.find_by_id.assert_called_once_with(1)
     mock_order_repository.delete.assert_called_once_with(order)
+    order_service.order_update_publisher.publish_order_update.assert_called_once_with(
+        order_id=1, amount=0.0, status="deleted", created_at=None
+    )
     assert result == order
 
 
@@ -501,3 +525,119 @@ async def test_delete_customer_not_found(
     mock_customer_repository.find_by_email.assert_called_once_with(
         "jane@example.com"
     )
+
+
+@pytest.mark.asyncio
+@patch("src.application.services.order_service.aiohttp.ClientSession")
+async def test_calculate_order_total_reuses_injected_http_session(
+    mock_client_session,
+    mock_order_repository,
+    mock_customer_repository,
+    mock_inventory_publisher,
+    mock_order_update_publisher,
+):
+    http_session = MagicMock()
+    http_session.get.return_value.__aenter__.return_value.status = 200
+    http_session.get.return_value.__aenter__.return_value.headers = {}
+    http_session.get.return_value.__aenter__.return_value.json = AsyncMock(
+        return_value={"price": 10.0}
+    )
+    service = OrderService(
+        order_repository=mock_order_repository,
+        customer_repository=mock_customer_repository,
+        inventory_publisher=mock_inventory_publisher,
+        order_update_publisher=mock_order_update_publisher,
+        http_session=http_session,
+    )
+    customer = CustomerEntity(
+        name="John Doe",
+        email="john.doe@example.com",
+        phone_number="+123456789",
+    )
+    order = OrderEntity(
+        id=1,
+        customer=customer,
+        order_items=[OrderItemEntity(product_sku="SKU123", quantity=2)],
+    )
+
+    total = await service.calculate_order_total(order)
+
+    assert total == 20.0
+    mock_client_session.assert_not_called()
+    http_session.get.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("src.application.services.order_service.aiohttp.ClientSession.get")
+async def test_update_order_status_stages_event_before_save(
+    mock_get, order_service
+):
+    mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
+    mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+        return_value={"price": 5.0}
+    )
+    customer = CustomerEntity(
+        id=1,
+        name="John Doe",
+        email="john@example.com",
+        phone_number="+123456789",
+    )
+    order = OrderEntity(
+        id=1,
+        customer=customer,
+        order_items=[OrderItemEntity(product_sku="SKU123", quantity=2)],
+        status=OrderStatus.CONFIRMED,
+    )
+    calls = []
+    order_service.order_repository.find_by_id = MagicMock(return_value=order)
+    order_service.order_repository.save = MagicMock(
+        side_effect=lambda _: calls.append("save")
+    )
+    order_service.order_update_publisher.publish_order_update.side_effect = (
+        lambda **_: calls.append("publish")
+    )
+
+    await order_service.update_order_status(1, OrderStatus.PAID)
+
+    # The event must be staged before the commit that persists it
+    assert calls == ["publish", "save"]
+    order_service.order_update_publisher.publish_order_update.assert_called_once_with(
+        order_id=1,
+        amount=10.0,
+        status=OrderStatus.PAID.value,
+        created_at=None,
+    )
+
+
+@pytest.mark.asyncio
+@patch("src.application.services.order_service.aiohttp.ClientSession.get")
+async def test_create_order_failed_save_does_not_compensate(
+    mock_get, order_service
+):
+    mock_get.return_value.__aenter__.return_value.status = 200
+    mock_get.return_value.__aenter__.return_value.headers = {}
+    mock_get.return_value.__aenter__.return_value.json = AsyncMock(
+        return_value={"quantity": 10, "price": 5.0}
+    )
+    customer = CustomerEntity(
+        name="John Doe",
+        email="john@example.com",
+        phone_number="+123456789",
+    )
+    order_service.customer_repository.find_by_email = MagicMock(
+        return_value=customer
+    )
+    order_service.order_repository.save = MagicMock(
+        side_effect=Exception("database unavailable")
+    )
+
+    with pytest.raises(Exception, match="database unavailable"):
+        await order_service.create_order(
+            customer, [OrderItemEntity(product_sku="SKU123", quantity=2)]
+        )
+
+    # The staged subtract is rolled back with the order, so no "add" event
+    order_service.inventory_publisher.publish_inventory_update.assert_called_once_with(
+        "SKU123", "subtract", 2
+    )
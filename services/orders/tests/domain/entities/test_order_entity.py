@@ -1,5 +1,5 @@
 import math
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from src.domain.entities.customer_entity import CustomerEntity
@@ -214,3 +214,52 @@ def test_validate_estimated_time_invalid():
     )
     with pytest.raises(InvalidEntity):
         order.estimated_time = 12345
+
+
+def test_from_trusted_row_builds_entity_without_validation():
+    customer = CustomerEntity.from_trusted_row(
+        name="John Doe", email="john@example.com", id=1
+    )
+    item = OrderItemEntity.from_trusted_row(
+        product_sku="SKU1", quantity=2, price=10.0, id=1
+    )
+
+    order = OrderEntity.from_trusted_row(
+        customer=customer,
+        order_items=[item],
+        status=OrderStatus.PAID,
+        id=1,
+        order_number="ORD-1",
+        total_amount=20.0,
+    )
+
+    assert (
+        order.to_dict()
+        == OrderEntity(
+            customer=CustomerEntity(
+                name="John Doe", email="john@example.com", id=1
+            ),
+            order_items=[
+                OrderItemEntity(
+                    product_sku="SKU1", quantity=2, price=10.0, id=1
+                )
+            ],
+            status=OrderStatus.PAID,
+            id=1,
+            order_number="ORD-1",
+            total_amount=20.0,
+        ).to_dict()
+    )
+    with patch.object(OrderEntity, "_validate_order_items") as validate:
+        OrderEntity.from_trusted_row(customer=customer, order_items=[item])
+    validate.assert_not_called()
+
+
+def test_entities_use_slots():
+    order = OrderEntity(
+        customer=MagicMock(spec=CustomerEntity), order_items=[]
+    )
+
+    assert not hasattr(order, "__dict__")
+    with pytest.raises(AttributeError):
+        order.unexpected = True
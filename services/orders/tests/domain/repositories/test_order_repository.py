@@ -28,3 +28,13 @@ def test_order_repository_has_delete_method():
 def test_order_repository_has_list_all_method():
     assert hasattr(OrderRepository, "list_all")
     assert callable(getattr(OrderRepository, "list_all"))
+
+
+def test_order_repository_has_list_status_rows_method():
+    assert hasattr(OrderRepository, "list_status_rows")
+    assert callable(getattr(OrderRepository, "list_status_rows"))
+
+
+def test_order_repository_has_find_status_method():
+    assert hasattr(OrderRepository, "find_status")
+    assert callable(getattr(OrderRepository, "find_status"))
@@ -0,0 +1,103 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.infrastructure.clients.inventory_client import InventoryClient
+
+
+def make_response(status, body=None, etag=None):
+    response = MagicMock()
+    response.status = status
+    response.json = AsyncMock(return_value=body)
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+def make_session(*responses):
+    session = MagicMock()
+    session.get.return_value.__aenter__ = AsyncMock(side_effect=responses)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+@pytest.mark.asyncio
+async def test_get_product_revalidates_cached_product():
+    product = {"sku": "SKU1", "quantity": 5}
+    session = make_session(
+        make_response(200, product, etag='"abc"'),
+        make_response(304),
+    )
+    client = InventoryClient(cache_size=10)
+
+    assert await client.get_product(session, "SKU1") == product
+    assert await client.get_product(session, "SKU1") == product
+
+    first, second = session.get.call_args_list
+    assert first.kwargs["headers"] == {}
+    assert second.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert client.requests.get(outcome="not_modified") >= 1
+
+
+@pytest.mark.asyncio
+async def test_get_product_not_found_returns_none_and_invalidates():
+    session = make_session(
+        make_response(200, {"sku": "SKU1"}, etag='"abc"'),
+        make_response(404, {"detail": "Not found"}),
+        make_response(200, {"sku": "SKU1"}, etag='"def"'),
+    )
+    client = InventoryClient(cache_size=10)
+
+    await client.get_product(session, "SKU1")
+    assert await client.get_product(session, "SKU1") is None
+    await client.get_product(session, "SKU1")
+
+    assert session.get.call_args_list[2].kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_get_product_without_etag_is_not_cached():
+    session = make_session(
+        make_response(200, {"sku": "SKU1"}),
+        make_response(200, {"sku": "SKU1"}),
+    )
+    client = InventoryClient(cache_size=10)
+
+    await client.get_product(session, "SKU1")
+    await client.get_product(session, "SKU1")
+
+    assert session.get.call_args_list[1].kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_product():
+    session = make_session(
+        make_response(200, {"sku": "SKU1"}, etag='"1"'),
+        make_response(200, {"sku": "SKU2"}, etag='"2"'),
+        make_response(200, {"sku": "SKU1"}, etag='"1"'),
+    )
+    client = InventoryClient(cache_size=1)
+
+    await client.get_product(session, "SKU1")
+    await client.get_product(session, "SKU2")
+    await client.get_product(session, "SKU1")
+
+    assert session.get.call_args_list[2].kwargs["headers"] == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_request():
+    async def slow_enter(*args):
+        await asyncio.sleep(0.01)
+        return make_response(200, {"sku": "SKU1"}, etag='"1"')
+
+    session = MagicMock()
+    session.get.return_value.__aenter__ = AsyncMock(side_effect=slow_enter)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+    client = InventoryClient(cache_size=10)
+
+    results = await asyncio.gather(
+        *(client.get_product(session, "SKU1") for _ in range(3))
+    )
+
+    assert results == [{"sku": "SKU1"}] * 3
+    session.get.assert_called_once()
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from src.infrastructure.concurrency.single_flight import AsyncSingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_fetch():
+    single_flight = AsyncSingleFlight("test_share")
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", fetch) for _ in range(5))
+    )
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+    assert single_flight.calls.get(name="test_share", result="shared") == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_exception():
+    single_flight = AsyncSingleFlight("test_error")
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(single_flight.do("key", fetch) for _ in range(2)),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_fetch_again():
+    single_flight = AsyncSingleFlight("test_sequential")
+    values = iter(["first", "second"])
+
+    async def fetch():
+        return next(values)
+
+    assert await single_flight.do("key", fetch) == "first"
+    assert await single_flight.do("key", fetch) == "second"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch():
+    single_flight = AsyncSingleFlight("test_cancel")
+
+    async def fetch():
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first = asyncio.create_task(single_flight.do("key", fetch))
+    second = asyncio.create_task(single_flight.do("key", fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
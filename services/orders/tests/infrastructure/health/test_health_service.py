@@ -11,6 +11,7 @@ def test_check_database_success():
     # Ensure check_database returns True when the query succeeds
     assert health_service.check_database() is True
     mock_db.execute.assert_called_once()
+    mock_db.close.assert_called_once()
 
 
 def test_check_database_failure():
@@ -31,10 +32,12 @@ def test_check_rabbitmq_success(mock_blocking_connection):
     mock_blocking_connection.return_value = mock_connection
     health_service = HealthService(db=MagicMock(), rabbitmq_host="localhost")
 
-    # Ensure check_rabbitmq returns True when the connection succeeds
+    # Ensure check_rabbitmq returns True and reuses the open connection
+    assert health_service.check_rabbitmq() is True
     assert health_service.check_rabbitmq() is True
     mock_blocking_connection.assert_called_once()
-    mock_connection.close.assert_called_once()
+    assert mock_connection.process_data_events.call_count == 2
+    mock_connection.close.assert_not_called()
 
 
 @patch("src.infrastructure.health.health_service.pika.BlockingConnection")
@@ -46,6 +49,7 @@ def test_check_rabbitmq_failure(mock_blocking_connection):
     # Ensure check_rabbitmq returns False when the connection fails
     assert health_service.check_rabbitmq() is False
     mock_blocking_connection.assert_called_once()
+    assert health_service.rabbitmq_connection is None
 
 
 @patch.object(HealthService, "check_database", return_value=True)
@@ -4,6 +4,32 @@ from unittest.mock import MagicMock, patch
 import pika
 import pytest
 from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+from src.infrastructure.tracing.tracer import (
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    tracer,
+)
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_init_does_not_connect(mock_blocking_connection):
+    adapter = BaseMessagingAdapter(MagicMock())
+
+    mock_blocking_connection.assert_not_called()
+    assert adapter.connection is None
+    assert adapter.channel is None
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_ensure_connected_skips_open_channel(mock_blocking_connection):
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.channel = MagicMock()
+
+    adapter.ensure_connected()
+
+    mock_blocking_connection.assert_not_called()
 
 
 @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
@@ -16,6 +42,7 @@ def test_connect_success(mock_sleep, mock_blocking_connection):
 
     connection_params = MagicMock()
     adapter = BaseMessagingAdapter(connection_params)
+    adapter.connect()
 
     mock_blocking_connection.assert_called_once_with(connection_params)
     assert adapter.connection == mock_connection
@@ -30,7 +57,9 @@ def test_connect_failure_retries(mock_sleep, mock_blocking_connection):
 
     connection_params = MagicMock()
     with pytest.raises(pika.exceptions.AMQPConnectionError):
-        BaseMessagingAdapter(connection_params, max_retries=3, delay=1)
+        BaseMessagingAdapter(
+            connection_params, max_retries=3, delay=1
+        ).connect()
 
     assert mock_blocking_connection.call_count == 3
     assert (
@@ -47,7 +76,9 @@ def test_connect_failure_due_to_socket_error(
 
     connection_params = MagicMock()
     with pytest.raises(pika.exceptions.AMQPConnectionError):
-        BaseMessagingAdapter(connection_params, max_retries=3, delay=1)
+        BaseMessagingAdapter(
+            connection_params, max_retries=3, delay=1
+        ).connect()
 
     assert mock_blocking_connection.call_count == 3
     assert (
@@ -64,7 +95,9 @@ def test_connect_failure_exceeds_max_retries(
 
     connection_params = MagicMock()
     with pytest.raises(pika.exceptions.AMQPConnectionError):
-        BaseMessagingAdapter(connection_params, max_retries=5, delay=1)
+        BaseMessagingAdapter(
+            connection_params, max_retries=5, delay=1
+        ).connect()
 
     assert mock_blocking_connection.call_count == 5
     assert (
@@ -81,6 +114,7 @@ def test_connect_sets_channel_and_connection(mock_blocking_connection):
 
     connection_params = MagicMock()
     adapter = BaseMessagingAdapter(connection_params)
+    adapter.connect()
 
     assert adapter.connection == mock_connection
     assert adapter.channel == mock_channel
@@ -101,7 +135,151 @@ def test_connect_raises_exception_after_retries(
         pika.exceptions.AMQPConnectionError,
         match="Failed to connect to RabbitMQ after multiple attempts.",
     ):
-        BaseMessagingAdapter(connection_params, max_retries=3, delay=1)
+        BaseMessagingAdapter(
+            connection_params, max_retries=3, delay=1
+        ).connect()
 
     assert mock_blocking_connection.call_count == 3
     assert mock_sleep.call_count == 3
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_sends_buffered_message_in_background(
+    mock_blocking_connection,
+):
+    mock_channel = MagicMock()
+    mock_channel.is_closed = False
+    mock_blocking_connection.return_value.channel.return_value = mock_channel
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.exchange_name = "test_exchange"
+    properties = pika.BasicProperties(message_id="abc")
+
+    assert adapter.publish("test_queue", "body", properties) is True
+    adapter.close()
+
+    mock_channel.basic_publish.assert_called_once_with(
+        exchange="test_exchange",
+        routing_key="test_queue",
+        body="body",
+        properties=properties,
+    )
+    assert adapter.pending_messages() == 0
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_returns_immediately_when_broker_is_down(
+    mock_blocking_connection,
+):
+    mock_blocking_connection.side_effect = pika.exceptions.AMQPConnectionError
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    adapter = BaseMessagingAdapter(MagicMock(), circuit_breaker=breaker)
+
+    assert adapter.publish("test_queue", "body") is True
+    adapter.close(timeout=1)
+
+    assert mock_blocking_connection.call_count == 1
+    assert breaker.state == CircuitBreaker.OPEN
+    assert adapter.pending_messages() == 1
+
+
+def test_publish_drops_message_when_buffer_is_full():
+    adapter = BaseMessagingAdapter(
+        MagicMock(),
+        buffer_size=1,
+        circuit_breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60),
+    )
+    adapter.exchange_name = "full_exchange"
+    adapter._start_publisher = MagicMock()
+
+    assert adapter.publish("test_queue", "first") is True
+    assert adapter.publish("test_queue", "second") is False
+    assert adapter.dropped_messages.get(exchange="full_exchange") == 1
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_propagates_trace_context(mock_blocking_connection):
+    mock_channel = MagicMock()
+    mock_channel.is_closed = False
+    mock_blocking_connection.return_value.channel.return_value = mock_channel
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.exchange_name = "test_exchange"
+
+    with tracer.span("request") as request_span:
+        adapter.publish("test_queue", "body")
+    adapter.close()
+
+    properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+    context = SpanContext.from_traceparent(properties.headers["traceparent"])
+    assert context.trace_id == request_span.context.trace_id
+    assert context.span_id != request_span.context.span_id
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_span_ends_when_message_is_sent(
+    mock_blocking_connection, spans
+):
+    mock_channel = MagicMock()
+    mock_channel.is_closed = False
+    mock_blocking_connection.return_value.channel.return_value = mock_channel
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.exchange_name = "test_exchange"
+
+    adapter.publish("test_queue", "body")
+    adapter.close()
+
+    properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+    context = SpanContext.from_traceparent(properties.headers["traceparent"])
+    assert [span.name for span in spans] == ["test_exchange publish"]
+    assert spans[0].kind == SpanKind.PRODUCER
+    assert spans[0].context.span_id == context.span_id
+    assert spans[0].status_code == StatusCode.UNSET
+
+
+def test_publish_span_records_full_buffer(spans):
+    adapter = BaseMessagingAdapter(MagicMock(), buffer_size=1)
+    adapter.exchange_name = "full_exchange"
+    adapter._start_publisher = MagicMock()
+
+    adapter.publish("test_queue", "first")
+    adapter.publish("test_queue", "second")
+
+    assert len(spans) == 1
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].status_message == "publish buffer full"
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_span_records_unsent_message_on_close(
+    mock_blocking_connection, spans
+):
+    mock_blocking_connection.side_effect = pika.exceptions.AMQPConnectionError
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    adapter = BaseMessagingAdapter(MagicMock(), circuit_breaker=breaker)
+    adapter.exchange_name = "test_exchange"
+
+    adapter.publish("test_queue", "body")
+    adapter.close(timeout=1)
+
+    assert len(spans) == 1
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].status_message == "publisher closed"
+    assert spans[0].events[0]["name"] == "exception"
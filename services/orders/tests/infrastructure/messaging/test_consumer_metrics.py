@@ -0,0 +1,95 @@
+from unittest.mock import MagicMock
+
+import pytest
+from src.infrastructure.messaging.consumer_metrics import (
+    ConsumerMetrics,
+    instrument_consumer,
+)
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+@pytest.fixture
+def consumer_metrics():
+    return ConsumerMetrics("test_queue", MetricsRegistry())
+
+
+def test_track_records_message(consumer_metrics):
+    with consumer_metrics.track(MagicMock(redelivered=False)):
+        assert consumer_metrics.in_flight.get(queue="test_queue") == 1
+
+    assert consumer_metrics.in_flight.get(queue="test_queue") == 0
+    assert consumer_metrics.consumed.get(queue="test_queue") == 1
+    assert consumer_metrics.redeliveries.get(queue="test_queue") == 0
+    assert consumer_metrics.handler_duration.get_count(queue="test_queue") == 1
+
+
+def test_track_counts_redeliveries(consumer_metrics):
+    with consumer_metrics.track(MagicMock(redelivered=True)):
+        pass
+
+    assert consumer_metrics.redeliveries.get(queue="test_queue") == 1
+
+
+def test_track_records_failed_handler(consumer_metrics):
+    with pytest.raises(ValueError):
+        with consumer_metrics.track(MagicMock(redelivered=False)):
+            raise ValueError
+
+    assert consumer_metrics.in_flight.get(queue="test_queue") == 0
+    assert consumer_metrics.consumed.get(queue="test_queue") == 1
+
+
+def test_sample_uses_passive_declare(consumer_metrics):
+    channel = MagicMock()
+    channel.queue_declare.return_value.method.message_count = 42
+    channel.queue_declare.return_value.method.consumer_count = 2
+
+    consumer_metrics.sample(channel)
+
+    channel.queue_declare.assert_called_once_with(
+        queue="test_queue", passive=True
+    )
+    assert consumer_metrics.queue_depth.get(queue="test_queue") == 42
+    assert consumer_metrics.queue_consumers.get(queue="test_queue") == 2
+
+
+def test_sample_computes_consume_rate(consumer_metrics):
+    channel = MagicMock()
+    channel.queue_declare.return_value.method.message_count = 0
+    channel.queue_declare.return_value.method.consumer_count = 1
+    consumer_metrics._last_sample_time -= 2
+    consumer_metrics.consumed.inc(10, queue="test_queue")
+
+    consumer_metrics.sample(channel)
+
+    rate = consumer_metrics.consume_rate.get(queue="test_queue")
+    assert 4 < rate <= 5
+
+
+def test_schedule_sampling_reschedules_after_failure(consumer_metrics):
+    connection = MagicMock()
+    channel = MagicMock()
+    channel.queue_declare.side_effect = Exception("channel closed")
+
+    consumer_metrics.schedule_sampling(connection, channel, interval=5)
+    interval, sample = connection.call_later.call_args[0]
+    sample()
+
+    assert interval == 5
+    assert connection.call_later.call_count == 2
+
+
+def test_instrument_consumer_wraps_handler():
+    calls = []
+
+    class Subscriber:
+        @instrument_consumer("instrumented_queue")
+        def on_message(self, ch, method, properties, body):
+            calls.append(body)
+
+    subscriber = Subscriber()
+    subscriber.on_message(MagicMock(), MagicMock(), MagicMock(), b"{}")
+
+    assert calls == [b"{}"]
+    metrics = Subscriber.on_message.consumer_metrics
+    assert metrics.consumed.get(queue="instrumented_queue") == 1
@@ -18,7 +18,26 @@ def test_delivery_subscriber_initialization(mock_connect):
     )
 
     assert subscriber.order_service == mock_order_service
+    mock_connect.assert_not_called()
+
+
+@patch(
+    "src.infrastructure.messaging.delivery_subscriber.BaseMessagingAdapter.connect"
+)
+def test_start_consuming_connects_lazily(mock_connect):
+    subscriber = DeliverySubscriber(
+        order_service=MagicMock(), connection_params=MagicMock()
+    )
+
+    def connect():
+        subscriber.channel = MagicMock()
+
+    mock_connect.side_effect = connect
+
+    subscriber.start_consuming()
+
     mock_connect.assert_called_once()
+    subscriber.channel.start_consuming.assert_called_once()
 
 
 @patch(
@@ -39,9 +58,12 @@ def test_start_consuming(mock_connect):
     subscriber.channel.exchange_declare.assert_called_once_with(
         exchange="delivery_exchange", exchange_type="topic", durable=True
     )
-    subscriber.channel.queue_declare.assert_called_once_with(
+    subscriber.channel.queue_declare.assert_any_call(
         queue="delivery_queue", durable=True
     )
+    subscriber.channel.queue_declare.assert_any_call(
+        queue="delivery_queue.dlq", durable=True
+    )
     subscriber.channel.queue_bind.assert_called_once_with(
         exchange="delivery_exchange",
         queue="delivery_queue",
@@ -131,6 +153,66 @@ def test_on_message_exception(mock_connect):
     body = b"invalid json"
     subscriber.on_message(ch_mock, method_mock, properties_mock, body)
 
+    ch_mock.basic_publish.assert_called_once()
+    assert (
+        ch_mock.basic_publish.call_args.kwargs["routing_key"]
+        == "delivery_queue.retry.1000ms"
+    )
+    ch_mock.basic_ack.assert_called_once_with(
+        delivery_tag=method_mock.delivery_tag
+    )
+
+
+@patch(
+    "src.infrastructure.messaging.delivery_subscriber.BaseMessagingAdapter.connect"
+)
+@patch("src.infrastructure.messaging.delivery_subscriber.asyncio.run")
+def test_on_message_uses_event_loop_bridge(mock_asyncio_run, mock_connect):
+    mock_order_service = MagicMock()
+    mock_event_loop_bridge = MagicMock()
+
+    subscriber = DeliverySubscriber(
+        order_service=mock_order_service,
+        connection_params=MagicMock(),
+        event_loop_bridge=mock_event_loop_bridge,
+    )
+
+    ch_mock = MagicMock()
+    method_mock = MagicMock()
+
+    body = json.dumps({"order_id": 1, "status": "delivered"}).encode("utf-8")
+    subscriber.on_message(ch_mock, method_mock, MagicMock(), body)
+
+    mock_asyncio_run.assert_not_called()
+    mock_event_loop_bridge.run.assert_called_once_with(
+        mock_order_service.update_order_status(1, OrderStatus.FINISHED)
+    )
+    ch_mock.basic_ack.assert_called_once_with(
+        delivery_tag=method_mock.delivery_tag
+    )
+
+
+@patch(
+    "src.infrastructure.messaging.delivery_subscriber.BaseMessagingAdapter.connect"
+)
+@patch("src.infrastructure.messaging.delivery_subscriber.asyncio.run")
+def test_on_message_skips_duplicate(mock_asyncio_run, mock_connect):
+    mock_deduplicator = MagicMock()
+    mock_deduplicator.is_duplicate.return_value = True
+
+    subscriber = DeliverySubscriber(
+        order_service=MagicMock(),
+        connection_params=MagicMock(),
+        deduplicator=mock_deduplicator,
+    )
+
+    ch_mock = MagicMock()
+    method_mock = MagicMock()
+
+    body = json.dumps({"order_id": 1, "status": "delivered"}).encode("utf-8")
+    subscriber.on_message(ch_mock, method_mock, MagicMock(), body)
+
+    mock_asyncio_run.assert_not_called()
     ch_mock.basic_ack.assert_called_once_with(
         delivery_tag=method_mock.delivery_tag
     )
@@ -0,0 +1,74 @@
+import asyncio
+import concurrent.futures
+import threading
+
+import aiohttp
+import pytest
+from src.infrastructure.messaging.event_loop_bridge import EventLoopBridge
+
+
+@pytest.fixture
+def bridge():
+    event_loop_bridge = EventLoopBridge(timeout=1)
+    event_loop_bridge.start()
+    yield event_loop_bridge
+    event_loop_bridge.stop()
+
+
+def test_start_creates_shared_http_session(bridge):
+    assert isinstance(bridge.http_session, aiohttp.ClientSession)
+    assert not bridge.http_session.closed
+
+
+def test_run_returns_coroutine_result(bridge):
+    async def add(a, b):
+        return a + b
+
+    assert bridge.run(add(1, 2)) == 3
+
+
+def test_run_reuses_the_same_loop_thread(bridge):
+    async def current_thread():
+        return threading.current_thread().name, asyncio.get_running_loop()
+
+    first = bridge.run(current_thread())
+    second = bridge.run(current_thread())
+
+    assert first == second
+    assert first[0] == "event-loop-bridge"
+    assert first[1] is bridge.loop
+
+
+def test_run_propagates_exceptions(bridge):
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        bridge.run(fail())
+
+
+def test_run_timeout_cancels_coroutine(bridge):
+    canceled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            canceled.set()
+            raise
+
+    with pytest.raises(concurrent.futures.TimeoutError):
+        bridge.run(slow(), timeout=0.05)
+
+    assert canceled.wait(1)
+
+
+def test_stop_closes_http_session_and_loop():
+    event_loop_bridge = EventLoopBridge(timeout=1)
+    event_loop_bridge.start()
+    http_session = event_loop_bridge.http_session
+
+    event_loop_bridge.stop()
+
+    assert http_session.closed
+    assert event_loop_bridge.loop.is_closed()
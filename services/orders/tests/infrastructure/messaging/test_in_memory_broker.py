@@ -0,0 +1,119 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pika
+from src.infrastructure.messaging.in_memory_broker import InMemoryBroker
+from src.infrastructure.messaging.payment_subscriber import PaymentSubscriber
+
+
+def test_publish_routes_to_bound_queues():
+    broker = InMemoryBroker()
+    broker.bind("payment_exchange", "payment_queue", "payment_queue")
+
+    broker.publish("payment_exchange", "payment_queue", "{}")
+    broker.publish("payment_exchange", "other_queue", "{}")
+
+    assert broker.message_count("payment_queue") == 1
+    assert broker.message_count("other_queue") == 0
+
+
+def test_default_exchange_routes_by_queue_name():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+
+    channel.basic_publish(exchange="", routing_key="retry_queue", body="{}")
+
+    assert channel.queue_declare("retry_queue").method.message_count == 1
+
+
+def test_queue_declare_names_exclusive_queues():
+    channel = InMemoryBroker().connection().channel()
+
+    result = channel.queue_declare(queue="", exclusive=True)
+
+    assert result.method.queue.startswith("amq.gen-")
+
+
+def test_start_consuming_drains_queue_and_returns():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    channel.queue_declare("payment_queue")
+    for i in range(3):
+        channel.basic_publish("", "payment_queue", json.dumps({"i": i}))
+    received = []
+
+    def on_message(ch, method, properties, body):
+        received.append(json.loads(body))
+        ch.basic_ack(delivery_tag=method.delivery_tag)
+
+    channel.basic_consume(
+        queue="payment_queue", on_message_callback=on_message
+    )
+    channel.start_consuming()
+
+    assert received == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert broker.acked == 3
+    assert broker.message_count("payment_queue") == 0
+
+
+def test_multiple_ack_settles_earlier_deliveries():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    for _ in range(3):
+        channel.basic_publish("", "payment_queue", "{}")
+    tags = []
+    channel.basic_consume(
+        queue="payment_queue",
+        on_message_callback=lambda ch, method, p, b: tags.append(
+            method.delivery_tag
+        ),
+    )
+    channel.start_consuming()
+
+    channel.basic_ack(delivery_tag=tags[-1], multiple=True)
+
+    assert broker.acked == 3
+
+
+def test_nack_requeues_as_redelivered():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    channel.basic_publish("", "payment_queue", "{}")
+
+    method, _, _ = channel.basic_get("payment_queue")
+    channel.basic_nack(delivery_tag=method.delivery_tag)
+    method, _, body = channel.basic_get("payment_queue")
+
+    assert method.redelivered is True
+    assert body == b"{}"
+    assert broker.nacked == 1
+
+
+def test_connection_runs_due_timers_unless_removed():
+    connection = InMemoryBroker().connection()
+    fired = []
+    connection.call_later(0, lambda: fired.append("due"))
+    removed = connection.call_later(0, lambda: fired.append("removed"))
+    connection.call_later(60, lambda: fired.append("later"))
+
+    connection.remove_timeout(removed)
+    connection.process_data_events()
+
+    assert fired == ["due"]
+
+
+def test_payment_subscriber_consumes_through_broker():
+    broker = InMemoryBroker()
+    order_service = MagicMock()
+    order_service.set_paid_order = AsyncMock()
+    subscriber = PaymentSubscriber(order_service, MagicMock())
+    subscriber.connection = broker.connection()
+    subscriber.channel = subscriber.connection.channel()
+    body = json.dumps({"order_id": 7, "status": "completed"})
+    properties = pika.BasicProperties(message_id="m-1")
+
+    subscriber.channel.basic_publish("", "payment_queue", body, properties)
+    subscriber.start_consuming()
+
+    order_service.set_paid_order.assert_awaited_once_with(7)
+    assert broker.acked == 1
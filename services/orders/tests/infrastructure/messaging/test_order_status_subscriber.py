@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock, call
+
+from src.infrastructure.messaging.order_status_subscriber import (
+    OrderStatusSubscriber,
+)
+
+
+def test_start_consuming_binds_exclusive_queue():
+    subscriber = OrderStatusSubscriber(MagicMock(), MagicMock(), MagicMock())
+    subscriber.channel = MagicMock()
+    subscriber.channel.queue_declare.return_value.method.queue = "amq.gen-1"
+
+    subscriber.start_consuming()
+
+    subscriber.channel.queue_declare.assert_called_once_with(
+        queue="", exclusive=True
+    )
+    subscriber.channel.queue_bind.assert_called_once_with(
+        exchange="orders_exchange",
+        queue="amq.gen-1",
+        routing_key="orders_queue",
+    )
+    subscriber.channel.basic_consume.assert_called_once_with(
+        queue="amq.gen-1",
+        on_message_callback=subscriber.on_message,
+        auto_ack=True,
+    )
+    subscriber.channel.start_consuming.assert_called_once()
+
+
+def test_start_consuming_loads_snapshot_after_binding_queue():
+    kitchen_queue = MagicMock()
+    rows = [{"id": 1, "status": "paid", "created_at": None}]
+    subscriber = OrderStatusSubscriber(
+        kitchen_queue, MagicMock(), MagicMock(), load_snapshot=lambda: rows
+    )
+    subscriber.channel = MagicMock()
+    kitchen_queue.load.side_effect = lambda _: subscriber.channel.loaded()
+
+    subscriber.start_consuming()
+
+    kitchen_queue.load.assert_called_once_with(rows)
+    names = [name for name, _, _ in subscriber.channel.mock_calls]
+    assert (
+        names.index("queue_bind")
+        < names.index("loaded")
+        < names.index("basic_consume")
+    )
+
+
+def test_on_message_updates_kitchen_queue_and_order_stream():
+    kitchen_queue = MagicMock()
+    event_hub = MagicMock()
+    subscriber = OrderStatusSubscriber(kitchen_queue, event_hub, MagicMock())
+    body = json.dumps({"order_id": 1, "amount": 10.0, "status": "paid"})
+
+    subscriber.on_message(MagicMock(), MagicMock(), MagicMock(), body.encode())
+
+    kitchen_queue.apply.assert_called_once_with(1, "paid", None)
+    event_hub.publish.assert_called_once_with(
+        "order:1", {"type": "status", "order_id": 1, "status": "paid"}
+    )
+
+
+def test_on_message_passes_order_creation_time():
+    kitchen_queue = MagicMock()
+    subscriber = OrderStatusSubscriber(kitchen_queue, MagicMock(), MagicMock())
+    body = json.dumps(
+        {"order_id": 1, "status": "paid", "created_at": "2024-01-01T12:00:00"}
+    )
+
+    subscriber.on_message(MagicMock(), MagicMock(), MagicMock(), body.encode())
+
+    assert kitchen_queue.apply.call_args == call(
+        1, "paid", datetime(2024, 1, 1, 12, 0)
+    )
+
+
+def test_on_message_ignores_malformed_messages():
+    kitchen_queue = MagicMock()
+    subscriber = OrderStatusSubscriber(kitchen_queue, MagicMock(), MagicMock())
+
+    subscriber.on_message(MagicMock(), MagicMock(), MagicMock(), b"not json")
+
+    kitchen_queue.apply.assert_not_called()
@@ -0,0 +1,92 @@
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.orm import Session
+from src.infrastructure.messaging.outbox_publisher import OutboxPublisher
+from src.infrastructure.persistence.models import OutboxMessageModel
+from src.infrastructure.tracing.tracer import SpanContext, tracer
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def outbox_publisher(mock_session):
+    return OutboxPublisher(mock_session)
+
+
+def test_publish_inventory_update_stages_message(
+    outbox_publisher, mock_session
+):
+    outbox_publisher.publish_inventory_update("SKU1", "subtract", 2)
+
+    staged = mock_session.add.call_args[0][0]
+    assert isinstance(staged, OutboxMessageModel)
+    assert staged.exchange == "inventory_exchange"
+    assert staged.routing_key == "inventory_queue"
+    assert json.loads(staged.payload) == {
+        "sku": "SKU1",
+        "action": "subtract",
+        "quantity": 2,
+    }
+    assert len(staged.message_id) == 32
+    mock_session.commit.assert_not_called()
+
+
+def test_publish_order_update_stages_message(outbox_publisher, mock_session):
+    outbox_publisher.publish_order_update(1, 99.9, "confirmed")
+
+    staged = mock_session.add.call_args[0][0]
+    assert staged.exchange == "orders_exchange"
+    assert staged.routing_key == "orders_queue"
+    payload = json.loads(staged.payload)
+    occurred_at = datetime.fromisoformat(payload.pop("occurred_at"))
+    assert payload == {
+        "order_id": 1,
+        "amount": 99.9,
+        "status": "confirmed",
+        "created_at": None,
+    }
+    assert occurred_at <= datetime.utcnow()
+    mock_session.commit.assert_not_called()
+
+
+def test_publish_order_update_carries_order_creation_time(
+    outbox_publisher, mock_session
+):
+    outbox_publisher.publish_order_update(
+        1, 99.9, "paid", created_at=datetime(2024, 1, 1, 12, 0)
+    )
+
+    staged = mock_session.add.call_args[0][0]
+    assert json.loads(staged.payload)["created_at"] == "2024-01-01T12:00:00"
+
+
+def test_each_message_gets_its_own_id(outbox_publisher, mock_session):
+    outbox_publisher.publish_inventory_update("SKU1", "add", 1)
+    outbox_publisher.publish_inventory_update("SKU1", "add", 1)
+
+    first, second = [c[0][0] for c in mock_session.add.call_args_list]
+    assert first.message_id != second.message_id
+
+
+def test_staged_message_carries_trace_context(outbox_publisher, mock_session):
+    with tracer.span("PATCH /orders/{order_id}/confirm") as request_span:
+        outbox_publisher.publish_order_update(1, 99.9, "confirmed")
+
+    staged = mock_session.add.call_args[0][0]
+    context = SpanContext.from_traceparent(staged.traceparent)
+    assert context.trace_id == request_span.context.trace_id
+    assert context.span_id != request_span.context.span_id
+
+
+def test_staged_message_starts_trace_outside_requests(
+    outbox_publisher, mock_session
+):
+    outbox_publisher.publish_order_update(1, 99.9, "confirmed")
+
+    assert mock_session.add.call_args[0][0].traceparent is not None
@@ -0,0 +1,191 @@
+from unittest.mock import MagicMock, patch
+
+import pika
+import pytest
+from src.infrastructure.messaging.outbox_relay import OutboxRelay
+from src.infrastructure.persistence.models import OutboxMessageModel
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock()
+
+
+@pytest.fixture
+def relay(mock_session):
+    return OutboxRelay(
+        lambda: mock_session, MagicMock(), batch_size=2, poll_interval=0.01
+    )
+
+
+def _pending(mock_session, messages):
+    query = mock_session.query.return_value
+    limited = query.order_by.return_value.limit.return_value
+    locked = limited.with_for_update.return_value
+    locked.all.return_value = messages
+
+
+def _message(id, message_id):
+    return OutboxMessageModel(
+        id=id,
+        message_id=message_id,
+        exchange="orders_exchange",
+        routing_key="orders_queue",
+        payload='{"order_id": 1}',
+    )
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_publishes_in_one_transaction_and_deletes(
+    mock_connection, relay, mock_session
+):
+    messages = [_message(1, "a"), _message(2, "b")]
+    _pending(mock_session, messages)
+    channel = mock_connection.return_value.channel.return_value
+
+    relayed = relay.relay_batch()
+
+    assert relayed == 2
+    channel.tx_select.assert_called_once()
+    channel.confirm_delivery.assert_not_called()
+    assert channel.basic_publish.call_count == 2
+    channel.tx_commit.assert_called_once()
+    kwargs = channel.basic_publish.call_args.kwargs
+    assert kwargs["exchange"] == "orders_exchange"
+    assert kwargs["routing_key"] == "orders_queue"
+    assert kwargs["body"] == '{"order_id": 1}'
+    assert kwargs["properties"].message_id == "b"
+    mock_session.delete.assert_any_call(messages[0])
+    mock_session.delete.assert_any_call(messages[1])
+    mock_session.commit.assert_called_once()
+    mock_session.close.assert_called_once()
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_without_messages_does_not_connect(
+    mock_connection, relay, mock_session
+):
+    _pending(mock_session, [])
+
+    assert relay.relay_batch() == 0
+    mock_connection.assert_not_called()
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_waits_for_broker_once_after_publishing(
+    mock_connection, relay, mock_session
+):
+    _pending(mock_session, [_message(1, "a"), _message(2, "b")])
+    channel = mock_connection.return_value.channel.return_value
+    calls = MagicMock()
+    calls.attach_mock(channel.basic_publish, "basic_publish")
+    calls.attach_mock(channel.tx_commit, "tx_commit")
+    calls.attach_mock(mock_session.commit, "db_commit")
+
+    relay.relay_batch()
+
+    assert [name for name, _, _ in calls.mock_calls] == [
+        "basic_publish",
+        "basic_publish",
+        "tx_commit",
+        "db_commit",
+    ]
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_rolls_back_when_broker_commit_fails(
+    mock_connection, relay, mock_session
+):
+    _pending(mock_session, [_message(1, "a"), _message(2, "b")])
+    channel = mock_connection.return_value.channel.return_value
+    channel.tx_commit.side_effect = pika.exceptions.AMQPChannelError()
+
+    with pytest.raises(pika.exceptions.AMQPChannelError):
+        relay.relay_batch()
+
+    assert channel.basic_publish.call_count == 2
+    mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_not_called()
+    mock_session.close.assert_called_once()
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_rolls_back_when_publish_fails(
+    mock_connection, relay, mock_session
+):
+    _pending(mock_session, [_message(1, "a")])
+    channel = mock_connection.return_value.channel.return_value
+    channel.basic_publish.side_effect = pika.exceptions.ChannelClosedByBroker(
+        404, "NOT_FOUND"
+    )
+
+    with pytest.raises(pika.exceptions.ChannelClosedByBroker):
+        relay.relay_batch()
+
+    mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_not_called()
+    mock_session.close.assert_called_once()
+
+
+def test_run_reconnects_after_failure(relay):
+    calls = []
+
+    def relay_batch():
+        calls.append(1)
+        if len(calls) == 1:
+            raise Exception("broker down")
+        relay._stopped.set()
+        return 0
+
+    relay.relay_batch = relay_batch
+    relay.channel = MagicMock()
+    relay.connection = MagicMock()
+
+    relay.run()
+
+    assert len(calls) == 2
+    assert relay.channel is None
+    assert relay.connection is None
+
+
+def test_run_waits_while_circuit_is_open(relay):
+    relay.circuit_breaker = MagicMock()
+    relay.circuit_breaker.allow_request.return_value = False
+    relay.circuit_breaker.retry_after.return_value = 0.01
+    relay.relay_batch = MagicMock()
+    relay._stopped.wait = MagicMock(side_effect=lambda _: relay._stopped.set())
+
+    relay.run()
+
+    relay.relay_batch.assert_not_called()
+    relay._stopped.wait.assert_called_once_with(0.01)
+
+
+def test_start_and_stop(relay):
+    relay.relay_batch = MagicMock(return_value=0)
+
+    relay.start()
+    relay.stop()
+
+    assert not relay._thread.is_alive()
+    relay.relay_batch.assert_called()
+
+
+@patch("src.infrastructure.messaging.outbox_relay.pika.BlockingConnection")
+def test_relay_batch_forwards_trace_context(
+    mock_connection, relay, mock_session
+):
+    traced = _message(1, "a")
+    traced.traceparent = (
+        "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    )
+    _pending(mock_session, [traced, _message(2, "b")])
+    channel = mock_connection.return_value.channel.return_value
+
+    relay.relay_batch()
+
+    first, second = [
+        c.kwargs["properties"] for c in channel.basic_publish.call_args_list
+    ]
+    assert first.headers == {"traceparent": traced.traceparent}
+    assert second.headers is None
@@ -34,9 +34,12 @@ def test_start_consuming(payment_subscriber):
     payment_subscriber.channel.exchange_declare.assert_called_once_with(
         exchange="payment_exchange", exchange_type="topic", durable=True
     )
-    payment_subscriber.channel.queue_declare.assert_called_once_with(
+    payment_subscriber.channel.queue_declare.assert_any_call(
         queue="payment_queue", durable=True
     )
+    payment_subscriber.channel.queue_declare.assert_any_call(
+        queue="payment_queue.dlq", durable=True
+    )
     payment_subscriber.channel.queue_bind.assert_called_once_with(
         exchange="payment_exchange",
         queue="payment_queue",
@@ -125,3 +128,124 @@ def test_on_message_invalid_json(payment_subscriber):
 
         mock_logger.error.assert_called_once()
         ch.basic_ack.assert_called_once_with(delivery_tag=method.delivery_tag)
+
+
+def test_on_message_uses_event_loop_bridge(
+    payment_subscriber, mock_order_service
+):
+    payment_subscriber.event_loop_bridge = MagicMock()
+    ch = MagicMock()
+    method = MagicMock()
+    properties = MagicMock()
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+
+    with patch(
+        "src.infrastructure.messaging.payment_subscriber.asyncio.run"
+    ) as mock_asyncio_run:
+        payment_subscriber.on_message(ch, method, properties, body)
+
+    mock_asyncio_run.assert_not_called()
+    payment_subscriber.event_loop_bridge.run.assert_called_once_with(
+        mock_order_service.set_paid_order(1)
+    )
+    ch.basic_ack.assert_called_once_with(delivery_tag=method.delivery_tag)
+
+
+def test_on_message_skips_duplicate(payment_subscriber, mock_order_service):
+    payment_subscriber.deduplicator = MagicMock()
+    payment_subscriber.deduplicator.is_duplicate.return_value = True
+    ch = MagicMock()
+    method = MagicMock()
+    properties = MagicMock(message_id="abc")
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+
+    payment_subscriber.on_message(ch, method, properties, body)
+
+    mock_order_service.set_paid_order.assert_not_called()
+    payment_subscriber.deduplicator.mark_processed.assert_not_called()
+    ch.basic_ack.assert_called_once_with(delivery_tag=method.delivery_tag)
+
+
+@patch("src.infrastructure.messaging.payment_subscriber.asyncio.run")
+def test_on_message_marks_processed(
+    mock_asyncio_run, payment_subscriber, mock_order_service
+):
+    payment_subscriber.deduplicator = MagicMock()
+    payment_subscriber.deduplicator.is_duplicate.return_value = False
+    ch = MagicMock()
+    method = MagicMock()
+    properties = MagicMock(message_id="abc")
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+
+    payment_subscriber.on_message(ch, method, properties, body)
+
+    mock_order_service.set_paid_order.assert_called_once_with(1)
+    payment_subscriber.deduplicator.mark_processed.assert_called_once_with(
+        properties
+    )
+    ch.basic_ack.assert_called_once_with(delivery_tag=method.delivery_tag)
+
+
+@patch(
+    "src.infrastructure.messaging.payment_subscriber.asyncio.run",
+    side_effect=Exception("inventory unavailable"),
+)
+def test_on_message_failure_is_not_marked_processed(
+    mock_asyncio_run, payment_subscriber
+):
+    payment_subscriber.deduplicator = MagicMock()
+    payment_subscriber.deduplicator.is_duplicate.return_value = False
+    ch = MagicMock()
+    method = MagicMock()
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+
+    payment_subscriber.on_message(ch, method, MagicMock(), body)
+
+    payment_subscriber.deduplicator.mark_processed.assert_not_called()
+    payment_subscriber.deduplicator.discard.assert_called_once()
+
+
+@patch(
+    "src.infrastructure.messaging.payment_subscriber.asyncio.run",
+    side_effect=Exception("inventory unavailable"),
+)
+def test_on_message_failure_is_scheduled_for_retry(
+    mock_asyncio_run, payment_subscriber
+):
+    payment_subscriber.retry_topology = MagicMock()
+    ch = MagicMock()
+    method = MagicMock()
+    properties = MagicMock()
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+
+    payment_subscriber.on_message(ch, method, properties, body)
+
+    payment_subscriber.retry_topology.retry.assert_called_once_with(
+        ch, properties, body, mock_asyncio_run.side_effect
+    )
+    ch.basic_ack.assert_called_once_with(delivery_tag=method.delivery_tag)
+
+
+def test_start_consuming_schedules_queue_sampling(payment_subscriber):
+    payment_subscriber.channel = MagicMock()
+    payment_subscriber.connection = MagicMock()
+
+    payment_subscriber.start_consuming()
+
+    payment_subscriber.connection.call_later.assert_called_once()
+
+
+@patch("src.infrastructure.messaging.payment_subscriber.asyncio.run")
+def test_on_message_records_metrics(mock_asyncio_run, payment_subscriber):
+    metrics = payment_subscriber.on_message.consumer_metrics
+    consumed = metrics.consumed.get(queue="payment_queue")
+
+    body = json.dumps({"order_id": 1, "status": "completed"}).encode("utf-8")
+    payment_subscriber.on_message(MagicMock(), MagicMock(), MagicMock(), body)
+
+    assert metrics.consumed.get(queue="payment_queue") == consumed + 1
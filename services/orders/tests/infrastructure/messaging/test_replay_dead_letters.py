@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+import pytest
+from src.infrastructure.messaging.replay_dead_letters import main
+
+
+@patch("src.infrastructure.messaging.replay_dead_letters.RetryTopology")
+@patch("src.infrastructure.messaging.replay_dead_letters.pika")
+def test_main_replays_queue_and_closes_connection(mock_pika, mock_topology):
+    mock_topology.return_value.replay_dead_letters.return_value = 3
+    connection = mock_pika.BlockingConnection.return_value
+
+    replayed = main(["payment_queue", "--limit", "10"])
+
+    assert replayed == 3
+    mock_topology.assert_called_once_with("payment_queue")
+    mock_topology.return_value.replay_dead_letters.assert_called_once_with(
+        connection.channel.return_value, limit=10
+    )
+    connection.close.assert_called_once()
+
+
+def test_main_rejects_unknown_queue():
+    with pytest.raises(SystemExit):
+        main(["unknown_queue"])
@@ -0,0 +1,45 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import create_engine, text
+from src.infrastructure.metrics.request_metrics import (
+    current_stats,
+    instrument_engine,
+    outbound_call_trace_config,
+    track_request,
+)
+
+
+def test_engine_queries_are_attributed_to_the_current_request():
+    engine = instrument_engine(create_engine("sqlite://"))
+
+    with track_request() as stats:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+    assert stats.queries == 2
+    assert stats.query_seconds > 0
+    assert current_stats() is None
+
+
+def test_queries_outside_a_request_are_ignored():
+    engine = instrument_engine(create_engine("sqlite://"))
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert current_stats() is None
+
+
+def test_outbound_calls_are_counted():
+    trace_config = outbound_call_trace_config()
+    on_request_start = trace_config.on_request_start[0]
+
+    async def fan_out():
+        with track_request() as stats:
+            for _ in range(3):
+                await on_request_start(None, SimpleNamespace(), None)
+        return stats
+
+    assert asyncio.run(fan_out()).outbound_calls == 3
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import create_engine, text
+from src.infrastructure.persistence.query_counter import (
+    QueryCounter,
+    assert_max_queries,
+)
+
+
+@pytest.fixture
+def engine():
+    return create_engine("sqlite://")
+
+
+def test_counter_captures_statements_inside_the_block(engine):
+    with engine.connect() as connection:
+        with QueryCounter(engine) as counter:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+        connection.execute(text("SELECT 3"))
+
+    assert counter.statements == ["SELECT 1", "SELECT 2"]
+
+
+def test_budget_within_limit_passes(engine):
+    with engine.connect() as connection:
+        with assert_max_queries(engine, 1) as counter:
+            connection.execute(text("SELECT 1"))
+
+    assert counter.count == 1
+
+
+def test_budget_exceeded_lists_offending_statements(engine):
+    with engine.connect() as connection:
+        with pytest.raises(AssertionError) as error:
+            with assert_max_queries(engine, 1):
+                connection.execute(text("SELECT 1"))
+                connection.execute(text("SELECT\n    2"))
+
+    assert "at most 1 queries, 2 ran" in str(error.value)
+    assert "1. SELECT 1\n2. SELECT 2" in str(error.value)
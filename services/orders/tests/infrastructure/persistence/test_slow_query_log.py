@@ -0,0 +1,101 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from src.infrastructure.persistence.slow_query_log import (
+    SlowQueryLog,
+    fingerprint,
+    fingerprint_id,
+)
+from src.infrastructure.tracing.tracer import tracer
+
+
+@pytest.fixture
+def log():
+    return SlowQueryLog(threshold_ms=100, sample_ratio=1.0)
+
+
+def test_fingerprint_normalizes_literals_and_parameters():
+    assert fingerprint(
+        "SELECT * FROM orders WHERE id = 42 AND status = 'PAID'"
+    ) == ("SELECT * FROM orders WHERE id = ? AND status = ?")
+    assert fingerprint(
+        "SELECT orders.id FROM orders\n WHERE orders.id = %(id_1)s"
+    ) == ("SELECT orders.id FROM orders WHERE orders.id = ?")
+
+
+def test_fingerprint_collapses_in_lists_of_any_length():
+    short = "SELECT * FROM customers WHERE id IN (%(p_1)s)"
+    long = "SELECT * FROM customers WHERE id IN (%(p_1)s, %(p_2)s, %(p_3)s)"
+
+    assert fingerprint(short) == fingerprint(long)
+    assert fingerprint(long).endswith("IN (...)")
+
+
+def test_fingerprint_keeps_casts_and_identifiers():
+    assert fingerprint("SELECT anon_1.id::text FROM t LIMIT %(param_1)s") == (
+        "SELECT anon_1.id::text FROM t LIMIT ?"
+    )
+
+
+def test_stats_aggregate_per_fingerprint(log):
+    for duration in [1, 2, 3, 4, 200]:
+        log.record("SELECT * FROM orders WHERE id = 1", duration, rows=1)
+    log.record("SELECT * FROM customers", 5, rows=10)
+
+    orders, customers = log.snapshot()
+
+    assert orders["fingerprint"] == "SELECT * FROM orders WHERE id = ?"
+    assert orders["sampled_calls"] == 5
+    assert orders["slow_calls"] == 1
+    assert orders["p50_ms"] == 3
+    assert orders["p99_ms"] == 200
+    assert orders["mean_rows"] == 1
+    assert customers["total_ms"] == 5
+
+
+def test_slow_query_is_logged_with_its_repository_method(log, caplog):
+    statement = "SELECT * FROM orders WHERE id = 1"
+
+    with caplog.at_level(logging.WARNING, logger="app"):
+        with tracer.span("SQLAlchemyOrderRepository.find_by_id"):
+            log.record(statement, 250)
+
+    assert "Slow query 250.0ms in SQLAlchemyOrderRepository.find_by_id" in (
+        caplog.text
+    )
+    assert fingerprint_id(fingerprint(statement)) in caplog.text
+    assert log.snapshot()[0]["sources"] == {
+        "SQLAlchemyOrderRepository.find_by_id": 1
+    }
+
+
+def test_fast_queries_outside_the_sample_are_skipped():
+    log = SlowQueryLog(threshold_ms=100, sample_ratio=0)
+
+    log.record("SELECT 1", 1)
+    log.record("SELECT 2", 150)
+
+    entries = log.snapshot()
+    assert [entry["fingerprint"] for entry in entries] == ["SELECT ?"]
+    assert entries[0]["slow_calls"] == 1
+    assert entries[0]["sampled_calls"] == 0
+
+
+def test_new_fingerprints_are_dropped_when_the_table_is_full():
+    log = SlowQueryLog(threshold_ms=100, sample_ratio=1.0, max_fingerprints=1)
+
+    log.record("SELECT * FROM orders", 1)
+    log.record("SELECT * FROM customers", 1)
+
+    assert len(log.snapshot()) == 1
+
+
+def test_instrumented_engine_records_statements(log):
+    engine = log.instrument(create_engine("sqlite://"))
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        connection.execute(text("SELECT 2"))
+
+    assert log.snapshot()[0]["sampled_calls"] == 2
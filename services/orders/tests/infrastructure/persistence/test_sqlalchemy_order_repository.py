@@ -2,10 +2,12 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
 from src.domain.entities.customer_entity import CustomerEntity
-from src.domain.entities.order_entity import OrderEntity
+from src.domain.entities.order_entity import OrderEntity, OrderStatus
 from src.domain.entities.order_item_entity import OrderItemEntity
+from src.infrastructure.persistence.db_setup import Base
 from src.infrastructure.persistence.models import (
     CustomerModel,
     OrderItemModel,
@@ -112,6 +114,17 @@ def test_find_by_order_number_non_existing_order(
     assert order is None
 
 
+def test_find_status(order_repository, mock_session):
+    mock_session.query.return_value.filter.return_value.scalar.return_value = (
+        OrderStatus.READY
+    )
+
+    status = order_repository.find_status(1)
+
+    assert status == OrderStatus.READY
+    mock_session.query.assert_called_once_with(OrderModel.status)
+
+
 def test_delete_existing_order(order_repository, mock_session):
     mock_order_model = MagicMock(spec=OrderModel)
     mock_order_model.id = 1
@@ -135,3 +148,38 @@ def test_delete_existing_order(order_repository, mock_session):
 
     mock_session.delete.assert_called_with(mock_order_model)
     mock_session.commit.assert_called()
+
+
+def test_save_rolls_back_on_commit_failure(order_repository, mock_session):
+    customer = CustomerEntity(
+        name="John Doe",
+        email="john.doe@example.com",
+        phone_number="+123456789",
+    )
+    order = OrderEntity(customer=customer, order_items=[])
+    mock_session.commit.side_effect = Exception("database unavailable")
+
+    with pytest.raises(Exception, match="database unavailable"):
+        order_repository.save(order)
+
+    mock_session.rollback.assert_called_once()
+    mock_session.commit.assert_called_once()
+
+
+def test_list_status_rows_selects_matching_orders():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for status in [OrderStatus.PAID, OrderStatus.PENDING, OrderStatus.READY]:
+        db.add(OrderModel(status=status))
+    db.commit()
+    repository = SQLAlchemyOrderRepository(db=db)
+
+    rows = repository.list_status_rows([OrderStatus.PAID, OrderStatus.READY])
+
+    assert [(row["id"], row["status"]) for row in rows] == [
+        (1, OrderStatus.PAID),
+        (3, OrderStatus.READY),
+    ]
+    assert all(row["created_at"] is not None for row in rows)
+    db.close()
@@ -0,0 +1,57 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from src.infrastructure.persistence.models import ProcessedMessageModel
+from src.infrastructure.persistence.sqlalchemy_processed_message_repository import (
+    SQLAlchemyProcessedMessageRepository,
+)
+
+
+@pytest.fixture
+def mock_session():
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def repository(mock_session):
+    return SQLAlchemyProcessedMessageRepository(db=mock_session)
+
+
+def test_add_stages_row_without_committing(repository, mock_session):
+    assert repository.add("abc") is True
+
+    mock_session.begin_nested.assert_called_once()
+    added = mock_session.add.call_args[0][0]
+    assert isinstance(added, ProcessedMessageModel)
+    assert added.message_id == "abc"
+    mock_session.flush.assert_called_once()
+    mock_session.commit.assert_not_called()
+
+
+def test_add_returns_false_for_recorded_message(repository, mock_session):
+    mock_session.begin_nested.return_value.__exit__.return_value = False
+    mock_session.flush.side_effect = IntegrityError("", {}, Exception())
+
+    assert repository.add("abc") is False
+
+    mock_session.rollback.assert_not_called()
+
+
+def test_commit_and_rollback_use_the_shared_session(repository, mock_session):
+    repository.commit()
+    repository.rollback()
+
+    mock_session.commit.assert_called_once()
+    mock_session.rollback.assert_called_once()
+
+
+def test_delete_older_than(repository, mock_session):
+    mock_session.query().filter().delete.return_value = 3
+
+    deleted = repository.delete_older_than(datetime.utcnow())
+
+    assert deleted == 3
+    mock_session.commit.assert_called_once()
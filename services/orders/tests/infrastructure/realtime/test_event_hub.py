@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import pytest
+from src.infrastructure.realtime.event_hub import EventHub
+
+
+async def _next(subscription, keepalive=None):
+    events = subscription.events(keepalive)
+    return await asyncio.wait_for(events.__anext__(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_publish_delivers_to_topic_subscribers():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("kitchen")
+    other = hub.subscribe("other")
+
+    hub.publish("kitchen", {"type": "upsert"})
+
+    assert await _next(subscription) == {"type": "upsert"}
+    await asyncio.sleep(0)
+    assert other.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_publish_from_another_thread():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("kitchen")
+
+    thread = threading.Thread(
+        target=hub.publish, args=("kitchen", {"type": "remove"})
+    )
+    thread.start()
+    thread.join()
+
+    assert await _next(subscription) == {"type": "remove"}
+
+
+@pytest.mark.asyncio
+async def test_events_yield_none_as_keepalive():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("kitchen")
+
+    assert await _next(subscription, keepalive=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_dropped():
+    hub = EventHub(max_queue_size=2)
+    subscription = hub.subscribe("kitchen")
+    dropped = hub.dropped_subscribers.get()
+
+    for index in range(3):
+        hub.publish("kitchen", {"type": "upsert", "index": index})
+    await asyncio.sleep(0.01)
+
+    assert subscription.closed
+    assert hub.subscriber_count("kitchen") == 0
+    assert hub.dropped_subscribers.get() == dropped + 1
+    assert [event async for event in subscription.events()] == []
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_unsubscribes():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("kitchen")
+    subscribers = hub.subscribers.get()
+    hub.publish("kitchen", {"type": "upsert"})
+
+    events = subscription.events()
+    await events.__anext__()
+    await events.aclose()
+
+    assert hub.subscriber_count("kitchen") == 0
+    assert hub.subscribers.get() == subscribers - 1
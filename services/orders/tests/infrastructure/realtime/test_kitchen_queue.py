@@ -0,0 +1,124 @@
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from src.domain.entities.order_entity import OrderStatus
+from src.infrastructure.realtime.kitchen_queue import (
+    KITCHEN_TOPIC,
+    KitchenQueue,
+)
+
+
+def _row(order_id, status, created_at):
+    return {"id": order_id, "status": status, "created_at": created_at}
+
+
+def test_snapshot_orders_by_status_then_wait_time():
+    kitchen_queue = KitchenQueue(MagicMock())
+    kitchen_queue.load(
+        [
+            _row(1, OrderStatus.PAID, datetime(2024, 1, 1, 12, 5)),
+            _row(2, OrderStatus.PREPARING, datetime(2024, 1, 1, 12, 10)),
+            _row(3, OrderStatus.PAID, datetime(2024, 1, 1, 12, 0)),
+            _row(4, OrderStatus.PENDING, datetime(2024, 1, 1, 11, 0)),
+        ]
+    )
+
+    snapshot = kitchen_queue.snapshot()
+
+    assert [ticket["order_id"] for ticket in snapshot] == [2, 3, 1]
+
+
+def test_apply_upserts_and_publishes_delta():
+    event_hub = MagicMock()
+    kitchen_queue = KitchenQueue(event_hub)
+    kitchen_queue.load(
+        [_row(1, OrderStatus.PAID, datetime(2024, 1, 1, 12, 0))]
+    )
+
+    delta = kitchen_queue.apply(1, "preparing")
+
+    assert delta == {
+        "type": "upsert",
+        "ticket": {
+            "order_id": 1,
+            "status": "preparing",
+            "queued_at": datetime(2024, 1, 1, 12, 0),
+        },
+    }
+    event_hub.publish.assert_called_once_with(KITCHEN_TOPIC, delta)
+
+
+def test_apply_adds_new_orders_entering_the_kitchen():
+    kitchen_queue = KitchenQueue(MagicMock())
+
+    delta = kitchen_queue.apply(7, "paid")
+
+    assert delta["type"] == "upsert"
+    assert [ticket["order_id"] for ticket in kitchen_queue.snapshot()] == [7]
+
+
+def test_apply_queues_new_orders_by_creation_time():
+    kitchen_queue = KitchenQueue(MagicMock())
+    kitchen_queue.load(
+        [_row(1, OrderStatus.PAID, datetime(2024, 1, 1, 12, 5))]
+    )
+
+    kitchen_queue.apply(2, "paid", datetime(2024, 1, 1, 12, 0))
+
+    snapshot = kitchen_queue.snapshot()
+    assert [ticket["order_id"] for ticket in snapshot] == [2, 1]
+    assert snapshot[0]["queued_at"] == datetime(2024, 1, 1, 12, 0)
+
+
+def test_apply_is_idempotent_for_statuses_in_the_snapshot():
+    event_hub = MagicMock()
+    kitchen_queue = KitchenQueue(event_hub)
+    kitchen_queue.load(
+        [_row(1, OrderStatus.PREPARING, datetime(2024, 1, 1, 12, 0))]
+    )
+
+    # Committed after the queue was bound, so both loaded and queued
+    assert kitchen_queue.apply(1, "preparing") is None
+    assert kitchen_queue.apply(1, "preparing") is None
+    assert kitchen_queue.snapshot()[0]["status"] == "preparing"
+    event_hub.publish.assert_not_called()
+
+
+def test_apply_removes_orders_leaving_the_kitchen():
+    event_hub = MagicMock()
+    kitchen_queue = KitchenQueue(event_hub)
+    kitchen_queue.load(
+        [_row(1, OrderStatus.READY, datetime(2024, 1, 1, 12, 0))]
+    )
+
+    delta = kitchen_queue.apply(1, "shipped")
+
+    assert delta == {"type": "remove", "order_id": 1}
+    assert kitchen_queue.snapshot() == []
+    event_hub.publish.assert_called_once_with(KITCHEN_TOPIC, delta)
+
+
+def test_apply_ignores_unchanged_and_unknown_orders():
+    event_hub = MagicMock()
+    kitchen_queue = KitchenQueue(event_hub)
+    kitchen_queue.load(
+        [_row(1, OrderStatus.PAID, datetime(2024, 1, 1, 12, 0))]
+    )
+
+    assert kitchen_queue.apply(1, "paid") is None
+    assert kitchen_queue.apply(2, "pending") is None
+    event_hub.publish.assert_not_called()
+
+
+def test_subscribe_returns_snapshot_and_subscription():
+    event_hub = MagicMock()
+    kitchen_queue = KitchenQueue(event_hub)
+    kitchen_queue.load(
+        [_row(1, OrderStatus.PAID, datetime(2024, 1, 1, 12, 0))]
+    )
+
+    tickets, subscription = kitchen_queue.subscribe()
+
+    assert [ticket["order_id"] for ticket in tickets] == [1]
+    assert subscription == event_hub.subscribe.return_value
+    event_hub.subscribe.assert_called_once_with(KITCHEN_TOPIC)
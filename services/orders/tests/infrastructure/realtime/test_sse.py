@@ -0,0 +1,54 @@
+import pytest
+from src.infrastructure.realtime.event_hub import EventHub
+from src.infrastructure.realtime.sse import (
+    KEEPALIVE,
+    event_stream,
+    format_event,
+)
+
+
+def test_format_event():
+    assert (
+        format_event("remove", {"order_id": 1})
+        == b'event: remove\ndata: {"order_id":1}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_stream_sends_first_events_then_hub_events():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("kitchen")
+    hub.publish("kitchen", {"type": "remove", "order_id": 1})
+    stream = event_stream(subscription, [b"first"], keepalive=0.01)
+
+    chunks = [await stream.__anext__() for _ in range(3)]
+    await stream.aclose()
+
+    assert chunks == [
+        b"first",
+        format_event("remove", {"type": "remove", "order_id": 1}),
+        KEEPALIVE,
+    ]
+    assert hub.subscriber_count("kitchen") == 0
+
+
+@pytest.mark.asyncio
+async def test_event_stream_ends_after_last_event():
+    hub = EventHub(max_queue_size=10)
+    subscription = hub.subscribe("order:1")
+    hub.publish("order:1", {"type": "status", "status": "ready"})
+    hub.publish("order:1", {"type": "status", "status": "finished"})
+    hub.publish("order:1", {"type": "status", "status": "ignored"})
+
+    chunks = [
+        chunk
+        async for chunk in event_stream(
+            subscription, is_last=lambda event: event["status"] == "finished"
+        )
+    ]
+
+    assert chunks == [
+        format_event("status", {"type": "status", "status": "ready"}),
+        format_event("status", {"type": "status", "status": "finished"}),
+    ]
+    assert hub.subscriber_count("order:1") == 0
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+from multidict import CIMultiDict
+from src.infrastructure.tracing.http_client import client_trace_config
+from src.infrastructure.tracing.tracer import (
+    TRACEPARENT,
+    SpanKind,
+    StatusCode,
+    tracer,
+)
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+async def _request(trace_config, status=None, exception=None):
+    context = SimpleNamespace()
+    params = SimpleNamespace(
+        method="GET",
+        url="http://inventory/products/SKU1",
+        headers=CIMultiDict(),
+        response=SimpleNamespace(status=status),
+        exception=exception,
+    )
+    for callback in trace_config.on_request_start:
+        await callback(None, context, params)
+    hooks = (
+        trace_config.on_request_exception
+        if exception
+        else trace_config.on_request_end
+    )
+    for callback in hooks:
+        await callback(None, context, params)
+    return params
+
+
+@pytest.mark.asyncio
+async def test_client_span_is_propagated_in_traceparent(spans):
+    with tracer.span("order_service") as parent:
+        params = await _request(client_trace_config(), status=200)
+
+    span = spans[0]
+    assert span.kind == SpanKind.CLIENT
+    assert span.parent_span_id == parent.context.span_id
+    assert span.attributes["http.response.status_code"] == 200
+    assert params.headers[TRACEPARENT] == span.context.to_traceparent()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_mark_client_span(spans):
+    await _request(client_trace_config(), status=503)
+
+    assert spans[0].status_code == StatusCode.ERROR
+
+
+@pytest.mark.asyncio
+async def test_request_exception_is_recorded(spans):
+    await _request(client_trace_config(), exception=OSError("refused"))
+
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].events[0]["attributes"]["exception.message"] == "refused"
@@ -0,0 +1,207 @@
+import asyncio
+import threading
+
+import pika
+import pytest
+from src.infrastructure.tracing.tracer import (
+    TRACEPARENT,
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    Tracer,
+    inject_message_properties,
+    traced_consumer,
+    traced_repository,
+    tracer,
+)
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+def test_traceparent_round_trip():
+    context = SpanContext.from_traceparent(PARENT)
+
+    assert context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert context.span_id == "b7ad6b7169203331"
+    assert context.sampled is True
+    assert context.to_traceparent() == PARENT
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "",
+        "garbage",
+        "ff-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01",
+        "00-00000000000000000000000000000000-b7ad6b7169203331-01",
+        "00-0af7651916cd43dd8448eb211c80319c-0000000000000000-01",
+    ],
+)
+def test_invalid_traceparent_is_ignored(value):
+    assert SpanContext.from_traceparent(value) is None
+
+
+def test_traceparent_from_amqp_bytes_header():
+    context = SpanContext.from_traceparent(PARENT.encode())
+
+    assert context.span_id == "b7ad6b7169203331"
+
+
+def test_nested_spans_share_trace(spans):
+    with tracer.span("outer") as outer:
+        with tracer.span("inner") as inner:
+            pass
+
+    assert inner.context.trace_id == outer.context.trace_id
+    assert inner.parent_span_id == outer.context.span_id
+    assert outer.parent_span_id is None
+    assert [span.name for span in spans] == ["inner", "outer"]
+    assert tracer.current_span() is None
+
+
+def test_span_continues_remote_parent(spans):
+    parent = tracer.extract({TRACEPARENT: PARENT})
+
+    with tracer.span("handler", SpanKind.SERVER, parent=parent) as span:
+        pass
+
+    assert span.context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span.parent_span_id == "b7ad6b7169203331"
+    assert span.kind == SpanKind.SERVER
+
+
+def test_span_records_exception(spans):
+    with pytest.raises(ValueError):
+        with tracer.span("failing"):
+            raise ValueError("boom")
+
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].events[0]["attributes"]["exception.type"] == "ValueError"
+
+
+def test_unsampled_spans_propagate_but_are_not_exported():
+    collector = _Collector()
+    unsampled = Tracer("orders", sample_ratio=0.0, processor=collector)
+
+    with unsampled.span("request") as span:
+        carrier = unsampled.inject({})
+
+    assert carrier[TRACEPARENT].endswith("-00")
+    assert span.context.sampled is False
+    assert collector.spans == []
+
+
+def test_inject_without_span_leaves_carrier_alone():
+    assert tracer.inject({}) == {}
+    assert tracer.current_traceparent() is None
+
+
+def test_traced_repository_wraps_public_methods(spans):
+    @traced_repository("postgresql")
+    class Repository:
+        def find(self, id):
+            return self._load(id)
+
+        def _load(self, id):
+            return {"id": id}
+
+        @staticmethod
+        def helper():
+            return "static"
+
+    assert Repository().find(1) == {"id": 1}
+    assert Repository.helper() == "static"
+    assert [span.name for span in spans] == ["Repository.find"]
+    assert spans[0].kind == SpanKind.CLIENT
+    assert spans[0].attributes["db.system"] == "postgresql"
+
+
+def test_traced_consumer_continues_trace_from_headers(spans):
+    class Subscriber:
+        @traced_consumer("payment_queue")
+        def on_message(self, ch, method, properties, body):
+            return tracer.current_span()
+
+    properties = pika.BasicProperties(
+        message_id="m-1", headers={TRACEPARENT: PARENT}
+    )
+
+    span = Subscriber().on_message(None, None, properties, b"{}")
+
+    assert span.name == "payment_queue process"
+    assert span.kind == SpanKind.CONSUMER
+    assert span.parent_span_id == "b7ad6b7169203331"
+    assert span.attributes["messaging.message.id"] == "m-1"
+
+
+def test_inject_message_properties_keeps_existing_headers(spans):
+    properties = pika.BasicProperties(headers={"x-attempts": 1})
+
+    with tracer.span("publish") as span:
+        injected = inject_message_properties(properties)
+
+    assert injected.headers == {
+        "x-attempts": 1,
+        TRACEPARENT: span.context.to_traceparent(),
+    }
+
+
+def test_inject_message_properties_with_detached_span(spans):
+    span = tracer.start_span("publish")
+
+    injected = inject_message_properties(None, span)
+
+    assert injected.headers == {TRACEPARENT: span.context.to_traceparent()}
+    assert tracer.current_span() is None
+
+
+def test_span_records_recovered_exception_as_event(spans):
+    with tracer.span("publish") as span:
+        span.record_exception(ValueError("retry"), set_status=False)
+
+    assert spans[0].status_code == StatusCode.UNSET
+    assert spans[0].events[0]["attributes"]["exception.message"] == "retry"
+
+
+def test_inject_message_properties_without_span():
+    assert inject_message_properties(None) is None
+
+
+def test_bind_carries_span_to_another_loop(spans):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    async def current():
+        return tracer.current_span()
+
+    try:
+        with tracer.span("consumer") as span:
+            future = asyncio.run_coroutine_threadsafe(
+                tracer.bind(current()), loop
+            )
+            assert future.result(timeout=1) is span
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -2,7 +2,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi import FastAPI
-from main import app, lifespan
+from main import app, lifespan, load_kitchen_rows
+from src.infrastructure.realtime.kitchen_queue import KITCHEN_STATUSES
 
 
 @pytest.fixture
@@ -24,17 +25,15 @@ def mock_customer_repo():
 
 
 @pytest.fixture
-def mock_inventory_publisher():
-    with patch("main.get_inventory_publisher") as mock_inventory_publisher:
-        yield mock_inventory_publisher
+def mock_outbox_publisher():
+    with patch("main.get_outbox_publisher") as mock_outbox_publisher:
+        yield mock_outbox_publisher
 
 
 @pytest.fixture
-def mock_order_update_publisher():
-    with patch(
-        "main.get_order_update_publisher"
-    ) as mock_order_update_publisher:
-        yield mock_order_update_publisher
+def mock_outbox_relay():
+    with patch("main.OutboxRelay") as mock_outbox_relay:
+        yield mock_outbox_relay
 
 
 @pytest.fixture
@@ -61,38 +60,107 @@ def mock_delivery_subscriber():
         yield mock_delivery_subscriber
 
 
+@pytest.fixture
+def mock_deduplicator():
+    with patch("main.MessageDeduplicator") as mock_deduplicator:
+        yield mock_deduplicator
+
+
+@pytest.fixture
+def mock_processed_message_repo():
+    with patch(
+        "main.SQLAlchemyProcessedMessageRepository"
+    ) as mock_processed_message_repo:
+        yield mock_processed_message_repo
+
+
+@pytest.fixture
+def mock_event_loop_bridge():
+    with patch("main.EventLoopBridge") as mock_event_loop_bridge:
+        yield mock_event_loop_bridge
+
+
+@pytest.fixture
+def mock_health_monitor():
+    with patch("main.get_health_monitor") as mock_health_monitor:
+        yield mock_health_monitor
+
+
+@pytest.fixture
+def mock_inventory_client():
+    with patch("main.get_inventory_client") as mock_inventory_client:
+        yield mock_inventory_client
+
+
+@pytest.fixture
+def mock_kitchen_queue():
+    with patch("main.get_kitchen_queue") as mock_kitchen_queue:
+        yield mock_kitchen_queue
+
+
+@pytest.fixture
+def mock_event_hub():
+    with patch("main.get_event_hub") as mock_event_hub:
+        yield mock_event_hub
+
+
+@pytest.fixture
+def mock_order_status_subscriber():
+    with patch("main.OrderStatusSubscriber") as mock_order_status_subscriber:
+        yield mock_order_status_subscriber
+
+
 @pytest.mark.asyncio
 async def test_lifespan(
     mock_session,
     mock_order_repo,
     mock_customer_repo,
-    mock_inventory_publisher,
-    mock_order_update_publisher,
+    mock_outbox_publisher,
+    mock_outbox_relay,
     mock_order_service,
     mock_pika_connection,
     mock_payment_subscriber,
     mock_delivery_subscriber,
+    mock_event_loop_bridge,
+    mock_deduplicator,
+    mock_processed_message_repo,
+    mock_health_monitor,
+    mock_inventory_client,
+    mock_kitchen_queue,
+    mock_event_hub,
+    mock_order_status_subscriber,
 ):
     test_app = FastAPI(lifespan=lifespan)
 
     async with lifespan(test_app):
-        # Assert that the session was initialized
-        mock_session.assert_called_once()
+        # Assert that dependency health is refreshed in the background
+        mock_health_monitor().start.assert_called_once()
+
+        # Assert that each subscriber got a session
+        assert mock_session.call_count == 2
 
-        # Assert that repositories were initialized
-        mock_order_repo.assert_called_once_with(mock_session())
-        mock_customer_repo.assert_called_once_with(mock_session())
+        # Assert that repositories were initialized per session
+        assert mock_order_repo.call_count == 2
+        mock_order_repo.assert_called_with(mock_session())
+        assert mock_customer_repo.call_count == 2
+        mock_customer_repo.assert_called_with(mock_session())
 
-        # Assert that publishers were initialized
-        mock_inventory_publisher.assert_called_once()
-        mock_order_update_publisher.assert_called_once()
+        # Assert that events are staged in each subscriber's session
+        assert mock_outbox_publisher.call_count == 2
+        mock_outbox_publisher.assert_called_with(mock_session())
 
-        # Assert that the order service was initialized with correct arguments
-        mock_order_service.assert_called_once_with(
+        # Assert that the event loop bridge was started
+        mock_event_loop_bridge().start.assert_called_once()
+
+        # Assert that each subscriber got its own order service
+        assert mock_order_service.call_count == 2
+        mock_order_service.assert_called_with(
             mock_order_repo(),
             mock_customer_repo(),
-            mock_inventory_publisher(),
-            mock_order_update_publisher(),
+            mock_outbox_publisher(),
+            mock_outbox_publisher(),
+            http_session=mock_event_loop_bridge().http_session,
+            inventory_client=mock_inventory_client(),
         )
 
         # Assert that the pika connection was initialized
@@ -102,15 +170,58 @@ async def test_lifespan(
 
         # Assert that subscribers were initialized and started
         mock_payment_subscriber.assert_called_once_with(
-            mock_order_service(), mock_pika_connection()
+            mock_order_service(),
+            mock_pika_connection(),
+            event_loop_bridge=mock_event_loop_bridge(),
+            deduplicator=mock_deduplicator(),
         )
         mock_delivery_subscriber.assert_called_once_with(
-            mock_order_service(), mock_pika_connection()
+            mock_order_service(),
+            mock_pika_connection(),
+            event_loop_bridge=mock_event_loop_bridge(),
+            deduplicator=mock_deduplicator(),
+        )
+        assert mock_processed_message_repo.call_count == 2
+        mock_processed_message_repo.assert_called_with(mock_session())
+
+        # Assert that the kitchen queue is loaded by its subscriber, once
+        # the status queue is bound, and kept current from there
+        mock_kitchen_queue().load.assert_not_called()
+        mock_order_status_subscriber.assert_called_once_with(
+            mock_kitchen_queue(),
+            mock_event_hub(),
+            mock_pika_connection(),
+            load_snapshot=load_kitchen_rows,
         )
 
+        # Assert that the outbox relay was started
+        mock_outbox_relay.assert_called_once_with(
+            mock_session, mock_pika_connection()
+        )
+        mock_outbox_relay().start.assert_called_once()
+
         # Verify that the start_consuming method was called in separate threads
         assert mock_payment_subscriber().start_consuming.call_count == 1
         assert mock_delivery_subscriber().start_consuming.call_count == 1
+        assert mock_order_status_subscriber().start_consuming.call_count == 1
+
+    mock_outbox_relay().stop.assert_called_once()
+    mock_event_loop_bridge().stop.assert_called_once()
+    mock_health_monitor().stop.assert_called_once()
+    assert mock_session().close.call_count == 2
+
+
+def test_load_kitchen_rows_uses_short_lived_session(
+    mock_session, mock_order_repo
+):
+    rows = load_kitchen_rows()
+
+    mock_order_repo.assert_called_once_with(mock_session())
+    mock_order_repo().list_status_rows.assert_called_once_with(
+        KITCHEN_STATUSES
+    )
+    assert rows == mock_order_repo().list_status_rows()
+    mock_session().close.assert_called_once()
 
 
 def test_app_routes():
@@ -118,5 +229,10 @@ def test_app_routes():
 
     assert "/orders/" in routes
     assert "/orders/{order_id}" in routes
+    assert "/orders/{order_id}/events" in routes
     assert "/customers/" in routes
+    assert "/kitchen/queue" in routes
+    assert "/kitchen/queue/events" in routes
     assert "/health" in routes
+    assert "/health/live" in routes
+    assert "/health/ready" in routes
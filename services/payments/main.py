@@ -3,9 +3,21 @@ import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from src.adapters.api import health_api, payment_api
-from src.adapters.dependencies import get_payment_service
+from src.adapters.api import health_api, metrics_api, payment_api
+from src.adapters.dependencies import (
+    get_health_monitor,
+    get_message_deduplicator,
+    get_payment_publisher,
+    get_payment_service,
+)
+from src.adapters.middleware.compression_middleware import (
+    CompressionMiddleware,
+)
+from src.adapters.middleware.metrics_middleware import MetricsMiddleware
+from src.adapters.middleware.tracing_middleware import TracingMiddleware
 from src.infrastructure.messaging.order_subscriber import OrderSubscriber
+from src.infrastructure.tracing.exporters import start_tracing
+from src.infrastructure.tracing.tracer import tracer
 
 logger = logging.getLogger("app")
 logger.setLevel(logging.INFO)
@@ -21,12 +33,24 @@ logger.addHandler(console_handler)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    start_tracing(tracer)
+    health_monitor = get_health_monitor()
+    health_monitor.start()
     payment_service = get_payment_service()
-    order_subscriber = OrderSubscriber(payment_service)
+    order_subscriber = OrderSubscriber(
+        payment_service, deduplicator=get_message_deduplicator()
+    )
     threading.Thread(target=order_subscriber.start_consuming).start()
     yield
+    get_payment_publisher().close()
+    health_monitor.stop()
+    tracer.shutdown()
 
 
 app = FastAPI(lifespan=lifespan, root_path="/payments")
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(TracingMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(payment_api.router)
 app.include_router(health_api.router)
+app.include_router(metrics_api.router)
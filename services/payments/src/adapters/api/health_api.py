@@ -1,10 +1,25 @@
-from fastapi import APIRouter, Depends
-from src.adapters.dependencies import get_health_service
-from src.infrastructure.health.health_service import HealthService
+from fastapi import APIRouter, Depends, Response, status
+from src.adapters.dependencies import get_health_monitor
+from src.infrastructure.health.health_monitor import HealthMonitor
 
 router = APIRouter()
 
 
 @router.get("/health", tags=["Health"])
-def health_check(health_service: HealthService = Depends(get_health_service)):
-    return health_service.get_health_status()
+def health_check(health_monitor: HealthMonitor = Depends(get_health_monitor)):
+    return health_monitor.get_health_status()
+
+
+@router.get("/health/live", tags=["Health"])
+def liveness_check():
+    return {"status": "alive"}
+
+
+@router.get("/health/ready", tags=["Health"])
+def readiness_check(
+    response: Response,
+    health_monitor: HealthMonitor = Depends(get_health_monitor),
+):
+    if not health_monitor.is_ready():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return health_monitor.get_health_status()
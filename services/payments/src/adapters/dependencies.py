@@ -1,14 +1,27 @@
 import os
+from functools import lru_cache
 
 import pika
+from src.config import Config
 from src.application.services.payment_service import PaymentService
 from src.application.services.qr_code_service import QRCodeService
+from src.infrastructure.health.health_monitor import HealthMonitor
 from src.infrastructure.health.health_service import HealthService
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
 from src.infrastructure.messaging.payment_publisher import PaymentPublisher
-from src.infrastructure.persistence.db_setup import db, payments_collection
+from src.infrastructure.persistence.db_setup import (
+    db,
+    payments_collection,
+    processed_messages_collection,
+)
 from src.infrastructure.persistence.mongo_payment_repository import (
     MongoDBPaymentRepository,
 )
+from src.infrastructure.persistence.mongo_processed_message_repository import (
+    MongoDBProcessedMessageRepository,
+)
 
 
 def get_payment_service() -> PaymentService:
@@ -20,7 +33,9 @@ def get_payment_service() -> PaymentService:
     )
 
 
+@lru_cache
 def get_payment_publisher() -> PaymentPublisher:
+    # One publisher per process; it owns the connection and local buffer
     connection_params = pika.ConnectionParameters(
         host="rabbitmq", heartbeat=120
     )
@@ -36,3 +51,22 @@ def get_qr_code_service() -> QRCodeService:
 
 def get_health_service() -> HealthService:
     return HealthService(db, rabbitmq_host="rabbitmq")
+
+
+@lru_cache
+def get_health_monitor() -> HealthMonitor:
+    health_service = get_health_service()
+    return HealthMonitor(
+        {
+            "mongodb": health_service.check_mongodb,
+            "rabbitmq": health_service.check_rabbitmq,
+        }
+    )
+
+
+def get_message_deduplicator() -> MessageDeduplicator:
+    repository = MongoDBProcessedMessageRepository(
+        processed_messages_collection
+    )
+    repository.ensure_ttl_index(Config.MESSAGE_LEDGER_TTL)
+    return MessageDeduplicator(repository)
@@ -11,6 +11,15 @@ class PaymentStatus(str, Enum):
 
 
 class PaymentEntity:
+    __slots__ = (
+        "id",
+        "order_id",
+        "amount",
+        "status",
+        "qr_code",
+        "qr_code_expiration",
+    )
+
     def __init__(
         self,
         order_id: int,
@@ -29,3 +38,13 @@ class PaymentEntity:
 
     def update_status(self, new_status: str):
         self.status = new_status
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "order_id": self.order_id,
+            "amount": self.amount,
+            "status": self.status,
+            "qr_code": self.qr_code,
+            "qr_code_expiration": self.qr_code_expiration,
+        }
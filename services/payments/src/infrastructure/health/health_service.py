@@ -9,6 +9,7 @@ class HealthService:
     def __init__(self, db, rabbitmq_host: str):
         self.db = db
         self.rabbitmq_host = rabbitmq_host
+        self.rabbitmq_connection = None
 
     def check_mongodb(self) -> bool:
         try:
@@ -21,15 +22,22 @@ class HealthService:
 
     def check_rabbitmq(self) -> bool:
         try:
-            connection = pika.BlockingConnection(
-                pika.ConnectionParameters(
-                    host=self.rabbitmq_host, heartbeat=120
+            # Reuses one connection across checks instead of opening and
+            # closing a new one on every probe
+            if (
+                self.rabbitmq_connection is None
+                or not self.rabbitmq_connection.is_open
+            ):
+                self.rabbitmq_connection = pika.BlockingConnection(
+                    pika.ConnectionParameters(
+                        host=self.rabbitmq_host, heartbeat=120
+                    )
                 )
-            )
-            connection.close()
+            self.rabbitmq_connection.process_data_events(time_limit=0)
             return True
         except Exception as e:
             logger.error(f"RabbitMQ health check failed: {e}")
+            self.rabbitmq_connection = None
             return False
 
     def get_health_status(self) -> dict:
@@ -0,0 +1,67 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+from src.config import Config
+
+logger = logging.getLogger("app")
+
+
+class CircuitBreaker:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+    ):
+        self.failure_threshold = (
+            failure_threshold or Config.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+        )
+        self.reset_timeout = (
+            reset_timeout or Config.CIRCUIT_BREAKER_RESET_TIMEOUT
+        )
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow_request(self) -> bool:
+        return self.state != self.OPEN
+
+    def retry_after(self) -> float:
+        if self._opened_at is None:
+            return 0.0
+        elapsed = time.monotonic() - self._opened_at
+        return max(self.reset_timeout - elapsed, 0.0)
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit breaker closed.")
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            # A failed trial call while half-open re-opens immediately
+            if (
+                self._opened_at is not None
+                or self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                logger.warning(
+                    f"Circuit breaker open for {self.reset_timeout}s after "
+                    f"{self._failures} consecutive failures."
+                )
@@ -1,24 +1,39 @@
 import json
 import logging
+from typing import Optional
 
 import pika
 from src.application.services.payment_service import PaymentService
 from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.consumer_metrics import instrument_consumer
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.messaging.retry_topology import RetryTopology
+from src.infrastructure.tracing.tracer import traced_consumer
 
 logger = logging.getLogger("app")
 
 
 class OrderSubscriber(BaseMessagingAdapter):
     def __init__(
-        self, payment_service: PaymentService, max_retries=5, delay=5
+        self,
+        payment_service: PaymentService,
+        max_retries=5,
+        delay=5,
+        deduplicator: Optional[MessageDeduplicator] = None,
+        retry_topology: Optional[RetryTopology] = None,
     ):
         self.payment_service = payment_service
+        self.deduplicator = deduplicator
+        self.retry_topology = retry_topology or RetryTopology("orders_queue")
         connection_params = pika.ConnectionParameters(
             host="rabbitmq", heartbeat=120
         )
         super().__init__(connection_params, max_retries, delay)
 
     def start_consuming(self):
+        self.ensure_connected()
         self.channel.exchange_declare(
             exchange="orders_exchange", exchange_type="topic", durable=True
         )
@@ -28,6 +43,7 @@ class OrderSubscriber(BaseMessagingAdapter):
             queue="orders_queue",
             routing_key="orders_queue",
         )
+        self.retry_topology.declare(self.channel)
 
         self.channel.basic_consume(
             queue="orders_queue",
@@ -36,10 +52,20 @@ class OrderSubscriber(BaseMessagingAdapter):
         )
 
         logger.info("Starting to consume messages from orders_queue.")
+        self.schedule_queue_sampling(self.on_message)
         self.channel.start_consuming()
 
+    @instrument_consumer("orders_queue")
+    @traced_consumer("orders_queue")
     def on_message(self, ch, method, properties, body):
         logger.info(f"Received message from orders_queue: {body}")
+        if self.deduplicator and self.deduplicator.is_duplicate(properties):
+            logger.info(
+                f"Skipping duplicate message {properties.message_id} "
+                "from orders_queue."
+            )
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
         try:
             data = json.loads(body.decode("utf-8"))
             order_id = data.get("order_id")
@@ -50,10 +76,9 @@ class OrderSubscriber(BaseMessagingAdapter):
                 payment = self.payment_service.get_payment_by_order_id(
                     order_id
                 )
-                if payment.status in ["failed", "refunded", "canceled"]:
-                    return
-                self.payment_service.cancel_payment(payment.id)
-                logger.info(f"Canceled payment for order ID: {order_id}.")
+                if payment.status not in ["failed", "refunded", "canceled"]:
+                    self.payment_service.cancel_payment(payment.id)
+                    logger.info(f"Canceled payment for order ID: {order_id}.")
 
             if status == "confirmed":
                 self.payment_service.create_payment(
@@ -62,7 +87,12 @@ class OrderSubscriber(BaseMessagingAdapter):
                 logger.info(
                     f"Created pending payment for order ID: {order_id}."
                 )
+            if self.deduplicator:
+                self.deduplicator.mark_processed(properties)
         except Exception as e:
             logger.error(f"Error processing message: {e}")
+            if self.deduplicator:
+                self.deduplicator.discard()
+            self.retry_topology.retry(ch, properties, body, e)
         finally:
             ch.basic_ack(delivery_tag=method.delivery_tag)
@@ -1,5 +1,6 @@
 import json
 import logging
+import uuid
 
 import pika
 from src.infrastructure.messaging.base import BaseMessagingAdapter
@@ -22,16 +23,9 @@ class PaymentPublisher(BaseMessagingAdapter):
                 "status": status,
             }
         )
-        try:
-            self.channel.basic_publish(
-                exchange=self.exchange_name,
-                routing_key="payment_queue",
-                body=message,
-            )
-            logger.info(
-                f"Published payment update: {message} to payment_queue"
-            )
-        except pika.exceptions.ConnectionClosed:
-            logger.error("Connection closed, attempting to reconnect.")
-            self.connect()
-            self.publish_payment_update(payment_id, order_id, status)
+        if self.publish(
+            "payment_queue",
+            message,
+            pika.BasicProperties(message_id=uuid.uuid4().hex),
+        ):
+            logger.info(f"Queued payment update: {message} to payment_queue")
@@ -0,0 +1,31 @@
+import argparse
+
+import pika
+from src.infrastructure.messaging.retry_topology import RetryTopology
+
+QUEUES = ["orders_queue"]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Move dead-lettered messages back onto their queue."
+    )
+    parser.add_argument("queue", choices=QUEUES)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    connection = pika.BlockingConnection(
+        pika.ConnectionParameters(host="rabbitmq")
+    )
+    try:
+        replayed = RetryTopology(args.queue).replay_dead_letters(
+            connection.channel(), limit=args.limit
+        )
+    finally:
+        connection.close()
+    print(f"Replayed {replayed} messages onto {args.queue}.")
+    return replayed
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,14 @@
 from pymongo import MongoClient
 from src.config import Config
+from src.infrastructure.metrics.request_metrics import QueryCommandListener
 
 client = MongoClient(
     host=Config.MONGO_HOST,
     port=Config.MONGO_PORT,
     username=Config.MONGO_USER,
     password=Config.MONGO_PASS,
+    event_listeners=[QueryCommandListener()],
 )
 db = client[Config.MONGO_DB]
 payments_collection = db["payments"]
+processed_messages_collection = db["processed_messages"]
@@ -3,8 +3,10 @@ from typing import Optional
 from bson.objectid import ObjectId
 from src.domain.entities.payment_entity import PaymentEntity
 from src.domain.repositories.payment_repository import PaymentRepository
+from src.infrastructure.tracing.tracer import traced_repository
 
 
+@traced_repository("mongodb")
 class MongoDBPaymentRepository(PaymentRepository):
     def __init__(self, db):
         self.db = db
@@ -12,10 +14,10 @@ class MongoDBPaymentRepository(PaymentRepository):
     def save(self, payment: PaymentEntity):
         if payment.id:
             self.db.replace_one(
-                {"_id": ObjectId(payment.id)}, payment.__dict__
+                {"_id": ObjectId(payment.id)}, payment.to_dict()
             )
         else:
-            result = self.db.insert_one(payment.__dict__)
+            result = self.db.insert_one(payment.to_dict())
             payment.id = str(result.inserted_id)
 
     def find_by_id(self, payment_id: str) -> Optional[PaymentEntity]:
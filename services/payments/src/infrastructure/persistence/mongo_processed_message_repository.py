@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Set
+
+from pymongo.errors import DuplicateKeyError
+from src.domain.repositories.processed_message_repository import (
+    ProcessedMessageRepository,
+)
+from src.infrastructure.tracing.tracer import traced_repository
+
+
+@traced_repository("mongodb")
+class MongoDBProcessedMessageRepository(ProcessedMessageRepository):
+    # A standalone Mongo has no multi-document transactions to join, so
+    # claimed ids are held here and written once the handler succeeds
+    def __init__(self, db):
+        self.db = db
+        self._staged: Set[str] = set()
+
+    def ensure_ttl_index(self, ttl: int):
+        # Mongo expires ledger entries on its own; delete_older_than stays
+        # as the portable fallback used by MessageDeduplicator.
+        self.db.create_index("processed_at", expireAfterSeconds=ttl)
+
+    def exists(self, message_id: str) -> bool:
+        return (
+            self.db.find_one({"_id": message_id}, projection={"_id": 1})
+            is not None
+        )
+
+    def add(self, message_id: str) -> bool:
+        if message_id in self._staged or self.exists(message_id):
+            return False
+        self._staged.add(message_id)
+        return True
+
+    def commit(self):
+        staged, self._staged = self._staged, set()
+        for message_id in staged:
+            try:
+                self.db.insert_one(
+                    {"_id": message_id, "processed_at": datetime.utcnow()}
+                )
+            except DuplicateKeyError:
+                pass
+
+    def rollback(self):
+        self._staged.clear()
+
+    def delete_older_than(self, cutoff: datetime) -> int:
+        result = self.db.delete_many({"processed_at": {"$lt": cutoff}})
+        return result.deleted_count
@@ -0,0 +1,313 @@
+import contextvars
+import functools
+import random
+import re
+import secrets
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+import pika
+from src.config import Config
+
+# W3C Trace Context header, understood by OpenTelemetry SDKs and collectors
+TRACEPARENT = "traceparent"
+_TRACEPARENT_RE = re.compile(
+    r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$"
+)
+
+
+class SpanKind:
+    # Values match the OTLP protobuf enum
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+class StatusCode:
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+class SpanContext:
+    __slots__ = ("trace_id", "span_id", "sampled")
+
+    def __init__(self, trace_id: str, span_id: str, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    def to_traceparent(self) -> str:
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+    @classmethod
+    def from_traceparent(cls, value: Any) -> Optional["SpanContext"]:
+        if isinstance(value, bytes):
+            value = value.decode("ascii", "ignore")
+        if not isinstance(value, str):
+            return None
+        match = _TRACEPARENT_RE.match(value.strip().lower())
+        if match is None:
+            return None
+        version, trace_id, span_id, flags = match.groups()
+        if version == "ff" or trace_id == "0" * 32 or span_id == "0" * 16:
+            return None
+        return cls(trace_id, span_id, sampled=bool(int(flags, 16) & 1))
+
+
+class Span:
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: SpanContext,
+        parent_span_id: Optional[str] = None,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.kind = kind
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.events: List[dict] = []
+        self.status_code = StatusCode.UNSET
+        self.status_message = ""
+        self.start_time_unix_nano = time.time_ns()
+        self.end_time_unix_nano: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any):
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_status(self, code: int, message: str = ""):
+        self.status_code = code
+        self.status_message = message
+
+    def add_event(self, name: str, attributes: Optional[dict] = None):
+        self.events.append(
+            {
+                "name": name,
+                "time_unix_nano": time.time_ns(),
+                "attributes": dict(attributes or {}),
+            }
+        )
+
+    def record_exception(
+        self, exception: BaseException, set_status: bool = True
+    ):
+        # set_status=False records an error the operation recovered from
+        self.add_event(
+            "exception",
+            {
+                "exception.type": type(exception).__name__,
+                "exception.message": str(exception),
+            },
+        )
+        if set_status:
+            self.set_status(StatusCode.ERROR, str(exception))
+
+    def end(self):
+        if self.end_time_unix_nano is not None:
+            return
+        self.end_time_unix_nano = time.time_ns()
+        self.tracer._on_end(self)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_time_unix_nano or time.time_ns()
+        return (end - self.start_time_unix_nano) / 1e6
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Tracer:
+    # Spans are always created so context keeps propagating; they are only
+    # handed to the processor when sampled and an exporter is configured.
+    def __init__(
+        self,
+        service_name: str,
+        sample_ratio: float = 1.0,
+        processor=None,
+    ):
+        self.service_name = service_name
+        self.sample_ratio = sample_ratio
+        self.processor = processor
+
+    def start(self, processor):
+        self.processor = processor
+
+    def shutdown(self):
+        processor, self.processor = self.processor, None
+        if processor is not None:
+            processor.shutdown()
+
+    def _on_end(self, span: Span):
+        processor = self.processor
+        if processor is not None and span.context.sampled:
+            processor.on_end(span)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def start_span(
+        self,
+        name: str,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Span:
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+        if parent is None:
+            context = SpanContext(
+                secrets.token_hex(16),
+                secrets.token_hex(8),
+                sampled=random.random() < self.sample_ratio,
+            )
+            parent_span_id = None
+        else:
+            context = SpanContext(
+                parent.trace_id, secrets.token_hex(8), parent.sampled
+            )
+            parent_span_id = parent.span_id
+        return Span(self, name, context, parent_span_id, kind, attributes)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: int = SpanKind.INTERNAL,
+        attributes: Optional[Dict[str, Any]] = None,
+        parent: Optional[SpanContext] = None,
+    ) -> Iterator[Span]:
+        span = self.start_span(name, kind, attributes, parent)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def inject(
+        self, carrier: Dict[str, Any], span: Optional[Span] = None
+    ) -> Dict[str, Any]:
+        span = span or _current_span.get()
+        if span is not None:
+            carrier[TRACEPARENT] = span.context.to_traceparent()
+        return carrier
+
+    def extract(self, carrier: Optional[Mapping]) -> Optional[SpanContext]:
+        if not carrier:
+            return None
+        return SpanContext.from_traceparent(carrier.get(TRACEPARENT))
+
+    def current_traceparent(self) -> Optional[str]:
+        span = _current_span.get()
+        return span.context.to_traceparent() if span is not None else None
+
+    def bind(self, coro):
+        # Coroutines handed to another thread's loop start from that
+        # loop's context; carry the caller's span across.
+        span = _current_span.get()
+        if span is None:
+            return coro
+        return _run_with_span(coro, span)
+
+
+async def _run_with_span(coro, span: Span):
+    token = _current_span.set(span)
+    try:
+        return await coro
+    finally:
+        _current_span.reset(token)
+
+
+tracer = Tracer(Config.TRACING_SERVICE_NAME, Config.TRACING_SAMPLE_RATIO)
+
+
+def traced_repository(db_system: str):
+    # Wraps the public methods a repository class defines in a CLIENT span
+    def decorator(cls):
+        for name, method in list(vars(cls).items()):
+            if (
+                name.startswith("_")
+                or not callable(method)
+                or isinstance(method, (staticmethod, classmethod))
+            ):
+                continue
+            setattr(
+                cls,
+                name,
+                _traced_method(cls.__name__, name, method, db_system),
+            )
+        return cls
+
+    return decorator
+
+
+def _traced_method(class_name: str, name: str, method, db_system: str):
+    span_name = f"{class_name}.{name}"
+    attributes = {"db.system": db_system, "code.function": name}
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with tracer.span(span_name, SpanKind.CLIENT, attributes):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+def traced_consumer(queue: str):
+    # Continues the publisher's trace from the message headers
+    attributes = {
+        "messaging.system": "rabbitmq",
+        "messaging.operation": "process",
+        "messaging.destination.name": queue,
+    }
+
+    def decorator(on_message):
+        @functools.wraps(on_message)
+        def wrapper(self, ch, method, properties, body):
+            headers = getattr(properties, "headers", None)
+            parent = tracer.extract(
+                headers if isinstance(headers, dict) else None
+            )
+            with tracer.span(
+                f"{queue} process", SpanKind.CONSUMER, attributes, parent
+            ) as span:
+                span.set_attribute(
+                    "messaging.message.id",
+                    getattr(properties, "message_id", None),
+                )
+                return on_message(self, ch, method, properties, body)
+
+        return wrapper
+
+    return decorator
+
+
+def inject_message_properties(properties, span: Optional[Span] = None):
+    # pika.BasicProperties with the given (or current) span in its headers
+    span = span or tracer.current_span()
+    if span is None:
+        return properties
+    if properties is None:
+        properties = pika.BasicProperties()
+    headers = (
+        properties.headers if isinstance(properties.headers, dict) else {}
+    )
+    properties.headers = tracer.inject(dict(headers), span)
+    return properties
@@ -1,30 +1,57 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-import pytest
-from src.adapters.api.health_api import health_check
-from src.infrastructure.health.health_service import HealthService
+from fastapi import Response
+from src.adapters.api.health_api import (
+    health_check,
+    liveness_check,
+    readiness_check,
+)
+from src.infrastructure.health.health_monitor import HealthMonitor
 
 
-@patch("src.adapters.api.health_api.get_health_service")
-def test_health_check(mock_get_health_service):
-    # Create a mock HealthService instance
-    mock_health_service = MagicMock(spec=HealthService)
+def test_health_check():
+    # Create a mock HealthMonitor instance
+    mock_health_monitor = MagicMock(spec=HealthMonitor)
 
     # Define the expected health status return value
     expected_health_status = {
         "mongodb": "healthy",
         "rabbitmq": "healthy",
     }
-
-    # Set up the mock to return the expected health status
-    mock_health_service.get_health_status.return_value = expected_health_status
-    mock_get_health_service.return_value = mock_health_service
+    mock_health_monitor.get_health_status.return_value = expected_health_status
 
     # Call the health_check function
-    response = health_check(health_service=mock_health_service)
-
-    # Assert that the get_health_status method was called once
-    mock_health_service.get_health_status.assert_called_once()
+    response = health_check(health_monitor=mock_health_monitor)
 
-    # Assert that the response is as expected
+    # Assert that the cached snapshot is returned
+    mock_health_monitor.get_health_status.assert_called_once()
     assert response == expected_health_status
+
+
+def test_liveness_check():
+    assert liveness_check() == {"status": "alive"}
+
+
+def test_readiness_check_not_ready():
+    mock_health_monitor = MagicMock(spec=HealthMonitor)
+    mock_health_monitor.is_ready.return_value = False
+    mock_health_monitor.get_health_status.return_value = {
+        "mongodb": "unhealthy",
+        "rabbitmq": "healthy",
+    }
+    response = Response()
+
+    result = readiness_check(response, health_monitor=mock_health_monitor)
+
+    assert response.status_code == 503
+    assert result["mongodb"] == "unhealthy"
+
+
+def test_readiness_check_ready():
+    mock_health_monitor = MagicMock(spec=HealthMonitor)
+    mock_health_monitor.is_ready.return_value = True
+    response = Response()
+
+    readiness_check(response, health_monitor=mock_health_monitor)
+
+    assert response.status_code == 200
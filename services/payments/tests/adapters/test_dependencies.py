@@ -3,13 +3,16 @@ from unittest.mock import MagicMock, patch
 import pika
 import pytest
 from src.adapters.dependencies import (
+    get_health_monitor,
     get_health_service,
+    get_message_deduplicator,
     get_payment_publisher,
     get_payment_service,
     get_qr_code_service,
 )
 from src.application.services.payment_service import PaymentService
 from src.application.services.qr_code_service import QRCodeService
+from src.config import Config
 from src.infrastructure.health.health_service import HealthService
 from src.infrastructure.messaging.payment_publisher import PaymentPublisher
 from src.infrastructure.persistence.mongo_payment_repository import (
@@ -53,6 +56,7 @@ def test_get_payment_publisher(
     mock_connection_params_instance = mock_connection_parameters.return_value
     mock_payment_publisher_instance = MagicMock(spec=PaymentPublisher)
     mock_payment_publisher.return_value = mock_payment_publisher_instance
+    get_payment_publisher.cache_clear()
 
     payment_publisher = get_payment_publisher()
 
@@ -63,6 +67,19 @@ def test_get_payment_publisher(
         mock_connection_params_instance
     )
     assert payment_publisher == mock_payment_publisher_instance
+    get_payment_publisher.cache_clear()
+
+
+@patch("src.adapters.dependencies.PaymentPublisher")
+def test_get_payment_publisher_is_shared(mock_payment_publisher):
+    get_payment_publisher.cache_clear()
+
+    first = get_payment_publisher()
+    second = get_payment_publisher()
+
+    assert first is second
+    mock_payment_publisher.assert_called_once()
+    get_payment_publisher.cache_clear()
 
 
 @patch("src.adapters.dependencies.os.getenv")
@@ -79,3 +96,25 @@ def test_get_qr_code_service(mock_qr_code_service, mock_getenv):
     )
     mock_qr_code_service.assert_called_once_with("fake_access_token")
     assert qr_code_service == mock_qr_code_service_instance
+
+
+def test_get_health_monitor():
+    get_health_monitor.cache_clear()
+
+    health_monitor = get_health_monitor()
+
+    assert get_health_monitor() is health_monitor
+    assert set(health_monitor.checks) == {"mongodb", "rabbitmq"}
+    get_health_monitor.cache_clear()
+
+
+@patch("src.adapters.dependencies.processed_messages_collection")
+@patch("src.adapters.dependencies.MongoDBProcessedMessageRepository")
+def test_get_message_deduplicator(mock_mongo_repo, mock_collection):
+    deduplicator = get_message_deduplicator()
+
+    mock_mongo_repo.assert_called_once_with(mock_collection)
+    mock_mongo_repo.return_value.ensure_ttl_index.assert_called_once_with(
+        Config.MESSAGE_LEDGER_TTL
+    )
+    assert deduplicator.repository == mock_mongo_repo.return_value
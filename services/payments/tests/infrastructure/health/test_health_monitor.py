@@ -0,0 +1,68 @@
+import threading
+from unittest.mock import MagicMock
+
+from src.infrastructure.health.health_monitor import HealthMonitor
+
+
+def test_initial_status_is_unknown_and_not_ready():
+    monitor = HealthMonitor({"database": MagicMock(return_value=True)})
+
+    assert monitor.get_health_status() == {"database": "unknown"}
+    assert monitor.is_ready() is False
+
+
+def test_refresh_caches_check_results():
+    database_check = MagicMock(return_value=True)
+    rabbitmq_check = MagicMock(return_value=False)
+    monitor = HealthMonitor(
+        {"database": database_check, "rabbitmq": rabbitmq_check}
+    )
+
+    monitor.refresh()
+    status = monitor.get_health_status()
+    monitor.get_health_status()
+
+    assert status == {"database": "healthy", "rabbitmq": "unhealthy"}
+    assert monitor.is_ready() is False
+    assert monitor.checked_at is not None
+    database_check.assert_called_once()
+    rabbitmq_check.assert_called_once()
+
+
+def test_refresh_marks_raising_check_unhealthy():
+    monitor = HealthMonitor({"database": MagicMock(side_effect=Exception)})
+
+    monitor.refresh()
+
+    assert monitor.get_health_status() == {"database": "unhealthy"}
+
+
+def test_refresh_times_out_slow_check_without_resubmitting():
+    release = threading.Event()
+    slow_check = MagicMock(side_effect=lambda: release.wait() or True)
+    monitor = HealthMonitor(
+        {"rabbitmq": slow_check, "database": MagicMock(return_value=True)},
+        timeout=0.05,
+    )
+
+    monitor.refresh()
+    monitor.refresh()
+
+    assert monitor.get_health_status() == {
+        "rabbitmq": "unhealthy",
+        "database": "healthy",
+    }
+    slow_check.assert_called_once()
+    release.set()
+    monitor.stop()
+
+
+def test_start_and_stop():
+    check = MagicMock(return_value=True)
+    monitor = HealthMonitor({"database": check}, interval=0.01)
+
+    monitor.start()
+    monitor.stop()
+
+    assert not monitor._thread.is_alive()
+    check.assert_called()
@@ -38,11 +38,13 @@ def test_check_rabbitmq_success(mock_blocking_connection):
 
     health_service = HealthService(db=None, rabbitmq_host="localhost")
 
+    assert health_service.check_rabbitmq() is True
     assert health_service.check_rabbitmq() is True
     mock_blocking_connection.assert_called_once_with(
         pika.ConnectionParameters(host="localhost", heartbeat=120)
     )
-    mock_connection.close.assert_called_once()
+    assert mock_connection.process_data_events.call_count == 2
+    mock_connection.close.assert_not_called()
 
 
 @patch("src.infrastructure.health.health_service.pika.BlockingConnection")
@@ -56,6 +58,7 @@ def test_check_rabbitmq_failure(mock_blocking_connection):
     mock_blocking_connection.assert_called_once_with(
         pika.ConnectionParameters(host="localhost", heartbeat=120)
     )
+    assert health_service.rabbitmq_connection is None
 
 
 def test_get_health_status():
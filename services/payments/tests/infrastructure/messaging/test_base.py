@@ -1,9 +1,16 @@
 import time
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 import pika
 import pytest
 from src.infrastructure.messaging.base import BaseMessagingAdapter
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+from src.infrastructure.tracing.tracer import (
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    tracer,
+)
 
 
 @patch("src.infrastructure.messaging.base.pika.BlockingConnection")
@@ -16,6 +23,7 @@ def test_connect_success(mock_sleep, mock_logger, mock_blocking_connection):
 
     connection_params = MagicMock()
     adapter = BaseMessagingAdapter(connection_params)
+    adapter.connect()
 
     mock_blocking_connection.assert_called_once_with(connection_params)
     assert adapter.connection == mock_connection
@@ -39,6 +47,7 @@ def test_connect_failure_then_success(
 
     connection_params = MagicMock()
     adapter = BaseMessagingAdapter(connection_params)
+    adapter.connect()
 
     assert mock_blocking_connection.call_count == 2
     assert adapter.connection == mock_connection
@@ -65,7 +74,7 @@ def test_connect_failure_max_retries(
         pika.exceptions.AMQPConnectionError,
         match="Failed to connect to RabbitMQ after multiple attempts.",
     ):
-        BaseMessagingAdapter(connection_params)
+        BaseMessagingAdapter(connection_params).connect()
 
     assert mock_blocking_connection.call_count == 5
     assert (
@@ -85,7 +94,7 @@ def test_adapter_initialization():
         assert adapter.connection_params == connection_params
         assert adapter.max_retries == 3
         assert adapter.delay == 2
-        mock_connect.assert_called_once()
+        mock_connect.assert_not_called()
 
 
 @patch(
@@ -97,7 +106,7 @@ def test_adapter_initialization():
 def test_connect_logging(mock_sleep, mock_logger, mock_blocking_connection):
     connection_params = MagicMock()
     with pytest.raises(pika.exceptions.AMQPConnectionError):
-        BaseMessagingAdapter(connection_params)
+        BaseMessagingAdapter(connection_params).connect()
 
     expected_calls = [
         call("Attempt 1/5 to connect to RabbitMQ failed: Connection failed"),
@@ -108,3 +117,125 @@ def test_connect_logging(mock_sleep, mock_logger, mock_blocking_connection):
         call("Max retries exceeded. Could not connect to RabbitMQ."),
     ]
     mock_logger.error.assert_has_calls(expected_calls, any_order=False)
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_sends_buffered_message_in_background(
+    mock_blocking_connection,
+):
+    mock_channel = MagicMock()
+    mock_channel.is_closed = False
+    mock_blocking_connection.return_value.channel.return_value = mock_channel
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.exchange_name = "test_exchange"
+
+    assert adapter.publish("test_queue", "body") is True
+    adapter.close()
+
+    mock_channel.basic_publish.assert_called_once_with(
+        exchange="test_exchange",
+        routing_key="test_queue",
+        body="body",
+        properties=ANY,
+    )
+    properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+    # The publish span's context travels in the message headers
+    assert SpanContext.from_traceparent(properties.headers["traceparent"])
+    assert adapter.pending_messages() == 0
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_keeps_message_while_circuit_is_open(
+    mock_blocking_connection,
+):
+    mock_blocking_connection.side_effect = pika.exceptions.AMQPConnectionError
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    adapter = BaseMessagingAdapter(MagicMock(), circuit_breaker=breaker)
+
+    assert adapter.publish("test_queue", "body") is True
+    adapter.close(timeout=1)
+
+    assert mock_blocking_connection.call_count == 1
+    assert breaker.state == CircuitBreaker.OPEN
+    assert adapter.pending_messages() == 1
+
+
+def test_publish_drops_message_when_buffer_is_full():
+    adapter = BaseMessagingAdapter(MagicMock(), buffer_size=1)
+    adapter.exchange_name = "full_exchange"
+    adapter._start_publisher = MagicMock()
+
+    assert adapter.publish("test_queue", "first") is True
+    assert adapter.publish("test_queue", "second") is False
+    assert adapter.dropped_messages.get(exchange="full_exchange") == 1
+
+
+class _Collector:
+    def __init__(self):
+        self.spans = []
+
+    def on_end(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def spans():
+    collector = _Collector()
+    tracer.start(collector)
+    yield collector.spans
+    tracer.shutdown()
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_span_ends_when_message_is_sent(
+    mock_blocking_connection, spans
+):
+    mock_channel = MagicMock()
+    mock_channel.is_closed = False
+    mock_blocking_connection.return_value.channel.return_value = mock_channel
+    adapter = BaseMessagingAdapter(MagicMock())
+    adapter.exchange_name = "test_exchange"
+
+    adapter.publish("test_queue", "body")
+    adapter.close()
+
+    properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+    context = SpanContext.from_traceparent(properties.headers["traceparent"])
+    assert [span.name for span in spans] == ["test_exchange publish"]
+    assert spans[0].kind == SpanKind.PRODUCER
+    assert spans[0].context.span_id == context.span_id
+    assert spans[0].status_code == StatusCode.UNSET
+
+
+def test_publish_span_records_full_buffer(spans):
+    adapter = BaseMessagingAdapter(MagicMock(), buffer_size=1)
+    adapter.exchange_name = "full_exchange"
+    adapter._start_publisher = MagicMock()
+
+    adapter.publish("test_queue", "first")
+    adapter.publish("test_queue", "second")
+
+    assert len(spans) == 1
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].status_message == "publish buffer full"
+
+
+@patch("src.infrastructure.messaging.base.pika.BlockingConnection")
+def test_publish_span_records_unsent_message_on_close(
+    mock_blocking_connection, spans
+):
+    mock_blocking_connection.side_effect = pika.exceptions.AMQPConnectionError
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    adapter = BaseMessagingAdapter(MagicMock(), circuit_breaker=breaker)
+    adapter.exchange_name = "test_exchange"
+
+    adapter.publish("test_queue", "body")
+    adapter.close(timeout=1)
+
+    assert len(spans) == 1
+    assert spans[0].status_code == StatusCode.ERROR
+    assert spans[0].status_message == "publisher closed"
+    assert spans[0].events[0]["name"] == "exception"
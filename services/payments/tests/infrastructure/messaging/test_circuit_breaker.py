@@ -0,0 +1,53 @@
+from unittest.mock import patch
+
+from src.infrastructure.messaging.circuit_breaker import CircuitBreaker
+
+
+def test_opens_after_failure_threshold():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.allow_request() is True
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+    assert 0 < breaker.retry_after() <= 30
+
+
+@patch("src.infrastructure.messaging.circuit_breaker.time.monotonic")
+def test_half_opens_after_reset_timeout(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    mock_monotonic.return_value = 131.0
+
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request() is True
+    assert breaker.retry_after() == 0
+
+
+@patch("src.infrastructure.messaging.circuit_breaker.time.monotonic")
+def test_failed_trial_reopens(mock_monotonic):
+    mock_monotonic.return_value = 100.0
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    for _ in range(3):
+        breaker.record_failure()
+    mock_monotonic.return_value = 131.0
+
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.retry_after() == 30
+
+
+def test_success_closes_and_resets_failures():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.CLOSED
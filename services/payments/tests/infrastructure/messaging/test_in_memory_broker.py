@@ -0,0 +1,118 @@
+import json
+from unittest.mock import MagicMock
+
+import pika
+from src.infrastructure.messaging.in_memory_broker import InMemoryBroker
+from src.infrastructure.messaging.order_subscriber import OrderSubscriber
+
+
+def test_publish_routes_to_bound_queues():
+    broker = InMemoryBroker()
+    broker.bind("orders_exchange", "orders_queue", "orders_queue")
+
+    broker.publish("orders_exchange", "orders_queue", "{}")
+    broker.publish("orders_exchange", "other_queue", "{}")
+
+    assert broker.message_count("orders_queue") == 1
+    assert broker.message_count("other_queue") == 0
+
+
+def test_default_exchange_routes_by_queue_name():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+
+    channel.basic_publish(exchange="", routing_key="retry_queue", body="{}")
+
+    assert channel.queue_declare("retry_queue").method.message_count == 1
+
+
+def test_queue_declare_names_exclusive_queues():
+    channel = InMemoryBroker().connection().channel()
+
+    result = channel.queue_declare(queue="", exclusive=True)
+
+    assert result.method.queue.startswith("amq.gen-")
+
+
+def test_start_consuming_drains_queue_and_returns():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    channel.queue_declare("orders_queue")
+    for i in range(3):
+        channel.basic_publish("", "orders_queue", json.dumps({"i": i}))
+    received = []
+
+    def on_message(ch, method, properties, body):
+        received.append(json.loads(body))
+        ch.basic_ack(delivery_tag=method.delivery_tag)
+
+    channel.basic_consume(queue="orders_queue", on_message_callback=on_message)
+    channel.start_consuming()
+
+    assert received == [{"i": 0}, {"i": 1}, {"i": 2}]
+    assert broker.acked == 3
+    assert broker.message_count("orders_queue") == 0
+
+
+def test_multiple_ack_settles_earlier_deliveries():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    for _ in range(3):
+        channel.basic_publish("", "orders_queue", "{}")
+    tags = []
+    channel.basic_consume(
+        queue="orders_queue",
+        on_message_callback=lambda ch, method, p, b: tags.append(
+            method.delivery_tag
+        ),
+    )
+    channel.start_consuming()
+
+    channel.basic_ack(delivery_tag=tags[-1], multiple=True)
+
+    assert broker.acked == 3
+
+
+def test_nack_requeues_as_redelivered():
+    broker = InMemoryBroker()
+    channel = broker.connection().channel()
+    channel.basic_publish("", "orders_queue", "{}")
+
+    method, _, _ = channel.basic_get("orders_queue")
+    channel.basic_nack(delivery_tag=method.delivery_tag)
+    method, _, body = channel.basic_get("orders_queue")
+
+    assert method.redelivered is True
+    assert body == b"{}"
+    assert broker.nacked == 1
+
+
+def test_connection_runs_due_timers_unless_removed():
+    connection = InMemoryBroker().connection()
+    fired = []
+    connection.call_later(0, lambda: fired.append("due"))
+    removed = connection.call_later(0, lambda: fired.append("removed"))
+    connection.call_later(60, lambda: fired.append("later"))
+
+    connection.remove_timeout(removed)
+    connection.process_data_events()
+
+    assert fired == ["due"]
+
+
+def test_order_subscriber_consumes_through_broker():
+    broker = InMemoryBroker()
+    payment_service = MagicMock()
+    subscriber = OrderSubscriber(payment_service)
+    subscriber.connection = broker.connection()
+    subscriber.channel = subscriber.connection.channel()
+    body = json.dumps({"order_id": 7, "amount": 10.0, "status": "confirmed"})
+    properties = pika.BasicProperties(message_id="m-1")
+
+    subscriber.channel.basic_publish("", "orders_queue", body, properties)
+    subscriber.start_consuming()
+
+    payment_service.create_payment.assert_called_once_with(
+        order_id=7, amount=10.0, status="pending"
+    )
+    assert broker.acked == 1
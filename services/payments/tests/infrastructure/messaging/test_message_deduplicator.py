@@ -0,0 +1,111 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.infrastructure.messaging.message_deduplicator import (
+    MessageDeduplicator,
+)
+from src.infrastructure.persistence.in_memory_processed_message_repository import (
+    InMemoryProcessedMessageRepository,
+)
+
+
+@pytest.fixture
+def repository():
+    return InMemoryProcessedMessageRepository()
+
+
+@pytest.fixture
+def deduplicator(repository):
+    return MessageDeduplicator(repository, ttl=60, eviction_interval=60)
+
+
+def test_is_duplicate_false_for_new_message(deduplicator):
+    properties = MagicMock(message_id="abc")
+
+    assert deduplicator.is_duplicate(properties) is False
+
+
+def test_is_duplicate_true_after_mark_processed(deduplicator):
+    properties = MagicMock(message_id="abc")
+
+    assert deduplicator.is_duplicate(properties) is False
+    deduplicator.mark_processed(properties)
+
+    assert deduplicator.is_duplicate(properties) is True
+
+
+def test_is_duplicate_true_while_claim_is_in_flight(deduplicator):
+    properties = MagicMock(message_id="abc")
+
+    assert deduplicator.is_duplicate(properties) is False
+
+    assert deduplicator.is_duplicate(properties) is True
+
+
+def test_discard_releases_the_claim(deduplicator, repository):
+    properties = MagicMock(message_id="abc")
+    deduplicator.is_duplicate(properties)
+
+    deduplicator.discard()
+
+    assert not repository.exists("abc")
+    assert deduplicator.is_duplicate(properties) is False
+
+
+def test_messages_without_id_are_never_duplicates(deduplicator, repository):
+    properties = MagicMock(message_id=None)
+
+    assert deduplicator.is_duplicate(properties) is False
+    deduplicator.mark_processed(properties)
+
+    assert deduplicator.is_duplicate(properties) is False
+    assert repository.delete_older_than(datetime.max) == 0
+
+
+def test_is_duplicate_falls_back_to_processing_on_store_error():
+    repository = MagicMock()
+    repository.add.side_effect = Exception("database unavailable")
+    deduplicator = MessageDeduplicator(repository)
+
+    assert deduplicator.is_duplicate(MagicMock(message_id="abc")) is False
+
+    repository.rollback.assert_called_once()
+
+
+def test_mark_processed_swallows_store_errors():
+    repository = MagicMock()
+    repository.commit.side_effect = Exception("database unavailable")
+    deduplicator = MessageDeduplicator(repository)
+
+    deduplicator.mark_processed(MagicMock(message_id="abc"))
+
+    repository.commit.assert_called_once()
+    repository.rollback.assert_called_once()
+
+
+def _process(deduplicator, message_id):
+    properties = MagicMock(message_id=message_id)
+    deduplicator.is_duplicate(properties)
+    deduplicator.mark_processed(properties)
+
+
+@patch("src.infrastructure.messaging.message_deduplicator.time.monotonic")
+def test_mark_processed_evicts_expired_entries(mock_monotonic, repository):
+    mock_monotonic.return_value = 0
+    deduplicator = MessageDeduplicator(
+        repository, ttl=60, eviction_interval=10
+    )
+    repository._processed_at["old"] = datetime.utcnow() - timedelta(
+        seconds=120
+    )
+
+    mock_monotonic.return_value = 5
+    _process(deduplicator, "new")
+    assert repository.exists("old")
+
+    mock_monotonic.return_value = 11
+    _process(deduplicator, "newer")
+    assert not repository.exists("old")
+    assert repository.exists("new")
+    assert repository.exists("newer")
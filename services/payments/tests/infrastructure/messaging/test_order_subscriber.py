@@ -15,7 +15,7 @@ def test_order_subscriber_initialization(mock_connect):
     subscriber = OrderSubscriber(payment_service=payment_service)
 
     assert subscriber.payment_service == payment_service
-    mock_connect.assert_called_once()
+    mock_connect.assert_not_called()
 
 
 @patch(
@@ -32,9 +32,12 @@ def test_start_consuming(mock_connect):
     subscriber.channel.exchange_declare.assert_called_once_with(
         exchange="orders_exchange", exchange_type="topic", durable=True
     )
-    subscriber.channel.queue_declare.assert_called_once_with(
+    subscriber.channel.queue_declare.assert_any_call(
         queue="orders_queue", durable=True
     )
+    subscriber.channel.queue_declare.assert_any_call(
+        queue="orders_queue.dlq", durable=True
+    )
     subscriber.channel.queue_bind.assert_called_once_with(
         exchange="orders_exchange",
         queue="orders_queue",
@@ -118,6 +121,137 @@ def test_on_message_with_exception(mock_connect, mock_logger):
     subscriber.on_message(subscriber.channel, method, properties, body)
 
     mock_logger.error.assert_called_once()
+    assert (
+        subscriber.channel.basic_publish.call_args.kwargs["routing_key"]
+        == "orders_queue.retry.1000ms"
+    )
+    subscriber.channel.basic_ack.assert_called_once_with(
+        delivery_tag=method.delivery_tag
+    )
+
+
+@patch(
+    "src.infrastructure.messaging.order_subscriber.BaseMessagingAdapter.connect",
+    return_value=None,
+)
+def test_on_message_skips_duplicate(mock_connect):
+    payment_service = MagicMock()
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.return_value = True
+    subscriber = OrderSubscriber(
+        payment_service=payment_service, deduplicator=deduplicator
+    )
+    subscriber.channel = MagicMock()
+
+    body = json.dumps(
+        {"order_id": 1, "status": "confirmed", "amount": 100.0}
+    ).encode("utf-8")
+    method = MagicMock()
+    properties = MagicMock(message_id="abc")
+
+    subscriber.on_message(subscriber.channel, method, properties, body)
+
+    payment_service.create_payment.assert_not_called()
+    deduplicator.mark_processed.assert_not_called()
+    subscriber.channel.basic_ack.assert_called_once_with(
+        delivery_tag=method.delivery_tag
+    )
+
+
+@patch(
+    "src.infrastructure.messaging.order_subscriber.BaseMessagingAdapter.connect",
+    return_value=None,
+)
+def test_on_message_marks_processed(mock_connect):
+    payment_service = MagicMock()
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.return_value = False
+    subscriber = OrderSubscriber(
+        payment_service=payment_service, deduplicator=deduplicator
+    )
+    subscriber.channel = MagicMock()
+
+    body = json.dumps(
+        {"order_id": 1, "status": "confirmed", "amount": 100.0}
+    ).encode("utf-8")
+    method = MagicMock()
+    properties = MagicMock(message_id="abc")
+
+    subscriber.on_message(subscriber.channel, method, properties, body)
+
+    payment_service.create_payment.assert_called_once()
+    deduplicator.mark_processed.assert_called_once_with(properties)
+
+
+@patch(
+    "src.infrastructure.messaging.order_subscriber.BaseMessagingAdapter.connect",
+    return_value=None,
+)
+def test_on_message_already_canceled_payment_is_marked_processed(
+    mock_connect,
+):
+    payment_service = MagicMock()
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.return_value = False
+    subscriber = OrderSubscriber(
+        payment_service=payment_service, deduplicator=deduplicator
+    )
+    subscriber.channel = MagicMock()
+    payment_service.get_payment_by_order_id.return_value = PaymentEntity(
+        order_id=1, amount=100.0, status="canceled"
+    )
+
+    body = json.dumps(
+        {"order_id": 1, "status": "canceled", "amount": 100.0}
+    ).encode("utf-8")
+    method = MagicMock()
+    properties = MagicMock(message_id="abc")
+
+    subscriber.on_message(subscriber.channel, method, properties, body)
+
+    payment_service.cancel_payment.assert_not_called()
+    deduplicator.mark_processed.assert_called_once_with(properties)
+
+
+@patch(
+    "src.infrastructure.messaging.order_subscriber.BaseMessagingAdapter.connect",
+    return_value=None,
+)
+def test_on_message_failure_is_not_marked_processed(mock_connect):
+    payment_service = MagicMock()
+    payment_service.create_payment.side_effect = Exception("mongo down")
+    deduplicator = MagicMock()
+    deduplicator.is_duplicate.return_value = False
+    subscriber = OrderSubscriber(
+        payment_service=payment_service, deduplicator=deduplicator
+    )
+    subscriber.channel = MagicMock()
+
+    body = json.dumps(
+        {"order_id": 1, "status": "confirmed", "amount": 100.0}
+    ).encode("utf-8")
+    method = MagicMock()
+
+    subscriber.on_message(subscriber.channel, method, MagicMock(), body)
+
+    deduplicator.mark_processed.assert_not_called()
+    deduplicator.discard.assert_called_once()
     subscriber.channel.basic_ack.assert_called_once_with(
         delivery_tag=method.delivery_tag
     )
+
+
+@patch(
+    "src.infrastructure.messaging.order_subscriber.BaseMessagingAdapter.connect",
+    return_value=None,
+)
+def test_start_consuming_schedules_queue_sampling(mock_connect):
+    subscriber = OrderSubscriber(payment_service=MagicMock())
+    subscriber.channel = MagicMock()
+    subscriber.connection = MagicMock()
+
+    subscriber.start_consuming()
+
+    subscriber.connection.call_later.assert_called_once()
+    metrics = subscriber.on_message.consumer_metrics
+    assert metrics.queue == "orders_queue"
@@ -1,5 +1,5 @@
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pika
 import pytest
@@ -15,7 +15,7 @@ def test_payment_publisher_initialization(mock_connect):
     publisher = PaymentPublisher(connection_params)
 
     assert publisher.exchange_name == "payment_exchange"
-    mock_connect.assert_called_once()
+    mock_connect.assert_not_called()
 
 
 @patch(
@@ -25,9 +25,10 @@ def test_payment_publisher_initialization(mock_connect):
 def test_publish_payment_update_success(mock_connect):
     connection_params = pika.ConnectionParameters(host="localhost")
     publisher = PaymentPublisher(connection_params)
-    publisher.channel = MagicMock()
+    publisher._publish_now = MagicMock()
 
     publisher.publish_payment_update("1", 1, "completed")
+    publisher.close()
 
     expected_message = json.dumps(
         {
@@ -37,11 +38,11 @@ def test_publish_payment_update_success(mock_connect):
         }
     )
 
-    publisher.channel.basic_publish.assert_called_once_with(
-        exchange="payment_exchange",
-        routing_key="payment_queue",
-        body=expected_message,
+    publisher._publish_now.assert_called_once_with(
+        "payment_queue", expected_message, ANY
     )
+    properties = publisher._publish_now.call_args.args[2]
+    assert len(properties.message_id) == 32
 
 
 @patch(
@@ -52,9 +53,10 @@ def test_publish_payment_update_success(mock_connect):
 def test_publish_payment_update_logs_success(mock_logger, mock_connect):
     connection_params = pika.ConnectionParameters(host="localhost")
     publisher = PaymentPublisher(connection_params)
-    publisher.channel = MagicMock()
+    publisher._publish_now = MagicMock()
 
     publisher.publish_payment_update("1", 1, "completed")
+    publisher.close()
 
     expected_message = json.dumps(
         {
@@ -65,5 +67,5 @@ def test_publish_payment_update_logs_success(mock_logger, mock_connect):
     )
 
     mock_logger.info.assert_called_once_with(
-        f"Published payment update: {expected_message} to payment_queue"
+        f"Queued payment update: {expected_message} to payment_queue"
     )
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock
+
+import pytest
+from src.infrastructure.messaging.retry_topology import (
+    ATTEMPTS_HEADER,
+    LAST_ERROR_HEADER,
+    RetryTopology,
+)
+
+
+@pytest.fixture
+def topology():
+    return RetryTopology("orders_queue", delays=[100, 1000], max_attempts=3)
+
+
+def test_declare_creates_delay_queues_and_dead_letter_queue(topology):
+    channel = MagicMock()
+
+    topology.declare(channel)
+
+    channel.queue_declare.assert_any_call(
+        queue="orders_queue.retry.100ms",
+        durable=True,
+        arguments={
+            "x-message-ttl": 100,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "orders_queue",
+        },
+    )
+    channel.queue_declare.assert_any_call(
+        queue="orders_queue.retry.1000ms",
+        durable=True,
+        arguments={
+            "x-message-ttl": 1000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "orders_queue",
+        },
+    )
+    channel.queue_declare.assert_any_call(
+        queue="orders_queue.dlq", durable=True
+    )
+
+
+@pytest.mark.parametrize(
+    "attempts, routing_key",
+    [
+        (0, "orders_queue.retry.100ms"),
+        (1, "orders_queue.retry.1000ms"),
+        (2, "orders_queue.dlq"),
+    ],
+)
+def test_retry_routes_by_attempt(topology, attempts, routing_key):
+    channel = MagicMock()
+    properties = MagicMock(
+        message_id="abc", headers={ATTEMPTS_HEADER: attempts}
+    )
+
+    topology.retry(channel, properties, b"{}", Exception("boom"))
+
+    kwargs = channel.basic_publish.call_args.kwargs
+    assert kwargs["exchange"] == ""
+    assert kwargs["routing_key"] == routing_key
+    assert kwargs["body"] == b"{}"
+    assert kwargs["properties"].message_id == "abc"
+    assert kwargs["properties"].headers[ATTEMPTS_HEADER] == attempts + 1
+    assert kwargs["properties"].headers[LAST_ERROR_HEADER] == "boom"
+
+
+def test_retry_reuses_last_tier_when_attempts_exceed_tiers():
+    topology = RetryTopology("orders_queue", delays=[100], max_attempts=5)
+    channel = MagicMock()
+    properties = MagicMock(headers={ATTEMPTS_HEADER: 3})
+
+    topology.retry(channel, properties, b"{}", Exception("boom"))
+
+    assert (
+        channel.basic_publish.call_args.kwargs["routing_key"]
+        == "orders_queue.retry.100ms"
+    )
+
+
+def test_get_attempts_without_headers():
+    assert RetryTopology.get_attempts(MagicMock(headers=None)) == 0
+
+
+def test_replay_dead_letters_republishes_and_acks(topology):
+    channel = MagicMock()
+    dead_letter = (
+        MagicMock(delivery_tag=7),
+        MagicMock(
+            message_id="abc",
+            headers={ATTEMPTS_HEADER: 3, LAST_ERROR_HEADER: "boom"},
+        ),
+        b"{}",
+    )
+    channel.basic_get.side_effect = [dead_letter, (None, None, None)]
+
+    replayed = topology.replay_dead_letters(channel)
+
+    assert replayed == 1
+    channel.basic_get.assert_called_with(queue="orders_queue.dlq")
+    kwargs = channel.basic_publish.call_args.kwargs
+    assert kwargs["routing_key"] == "orders_queue"
+    assert kwargs["properties"].message_id == "abc"
+    assert kwargs["properties"].headers == {}
+    channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+
+def test_replay_dead_letters_respects_limit(topology):
+    channel = MagicMock()
+    channel.basic_get.return_value = (
+        MagicMock(delivery_tag=1),
+        MagicMock(headers={}),
+        b"{}",
+    )
+
+    replayed = topology.replay_dead_letters(channel, limit=2)
+
+    assert replayed == 2
+    assert channel.basic_ack.call_count == 2
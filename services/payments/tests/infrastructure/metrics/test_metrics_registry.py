@@ -0,0 +1,79 @@
+import pytest
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+@pytest.fixture
+def metrics():
+    return MetricsRegistry()
+
+
+def test_counter_renders_labels(metrics):
+    counter = metrics.counter("jobs_total", "Jobs done.", ["queue"])
+
+    counter.inc(queue="a")
+    counter.inc(2, queue="a")
+    counter.inc(queue="b")
+
+    assert metrics.render() == (
+        "# HELP jobs_total Jobs done.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{queue="a"} 3\n'
+        'jobs_total{queue="b"} 1\n'
+    )
+
+
+def test_gauge_set_inc_dec(metrics):
+    gauge = metrics.gauge("in_flight", "In flight.")
+
+    gauge.set(5)
+    gauge.inc()
+    gauge.dec(2)
+
+    assert gauge.get() == 4
+    assert "in_flight 4\n" in metrics.render()
+
+
+def test_histogram_renders_cumulative_buckets(metrics):
+    histogram = metrics.histogram(
+        "latency_seconds", "Latency.", ["queue"], buckets=[0.1, 1]
+    )
+
+    histogram.observe(0.05, queue="a")
+    histogram.observe(0.5, queue="a")
+    histogram.observe(3, queue="a")
+
+    output = metrics.render()
+    assert 'latency_seconds_bucket{queue="a",le="0.1"} 1' in output
+    assert 'latency_seconds_bucket{queue="a",le="1"} 2' in output
+    assert 'latency_seconds_bucket{queue="a",le="+Inf"} 3' in output
+    assert 'latency_seconds_sum{queue="a"} 3.55' in output
+    assert 'latency_seconds_count{queue="a"} 3' in output
+    assert histogram.get_count(queue="a") == 3
+
+
+def test_get_or_create_returns_same_metric(metrics):
+    first = metrics.counter("jobs_total", "Jobs done.")
+
+    assert metrics.counter("jobs_total", "Jobs done.") is first
+
+
+def test_conflicting_metric_type_raises(metrics):
+    metrics.counter("jobs_total", "Jobs done.")
+
+    with pytest.raises(ValueError):
+        metrics.gauge("jobs_total", "Jobs done.")
+
+
+def test_wrong_labels_raise(metrics):
+    counter = metrics.counter("jobs_total", "Jobs done.", ["queue"])
+
+    with pytest.raises(ValueError):
+        counter.inc(exchange="a")
+
+
+def test_label_values_are_escaped(metrics):
+    counter = metrics.counter("jobs_total", "Jobs done.", ["queue"])
+
+    counter.inc(queue='a"b')
+
+    assert 'jobs_total{queue="a\\"b"} 1' in metrics.render()
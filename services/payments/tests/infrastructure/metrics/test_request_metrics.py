@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+from src.infrastructure.metrics.request_metrics import (
+    QueryCommandListener,
+    current_stats,
+    track_request,
+)
+
+
+def test_mongo_commands_are_attributed_to_the_current_request():
+    listener = QueryCommandListener()
+
+    with track_request() as stats:
+        listener.succeeded(SimpleNamespace(duration_micros=1500))
+        listener.failed(SimpleNamespace(duration_micros=500))
+
+    assert stats.queries == 2
+    assert stats.query_seconds == 0.002
+    assert current_stats() is None
+
+
+def test_commands_outside_a_request_are_ignored():
+    listener = QueryCommandListener()
+
+    listener.succeeded(SimpleNamespace(duration_micros=1500))
+
+    assert current_stats() is None
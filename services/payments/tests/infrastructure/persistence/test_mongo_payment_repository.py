@@ -19,7 +19,16 @@ def test_save_new_payment():
 
     repository.save(payment)
 
-    mock_db.insert_one.assert_called_once_with(payment.__dict__)
+    mock_db.insert_one.assert_called_once_with(
+        {
+            "id": None,
+            "order_id": 1,
+            "amount": 100.0,
+            "status": "pending",
+            "qr_code": None,
+            "qr_code_expiration": None,
+        }
+    )
     assert payment.id == str(mock_result.inserted_id)
 
 
@@ -34,7 +43,7 @@ def test_save_existing_payment():
     repository.save(payment)
 
     mock_db.replace_one.assert_called_once_with(
-        {"_id": ObjectId(payment.id)}, payment.__dict__
+        {"_id": ObjectId(payment.id)}, payment.to_dict()
     )
 
 
@@ -0,0 +1,98 @@
+from datetime import datetime
+from unittest.mock import ANY, MagicMock
+
+from pymongo.errors import DuplicateKeyError
+from src.infrastructure.persistence.mongo_processed_message_repository import (
+    MongoDBProcessedMessageRepository,
+)
+
+
+def test_ensure_ttl_index():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+
+    repository.ensure_ttl_index(3600)
+
+    mock_db.create_index.assert_called_once_with(
+        "processed_at", expireAfterSeconds=3600
+    )
+
+
+def test_exists():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.return_value = {"_id": "abc"}
+
+    assert repository.exists("abc") is True
+    mock_db.find_one.assert_called_once_with(
+        {"_id": "abc"}, projection={"_id": 1}
+    )
+
+
+def test_exists_not_found():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.return_value = None
+
+    assert repository.exists("abc") is False
+
+
+def test_add_stages_until_commit():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.return_value = None
+
+    assert repository.add("abc") is True
+    mock_db.insert_one.assert_not_called()
+
+    repository.commit()
+
+    mock_db.insert_one.assert_called_once_with(
+        {"_id": "abc", "processed_at": ANY}
+    )
+
+
+def test_add_returns_false_for_recorded_or_staged_message():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.side_effect = [{"_id": "abc"}, None]
+
+    assert repository.add("abc") is False
+    assert repository.add("def") is True
+    assert repository.add("def") is False
+
+
+def test_rollback_drops_staged_messages():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.return_value = None
+    repository.add("abc")
+
+    repository.rollback()
+    repository.commit()
+
+    mock_db.insert_one.assert_not_called()
+
+
+def test_commit_ignores_duplicate_key():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.find_one.return_value = None
+    mock_db.insert_one.side_effect = DuplicateKeyError("duplicate")
+    repository.add("abc")
+
+    repository.commit()
+
+    mock_db.insert_one.assert_called_once()
+
+
+def test_delete_older_than():
+    mock_db = MagicMock()
+    repository = MongoDBProcessedMessageRepository(mock_db)
+    mock_db.delete_many.return_value = MagicMock(deleted_count=2)
+    cutoff = datetime(2024, 1, 1)
+
+    assert repository.delete_older_than(cutoff) == 2
+    mock_db.delete_many.assert_called_once_with(
+        {"processed_at": {"$lt": cutoff}}
+    )
@@ -0,0 +1,162 @@
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.tracing.exporters import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    FileSpanExporter,
+    OtlpHttpSpanExporter,
+    build_exporter,
+    start_tracing,
+    to_otlp,
+)
+from src.infrastructure.tracing.tracer import SpanKind, Tracer
+
+
+def _span(name="GET /payments/{payment_id}"):
+    tracer = Tracer("payments")
+    with tracer.span(
+        name, SpanKind.SERVER, {"http.response.status_code": 200}
+    ) as span:
+        with tracer.span("child"):
+            pass
+    return span
+
+
+def test_to_otlp_builds_export_request():
+    span = _span()
+
+    request = to_otlp([span], "payments")
+
+    resource_spans = request["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "payments"}}
+    ]
+    exported = resource_spans["scopeSpans"][0]["spans"][0]
+    assert exported["traceId"] == span.context.trace_id
+    assert exported["spanId"] == span.context.span_id
+    assert "parentSpanId" not in exported
+    assert exported["kind"] == SpanKind.SERVER
+    assert exported["startTimeUnixNano"] == str(span.start_time_unix_nano)
+    assert exported["attributes"] == [
+        {"key": "http.response.status_code", "value": {"intValue": "200"}}
+    ]
+
+
+def test_file_exporter_appends_one_request_per_line(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = FileSpanExporter(str(path))
+
+    exporter.export([_span("a")], "payments")
+    exporter.export([_span("b")], "payments")
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    names = [
+        json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"][0][
+            "name"
+        ]
+        for line in lines
+    ]
+    assert names == ["a", "b"]
+
+
+def test_console_exporter_writes_a_line_per_span():
+    stream = io.StringIO()
+    span = _span()
+
+    ConsoleSpanExporter(stream).export([span], "payments")
+
+    line = stream.getvalue()
+    assert line.startswith(f"[trace] payments {span.context.trace_id}")
+    assert "GET /payments/{payment_id}" in line
+
+
+@patch("src.infrastructure.tracing.exporters.urllib.request.urlopen")
+def test_otlp_exporter_posts_json(mock_urlopen):
+    exporter = OtlpHttpSpanExporter("http://collector:4318/v1/traces")
+
+    exporter.export([_span()], "payments")
+
+    request = mock_urlopen.call_args[0][0]
+    assert request.full_url == "http://collector:4318/v1/traces"
+    assert request.get_header("Content-type") == "application/json"
+    assert "resourceSpans" in json.loads(request.data)
+
+
+def test_batch_processor_exports_in_batches_on_flush():
+    exporter = MagicMock()
+    processor = BatchSpanProcessor(exporter, "payments", batch_size=2)
+    spans = [_span(str(i)) for i in range(3)]
+    for span in spans:
+        processor.on_end(span)
+
+    processor.flush()
+
+    assert [c.args[0] for c in exporter.export.call_args_list] == [
+        spans[:2],
+        spans[2:],
+    ]
+
+
+def test_batch_processor_drops_spans_when_full():
+    processor = BatchSpanProcessor(MagicMock(), "payments", max_queue_size=1)
+    before = processor.dropped_spans.get()
+
+    processor.on_end(_span())
+    processor.on_end(_span())
+
+    assert processor.dropped_spans.get() == before + 1
+
+
+def test_batch_processor_survives_export_failures():
+    exporter = MagicMock()
+    exporter.export.side_effect = OSError("collector down")
+    processor = BatchSpanProcessor(exporter, "payments")
+    before = processor.export_failures.get()
+    processor.on_end(_span())
+
+    processor.flush()
+
+    assert processor.export_failures.get() == before + 1
+
+
+def test_batch_processor_shutdown_flushes_pending_spans():
+    exporter = MagicMock()
+    processor = BatchSpanProcessor(exporter, "payments", interval=60).start()
+    processor.on_end(_span())
+
+    processor.shutdown()
+
+    exporter.export.assert_called_once()
+    exporter.shutdown.assert_called_once()
+
+
+def test_build_exporter():
+    assert isinstance(build_exporter("console"), ConsoleSpanExporter)
+    assert isinstance(build_exporter("file"), FileSpanExporter)
+    assert isinstance(build_exporter("otlp"), OtlpHttpSpanExporter)
+    assert build_exporter("none") is None
+    assert build_exporter("jaeger") is None
+
+
+@patch("src.infrastructure.tracing.exporters.build_exporter")
+def test_start_tracing_installs_processor(mock_build_exporter):
+    tracer = Tracer("payments")
+
+    processor = start_tracing(tracer)
+
+    assert tracer.processor is processor
+    tracer.shutdown()
+    assert tracer.processor is None
+    mock_build_exporter.return_value.shutdown.assert_called_once()
+
+
+@patch("src.infrastructure.tracing.exporters.build_exporter")
+def test_start_tracing_is_off_without_exporter(mock_build_exporter):
+    mock_build_exporter.return_value = None
+    tracer = Tracer("payments")
+
+    assert start_tracing(tracer) is None
+    assert tracer.processor is None